@@ -95,3 +95,21 @@ def performance(session: nox.Session, robocop_version: str) -> None:
             env={"UV_PROJECT_ENVIRONMENT": session.virtualenv.location},
         )
     session.run("python", "-m", "tests.performance.generate_reports", robocop_version, external=True, silent=False)
+
+
+@nox.session(python=PYTHON_VERSIONS[-2])
+def benchmark(session: nox.Session) -> None:
+    """
+    Run the benchmark suite on the generated projects of growing size.
+
+    Extra arguments are passed to the benchmark, for example, to compare with the baseline:
+
+    > uv run nox -s benchmark -- --baseline tests/performance/reports/benchmark/robocop_9_0_0b1_suites.json
+    """
+    session.run_install(
+        "uv",
+        "sync",
+        f"--python={session.virtualenv.location}",
+        env={"UV_PROJECT_ENVIRONMENT": session.virtualenv.location},
+    )
+    session.run("python", "-m", "tests.performance.benchmark", "run", *session.posargs, external=True, silent=False)
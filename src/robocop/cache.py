@@ -7,41 +7,89 @@ significantly improving performance on subsequent runs.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import hashlib
+import os
+import time
+from collections.abc import MutableMapping
+from dataclasses import dataclass, field, replace
 from functools import cached_property
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import msgpack
 
 from robocop import __version__
 from robocop.config import defaults
+from robocop.files import file_lock
 from robocop.source_file import SourceFile
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     from robocop.config.schema import Config
     from robocop.linter.diagnostics import Diagnostic
     from robocop.runtime.resolved_config import ResolvedConfig
 
 
+def file_content_hash(path: Path) -> str:
+    """
+    Calculate the hash of the file content.
+
+    Returns:
+        Hex digest of the file content hash.
+
+    """
+    return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+
+
 @dataclass(frozen=True)
 class FileMetadata:
     """Immutable file metadata used for cache invalidation."""
 
     mtime: float
     size: int
+    content_hash: str | None = None
 
     @classmethod
-    def from_path(cls, path: Path) -> FileMetadata:
+    def from_path(cls, path: Path, content_hash: bool = False) -> FileMetadata:
         """
         Create metadata from a file path.
 
+        Args:
+            path: Path to the file.
+            content_hash: Whether to calculate the hash of the file content.
+
         Returns:
             FileMetadata: The metadata of the file.
 
         """
         stat = path.stat()
-        return cls(mtime=stat.st_mtime, size=stat.st_size)
+        return cls(
+            mtime=stat.st_mtime,
+            size=stat.st_size,
+            content_hash=file_content_hash(path) if content_hash else None,
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> FileMetadata:
+        """
+        Create from dictionary of the cache entry loaded from cache.
+
+        Returns:
+            FileMetadata: The metadata of the file.
+
+        """
+        return cls(mtime=data["mtime"], size=data["size"], content_hash=data.get("content_hash"))
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert to dictionary for serialization.
+
+        Returns:
+            Dictionary representation of the file metadata.
+
+        """
+        return {"mtime": self.mtime, "size": self.size, "content_hash": self.content_hash}
 
 
 @dataclass(frozen=True)
@@ -124,6 +172,7 @@ class LinterCacheEntry:
     metadata: FileMetadata
     config_hash: str
     diagnostics: tuple[CachedDiagnostic, ...]
+    last_access: float = 0.0
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -136,8 +185,10 @@ class LinterCacheEntry:
         return {
             "mtime": self.metadata.mtime,
             "size": self.metadata.size,
+            "content_hash": self.metadata.content_hash,
             "config_hash": self.config_hash,
             "diagnostics": [d.to_dict() for d in self.diagnostics],
+            "last_access": self.last_access,
         }
 
     @classmethod
@@ -150,9 +201,10 @@ class LinterCacheEntry:
 
         """
         return cls(
-            metadata=FileMetadata(mtime=data["mtime"], size=data["size"]),
+            metadata=FileMetadata.from_dict(data),
             config_hash=data["config_hash"],
             diagnostics=tuple(CachedDiagnostic.from_dict(d) for d in data.get("diagnostics", [])),
+            last_access=data.get("last_access", 0.0),
         )
 
 
@@ -163,6 +215,7 @@ class FormatterCacheEntry:
     metadata: FileMetadata
     config_hash: str
     needs_formatting: bool
+    last_access: float = 0.0
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -175,8 +228,10 @@ class FormatterCacheEntry:
         return {
             "mtime": self.metadata.mtime,
             "size": self.metadata.size,
+            "content_hash": self.metadata.content_hash,
             "config_hash": self.config_hash,
             "needs_formatting": self.needs_formatting,
+            "last_access": self.last_access,
         }
 
     @classmethod
@@ -189,9 +244,10 @@ class FormatterCacheEntry:
 
         """
         return cls(
-            metadata=FileMetadata(mtime=data["mtime"], size=data["size"]),
+            metadata=FileMetadata.from_dict(data),
             config_hash=data["config_hash"],
             needs_formatting=data.get("needs_formatting", True),
+            last_access=data.get("last_access", 0.0),
         )
 
 
@@ -203,6 +259,7 @@ class LibraryCacheEntry:
     environment_hash: str
     source: str
     response: dict[str, Any]
+    last_access: float = 0.0
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -215,9 +272,11 @@ class LibraryCacheEntry:
         return {
             "mtime": self.metadata.mtime,
             "size": self.metadata.size,
+            "content_hash": self.metadata.content_hash,
             "environment_hash": self.environment_hash,
             "source": self.source,
             "response": self.response,
+            "last_access": self.last_access,
         }
 
     @classmethod
@@ -230,20 +289,30 @@ class LibraryCacheEntry:
 
         """
         return cls(
-            metadata=FileMetadata(mtime=data["mtime"], size=data["size"]),
+            metadata=FileMetadata.from_dict(data),
             environment_hash=data["environment_hash"],
             source=data["source"],
             response=data["response"],
+            last_access=data.get("last_access", 0.0),
         )
 
 
 @dataclass(frozen=True)
 class ProjectCacheEntry:
-    """Immutable cache entry with the data collected from a single source file."""
+    """
+    Immutable cache entry with the data collected from a single source file.
+
+    Imports of the file resolved to paths are stored as well, together with the hash of the configuration used to
+    resolve them and the metadata of every path checked while resolving them (None for paths that did not exist).
+    """
 
     metadata: FileMetadata
     config_hash: str
     collected: dict[str, Any]
+    last_access: float = 0.0
+    resolution_hash: str | None = None
+    checked_paths: dict[str, FileMetadata | None] = field(default_factory=dict)
+    imports: dict[str, Any] | None = None
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -256,8 +325,16 @@ class ProjectCacheEntry:
         return {
             "mtime": self.metadata.mtime,
             "size": self.metadata.size,
+            "content_hash": self.metadata.content_hash,
             "config_hash": self.config_hash,
             "collected": self.collected,
+            "last_access": self.last_access,
+            "resolution_hash": self.resolution_hash,
+            "checked_paths": {
+                path: metadata.to_dict() if metadata is not None else None
+                for path, metadata in self.checked_paths.items()
+            },
+            "imports": self.imports,
         }
 
     @classmethod
@@ -270,21 +347,325 @@ class ProjectCacheEntry:
 
         """
         return cls(
-            metadata=FileMetadata(mtime=data["mtime"], size=data["size"]),
+            metadata=FileMetadata.from_dict(data),
             config_hash=data["config_hash"],
             collected=data["collected"],
+            last_access=data.get("last_access", 0.0),
+            resolution_hash=data.get("resolution_hash"),
+            checked_paths={
+                path: FileMetadata.from_dict(metadata) if metadata is not None else None
+                for path, metadata in data.get("checked_paths", {}).items()
+            },
+            imports=data.get("imports"),
         )
 
 
-@dataclass
+@dataclass(frozen=True)
+class ProjectChecksCacheEntry:
+    """
+    Immutable cache entry with diagnostics reported by the project checkers.
+
+    Project checkers analyse the whole project at once, so the entry is valid only if none of the files it depends on
+    changed: source files of the project and files imported by them, such as libraries and variable files. When some
+    of them changed, the configuration hashes of the project files and the files importing every imported file are
+    used to find the files whose diagnostics need to be updated.
+    """
+
+    root: str
+    config_hash: str
+    files_hash: str
+    dependencies: dict[str, FileMetadata]
+    diagnostics: tuple[tuple[str, CachedDiagnostic], ...]
+    last_access: float = 0.0
+    file_configs: dict[str, str] = field(default_factory=dict)
+    imported_by: dict[str, tuple[str, ...]] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert to dictionary for serialization.
+
+        Returns:
+            Dictionary representation of the project checks cache entry.
+
+        """
+        return {
+            "root": self.root,
+            "config_hash": self.config_hash,
+            "files_hash": self.files_hash,
+            "dependencies": {path: metadata.to_dict() for path, metadata in self.dependencies.items()},
+            "diagnostics": [{"source": source, **diag.to_dict()} for source, diag in self.diagnostics],
+            "last_access": self.last_access,
+            "file_configs": self.file_configs,
+            "imported_by": {path: list(importers) for path, importers in self.imported_by.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ProjectChecksCacheEntry:
+        """
+        Create from dictionary loaded from cache.
+
+        Returns:
+            ProjectChecksCacheEntry: The project checks cache entry object.
+
+        """
+        return cls(
+            root=data["root"],
+            config_hash=data["config_hash"],
+            files_hash=data["files_hash"],
+            dependencies={path: FileMetadata.from_dict(metadata) for path, metadata in data["dependencies"].items()},
+            diagnostics=tuple((diag["source"], CachedDiagnostic.from_dict(diag)) for diag in data["diagnostics"]),
+            last_access=data.get("last_access", 0.0),
+            file_configs=data.get("file_configs", {}),
+            imported_by={path: tuple(importers) for path, importers in data.get("imported_by", {}).items()},
+        )
+
+
+SECTION_LOCK_FILE = ".lock"
+"""Lock file held by the process saving the section, in the section directory."""
+
+EntryT = TypeVar(
+    "EntryT", LinterCacheEntry, FormatterCacheEntry, LibraryCacheEntry, ProjectCacheEntry, ProjectChecksCacheEntry
+)
+
+
+class CacheSection(MutableMapping[str, EntryT]):
+    """
+    Cache entries of one kind (linter, formatter, libraries, project or project checks) stored in shards.
+
+    Entries are split into shards by the hash of their key. Each shard is stored in a separate file inside the section
+    directory and it is loaded only when one of its entries is accessed, so looking up a single file does not require
+    reading the whole cache. Only shards with modified entries are written back on save.
+    """
+
+    def __init__(self, entry_class: type[EntryT], directory: Path | None = None) -> None:
+        """
+        Initialize the cache section.
+
+        Args:
+            entry_class: Class of the cache entries, used to deserialize them.
+            directory: Directory with the shard files. If not set, the section is kept only in memory.
+
+        """
+        self.entry_class = entry_class
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self._shards: dict[str, dict[str, EntryT]] = {}
+        self._changed: dict[str, set[str]] = {}
+        self._cleared = False
+
+    @staticmethod
+    def shard_name(key: str) -> str:
+        """
+        Get the name of the shard the entry with the given key belongs to.
+
+        Returns:
+            Name of the shard.
+
+        """
+        return hashlib.blake2b(key.encode("utf-8"), digest_size=defaults.CACHE_SHARD_DIGEST_SIZE).hexdigest()
+
+    def _shard_file(self, shard: str) -> Path:
+        return self.directory / f"{shard}.msgpack"  # type: ignore[operator]
+
+    def _read_shard(self, shard: str) -> dict[str, EntryT]:
+        """
+        Read shard entries from disk.
+
+        Returns:
+            Entries stored in the shard, or empty dictionary if the shard is missing, corrupted or was created by
+            a different Robocop version.
+
+        """
+        if self.directory is None:
+            return {}
+        try:
+            raw_data = msgpack.unpackb(self._shard_file(shard).read_bytes(), raw=False, strict_map_key=False)
+            if raw_data.get("robocop_version") != __version__:
+                return {}
+            return {key: self.entry_class.from_dict(entry) for key, entry in raw_data["entries"].items()}
+        except (
+            msgpack.exceptions.UnpackException,
+            msgpack.exceptions.ExtraData,
+            AttributeError,
+            KeyError,
+            TypeError,
+            ValueError,
+            OSError,
+        ):
+            # Missing or corrupted shard - start fresh
+            return {}
+
+    def _get_shard(self, shard: str) -> dict[str, EntryT]:
+        if shard not in self._shards:
+            self._shards[shard] = {} if self._cleared else self._read_shard(shard)
+        return self._shards[shard]
+
+    def _load_all(self) -> None:
+        """Load every shard stored on the disk."""
+        if self.directory is None or self._cleared or not self.directory.is_dir():
+            return
+        for shard_file in self.directory.glob("*.msgpack"):
+            self._get_shard(shard_file.stem)
+
+    def __getitem__(self, key: str) -> EntryT:
+        return self._get_shard(self.shard_name(key))[key]
+
+    def __setitem__(self, key: str, entry: EntryT) -> None:
+        shard = self.shard_name(key)
+        self._get_shard(shard)[key] = entry
+        self._changed.setdefault(shard, set()).add(key)
+
+    def __delitem__(self, key: str) -> None:
+        shard = self.shard_name(key)
+        del self._get_shard(shard)[key]
+        self._changed.setdefault(shard, set()).add(key)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and key in self._get_shard(self.shard_name(key))
+
+    def __iter__(self) -> Iterator[str]:
+        self._load_all()
+        for entries in list(self._shards.values()):
+            yield from entries
+
+    def __len__(self) -> int:
+        self._load_all()
+        return sum(len(entries) for entries in self._shards.values())
+
+    def disk_size(self) -> int:
+        """
+        Get the size of the section stored on the disk.
+
+        Returns:
+            Total size of the shard files in bytes.
+
+        """
+        if self.directory is None or not self.directory.is_dir():
+            return 0
+        return sum(shard_file.stat().st_size for shard_file in self.directory.glob("*.msgpack"))
+
+    def clear(self) -> None:
+        """Remove all entries, including the ones that were not loaded yet."""
+        self._shards = {}
+        self._changed = {}
+        self._cleared = True
+
+    def save(self) -> None:
+        """
+        Write modified shards to the disk.
+
+        The stored shard is read again and only the entries modified by this process are replaced, so entries
+        written by other processes in the meantime are preserved. Reading, merging and writing the shards is done
+        while holding the lock of the section, so concurrent processes (for example parallel jobs in CI) save the
+        section one after another. The shard is written to a temporary file and then moved in place, so other
+        processes never read a partially written shard.
+
+        Raises:
+            OSError: If the shard cannot be written.
+
+        """
+        if self.directory is None or not (self._cleared or self._changed):
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with file_lock(self.directory / SECTION_LOCK_FILE):
+            if self._cleared:
+                for shard_file in self.directory.glob("*.msgpack"):
+                    shard_file.unlink(missing_ok=True)
+                self._cleared = False
+            for shard, changed_keys in list(self._changed.items()):
+                stored = self._read_shard(shard)
+                entries = self._shards[shard]
+                for key in changed_keys:
+                    if key in entries:
+                        stored[key] = entries[key]
+                    else:
+                        stored.pop(key, None)
+                self._write_shard(shard, stored)
+                self._shards[shard] = stored
+                del self._changed[shard]
+
+    def _write_shard(self, shard: str, entries: dict[str, EntryT]) -> None:
+        shard_file = self._shard_file(shard)
+        if not entries:
+            shard_file.unlink(missing_ok=True)
+            return
+        data = {
+            "robocop_version": __version__,
+            "entries": {key: entry.to_dict() for key, entry in entries.items()},
+        }
+        temp_file = shard_file.with_name(f"{shard_file.name}.{os.getpid()}.tmp")
+        try:
+            temp_file.write_bytes(msgpack.packb(data, use_bin_type=True))
+            temp_file.replace(shard_file)
+        finally:
+            temp_file.unlink(missing_ok=True)
+
+
 class CacheData:
-    """Mutable container for cache data."""
+    """
+    Mutable container for cache data.
+
+    Each kind of cache entries is stored in a separate section. Sections bound to the cache directory load their
+    entries lazily.
+    """
+
+    def __init__(self, cache_dir: Path | None = None, robocop_version: str = __version__) -> None:
+        """
+        Initialize the cache data.
+
+        Args:
+            cache_dir: Cache directory with the stored sections. If not set, the data is kept only in memory.
+            robocop_version: Version of Robocop that created the cache.
+
+        """
+        self.robocop_version = robocop_version
+        self.linter: CacheSection[LinterCacheEntry] = CacheSection(
+            LinterCacheEntry, self._section_dir(cache_dir, "linter")
+        )
+        self.formatter: CacheSection[FormatterCacheEntry] = CacheSection(
+            FormatterCacheEntry, self._section_dir(cache_dir, "formatter")
+        )
+        self.libraries: CacheSection[LibraryCacheEntry] = CacheSection(
+            LibraryCacheEntry, self._section_dir(cache_dir, "libraries")
+        )
+        self.project: CacheSection[ProjectCacheEntry] = CacheSection(
+            ProjectCacheEntry, self._section_dir(cache_dir, "project")
+        )
+        self.project_checks: CacheSection[ProjectChecksCacheEntry] = CacheSection(
+            ProjectChecksCacheEntry, self._section_dir(cache_dir, "project_checks")
+        )
+
+    @staticmethod
+    def _section_dir(cache_dir: Path | None, name: str) -> Path | None:
+        return None if cache_dir is None else cache_dir / name
+
+    @property
+    def sections(self) -> dict[str, CacheSection]:
+        """All cache sections by their names."""
+        return {
+            "linter": self.linter,
+            "formatter": self.formatter,
+            "libraries": self.libraries,
+            "project": self.project,
+            "project_checks": self.project_checks,
+        }
 
-    robocop_version: str = field(default_factory=lambda: __version__)
-    linter: dict[str, LinterCacheEntry] = field(default_factory=dict)
-    formatter: dict[str, FormatterCacheEntry] = field(default_factory=dict)
-    libraries: dict[str, LibraryCacheEntry] = field(default_factory=dict)
-    project: dict[str, ProjectCacheEntry] = field(default_factory=dict)
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        for section in self.sections.values():
+            section.clear()
+
+    def save(self) -> None:
+        """
+        Write modified entries of all sections to the disk.
+
+        Raises:
+            OSError: If any of the shards cannot be written.
+
+        """
+        for section in self.sections.values():
+            section.save()
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -300,24 +681,90 @@ class CacheData:
             "formatter": {path: entry.to_dict() for path, entry in self.formatter.items()},
             "libraries": {key: entry.to_dict() for key, entry in self.libraries.items()},
             "project": {path: entry.to_dict() for path, entry in self.project.items()},
+            "project_checks": {key: entry.to_dict() for key, entry in self.project_checks.items()},
         }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> CacheData:
         """
-        Create from dictionary loaded from cache.
+        Create in-memory cache data from dictionary.
 
         Returns:
             CacheData: The cache data object.
 
         """
-        return cls(
-            robocop_version=data.get("robocop_version", ""),
-            linter={path: LinterCacheEntry.from_dict(entry) for path, entry in data.get("linter", {}).items()},
-            formatter={path: FormatterCacheEntry.from_dict(entry) for path, entry in data.get("formatter", {}).items()},
-            libraries={key: LibraryCacheEntry.from_dict(entry) for key, entry in data.get("libraries", {}).items()},
-            project={path: ProjectCacheEntry.from_dict(entry) for path, entry in data.get("project", {}).items()},
-        )
+        cache_data = cls(robocop_version=data.get("robocop_version", ""))
+        for path, entry in data.get("linter", {}).items():
+            cache_data.linter[path] = LinterCacheEntry.from_dict(entry)
+        for path, entry in data.get("formatter", {}).items():
+            cache_data.formatter[path] = FormatterCacheEntry.from_dict(entry)
+        for key, entry in data.get("libraries", {}).items():
+            cache_data.libraries[key] = LibraryCacheEntry.from_dict(entry)
+        for path, entry in data.get("project", {}).items():
+            cache_data.project[path] = ProjectCacheEntry.from_dict(entry)
+        for key, entry in data.get("project_checks", {}).items():
+            cache_data.project_checks[key] = ProjectChecksCacheEntry.from_dict(entry)
+        return cache_data
+
+
+@dataclass
+class CacheStatistics:
+    """Cache usage statistics accumulated over the runs, stored next to the cache entries."""
+
+    last_prune: float = 0.0
+    hits: dict[str, int] = field(default_factory=dict)
+    misses: dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert to dictionary for serialization.
+
+        Returns:
+            Dictionary representation of the cache statistics.
+
+        """
+        return {"last_prune": self.last_prune, "hits": self.hits, "misses": self.misses}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CacheStatistics:
+        """
+        Create from dictionary loaded from cache.
+
+        Returns:
+            CacheStatistics: The cache statistics object.
+
+        """
+        return cls(last_prune=data["last_prune"], hits=dict(data["hits"]), misses=dict(data["misses"]))
+
+
+@dataclass(frozen=True)
+class SectionStatistics:
+    """Size and usage statistics of a single cache section."""
+
+    entries: int
+    size: int
+    hits: int
+    misses: int
+
+    @property
+    def hit_rate(self) -> float | None:
+        """Ratio of the cache lookups that returned a valid entry, or None if the cache was not used yet."""
+        lookups = self.hits + self.misses
+        if not lookups:
+            return None
+        return self.hits / lookups
+
+
+def _entry_source(
+    key: str,
+    entry: LinterCacheEntry | FormatterCacheEntry | LibraryCacheEntry | ProjectCacheEntry | ProjectChecksCacheEntry,
+) -> Path:
+    """Return the path of the file (or the project directory) the entry was created for."""
+    if isinstance(entry, LibraryCacheEntry):
+        return Path(entry.source)
+    if isinstance(entry, ProjectChecksCacheEntry):
+        return Path(entry.root)
+    return Path(key)
 
 
 class RobocopCache:
@@ -325,7 +772,7 @@ class RobocopCache:
     Manages file-level caching for linter and formatter.
 
     The cache stores results keyed by absolute file path, with metadata
-    for invalidation (mtime, size, config hash).
+    for invalidation (mtime, size, config hash and optionally content hash).
     """
 
     def __init__(
@@ -333,6 +780,10 @@ class RobocopCache:
         cache_dir: Path,
         enabled: bool,
         verbose: bool,
+        *,
+        content_hash: bool = False,
+        max_size: int = 0,
+        max_config_hashes: int = defaults.CACHE_MAX_CONFIG_HASHES,
     ) -> None:
         """
         Initialize the cache.
@@ -341,12 +792,22 @@ class RobocopCache:
             cache_dir: Custom cache directory. Defaults to .robocop_cache in cwd.
             enabled: Whether caching is enabled.
             verbose: Whether to print verbose messages (e.g., on errors).
+            content_hash: Whether to store the hash of the file content and use it to validate entries of the files
+                with modified mtime, for example after a fresh checkout of the repository.
+            max_size: Maximum size of the cache in bytes. The least recently used entries are removed when the cache
+                is pruned and its size exceeds the limit. 0 means no limit.
+            max_config_hashes: Number of the most recently used configurations to keep the project checks results
+                for per project when the cache is pruned. 0 means no limit.
 
         """
         self.enabled = enabled
         self.cache_dir = cache_dir
         self.verbose = verbose
+        self.content_hash = content_hash
+        self.max_size = max_size
+        self.max_config_hashes = max_config_hashes
         self._dirty = False
+        self._pruned = False
         self._path_cache: dict[Path, str] = {}  # Instance-bound path normalization cache
 
     @cached_property
@@ -355,50 +816,210 @@ class RobocopCache:
         return self._load()
 
     def _load(self) -> CacheData:
-        """Load cache from disk."""
-        # Handle missing cache directory (first run)
-        if not self.cache_dir.exists():
-            return CacheData()
+        """
+        Create cache data bound to the cache directory.
 
-        cache_file = self.cache_dir / defaults.CACHE_FILE_NAME
+        Entries are read from the disk only when they are accessed.
+        """
+        return CacheData(self.cache_dir)
+
+    def save(self) -> None:
+        """
+        Save modified cache entries and usage statistics to disk.
+
+        Stale entries are pruned before saving if the cache was not pruned for a day.
+        """
+        if not self.enabled:
+            return
+        lookups = any(section.hits or section.misses for section in self.data.sections.values())
+        if not self._dirty and not self._pruned and not lookups:
+            return
 
-        if not cache_file.is_file():
-            return CacheData()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._create_gitignore()
+        self._remove_legacy_cache_file()
 
         try:
-            raw_data = msgpack.unpackb(cache_file.read_bytes(), raw=False, strict_map_key=False)
+            if self._dirty and time.time() - self._read_statistics().last_prune > defaults.CACHE_PRUNE_INTERVAL:
+                self.prune()
+            if self._dirty:
+                self.data.save()
+                self._dirty = False
+            self._save_statistics()
+        except OSError as err:
+            if self.verbose:
+                print(f"Warning: Failed to save cache to {self.cache_dir}: {err}")
 
-            # Invalidate if version changed
-            if raw_data.get("robocop_version") != __version__:
-                return CacheData()
+    def _read_statistics(self) -> CacheStatistics:
+        """
+        Read the cache usage statistics from disk.
 
-            return CacheData.from_dict(raw_data)
+        Returns:
+            Stored statistics, or empty statistics if they are missing or corrupted.
+
+        """
+        statistics_file = self.cache_dir / defaults.CACHE_STATISTICS_FILE_NAME
+        try:
+            return CacheStatistics.from_dict(
+                msgpack.unpackb(statistics_file.read_bytes(), raw=False, strict_map_key=False)
+            )
         except (
             msgpack.exceptions.UnpackException,
             msgpack.exceptions.ExtraData,
+            AttributeError,
             KeyError,
             TypeError,
+            ValueError,
             OSError,
         ):
-            # Corrupted cache - start fresh
-            return CacheData()
+            return CacheStatistics()
 
-    def save(self) -> None:
-        """Save cache to disk if modified."""
-        should_skip = not self.enabled or not self._dirty
-        if should_skip:
-            return
+    def _save_statistics(self) -> None:
+        """
+        Add the lookups of this run to the stored statistics and save them.
 
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self._create_gitignore()
-        cache_file = self.cache_dir / defaults.CACHE_FILE_NAME
+        Statistics are read just before writing, so lookups counted by other processes are preserved.
+        """
+        statistics = self._read_statistics()
+        for name, section in self.data.sections.items():
+            statistics.hits[name] = statistics.hits.get(name, 0) + section.hits
+            statistics.misses[name] = statistics.misses.get(name, 0) + section.misses
+        if self._pruned:
+            statistics.last_prune = time.time()
+        statistics_file = self.cache_dir / defaults.CACHE_STATISTICS_FILE_NAME
+        temp_file = statistics_file.with_name(f"{statistics_file.name}.{os.getpid()}.tmp")
+        try:
+            temp_file.write_bytes(msgpack.packb(statistics.to_dict(), use_bin_type=True))
+            temp_file.replace(statistics_file)
+        finally:
+            temp_file.unlink(missing_ok=True)
+        for section in self.data.sections.values():
+            section.hits = section.misses = 0
+        self._pruned = False
+
+    def get_statistics(self) -> dict[str, SectionStatistics]:
+        """
+        Get the size and usage statistics of the cache sections.
+
+        Returns:
+            Statistics of every cache section by its name.
+
+        """
+        statistics = self._read_statistics()
+        return {
+            name: SectionStatistics(
+                entries=len(section),
+                size=section.disk_size(),
+                hits=statistics.hits.get(name, 0) + section.hits,
+                misses=statistics.misses.get(name, 0) + section.misses,
+            )
+            for name, section in self.data.sections.items()
+        }
+
+    def prune(self, max_size: int | None = None, max_config_hashes: int | None = None) -> dict[str, int]:
+        """
+        Remove stale entries from the cache.
+
+        Removed are the entries of files that no longer exist and the project checks results of the configurations
+        not used recently. If the cache is still bigger than the maximum size, the least recently used entries are
+        removed as well. Pruning loads the whole cache.
+
+        Args:
+            max_size: Maximum size of the cache in bytes. Defaults to the limit set for the cache.
+            max_config_hashes: Number of configurations to keep the project checks results for per project.
+                Defaults to the limit set for the cache.
+
+        Returns:
+            Number of removed entries by the cache section name.
+
+        """
+        max_size = self.max_size if max_size is None else max_size
+        max_config_hashes = self.max_config_hashes if max_config_hashes is None else max_config_hashes
+        removed = {}
+        for name, section in self.data.sections.items():
+            stale_keys = self._get_stale_keys(section)
+            if section is self.data.project_checks and max_config_hashes:
+                stale = set(stale_keys)
+                stale_keys.extend(
+                    key for key in self._get_old_configuration_keys(section, max_config_hashes) if key not in stale
+                )
+            for key in stale_keys:
+                del section[key]
+            removed[name] = len(stale_keys)
+        if max_size:
+            for name, key in self._get_least_recently_used_keys(max_size):
+                del self.data.sections[name][key]
+                removed[name] += 1
+        if any(removed.values()):
+            self._dirty = True
+        self._pruned = True
+        return removed
+
+    @staticmethod
+    def _get_stale_keys(section: CacheSection) -> list[str]:
+        """
+        Find entries of files that no longer exist.
+
+        Returns:
+            Keys of the stale entries.
+
+        """
+        return [key for key, entry in section.items() if not _entry_source(key, entry).exists()]
+
+    @staticmethod
+    def _get_old_configuration_keys(section: CacheSection, max_config_hashes: int) -> list[str]:
+        """
+        Find the project checks results of the configurations that were not used recently.
+
+        Other entries are stored by the file path and replaced when the file is cached with a new configuration, but
+        the project checks results are stored for every configuration of the project separately. Only the results of
+        ``max_config_hashes`` most recently used configurations of every project are kept. The entries last accessed
+        at the same time are all kept.
+
+        Returns:
+            Keys of the old entries.
+
+        """
+        by_root: dict[str, list[tuple[float, str]]] = {}
+        for key, entry in section.items():
+            by_root.setdefault(entry.root, []).append((entry.last_access, key))
+        old_keys = []
+        for entries in by_root.values():
+            if len(entries) <= max_config_hashes:
+                continue
+            oldest_kept = sorted((last_access for last_access, _ in entries), reverse=True)[max_config_hashes - 1]
+            old_keys.extend(key for last_access, key in entries if last_access < oldest_kept)
+        return old_keys
+
+    def _get_least_recently_used_keys(self, max_size: int) -> list[tuple[str, str]]:
+        """
+        Find the least recently used entries that need to be removed to fit the cache in the maximum size.
+
+        Returns:
+            Section names and keys of the entries to remove.
 
+        """
+        entries = []
+        total_size = 0
+        for name, section in self.data.sections.items():
+            for key, entry in section.items():
+                size = len(msgpack.packb(entry.to_dict(), use_bin_type=True))
+                entries.append((entry.last_access, name, key, size))
+                total_size += size
+        to_remove = []
+        for _, name, key, size in sorted(entries):
+            if total_size <= max_size:
+                break
+            to_remove.append((name, key))
+            total_size -= size
+        return to_remove
+
+    def _remove_legacy_cache_file(self) -> None:
+        """Remove the cache file used by previous versions that stored the whole cache in a single file."""
         try:
-            cache_file.write_bytes(msgpack.packb(self.data.to_dict(), use_bin_type=True))
-            self._dirty = False
-        except OSError as err:
-            if self.verbose:
-                print(f"Warning: Failed to save cache to {cache_file}: {err}")
+            (self.cache_dir / defaults.LEGACY_CACHE_FILE_NAME).unlink(missing_ok=True)
+        except OSError:
+            pass
 
     def _create_gitignore(self) -> None:
         """Create .gitignore file in cache directory to prevent committing cache files."""
@@ -412,7 +1033,7 @@ class RobocopCache:
 
     def invalidate_all(self) -> None:
         """Clear the entire cache."""
-        self.data = CacheData()
+        self.data.clear()
         self._dirty = True
 
     def _normalize_path(self, path: Path) -> str:
@@ -431,37 +1052,107 @@ class RobocopCache:
             self._path_cache[path] = str(path.resolve())
         return self._path_cache[path]
 
-    @staticmethod
+    def _get_metadata(self, path: Path) -> FileMetadata:
+        """
+        Get metadata of the file stored with the cache entry.
+
+        Returns:
+            FileMetadata: The metadata of the file, with the content hash if content hash validation is enabled.
+
+        """
+        return FileMetadata.from_path(path, content_hash=self.content_hash)
+
     def _is_entry_valid(
+        self,
+        entries: CacheSection,
+        key: str,
         path: Path,
-        entry_metadata: FileMetadata,
         config_hash: str,
         entry_config_hash: str,
     ) -> bool:
         """
         Check if a cache entry is still valid.
 
+        If the file mtime changed but the content hash did not, the entry is valid and its metadata is updated, so
+        the content is not hashed again in the next run. Invalid entry is removed from the cache.
+
+        Args:
+            entries: Cache section containing the cache entry.
+            key: Key of the cache entry.
+            path: Path to the file the entry was created for.
+            config_hash: Hash of the current configuration.
+            entry_config_hash: Hash of the configuration stored with the entry.
+
         Returns:
             True if the cache entry is valid, False otherwise.
 
         """
+        entry = entries[key]
+        now = time.time()
         # Check the cheapest condition first (string comparison)
-        if config_hash != entry_config_hash:
-            return False
+        valid = config_hash == entry_config_hash
+        if valid:
+            # Then check file metadata (requires I/O)
+            metadata = self._get_unchanged_metadata(path, entry.metadata)
+            valid = metadata is not None
+            if metadata is not None and metadata is not entry.metadata:
+                entries[key] = entry = replace(entry, metadata=metadata, last_access=now)
+                self._dirty = True
+        if valid:
+            entries.hits += 1
+            # last access is used to find the least recently used entries, and it does not need to be exact
+            if now - entry.last_access > defaults.CACHE_ACCESS_RESOLUTION:
+                entries[key] = replace(entry, last_access=now)
+                self._dirty = True
+        else:
+            entries.misses += 1
+            del entries[key]
+            self._dirty = True
+        return valid
+
+    def _get_unchanged_metadata(self, path: Path, entry_metadata: FileMetadata) -> FileMetadata | None:
+        """
+        Check if the file is the same as when its metadata was stored in the cache.
+
+        Returns:
+            Stored metadata if the file did not change, metadata with the new modification time if only the
+            modification time changed, or None if the file changed or does not exist.
 
-        # Then check file metadata (requires I/O)
+        """
         try:
             current_metadata = FileMetadata.from_path(path)
         except OSError:
-            return False
+            return None
+        if current_metadata.size != entry_metadata.size:
+            return None
+        if current_metadata.mtime == entry_metadata.mtime:
+            return entry_metadata
+        if not self._is_content_unchanged(path, entry_metadata):
+            return None
+        return replace(current_metadata, content_hash=entry_metadata.content_hash)
+
+    def _is_content_unchanged(self, path: Path, entry_metadata: FileMetadata) -> bool:
+        """
+        Check if the file content is the same as when the cache entry was created.
+
+        The content hash is only calculated when content hash validation is enabled and the entry has a stored hash.
+
+        Returns:
+            True if the content hash of the file matches the hash stored in the entry, False otherwise.
 
-        return current_metadata.mtime == entry_metadata.mtime and current_metadata.size == entry_metadata.size
+        """
+        if not self.content_hash or entry_metadata.content_hash is None:
+            return False
+        try:
+            return file_content_hash(path) == entry_metadata.content_hash
+        except OSError:
+            return False
 
     # Generic cache entry methods
 
     def _get_entry(
         self,
-        cache_dict: dict[str, LinterCacheEntry] | dict[str, FormatterCacheEntry],
+        cache_dict: CacheSection[LinterCacheEntry] | CacheSection[FormatterCacheEntry],
         path: Path,
         config_hash: str,
     ) -> LinterCacheEntry | FormatterCacheEntry | None:
@@ -469,7 +1160,7 @@ class RobocopCache:
         Retrieve and validate a cache entry.
 
         Args:
-            cache_dict: Dictionary containing cache entries (linter or formatter).
+            cache_dict: Cache section containing cache entries (linter or formatter).
             path: Absolute path to the file.
             config_hash: Hash of the current configuration.
 
@@ -484,15 +1175,13 @@ class RobocopCache:
         entry = cache_dict.get(str_path)
 
         if entry is None:
+            cache_dict.misses += 1
             return None
 
-        if not self._is_entry_valid(path, entry.metadata, config_hash, entry.config_hash):
-            # Invalidate stale entry
-            del cache_dict[str_path]
-            self._dirty = True
+        if not self._is_entry_valid(cache_dict, str_path, path, config_hash, entry.config_hash):
             return None
 
-        return entry
+        return cache_dict[str_path]
 
     # Linter cache methods
 
@@ -528,7 +1217,7 @@ class RobocopCache:
         if not self.enabled:
             return
         try:
-            metadata = FileMetadata.from_path(path)
+            metadata = self._get_metadata(path)
         except OSError:
             return
 
@@ -536,6 +1225,7 @@ class RobocopCache:
             metadata=metadata,
             config_hash=config_hash,
             diagnostics=tuple(CachedDiagnostic.from_diagnostic(d) for d in diagnostics),
+            last_access=time.time(),
         )
         str_path = self._normalize_path(path)
         self.data.linter[str_path] = entry
@@ -575,7 +1265,7 @@ class RobocopCache:
         if not self.enabled:
             return
         try:
-            metadata = FileMetadata.from_path(path)
+            metadata = self._get_metadata(path)
         except OSError:
             return
 
@@ -583,6 +1273,7 @@ class RobocopCache:
             metadata=metadata,
             config_hash=config_hash,
             needs_formatting=needs_formatting,
+            last_access=time.time(),
         )
         str_path = self._normalize_path(path)
         self.data.formatter[str_path] = entry
@@ -609,10 +1300,11 @@ class RobocopCache:
             return None
         entry = self.data.libraries.get(key)
         if entry is None:
+            self.data.libraries.misses += 1
             return None
-        if not self._is_entry_valid(Path(entry.source), entry.metadata, environment_hash, entry.environment_hash):
-            del self.data.libraries[key]
-            self._dirty = True
+        if not self._is_entry_valid(
+            self.data.libraries, key, Path(entry.source), environment_hash, entry.environment_hash
+        ):
             return None
         return entry.response
 
@@ -630,7 +1322,7 @@ class RobocopCache:
         if not self.enabled:
             return
         try:
-            metadata = FileMetadata.from_path(source)
+            metadata = self._get_metadata(source)
         except OSError:
             return
         self.data.libraries[key] = LibraryCacheEntry(
@@ -638,6 +1330,7 @@ class RobocopCache:
             environment_hash=environment_hash,
             source=str(source),
             response=response,
+            last_access=time.time(),
         )
         self._dirty = True
 
@@ -660,12 +1353,11 @@ class RobocopCache:
         str_path = self._normalize_path(path)
         entry = self.data.project.get(str_path)
         if entry is None:
+            self.data.project.misses += 1
             return None
-        if not self._is_entry_valid(path, entry.metadata, config_hash, entry.config_hash):
-            del self.data.project[str_path]
-            self._dirty = True
+        if not self._is_entry_valid(self.data.project, str_path, path, config_hash, entry.config_hash):
             return None
-        return entry.collected
+        return self.data.project[str_path].collected
 
     def set_project_entry(self, path: Path, config_hash: str, collected: dict[str, Any]) -> None:
         """
@@ -680,16 +1372,232 @@ class RobocopCache:
         if not self.enabled:
             return
         try:
-            metadata = FileMetadata.from_path(path)
+            metadata = self._get_metadata(path)
         except OSError:
             return
         self.data.project[self._normalize_path(path)] = ProjectCacheEntry(
             metadata=metadata,
             config_hash=config_hash,
             collected=collected,
+            last_access=time.time(),
         )
         self._dirty = True
 
+    def get_project_imports(
+        self, path: Path, config_hash: str, resolution_hash: str, checked: dict[str, bool] | None = None
+    ) -> dict[str, Any] | None:
+        """
+        Get imports of the source file resolved to paths, if they would still be resolved the same way.
+
+        The imports are valid if the source file is the same as when its collected data was stored, and if none of
+        the paths checked while resolving the imports was created, removed or modified since.
+
+        Args:
+            path: Absolute path to the source file.
+            config_hash: Hash of the configuration that affects parsing and collecting.
+            resolution_hash: Hash of the configuration that affects resolving the imports.
+            checked: Validity of the checked paths, shared between the files importing the same paths.
+
+        Returns:
+            Serialized resolved imports if valid, None otherwise.
+
+        """
+        if not self.enabled:
+            return None
+        entry = self.data.project.get(self._normalize_path(path))
+        if entry is None or entry.imports is None or entry.resolution_hash != resolution_hash:
+            return None
+        if entry.config_hash != config_hash or self._get_unchanged_metadata(path, entry.metadata) is None:
+            return None
+        if checked is None:
+            checked = {}
+        for checked_path, metadata in entry.checked_paths.items():
+            valid = checked.get(checked_path)
+            if valid is None:
+                valid = checked[checked_path] = self._is_checked_path_unchanged(Path(checked_path), metadata)
+            if not valid:
+                return None
+        return entry.imports
+
+    def _is_checked_path_unchanged(self, path: Path, metadata: FileMetadata | None) -> bool:
+        """
+        Check if the path checked while resolving imports is the same as when the imports were resolved.
+
+        Returns:
+            True if the file did not change, or if the path still does not point to a file.
+
+        """
+        if metadata is None:
+            return not path.is_file()
+        return self._get_unchanged_metadata(path, metadata) is not None
+
+    def set_project_imports(
+        self,
+        path: Path,
+        config_hash: str,
+        resolution_hash: str,
+        imports: dict[str, Any],
+        checked_paths: Iterable[Path],
+    ) -> None:
+        """
+        Store imports of the source file resolved to paths in the cache, next to its collected data.
+
+        Args:
+            path: Absolute path to the source file.
+            config_hash: Hash of the configuration that affects parsing and collecting.
+            resolution_hash: Hash of the configuration that affects resolving the imports.
+            imports: Serialized resolved imports.
+            checked_paths: Paths checked while resolving the imports, existing or not.
+
+        """
+        if not self.enabled:
+            return
+        key = self._normalize_path(path)
+        entry = self.data.project.get(key)
+        if entry is None or entry.config_hash != config_hash:
+            return
+        try:
+            metadata = {
+                str(checked_path): self._get_metadata(checked_path) if checked_path.is_file() else None
+                for checked_path in checked_paths
+            }
+        except OSError:
+            return
+        self.data.project[key] = replace(
+            entry, resolution_hash=resolution_hash, checked_paths=metadata, imports=imports, last_access=time.time()
+        )
+        self._dirty = True
+
+    # Project checks cache methods
+
+    def get_project_checks_entry(
+        self, root: Path, config_hash: str, files_hash: str
+    ) -> tuple[tuple[str, CachedDiagnostic], ...] | None:
+        """
+        Get diagnostics reported by the project checkers if none of the project files changed.
+
+        Args:
+            root: Root directory of the project.
+            config_hash: Hash of the configuration that affects the project checks.
+            files_hash: Hash of the paths and configurations of all project source files.
+
+        Returns:
+            Cached diagnostics together with their source paths if valid, None otherwise.
+
+        """
+        if not self.enabled:
+            return None
+        section = self.data.project_checks
+        key = self._project_checks_key(root, config_hash)
+        entry = section.get(key)
+        if entry is None:
+            section.misses += 1
+            return None
+        # the list of files is compared first, since it does not require any I/O
+        valid = entry.files_hash == files_hash
+        dependencies: dict[str, FileMetadata] = {}
+        for path, metadata in entry.dependencies.items():
+            if not valid:
+                break
+            unchanged = self._get_unchanged_metadata(Path(path), metadata)
+            valid = unchanged is not None
+            if unchanged is not None:
+                dependencies[path] = unchanged
+        if not valid:
+            # the outdated entry is kept, so that only the diagnostics affected by the changes are updated
+            section.misses += 1
+            return None
+        section.hits += 1
+        now = time.time()
+        if dependencies != entry.dependencies or now - entry.last_access > defaults.CACHE_ACCESS_RESOLUTION:
+            section[key] = replace(entry, dependencies=dependencies, last_access=now)
+            self._dirty = True
+        return entry.diagnostics
+
+    def get_outdated_project_checks_entry(
+        self, root: Path, config_hash: str
+    ) -> tuple[ProjectChecksCacheEntry, set[Path]] | None:
+        """
+        Get the entry of the project checks together with the files it depends on that changed since.
+
+        Args:
+            root: Root directory of the project.
+            config_hash: Hash of the configuration that affects the project checks.
+
+        Returns:
+            The entry and the paths of the changed or removed dependencies, or None if there is no entry.
+
+        """
+        if not self.enabled:
+            return None
+        entry = self.data.project_checks.get(self._project_checks_key(root, config_hash))
+        if entry is None:
+            return None
+        changed = {
+            Path(path)
+            for path, metadata in entry.dependencies.items()
+            if self._get_unchanged_metadata(Path(path), metadata) is None
+        }
+        return entry, changed
+
+    def set_project_checks_entry(
+        self,
+        root: Path,
+        config_hash: str,
+        files_hash: str,
+        dependencies: Iterable[Path],
+        diagnostics: list[Diagnostic],
+        file_configs: dict[Path, str] | None = None,
+        imported_by: dict[Path, set[Path]] | None = None,
+    ) -> None:
+        """
+        Store diagnostics reported by the project checkers in the cache.
+
+        Args:
+            root: Root directory of the project.
+            config_hash: Hash of the configuration that affects the project checks.
+            files_hash: Hash of the paths and configurations of all project source files.
+            dependencies: Files the diagnostics depend on: project source files and files imported by them.
+            diagnostics: Diagnostics reported by the project checkers.
+            file_configs: Hashes of the configurations of the project source files, by resolved path.
+            imported_by: Project source files importing every imported file, by resolved path of the imported file.
+
+        """
+        if not self.enabled:
+            return
+        try:
+            metadata = {self._normalize_path(path): self._get_metadata(path) for path in dependencies}
+        except OSError:
+            return
+        self.data.project_checks[self._project_checks_key(root, config_hash)] = ProjectChecksCacheEntry(
+            root=self._normalize_path(root),
+            config_hash=config_hash,
+            files_hash=files_hash,
+            dependencies=metadata,
+            diagnostics=tuple(
+                (self._normalize_path(diag.source.path), CachedDiagnostic.from_diagnostic(diag)) for diag in diagnostics
+            ),
+            last_access=time.time(),
+            file_configs={str(path): file_config for path, file_config in (file_configs or {}).items()},
+            imported_by={
+                str(path): tuple(sorted(str(importer) for importer in importers))
+                for path, importers in (imported_by or {}).items()
+            },
+        )
+        self._dirty = True
+
+    def _project_checks_key(self, root: Path, config_hash: str) -> str:
+        """
+        Build the key of the project checks entry.
+
+        Results of every configuration are stored separately, so switching between configurations reuses them.
+
+        Returns:
+            Key built from the project root and the configuration hash.
+
+        """
+        return f"{self._normalize_path(root)}::{config_hash}"
+
 
 def restore_diagnostics(
     cached_entry: LinterCacheEntry,
@@ -710,11 +1618,32 @@ def restore_diagnostics(
         List of restored diagnostics, or None if restoration failed
         (e.g. rule no longer exists).
 
+    """
+    return restore_cached_diagnostics(cached_entry.diagnostics, source, config, resolved_config)
+
+
+def restore_cached_diagnostics(
+    cached_diagnostics: Iterable[CachedDiagnostic],
+    source: Path,
+    config: Config,
+    resolved_config: ResolvedConfig,
+) -> list[Diagnostic] | None:
+    """
+    Restore Diagnostic objects from serialized diagnostics.
+
+    Diagnostics are serialized both for the cache and for sending them from the worker processes.
+    The severity is restored as it was reported, since it can depend on the reported value
+    (``severity_threshold``).
+
+    Returns:
+        List of restored diagnostics, or None if any of the rules does not exist.
+
     """
     from robocop.linter.diagnostics import Diagnostic  # noqa: PLC0415
+    from robocop.linter.rules import RuleSeverity  # noqa: PLC0415
 
     restored = []
-    for cached_diag in cached_entry.diagnostics:
+    for cached_diag in cached_diagnostics:
         # Try to find rule by ID first, fall back to name
         rule = resolved_config.rules.get(cached_diag.rule_id)
         if rule is None:
@@ -733,6 +1662,7 @@ def restore_diagnostics(
             end_col=cached_diag.end_col,
             **dict(cached_diag.arguments),
         )
+        diagnostic.severity = RuleSeverity(cached_diag.severity)
         restored.append(diagnostic)
 
     return restored
@@ -96,8 +96,12 @@ class ConfigBuilder:
         analyze_libraries = resolve(cli_raw, file_raw, "analyze_libraries", defaults.ANALYZE_LIBRARIES)
         load_library_timeout = resolve(cli_raw, file_raw, "load_library_timeout", defaults.LOAD_LIBRARY_TIMEOUT)
         library_workers = resolve(cli_raw, file_raw, "library_workers", defaults.LIBRARY_WORKERS)
+        library_import_budget = resolve(cli_raw, file_raw, "library_import_budget", defaults.LIBRARY_IMPORT_BUDGET)
+        shared_library_cache = resolve(cli_raw, file_raw, "shared_library_cache", defaults.SHARED_LIBRARY_CACHE)
         ignored_libraries: list[str] = merge_lists(file_raw, cli_raw, "ignored_libraries")
+        library_specs: list[str] = merge_lists(file_raw, cli_raw, "library_specs")
         force_exclude = resolve(cli_raw, file_raw, "force_exclude", defaults.FORCE_EXCLUDE)
+        jobs = resolve(cli_raw, file_raw, "jobs", defaults.JOBS)
         verbose = resolve(cli_raw, file_raw, "verbose", defaults.VERBOSE)
         silent = resolve(cli_raw, file_raw, "silent", defaults.SILENT)
 
@@ -149,8 +153,12 @@ class ConfigBuilder:
             analyze_libraries=analyze_libraries,
             load_library_timeout=load_library_timeout,
             library_workers=library_workers,
+            library_import_budget=library_import_budget,
+            shared_library_cache=shared_library_cache,
+            library_specs=library_specs,
             ignored_libraries=ignored_libraries,
             force_exclude=force_exclude,
+            jobs=jobs,
             verbose=verbose,
             silent=silent,
             target_version=validated_version,
@@ -339,7 +347,16 @@ class ConfigBuilder:
     def cache_config_from_raw(self, cli_raw: RawCacheConfig | None, file_raw: RawCacheConfig | None) -> CacheConfig:
         enabled = resolve(cli_raw, file_raw, "enabled", default=True)
         cache_dir = resolve(cli_raw, file_raw, "cache_dir", Path.cwd() / defaults.CACHE_DIR_NAME)
-        return CacheConfig(enabled=enabled, cache_dir=cache_dir)
+        content_hash = resolve(cli_raw, file_raw, "content_hash", defaults.CACHE_CONTENT_HASH)
+        max_size = resolve(cli_raw, file_raw, "max_size", defaults.CACHE_MAX_SIZE)
+        max_config_hashes = resolve(cli_raw, file_raw, "max_config_hashes", defaults.CACHE_MAX_CONFIG_HASHES)
+        return CacheConfig(
+            enabled=enabled,
+            cache_dir=cache_dir,
+            content_hash=content_hash,
+            max_size=max_size,
+            max_config_hashes=max_config_hashes,
+        )
 
     def file_filters_from_raw(
         self, cli_raw: RawFileFiltersOptions | None, file_raw: RawFileFiltersOptions | None
@@ -27,6 +27,7 @@ SKIP_OPTIONS = frozenset(
 FORCE_EXCLUDE = False
 VERBOSE = False
 SILENT = False
+JOBS = 1  # 0: use the number of available CPUs
 
 # project checks
 
@@ -34,11 +35,21 @@ PROJECT: bool | None = None  # None: run project checks only if any project rule
 ANALYZE_LIBRARIES = True
 LOAD_LIBRARY_TIMEOUT = 10
 LIBRARY_WORKERS = False
+LIBRARY_IMPORT_BUDGET = 0  # in seconds, time limit for importing all libraries, 0 means no limit
+SHARED_LIBRARY_CACHE = True
+LIBRARY_CACHE_MAX_SIZE = 100  # in megabytes, size of the library cache shared by all projects
 
 # cache
 
 CACHE_DIR_NAME = ".robocop_cache"
-CACHE_FILE_NAME = "cache.msgpack"
+LEGACY_CACHE_FILE_NAME = "cache.msgpack"  # single file cache used before the cache was sharded
+CACHE_SHARD_DIGEST_SIZE = 1  # bytes of the key hash used as the shard name (256 shards per section)
+CACHE_CONTENT_HASH = False
+CACHE_MAX_SIZE = 0  # in megabytes, 0: no limit
+CACHE_MAX_CONFIG_HASHES = 5  # per project, 0: keep project checks results for all configurations
+CACHE_STATISTICS_FILE_NAME = "statistics.msgpack"
+CACHE_PRUNE_INTERVAL = 24 * 60 * 60  # seconds between automatic pruning of the cache
+CACHE_ACCESS_RESOLUTION = 24 * 60 * 60  # seconds before the last access time of a used entry is updated
 
 # reports cache
 
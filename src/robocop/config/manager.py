@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
 import pathspec
 from pathspec.patterns.gitwildmatch import GitWildMatchPattern
@@ -12,6 +13,8 @@ from robocop.cache import RobocopCache
 from robocop.config.builder import ConfigBuilder
 from robocop.config.parser import read_toml_config
 from robocop.config.schema import Config, RawConfig
+from robocop.runtime import git
+from robocop.runtime.shard import Shard, split_into_shards
 from robocop.source_file import SourceFile
 
 if TYPE_CHECKING:
@@ -19,6 +22,43 @@ if TYPE_CHECKING:
 
 CONFIG_NAMES = ("robocop.toml", "robot.toml", "pyproject.toml")
 GitIgnorePathSpec = pathspec.PathSpec
+MAX_DISCOVERY_THREADS = 16
+"""Maximum number of threads listing the directories in parallel."""
+
+
+class DirectoryEntry(NamedTuple):
+    """File or directory found in the directory, with the file type read together with the directory listing."""
+
+    name: str
+    is_dir: bool
+    is_file: bool
+    is_symlink: bool
+
+
+def list_directory(directory: Path) -> list[DirectoryEntry]:
+    """
+    List the directory with ``os.scandir``.
+
+    The file type is usually returned by the operating system together with the names of the files, so it does not
+    need a separate system call for every file.
+
+    Returns:
+        Entries of the directory, in the order returned by the operating system. Empty if the directory can't be read.
+
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return [
+                DirectoryEntry(
+                    entry.name,
+                    entry.is_dir(follow_symlinks=False),
+                    entry.is_file(follow_symlinks=False),
+                    entry.is_symlink(),
+                )
+                for entry in entries
+            ]
+    except OSError:
+        return []
 
 
 class GitIgnoreResolver:
@@ -26,15 +66,27 @@ class GitIgnoreResolver:
         self.cached_ignores: dict[Path, tuple[Path, GitIgnorePathSpec]] = {}
         self.ignore_dirs: set[Path] = set()
 
-    def path_excluded(self, path: Path, gitignores: list[tuple[Path, GitIgnorePathSpec]]) -> bool:
-        """Find path gitignores and check if file is excluded."""
+    def path_excluded(
+        self, path: Path, gitignores: list[tuple[Path, GitIgnorePathSpec]], is_dir: bool | None = None
+    ) -> bool:
+        """
+        Find path gitignores and check if file is excluded.
+
+        Args:
+            path: path to file/directory
+            gitignores: gitignores that apply to the path
+            is_dir: whether the path is a directory, if already known. Checked on the file system otherwise.
+
+        """
         if not gitignores:
             return False
+        if is_dir is None:
+            is_dir = path.is_dir()
         for gitignore_path, gitignore in gitignores:
             relative_path = files.get_relative_path(path, gitignore_path)
             path_str = str(relative_path)
             # fixes a bug in pathspec where directory needs to end with / to be ignored by pattern
-            if relative_path.is_dir() and path_str != ".":
+            if is_dir and path_str != ".":
                 path_str = f"{path_str}{os.sep}"
             if gitignore.match_file(path_str):
                 return True
@@ -101,6 +153,8 @@ class ConfigManager:
         skip_gitignore: bool = False,
         force_exclude: bool = False,
         overwrite_config: RawConfig | None = None,
+        changed_since: str | None = None,
+        shard: Shard | None = None,
     ) -> None:
         """
         Initialize ConfigManager.
@@ -115,6 +169,8 @@ class ConfigManager:
             skip_gitignore: Do not load .gitignore files when looking for the files to parse
             force_exclude: Enforce exclusions, even for paths passed directly in the command-line
             overwrite_config: Overwrite existing configuration file with the Config class
+            changed_since: Git reference. If set, only files changed since the reference are selected
+            shard: Part of the selected files to process, if the files are split between several runs
 
         """
         self.config_builder = ConfigBuilder()
@@ -134,6 +190,10 @@ class ConfigManager:
         self._project_paths: dict[Path, SourceFile] | None = None
         self.resolved_paths = False
         self._cache: RobocopCache | None = None
+        self.changed_since = changed_since
+        self._changed_paths: set[Path] | None = None
+        self.shard = shard
+        self._shards: list[set[Path]] | None = None
 
     @property
     def cache(self) -> RobocopCache:
@@ -144,6 +204,9 @@ class ConfigManager:
                 cache_dir=cache_config.cache_dir,
                 enabled=cache_config.enabled,
                 verbose=self.default_config.verbose,
+                content_hash=cache_config.content_hash,
+                max_size=cache_config.max_size * 1024 * 1024,
+                max_config_hashes=cache_config.max_config_hashes,
             )
         return self._cache
 
@@ -152,7 +215,56 @@ class ConfigManager:
         # TODO: what if we provide the same path twice - tests
         if not self.resolved_paths:
             self.resolve_paths(self.sources, ignore_file_filters=self.ignore_file_filters)
-        yield from self._paths.values()
+        changed_paths = self.changed_paths
+        shard_paths = None if self.shard is None else self.shards[self.shard.index - 1]
+        for path, source_file in self._paths.items():
+            if changed_paths is not None and path not in changed_paths:
+                continue
+            if shard_paths is not None and path not in shard_paths:
+                continue
+            yield source_file
+
+    @property
+    def changed_paths(self) -> set[Path] | None:
+        """
+        Resolved paths of the files changed since the ``changed_since`` git reference.
+
+        The changes are read from git once, when they are needed for the first time. None if all files are selected.
+        """
+        if self.changed_since is None:
+            return None
+        if self._changed_paths is None:
+            self._changed_paths = git.changed_files(self.changed_since, self.root)
+        return self._changed_paths
+
+    @property
+    def shards(self) -> list[set[Path]]:
+        """
+        Resolved paths of the selected files, split into the number of shards given by ``shard``.
+
+        Every run computes all the shards, so it knows which files are linted by the other runs.
+        """
+        if self._shards is None:
+            count = 1 if self.shard is None else self.shard.count
+            if not self.resolved_paths:
+                self.resolve_paths(self.sources, ignore_file_filters=self.ignore_file_filters)
+            changed_paths = self.changed_paths
+            selected = [path for path in self._paths if changed_paths is None or path in changed_paths]
+            self._shards = split_into_shards(selected, count, self.root)
+        return self._shards
+
+    def in_shard(self, path: Path) -> bool:
+        """
+        Check if issues found in the file are reported by the selected shard.
+
+        Files not linted by any shard, such as project files outside the selected sources, belong to the first shard.
+        """
+        if self.shard is None:
+            return True
+        for index, shard_paths in enumerate(self.shards, start=1):
+            if path in shard_paths:
+                return index == self.shard.index
+        return self.shard.index == 1
 
     @property
     def project_paths(self) -> Generator[SourceFile, None, None]:
@@ -245,9 +357,13 @@ class ConfigManager:
             source_file: Path to Robot Framework source file or directory.
 
         """
+        return self.get_config_for_directory(source_file.parent)
+
+    def get_config_for_directory(self, directory: Path) -> Config:
+        """Find the closest config to the files in the directory."""
         if self.overridden_config or self.ignore_file_config:
             return self.default_config
-        return self.find_config_in_dirs(source_file.parents, self.default_config)
+        return self.find_config_in_dirs([directory, *directory.parents], self.default_config)
 
     def resolve_paths(
         self,
@@ -259,7 +375,8 @@ class ConfigManager:
         Find all files to parse and their corresponding configs.
 
         Initially, sources can be ["."] (if not path provided, assume the current working directory).
-        It can be also any list of paths, for example ["tests/", "file.robot"].
+        It can be also any list of paths, for example ["tests/", "file.robot"]. Directories are walked with
+        ``walk_directory``.
 
         Args:
             sources: list of sources from CLI or configuration file.
@@ -290,6 +407,72 @@ class ConfigManager:
                     if self.gitignore_resolver.path_excluded(source_not_resolved, source_gitignore):
                         continue
             if source.is_dir():
-                self.resolve_paths(list(source.iterdir()), target=target)
+                self.walk_directory(source, target)
             elif source.is_file():
                 target[source] = self._paths.get(source) or SourceFile(path=source, config=config)
+
+    def walk_directory(self, directory: Path, target: dict[Path, SourceFile]) -> None:
+        """
+        Find all files to parse in the directory and its subdirectories.
+
+        Excluded and gitignored directories are skipped without listing them. The configuration and gitignores are
+        found once per directory, and the file types come from the directory listing, so the files are not checked
+        one by one on the file system. With more than one job configured, subdirectories are listed in parallel
+        threads while the files are filtered. Files are found in the same order either way.
+
+        Args:
+            directory: resolved path to the directory.
+            target: where the resolved source files are stored.
+
+        """
+        jobs = self.default_config.jobs or os.cpu_count() or 1
+        if jobs == 1:
+            self._walk_directory(directory, list_directory(directory), target, None, {directory})
+            return
+        with ThreadPoolExecutor(max_workers=min(jobs, MAX_DISCOVERY_THREADS)) as executor:
+            self._walk_directory(directory, list_directory(directory), target, executor, {directory})
+
+    def _walk_directory(
+        self,
+        directory: Path,
+        entries: list[DirectoryEntry],
+        target: dict[Path, SourceFile],
+        executor: ThreadPoolExecutor | None,
+        walked: set[Path],
+    ) -> None:
+        config = self.get_config_for_directory(directory)
+        gitignores = [] if self.skip_gitignore else self.gitignore_resolver.resolve_path_ignores(directory)
+        # subdirectories are listed in the background while the rest of the entries is filtered
+        found: list[tuple[Path, Config, bool, Future[list[DirectoryEntry]] | None]] = []
+        for entry in entries:
+            path = directory / entry.name
+            source, is_dir, is_file, source_config = path, entry.is_dir, entry.is_file, config
+            if entry.is_symlink:
+                source = path.resolve()
+                if not source.exists():  # dangling symlink
+                    continue
+                is_dir, is_file = source.is_dir(), source.is_file()
+                source_config = self.get_config_for_source_file(source)
+            if source in target or source in walked:
+                continue
+            if source_config.file_filters.path_excluded(path):
+                continue
+            if is_file and not source_config.file_filters.path_included(path):
+                continue
+            if gitignores and self.gitignore_resolver.path_excluded(path, gitignores, is_dir=is_dir):
+                continue
+            if is_dir:
+                listing = executor.submit(list_directory, source) if executor else None
+                found.append((source, source_config, True, listing))
+            elif is_file:
+                found.append((source, source_config, False, None))
+        for source, source_config, is_dir, listing in found:
+            if is_dir:
+                # the directory is marked as walked only now, so that a symlink to it does not change the order
+                if source in walked:
+                    continue
+                walked.add(source)
+                subdirectory_entries = listing.result() if listing else list_directory(source)
+                self._walk_directory(source, subdirectory_entries, target, executor, walked)
+            else:
+                target[source] = self._paths.get(source) or SourceFile(path=source, config=source_config)
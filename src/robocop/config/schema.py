@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, fields
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -17,6 +17,7 @@ from robocop.config.parser import (
     resolve_relative_path,
     validate_old_config,
 )
+from robocop.files import PathPatterns
 
 if TYPE_CHECKING:
     from robocop.linter.rules import RuleSeverity
@@ -273,16 +274,28 @@ class FormatterConfig:
 class RawCacheConfig:
     enabled: bool | None = None
     cache_dir: Path | None = None
+    content_hash: bool | None = None
+    max_size: int | None = None
+    max_config_hashes: int | None = None
 
     @classmethod
     def from_dict(cls, config: dict[str, Any], config_parent: Path) -> RawCacheConfig:
         enabled = config.pop("cache", True)
         cache_dir = config.pop("cache_dir", None)
+        content_hash = config.pop("cache_content_hash", None)
+        max_size = config.pop("cache_max_size", None)
+        max_config_hashes = config.pop("cache_max_config_hashes", None)
         if cache_dir is not None:
             cache_dir = Path(cache_dir)
             if not cache_dir.is_absolute():
                 cache_dir = config_parent / cache_dir
-        return cls(enabled=enabled, cache_dir=cache_dir)
+        return cls(
+            enabled=enabled,
+            cache_dir=cache_dir,
+            content_hash=content_hash,
+            max_size=max_size,
+            max_config_hashes=max_config_hashes,
+        )
 
 
 @dataclass
@@ -291,6 +304,9 @@ class CacheConfig:
 
     enabled: bool
     cache_dir: Path
+    content_hash: bool = False
+    max_size: int = 0
+    max_config_hashes: int = 5
 
 
 @dataclass
@@ -311,14 +327,20 @@ class RawFileFiltersOptions:
 class FileFiltersOptions:
     included_paths: set[str]
     excluded_paths: set[str]
+    _included: PathPatterns = field(init=False, repr=False, compare=False)
+    _excluded: PathPatterns = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._included = PathPatterns(self.included_paths)
+        self._excluded = PathPatterns(self.excluded_paths)
 
     def path_excluded(self, path: Path) -> bool:
         """Exclude all paths matching exclude patterns."""
-        return any(path.match(pattern) for pattern in self.excluded_paths)
+        return self._excluded.match(path)
 
     def path_included(self, path: Path) -> bool:
         """Only allow paths matching include patterns."""
-        return any(path.match(pattern) for pattern in self.included_paths)
+        return self._included.match(path)
 
 
 @dataclass
@@ -336,8 +358,12 @@ class RawConfig:
     analyze_libraries: bool | None = None
     load_library_timeout: int | None = None
     library_workers: bool | None = None
+    library_import_budget: int | None = None
+    shared_library_cache: bool | None = None
+    library_specs: list[str] | None = None
     ignored_libraries: list[str] | None = None
     force_exclude: bool | None = None
+    jobs: int | None = None
     verbose: bool | None = None
     silent: bool | None = None
     target_version: TargetVersion | None = None
@@ -352,6 +378,9 @@ class RawConfig:
             "sources",
             "cache",
             "cache_dir",
+            "cache_content_hash",
+            "cache_max_size",
+            "cache_max_config_hashes",
             "language",
             "variables",
             "variable_files",
@@ -360,8 +389,12 @@ class RawConfig:
             "analyze_libraries",
             "load_library_timeout",
             "library_workers",
+            "library_import_budget",
+            "shared_library_cache",
+            "library_specs",
             "ignored_libraries",
             "force_exclude",
+            "jobs",
             "verbose",
             "silent",
             "target_version",
@@ -382,7 +415,7 @@ class RawConfig:
             raw_dict["formatter"] = None
         if "target_version" in raw_dict:
             raw_dict["target_version"] = TargetVersion.from_string(str(raw_dict["target_version"]))
-        for path_field in ("variable_files", "python_path"):
+        for path_field in ("variable_files", "python_path", "library_specs"):
             if path_field in raw_dict:
                 raw_dict[path_field] = [
                     resolve_relative_path(path, config_path.parent, ensure_exists=False)
@@ -409,8 +442,12 @@ class Config:
     analyze_libraries: bool
     load_library_timeout: int
     library_workers: bool
+    library_import_budget: int
+    shared_library_cache: bool
+    library_specs: list[str]
     ignored_libraries: list[str]
     force_exclude: bool
+    jobs: int
     verbose: bool
     silent: bool
     target_version: Version
@@ -440,7 +477,11 @@ class Config:
             and self.analyze_libraries == other.analyze_libraries
             and self.load_library_timeout == other.load_library_timeout
             and self.library_workers == other.library_workers
+            and self.library_import_budget == other.library_import_budget
+            and self.shared_library_cache == other.shared_library_cache
+            and self.library_specs == other.library_specs
             and self.ignored_libraries == other.ignored_libraries
+            and self.jobs == other.jobs
             and self.verbose == other.verbose
             and self.silent == other.silent
             and self.target_version == other.target_version
@@ -0,0 +1,9 @@
+"""
+Robocop daemon - a long living process running Robocop commands on behalf of a thin client.
+
+The daemon keeps Robot Framework, loaded rules and formatters and the contexts of analysed projects in memory, so
+repeated runs only pay for the work on the changed files. The client (``robocop-client``) only imports the standard
+library, forwards its arguments and working directory to the daemon and prints the output it streams back.
+
+Modules in this package used by the client must not import anything heavier than the standard library.
+"""
@@ -0,0 +1,95 @@
+"""
+Thin client forwarding Robocop commands to the daemon.
+
+``robocop-client`` accepts the same arguments as ``robocop``. If the daemon is running, the command is run by the
+daemon and the client only prints its output and exits with its exit code. Otherwise, the command is run in the
+client process, as if ``robocop`` was called, so the client can always be used in place of ``robocop``.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from typing import TYPE_CHECKING, Any, TextIO
+
+from robocop.daemon.protocol import connect, default_socket_path, read_message, send_message
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+CONNECTION_LOST_EXIT_CODE = 3
+"""Exit code used when the daemon stops before the command is finished."""
+
+
+def request(
+    message: dict[str, Any], socket_path: Path | None = None, timeout: float | None = None
+) -> dict[str, Any] | None:
+    """
+    Send a request to the daemon and return the final answer. Output messages are ignored.
+
+    Returns:
+        The final message with the exit code, or None if the daemon is not running.
+
+    """
+    connection = connect(socket_path or default_socket_path(), timeout=timeout)
+    if connection is None:
+        return None
+    with connection, connection.makefile("rwb") as stream:
+        send_message(stream, message)
+        while (answer := read_message(stream)) is not None:
+            if "exit_code" in answer:
+                return answer
+    return {"exit_code": CONNECTION_LOST_EXIT_CODE}
+
+
+def run_in_daemon(
+    argv: list[str],
+    socket_path: Path | None = None,
+    stdout: TextIO | None = None,
+    stderr: TextIO | None = None,
+) -> int | None:
+    """
+    Run the Robocop command in the daemon, printing its output as it is produced.
+
+    Args:
+        argv: Command line arguments, without the program name.
+        socket_path: Path to the socket of the daemon. Defaults to :func:`default_socket_path`.
+        stdout: Stream for the standard output of the command. Defaults to ``sys.stdout``.
+        stderr: Stream for the standard error of the command. Defaults to ``sys.stderr``.
+
+    Returns:
+        Exit code of the command, or None if the daemon is not running.
+
+    """
+    connection = connect(socket_path or default_socket_path())
+    if connection is None:
+        return None
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+    with connection, connection.makefile("rwb") as stream:
+        send_message(stream, {"command": "run", "argv": argv, "cwd": os.getcwd()})
+        while (message := read_message(stream)) is not None:
+            if "stdout" in message:
+                stdout.write(message["stdout"])
+                stdout.flush()
+            elif "stderr" in message:
+                stderr.write(message["stderr"])
+                stderr.flush()
+            elif "exit_code" in message:
+                return message["exit_code"]
+    stderr.write("Robocop daemon stopped before finishing the command.\n")
+    return CONNECTION_LOST_EXIT_CODE
+
+
+def main() -> None:
+    exit_code = run_in_daemon(sys.argv[1:])
+    if exit_code is None:
+        from robocop.run import main as run_main  # noqa: PLC0415
+
+        run_main()
+        return
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Communication between the daemon and its clients.
+
+Messages are JSON objects, one per line, sent over a Unix domain socket. The client sends a single request and the
+daemon answers with any number of output messages followed by the final message with the exit code:
+
+- ``{"command": "run", "argv": [...], "cwd": "..."}`` - run Robocop command with given arguments. Answered with
+  ``{"stdout": "..."}`` and ``{"stderr": "..."}`` messages and ``{"exit_code": 0}`` at the end.
+- ``{"command": "status"}`` - answered with ``{"status": {...}, "exit_code": 0}``.
+- ``{"command": "stop"}`` - stop the daemon after answering with ``{"exit_code": 0}``.
+
+Only the standard library is imported, so that the client starts quickly.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import stat
+import tempfile
+from pathlib import Path
+from typing import IO, Any
+
+SOCKET_ENV_VARIABLE = "ROBOCOP_DAEMON_SOCKET"
+"""Environment variable with the path to the socket, used instead of the default path."""
+
+SUPPORTED = hasattr(socket, "AF_UNIX")
+"""Whether the platform supports Unix domain sockets used to communicate with the daemon."""
+
+
+def socket_directory() -> Path:
+    """
+    Return the directory of the default socket, private to the current user.
+
+    The user runtime directory from ``XDG_RUNTIME_DIR`` is used when it is set. Otherwise the directory is created in
+    the temporary directory, which is shared by all users, so the daemon verifies the owner and the permissions of the
+    directory before it creates the socket in it.
+
+    Returns:
+        Path to the directory of the socket.
+
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "robocop"
+    user = os.getuid() if hasattr(os, "getuid") else os.getlogin()
+    return Path(tempfile.gettempdir()) / f"robocop-{user}"
+
+
+def default_socket_path() -> Path:
+    """
+    Return the path to the socket of the daemon.
+
+    The socket is created in the directory private to the current user, so that users do not run commands in each
+    other's daemons.
+
+    Returns:
+        Path from ``ROBOCOP_DAEMON_SOCKET`` environment variable, or the default path.
+
+    """
+    from_env = os.environ.get(SOCKET_ENV_VARIABLE)
+    if from_env:
+        return Path(from_env)
+    return socket_directory() / "daemon.sock"
+
+
+def make_private_directory(directory: Path) -> None:
+    """
+    Create the directory accessible only to the current user, or verify the existing directory.
+
+    Raises:
+        PermissionError: If the directory is a symlink, belongs to another user or is accessible to other users.
+
+    """
+    directory.mkdir(mode=0o700, exist_ok=True)
+    status = directory.lstat()
+    if not stat.S_ISDIR(status.st_mode):
+        raise PermissionError(f"Socket directory {directory} is not a directory")
+    if hasattr(os, "getuid") and status.st_uid != os.getuid():
+        raise PermissionError(f"Socket directory {directory} belongs to another user")
+    if status.st_mode & 0o077:
+        raise PermissionError(f"Socket directory {directory} is accessible to other users")
+
+
+def owned_by_current_user(path: Path) -> bool:
+    """
+    Check if the file belongs to the current user, so that the commands are not sent to the daemon of other user.
+
+    Returns:
+        True if the file belongs to the current user, or if the platform does not have user ids.
+
+    """
+    if not hasattr(os, "getuid"):
+        return True
+    try:
+        return path.stat().st_uid == os.getuid()
+    except OSError:
+        return False
+
+
+def connect(socket_path: Path, timeout: float | None = None) -> socket.socket | None:
+    """
+    Connect to the daemon.
+
+    Returns:
+        Connected socket, or None if the daemon is not running or its socket belongs to another user.
+
+    """
+    if not SUPPORTED or not owned_by_current_user(socket_path):
+        return None
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    connection.settimeout(timeout)
+    try:
+        connection.connect(str(socket_path))
+    except OSError:
+        connection.close()
+        return None
+    connection.settimeout(None)
+    return connection
+
+
+def send_message(stream: IO[bytes], message: dict[str, Any]) -> None:
+    """Write the message to the stream, as a single line of JSON."""
+    stream.write(json.dumps(message).encode("utf-8") + b"\n")
+    stream.flush()
+
+
+def read_message(stream: IO[bytes]) -> dict[str, Any] | None:
+    """
+    Read a single message from the stream.
+
+    Returns:
+        The message, or None if the other side closed the connection.
+
+    """
+    line = stream.readline()
+    if not line:
+        return None
+    return json.loads(line)
@@ -0,0 +1,213 @@
+"""
+Robocop daemon serving the commands sent by the clients.
+
+Commands are run one at a time, in the daemon process, with the output sent back to the client as it is produced.
+A session is started for the lifetime of the daemon, so that loaded rules, formatters and project contexts are
+reused between the commands.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import socket
+import time
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from typing import IO, TYPE_CHECKING, Any
+
+from robocop.daemon.protocol import (
+    SUPPORTED,
+    connect,
+    make_private_directory,
+    owned_by_current_user,
+    read_message,
+    send_message,
+    socket_directory,
+)
+from robocop.exceptions import DaemonError
+from robocop.runtime import session
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+NOT_ALLOWED_COMMANDS = frozenset({"daemon"})
+"""Commands that cannot be run by the daemon."""
+
+
+class StreamingOutput(io.TextIOBase):
+    """Text stream sending everything written to it to the client."""
+
+    def __init__(self, stream: IO[bytes], name: str) -> None:
+        self._stream = stream
+        self._name = name
+        self._disconnected = False
+
+    @property
+    def encoding(self) -> str:
+        return "utf-8"
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return False
+
+    def write(self, text: str) -> int:
+        if text and not self._disconnected:
+            try:
+                send_message(self._stream, {self._name: text})
+            except OSError:  # the client does not wait for the output anymore, the command is finished anyway
+                self._disconnected = True
+        return len(text)
+
+
+class DaemonServer:
+    """
+    Server accepting the connections of the clients on a Unix domain socket.
+
+    Args:
+        socket_path: Path to the socket. The socket can only be used by the current user.
+        idle_timeout: Number of seconds without any request after which the daemon stops. None to run until stopped.
+
+    """
+
+    def __init__(self, socket_path: Path, idle_timeout: float | None = None) -> None:
+        self.socket_path = socket_path
+        self.idle_timeout = idle_timeout
+        self.started = time.time()
+        self.stopped = False
+
+    def serve(self) -> None:
+        """Serve the requests until the daemon is stopped or it is idle for too long."""
+        if not SUPPORTED:
+            raise DaemonError("Robocop daemon requires Unix domain sockets, which are not supported on this platform.")
+        if self.socket_path.parent == socket_directory():
+            try:
+                make_private_directory(self.socket_path.parent)
+            except OSError as error:
+                raise DaemonError(f"Cannot create the socket of Robocop daemon: {error}") from None
+        self._remove_stale_socket()
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        session.start_session()
+        try:
+            # the socket is created without access for other users, instead of changing its permissions after bind
+            previous_umask = os.umask(0o177)
+            try:
+                server.bind(str(self.socket_path))
+            finally:
+                os.umask(previous_umask)
+            server.listen()
+            server.settimeout(self.idle_timeout)
+            while not self.stopped:
+                try:
+                    connection, _ = server.accept()
+                except TimeoutError:
+                    break
+                with connection:
+                    self.handle(connection)
+        finally:
+            server.close()
+            self.socket_path.unlink(missing_ok=True)
+            session.end_session()
+
+    def _remove_stale_socket(self) -> None:
+        """Remove the socket left by a daemon that did not stop cleanly, or fail if the daemon is still running."""
+        if not self.socket_path.exists():
+            return
+        if not owned_by_current_user(self.socket_path):
+            raise DaemonError(f"Socket {self.socket_path} belongs to another user")
+        connection = connect(self.socket_path, timeout=1)
+        if connection is not None:
+            connection.close()
+            raise DaemonError(f"Robocop daemon is already running, listening on {self.socket_path}")
+        self.socket_path.unlink()
+
+    def handle(self, connection: socket.socket) -> None:
+        """Handle a single request of the client."""
+        connection.settimeout(None)
+        with connection.makefile("rwb") as stream:
+            try:
+                request = read_message(stream)
+            except ValueError:
+                request = None
+            if request is None:
+                return
+            command = request.get("command")
+            try:
+                if command == "run":
+                    exit_code = self.run_command(request.get("argv", []), request.get("cwd", os.getcwd()), stream)
+                    send_message(stream, {"exit_code": exit_code})
+                elif command == "status":
+                    send_message(stream, {"status": self.status(), "exit_code": 0})
+                elif command == "stop":
+                    self.stopped = True
+                    send_message(stream, {"exit_code": 0})
+                else:
+                    send_message(stream, {"stderr": f"Unknown daemon command: {command}\n", "exit_code": 2})
+            except OSError:  # the client disconnected
+                return
+
+    def run_command(self, argv: list[str], cwd: str, stream: IO[bytes]) -> int:
+        """
+        Run Robocop command in the daemon process, with the output sent to the client.
+
+        Returns:
+            Exit code of the command.
+
+        """
+        stdout = StreamingOutput(stream, "stdout")
+        stderr = StreamingOutput(stream, "stderr")
+        if argv and argv[0] in NOT_ALLOWED_COMMANDS:
+            stderr.write(f"'{argv[0]}' command cannot be run by the daemon.\n")
+            return 2
+        from robocop.run import app  # noqa: PLC0415
+
+        previous_cwd = os.getcwd()
+        try:
+            os.chdir(cwd)
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                app(args=argv, prog_name="robocop", windows_expand_args=False)
+        except SystemExit as exit_status:
+            return _exit_code(exit_status.code)
+        except Exception:  # noqa: BLE001 - the daemon keeps running even if a command fails unexpectedly
+            stderr.write(traceback.format_exc())
+            return 1
+        finally:
+            os.chdir(previous_cwd)
+            active = session.active_session()
+            if active is not None:
+                active.runs += 1
+        return 0
+
+    def status(self) -> dict[str, Any]:
+        """
+        Return the status of the daemon.
+
+        Returns:
+            Dictionary with the process id, uptime in seconds, number of served commands and analysed projects.
+
+        """
+        active = session.active_session()
+        return {
+            "pid": os.getpid(),
+            "socket": str(self.socket_path),
+            "uptime": round(time.time() - self.started, 1),
+            "runs": active.runs if active else 0,
+            "projects": len(active.project_contexts) if active else 0,
+        }
+
+
+def _exit_code(code: object) -> int:
+    """
+    Convert the code of ``SystemExit`` to the exit code of the process.
+
+    Returns:
+        Exit code.
+
+    """
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    return 1
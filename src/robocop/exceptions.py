@@ -113,3 +113,7 @@ class RobotFrameworkParsingError(Exception):
 class CircularExtendsReferenceError(FatalError):
     def __init__(self, config_path: str) -> None:
         super().__init__(f"Circular reference found in 'extends' parameter in the configuration file: {config_path}")
+
+
+class DaemonError(FatalError):
+    pass
@@ -1,7 +1,16 @@
 from __future__ import annotations
 
+import contextlib
+import fnmatch
+import os
+import re
+import sys
 from functools import cache, lru_cache
-from pathlib import Path
+from pathlib import Path, PurePath
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 
 def get_relative_path(path: str | Path, parent_path: Path) -> Path:
@@ -50,3 +59,60 @@ def get_common_parent_dirs(sources: list[Path]) -> list[Path]:
         key=lambda path: path.parts,
     )
     return [common_base, *common_base.parents]
+
+
+class PathPatterns:
+    """
+    Set of glob patterns matched against paths the same way as ``Path.match``.
+
+    Most patterns (such as ``*.robot`` or ``.venv``) only match the name of the file or directory. They are compiled
+    into a single regular expression, so a path is matched against all of them at once. Patterns with several parts
+    (such as ``tests/*.robot``) are matched with ``Path.match``.
+    """
+
+    def __init__(self, patterns: set[str] | list[str]) -> None:
+        name_patterns: list[str] = []
+        self.path_patterns: list[str] = []
+        for pattern in sorted(patterns):
+            pure_pattern = PurePath(pattern)
+            if len(pure_pattern.parts) == 1 and not pure_pattern.anchor:
+                name_patterns.append(fnmatch.translate(pure_pattern.name))
+            else:
+                self.path_patterns.append(pattern)
+        flags = re.IGNORECASE if os.name == "nt" else 0
+        self.name_pattern = re.compile("|".join(name_patterns), flags) if name_patterns else None
+
+    def match(self, path: Path) -> bool:
+        """Check if the path matches any pattern."""
+        if self.name_pattern is not None and path.name and self.name_pattern.match(path.name):
+            return True
+        return any(path.match(pattern) for pattern in self.path_patterns)
+
+
+@contextlib.contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """
+    Hold the exclusive lock of the file, waiting for other processes holding it.
+
+    The lock file is created if it does not exist. It is used to serialize the modifications of the files shared by
+    concurrent Robocop processes, such as the cache.
+    """
+    with open(path, "a+b") as lock_file:
+        if sys.platform == "win32":
+            import msvcrt  # noqa: PLC0415
+
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl  # noqa: PLC0415
+
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
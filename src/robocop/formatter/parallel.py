@@ -0,0 +1,58 @@
+"""
+Formatting of the source files in separate processes.
+
+Formatters are stateful model transformers, so every worker process loads its own instances and they are never
+shared between the processes. Worker processes format and save the files, and only the outcome of formatting is sent
+back - the main process reports it and writes the cache.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cache
+from typing import TYPE_CHECKING
+
+from robocop.runtime.resolver import ConfigResolver
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from robocop.source_file import SourceFile
+
+
+@dataclass
+class FileFormatResult:
+    """Result of formatting a single file."""
+
+    changed: bool = False
+    """Whether the formatters modified the file."""
+    path: Path | None = None
+    """Path of the formatted model. Only set if the file was modified."""
+    old_text: str | None = None
+    """Source before formatting. Only set in the diff mode."""
+    new_text: str | None = None
+    """Source after formatting. Only set in the diff mode."""
+    error: str | None = None
+    """Error raised while decoding the file."""
+
+
+@cache
+def _worker_config_resolver() -> ConfigResolver:
+    """Return the config resolver shared by all files formatted in the current worker process."""
+    return ConfigResolver(load_formatters=True)
+
+
+def format_file(source_file: SourceFile) -> FileFormatResult:
+    """
+    Format the source file in the worker process.
+
+    Formatters are loaded separately in every worker process, using the configuration of the formatted file.
+
+    Returns:
+        Result of formatting the file.
+
+    """
+    from robocop.formatter.runner import format_source_file  # noqa: PLC0415
+
+    resolved_config = _worker_config_resolver().resolve_config(source_file.config)
+    return format_source_file(source_file, resolved_config)
@@ -13,11 +13,14 @@ from robot.errors import DataError
 from robocop.formatter import (
     disablers,  # TODO compare robocop vs robotidy disablers, if we can merge something
 )
+from robocop.formatter.parallel import FileFormatResult, format_file
 from robocop.formatter.utils import misc
-from robocop.runtime.resolver import ConfigResolver
+from robocop.runtime import session
+from robocop.runtime.parallel import chunk_size, create_executor, resolve_jobs
 from robocop.source_file import SourceFile, StatementLinesCollector
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
 
     from robot.parsing import File
@@ -30,10 +33,102 @@ if TYPE_CHECKING:
 console = Console()
 
 
+def format_source_file(source_file: SourceFile, resolved_config: ResolvedConfig) -> FileFormatResult:
+    """
+    Run all selected formatters on the file and save it if it was modified.
+
+    Args:
+        source_file: SourceFile representing robot source file to format.
+        resolved_config: Resolved configuration of the file, with loaded formatters.
+
+    Returns:
+        Result of formatting the file.
+
+    """
+    try:
+        diff, old_model, new_model, model = format_until_stable(source_file, resolved_config)
+    except DataError as err:
+        return FileFormatResult(error=str(err))
+    if not (diff and old_model and new_model):
+        return FileFormatResult()
+    model_path = model.source or source_file.path
+    save_model(model_path, model, source_file.config)
+    result = FileFormatResult(changed=True, path=model_path)
+    if source_file.config.formatter.diff:
+        result.old_text, result.new_text = old_model.text, new_model.text
+    return result
+
+
+def format_until_stable(
+    source_file: SourceFile, resolved_config: ResolvedConfig
+) -> tuple[bool, StatementLinesCollector | None, StatementLinesCollector | None, File]:
+    config = source_file.config
+    model = source_file.model
+    disabler_finder = disablers.RegisterDisablers(config.formatter.start_line, config.formatter.end_line)
+    disabler_finder.visit(model)
+    if disabler_finder.is_disabled_in_file(disablers.ALL_FORMATTERS):
+        return False, None, None, model
+    diff, old_model, new_model = format_model(model, disabler_finder.disablers, resolved_config)
+    reruns = config.formatter.reruns
+    while diff and reruns:
+        model = get_model(new_model.text)
+        disabler_finder.visit(model)
+        new_diff, _, new_model = format_model(model, disabler_finder.disablers, resolved_config)
+        if not new_diff:
+            break
+        reruns -= 1
+    return diff, old_model, new_model, model
+
+
+def format_model(
+    model: File, disablers: disablers.DisablersInFile, resolved_config: ResolvedConfig
+) -> tuple[bool, StatementLinesCollector, StatementLinesCollector]:
+    old_model = StatementLinesCollector(model)
+    for name, formatter in resolved_config.formatters.items():
+        formatter.disablers = disablers  # set dynamically to allow using external formatters
+        if disablers.is_disabled_in_file(name):
+            continue
+        formatter.visit(model)
+    new_model = StatementLinesCollector(model)
+    return new_model != old_model, old_model, new_model
+
+
+def save_model(source: Path, model: File, config: Config) -> None:
+    if config.formatter.overwrite:
+        output = config.formatter.output or source
+        misc.ModelWriter(output=str(output), newline=get_line_ending(str(source), config)).write(model)
+
+
+def get_line_ending(path: str, config: Config) -> str:
+    if config.formatter.whitespace_config.line_ending == "auto":
+        with open(path) as f:
+            f.readline()
+            if f.newlines is None:
+                return os.linesep
+            if isinstance(f.newlines, str):
+                return f.newlines
+            return f.newlines[0]
+    return config.formatter.whitespace_config.line_ending
+
+
+def _in_selected_order(
+    source_files: list[tuple[SourceFile, bool]], formatted: Iterator[FileFormatResult]
+) -> Iterator[tuple[SourceFile, FileFormatResult | None]]:
+    """
+    Pair the selected files with the results of formatting, in the order of the selected files.
+
+    Yields:
+        Tuple of the source file and the result of formatting, or None if the file did not need formatting.
+
+    """
+    for source_file, needs_formatting in source_files:
+        yield source_file, next(formatted) if needs_formatting else None
+
+
 class RobocopFormatter:
     def __init__(self, config_manager: ConfigManager) -> None:
         self.config_manager = config_manager
-        self.config_resolver = ConfigResolver(load_formatters=True)
+        self.config_resolver = session.config_resolver(load_formatters=True)
         self.config: Config = self.config_manager.default_config
 
     def run(self) -> int:
@@ -41,52 +136,31 @@ class RobocopFormatter:
         skipped_files = 0
         all_files = 0
         cached_files = 0
-        previous_changed_files = 0  # TODO: hold in one container
         stdin = False
 
-        for source_file in self.config_manager.paths:
-            try:
-                # stdin = False
-                # if str(source) == "-":
-                #     stdin = True
-                #     if self.config.verbose:
-                #         typer.echo("Loading file from stdin")
-                #     source = self.load_from_stdin()
-                if self.config.verbose:
-                    print(f"Formatting {source_file.path} file")
-                self.config = source_file.config
-
-                all_files += 1
-
-                if source_file.config.cache.enabled:
-                    # Check cache - if file hasn't changed and didn't need formatting before, skip it
-                    cached_entry = self.config_manager.cache.get_formatter_entry(
-                        source_file.path, source_file.config.hash
-                    )
-                    if cached_entry is not None and not cached_entry.needs_formatting:
-                        # File hasn't changed and didn't need formatting - skip it
-                        cached_files += 1
-                        continue
-                previous_changed_files = changed_files
-                diff, old_model, new_model, model = self.format_until_stable(source_file)
-                # if stdin:
-                #     self.print_to_stdout(new_model)
-                if diff and old_model and new_model:
-                    model_path = model.source or source_file.path
-                    self.save_model(model_path, model)
-                    self.log_formatted_source(source_file.path, stdin)
-                    self.output_diff(model_path, old_model, new_model)
-                    changed_files += 1
-                # Cache result only if a file does not need formatting or was formatted (no --check and --no-overwrite)
-                if not diff or self.config.formatter.overwrite:
-                    self.config_manager.cache.set_formatter_entry(
-                        source_file.path, source_file.config.hash, needs_formatting=False
-                    )
-            except DataError as err:
+        for source_file, result in self.format_files():
+            self.config = source_file.config
+            all_files += 1
+            if result is None:
+                # File hasn't changed and didn't need formatting - skip it
+                cached_files += 1
+                continue
+            if result.error is not None:
                 if not source_file.config.silent:
-                    print(f"Failed to decode {source_file.path} with an error: {err}\nSkipping file")  # TODO stderr
-                changed_files = previous_changed_files
+                    # TODO stderr
+                    print(f"Failed to decode {source_file.path} with an error: {result.error}\nSkipping file")
                 skipped_files += 1
+                continue
+            if result.changed:
+                self.log_formatted_source(source_file.path, stdin)
+                self.output_diff(result.path, result.old_text, result.new_text)
+                changed_files += 1
+            # Cache result only if a file does not need formatting or was formatted (no --check and --no-overwrite)
+            if not result.changed or self.config.formatter.overwrite:
+                self.config_manager.cache.set_formatter_entry(
+                    source_file.path, source_file.config.hash, needs_formatting=False
+                )
+                session.keep_formatted(source_file.path, source_file.config.hash)
 
         # Save cache at the end
         self.config_manager.cache.save()
@@ -96,6 +170,65 @@ class RobocopFormatter:
 
         return self.formatting_result(all_files, changed_files, skipped_files, stdin)
 
+    def format_files(self) -> Iterator[tuple[SourceFile, FileFormatResult | None]]:
+        """
+        Format every selected file, skipping files that did not need formatting and did not change since.
+
+        If more than one job is configured, files are formatted in parallel, in separate processes. Results are
+        returned in the order of the selected files as soon as they are ready, so the output does not depend on the
+        number of jobs.
+
+        Yields:
+            Tuple of the source file and the result of formatting, or None if the file was skipped thanks to the cache.
+
+        """
+        default_config = self.config_manager.default_config
+        # with --output all files are written to the same file, so they are formatted one by one
+        if default_config.jobs == 1 or default_config.formatter.output is not None:
+            for source_file in self.config_manager.paths:
+                if self.is_formatted_in_cache(source_file):
+                    yield source_file, None
+                    continue
+                yield source_file, self.format_in_process(source_file)
+            return
+        source_files = [
+            (source_file, not self.is_formatted_in_cache(source_file)) for source_file in self.config_manager.paths
+        ]
+        to_format = [source_file for source_file, needs_formatting in source_files if needs_formatting]
+        jobs = resolve_jobs(default_config.jobs, len(to_format))
+        if jobs == 1:
+            yield from _in_selected_order(source_files, map(self.format_in_process, to_format))
+            return
+        with create_executor(jobs) as executor:
+            formatted = executor.map(format_file, to_format, chunksize=chunk_size(jobs, len(to_format)))
+            yield from _in_selected_order(source_files, formatted)
+
+    def format_in_process(self, source_file: SourceFile) -> FileFormatResult:
+        """Format the file in the Robocop process, using formatters loaded for its configuration."""
+        return format_source_file(source_file, self.config_resolver.resolve_config(source_file.config))
+
+    def is_formatted_in_cache(self, source_file: SourceFile) -> bool:
+        """
+        Check if the file did not need formatting and did not change since.
+
+        Results of the previous runs in the same session are used even if the cache is disabled.
+
+        Returns:
+            True if the file can be skipped.
+
+        """
+        if source_file.config.verbose:
+            print(f"Formatting {source_file.path} file")
+        if session.is_formatted(source_file.path, source_file.config.hash):
+            return True
+        if not source_file.config.cache.enabled:
+            return False
+        cached_entry = self.config_manager.cache.get_formatter_entry(source_file.path, source_file.config.hash)
+        if cached_entry is None or cached_entry.needs_formatting:
+            return False
+        session.keep_formatted(source_file.path, source_file.config.hash)
+        return True
+
     def formatting_result(self, all_files: int, changed_files: int, skipped_files: int, stdin: bool) -> int:
         """Print formatting summary and return status code."""
         if not stdin and not self.config_manager.default_config.silent:
@@ -118,38 +251,6 @@ class RobocopFormatter:
             return exit_code
         raise typer.Exit(code=exit_code)
 
-    def format_until_stable(
-        self, source_file: SourceFile
-    ) -> tuple[bool, StatementLinesCollector | None, StatementLinesCollector | None, File]:
-        model = source_file.model
-        resolved_config = self.config_resolver.resolve_config(source_file.config)
-        disabler_finder = disablers.RegisterDisablers(self.config.formatter.start_line, self.config.formatter.end_line)
-        disabler_finder.visit(model)
-        if disabler_finder.is_disabled_in_file(disablers.ALL_FORMATTERS):
-            return False, None, None, model
-        diff, old_model, new_model = self.format(model, disabler_finder.disablers, resolved_config)
-        reruns = self.config.formatter.reruns
-        while diff and reruns:
-            model = get_model(new_model.text)
-            disabler_finder.visit(model)
-            new_diff, _, new_model = self.format(model, disabler_finder.disablers, resolved_config)
-            if not new_diff:
-                break
-            reruns -= 1
-        return diff, old_model, new_model, model
-
-    def format(
-        self, model: File, disablers: disablers.DisablersInFile, resolved_config: ResolvedConfig
-    ) -> tuple[bool, StatementLinesCollector, StatementLinesCollector]:
-        old_model = StatementLinesCollector(model)
-        for name, formatter in resolved_config.formatters.items():
-            formatter.disablers = disablers  # set dynamically to allow using external formatters
-            if disablers.is_disabled_in_file(name):
-                continue
-            formatter.visit(model)
-        new_model = StatementLinesCollector(model)
-        return new_model != old_model, old_model, new_model
-
     def log_formatted_source(self, source: Path, stdin: bool) -> None:
         if stdin or self.config.silent:
             return
@@ -166,33 +267,12 @@ class RobocopFormatter:
         if not self.config.formatter.diff:
             print(collected_lines.text)
 
-    def save_model(self, source: Path, model: File) -> None:
-        if self.config.formatter.overwrite:
-            output = self.config.formatter.output or source
-            misc.ModelWriter(output=str(output), newline=self.get_line_ending(str(source))).write(model)
-
-    def get_line_ending(self, path: str) -> str:
-        if self.config.formatter.whitespace_config.line_ending == "auto":
-            with open(path) as f:
-                f.readline()
-                if f.newlines is None:
-                    return os.linesep
-                if isinstance(f.newlines, str):
-                    return f.newlines
-                return f.newlines[0]
-        return self.config.formatter.whitespace_config.line_ending
-
-    def output_diff(
-        self,
-        path: Path,
-        old_model: StatementLinesCollector,
-        new_model: StatementLinesCollector,
-    ) -> None:
-        if not self.config.formatter.diff:
+    def output_diff(self, path: Path | None, old_text: str | None, new_text: str | None) -> None:
+        if not self.config.formatter.diff or old_text is None or new_text is None:
             return
         # TODO: handle printing with rich console, with markup disabled
-        old = [line + "\n" for line in old_model.text.splitlines()]
-        new = [line + "\n" for line in new_model.text.splitlines()]
+        old = [line + "\n" for line in old_text.splitlines()]
+        new = [line + "\n" for line in new_text.splitlines()]
         lines = list(unified_diff(old, new, fromfile=f"{path}\tbefore", tofile=f"{path}\tafter"))
         if not lines:
             return
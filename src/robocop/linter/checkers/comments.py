@@ -21,6 +21,8 @@ if TYPE_CHECKING:
 class CommentChecker(VisitorChecker):
     """Checker for comments content. It detects invalid comments or leftovers like `todo` or `fixme` in the code."""
 
+    single_pass = True
+
     todo_in_comment: comments.ToDoInCommentRule
     missing_space_after_comment: comments.MissingSpaceAfterCommentRule
     invalid_comment: comments.InvalidCommentRule
@@ -42,6 +42,8 @@ if TYPE_CHECKING:
 class DuplicationsChecker(VisitorChecker):
     """Checker for duplicated names."""
 
+    single_pass = True
+
     duplicated_test_case: duplications.DuplicatedTestCaseRule
     duplicated_keyword: duplications.DuplicatedKeywordRule
     duplicated_variable: duplications.DuplicatedVariableRule
@@ -205,8 +207,9 @@ class ProjectDuplicationsChecker(ProjectChecker):
     ) -> list[Diagnostic]:
         self.issues = []
         reported: set[tuple[Path, int, int, str]] = set()
-        for project_file in context.iter_files():
-            for occurrences in self._duplicated_definitions(project_file, context):
+        # files seeing the same files through imports have the same duplicates, so they are searched once per group
+        for group in context.import_closure_groups():
+            for occurrences in self._duplicated_definitions(group[0], context):
                 first, *rest = occurrences
                 for duplicate in rest:
                     self._report_duplicate(duplicate, first, context, project_source_file, reported)
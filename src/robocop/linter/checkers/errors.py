@@ -25,6 +25,8 @@ if TYPE_CHECKING:
 class ParsingErrorChecker(VisitorChecker):
     """Checker that parses Robot Framework DataErrors."""
 
+    single_pass = True
+
     parsing_error: errors.ParsingErrorRule
     invalid_continuation_mark: errors.InvalidContinuationMarkRule
     not_enough_whitespace_after_newline_marker: whitespace.NotEnoughWhitespaceAfterNewlineMarkerRule
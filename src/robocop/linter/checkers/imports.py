@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING
 
 from robocop.files import path_relative_to_cwd, resolve_path
 from robocop.linter.rules import ProjectChecker, imports
-from robocop.project.context import KeywordIndex
+from robocop.project.context import KeywordIndex, strongly_connected_components
 from robocop.project.definitions import ImportStatus, ImportType
 from robocop.source_file import SourceFile
 
@@ -48,6 +48,7 @@ def _import_error(error: str | None) -> str:
 class ProjectImportsChecker(ProjectChecker):
     """Checker for imports that can only be validated with the whole project context."""
 
+    incremental = True
     unresolved_resource_import: imports.UnresolvedResourceImportRule
     unresolved_library_import: imports.UnresolvedLibraryImportRule
 
@@ -58,7 +59,7 @@ class ProjectImportsChecker(ProjectChecker):
         context: ProjectContext,
     ) -> list[Diagnostic]:
         self.issues = []
-        for project_file, imported in context.iter_imports():
+        for project_file, imported in context.iter_imports(reported_only=True):
             if imported.import_type == ImportType.RESOURCE:
                 if imported.status == ImportStatus.NOT_FOUND:
                     self._report_import(self.unresolved_resource_import, project_file, imported, project_source_file)
@@ -121,7 +122,7 @@ class UnusedImportsChecker(ProjectChecker):
 
     def __init__(self) -> None:
         super().__init__()
-        self._importers: dict[Path, list[ProjectFile]] | None = None
+        self._provided: dict[Path, tuple[KeywordIndex, set[str]]] = {}
 
     def scan_project(
         self,
@@ -130,8 +131,8 @@ class UnusedImportsChecker(ProjectChecker):
         context: ProjectContext,
     ) -> list[Diagnostic]:
         self.issues = []
-        self._importers = None
-        for project_file in context.iter_files():
+        self._provided = {}
+        for project_file in context.iter_files(reported_only=True):
             self._check_file(project_file, project_source_file, context)
         return self.issues
 
@@ -153,7 +154,7 @@ class UnusedImportsChecker(ProjectChecker):
             resource = context.files.get(imported_path)
             if resource is None or resource.resolved_path == own_path:
                 continue
-            if _is_used(resource, context, used_keywords, used_variables):
+            if self._is_used(resource, context, used_keywords, used_variables):
                 continue
             self.report(
                 self.unused_resource_import,
@@ -197,6 +198,53 @@ class UnusedImportsChecker(ProjectChecker):
                 end_col=imported.location.end_col,
             )
 
+    def _is_used(
+        self,
+        resource: ProjectFile,
+        context: ProjectContext,
+        used_keywords: set[str],
+        used_variables: set[str],
+    ) -> bool:
+        """
+        Check whether anything provided by the resource is used.
+
+        Resources without keywords and variables are never reported, since they may be imported only for the imports
+        they make themselves. Keywords coming from libraries are ignored, since the importing file can use them
+        without importing the resource.
+
+        Returns:
+            True if the resource provides nothing or if any of its keywords or variables is used.
+
+        """
+        index, variables = self._provided_by(resource, context)
+        if not variables and not any(True for _ in index):
+            return True
+        if used_variables & variables:
+            return True
+        return any(index.find(name) for name in used_keywords)
+
+    def _provided_by(self, resource: ProjectFile, context: ProjectContext) -> tuple[KeywordIndex, set[str]]:
+        """
+        Return keywords and variables the resource provides to the importing files, computed once per resource.
+
+        Returns:
+            Tuple of index of keywords defined in the project and normalized variable names.
+
+        """
+        provided = self._provided.get(resource.resolved_path)
+        if provided is None:
+            index = KeywordIndex()
+            for keyword in context.visible_keywords(resource.path):
+                if not keyword.is_from_library:
+                    index.add(keyword)
+            variables = {
+                variable.normalized_name
+                for file in context.imported_files(resource.path)
+                for variable in file.variables
+            }
+            provided = self._provided[resource.resolved_path] = (index, variables)
+        return provided
+
     def _consumers_of(self, project_file: ProjectFile, context: ProjectContext) -> list[ProjectFile]:
         """
         Return files whose keyword calls may rely on imports of given file.
@@ -214,13 +262,16 @@ class UnusedImportsChecker(ProjectChecker):
             return [other for other in context.iter_files() if str(other.resolved_path).startswith(directory)]
         if project_file.is_suite:
             return [project_file]
-        if self._importers is None:
-            self._importers = _build_importers(context)
-        return self._importers.get(project_file.resolved_path, [project_file])
+        return context.importing_files(project_file.path)
 
 
 class CircularImports(ProjectChecker):
-    """Checker reporting resource imports that take part in a circular import."""
+    """
+    Checker reporting resource imports that take part in a circular import.
+
+    The import graph is split into strongly connected components first. An import is a part of a cycle only if both
+    files belong to the same component, and the shortest chain of imports leading back is searched only inside it.
+    """
 
     circular_import: imports.CircularImportRule
 
@@ -231,72 +282,78 @@ class CircularImports(ProjectChecker):
         context: ProjectContext,
     ) -> list[Diagnostic]:
         self.issues = []
+        graph = context.import_graph()
+        component_of = strongly_connected_components(graph)
+        cyclic_imports: list[tuple[ProjectFile, ResolvedImport]] = []
+        by_imported_path: dict[Path, list[int]] = {}
         for project_file in context.iter_files():
             own_path = project_file.resolved_path
-            for imported in project_file.resource_imports():
-                if imported.status != ImportStatus.RESOLVED or imported.path is None:
-                    continue
+            for imported in context.project_resource_imports(project_file):
                 imported_path = imported.resolved_path
-                if imported_path not in context.files:
-                    continue
-                cycle = _path_back_to(context, imported_path, own_path)
-                if cycle is None:
+                if component_of[imported_path] != component_of[own_path]:
                     continue
-                self.report(
-                    self.circular_import,
-                    source=SourceFile(path=project_file.path, config=project_source_file.config),
-                    cycle=" -> ".join(str(path_relative_to_cwd(path)) for path in [own_path, *cycle]),
-                    lineno=imported.location.lineno,
-                    col=imported.location.col,
-                    end_lineno=imported.location.end_lineno,
-                    end_col=imported.location.end_col,
-                )
+                by_imported_path.setdefault(imported_path, []).append(len(cyclic_imports))
+                cyclic_imports.append((project_file, imported))
+        # every file imported back is searched from only once, for all imports of the file
+        cycles: list[list[Path]] = [[] for _ in cyclic_imports]
+        for imported_path, indexes in by_imported_path.items():
+            parents = _shortest_paths_from(graph, imported_path, component_of)
+            for index in indexes:
+                importing_file, _ = cyclic_imports[index]
+                cycles[index] = _path_to(parents, importing_file.resolved_path)
+        # long cycles repeat the same files in many reported chains
+        displayed: dict[Path, str] = {}
+        for (project_file, imported), cycle in zip(cyclic_imports, cycles, strict=True):
+            chain = [project_file.resolved_path, *cycle]
+            for path in chain:
+                if path not in displayed:
+                    displayed[path] = str(path_relative_to_cwd(path))
+            self.report(
+                self.circular_import,
+                source=SourceFile(path=project_file.path, config=project_source_file.config),
+                cycle=" -> ".join(displayed[path] for path in chain),
+                lineno=imported.location.lineno,
+                col=imported.location.col,
+                end_lineno=imported.location.end_lineno,
+                end_col=imported.location.end_col,
+            )
         return self.issues
 
 
-def _path_back_to(context: ProjectContext, start: Path, target: Path) -> list[Path] | None:
+def _shortest_paths_from(graph: dict[Path, list[Path]], start: Path, component_of: dict[Path, int]) -> dict[Path, Path]:
     """
-    Find the shortest chain of resource imports leading from the imported file back to the importing one.
+    Search the shortest chains of imports from the file to other files in its strongly connected component.
 
     Returns:
-        List of paths from the imported file to the target, or None if the target is not imported back.
+        Dictionary of every reached file to the file it is imported from in the shortest chain. The start file is
+        mapped to itself.
 
     """
-    queue: deque[tuple[Path, list[Path]]] = deque([(start, [start])])
-    seen = {start}
+    component = component_of[start]
+    parents = {start: start}
+    queue = deque([start])
     while queue:
-        current, chain = queue.popleft()
-        if current == target:
-            return chain
-        project_file = context.files.get(current)
-        if project_file is None:
-            continue
-        for imported in project_file.resource_imports():
-            if imported.status != ImportStatus.RESOLVED or imported.path is None:
-                continue
-            next_path = imported.resolved_path
-            if next_path == target:
-                return [*chain, next_path]
-            if next_path is None or next_path in seen or next_path not in context.files:
-                continue
-            seen.add(next_path)
-            queue.append((next_path, [*chain, next_path]))
-    return None
+        current = queue.popleft()
+        for next_path in graph[current]:
+            if next_path not in parents and component_of[next_path] == component:
+                parents[next_path] = current
+                queue.append(next_path)
+    return parents
 
 
-def _build_importers(context: ProjectContext) -> dict[Path, list[ProjectFile]]:
+def _path_to(parents: dict[Path, Path], target: Path) -> list[Path]:
     """
-    Map every file to the files that see it through transitive resource imports.
+    Read the chain of imports leading to the target from the search result.
 
     Returns:
-        Dictionary of resolved path to the list of files importing it, each including the file itself.
+        List of paths from the start of the search to the target.
 
     """
-    importers: dict[Path, list[ProjectFile]] = {}
-    for project_file in context.iter_files():
-        for visible in context.imported_files(project_file.path):
-            importers.setdefault(visible.resolved_path, []).append(project_file)
-    return importers
+    chain = [target]
+    while parents[chain[-1]] != chain[-1]:
+        chain.append(parents[chain[-1]])
+    chain.reverse()
+    return chain
 
 
 def _collect_usage(files: list[ProjectFile]) -> tuple[set[str], set[str]]:
@@ -314,34 +371,3 @@ def _collect_usage(files: list[ProjectFile]) -> tuple[set[str], set[str]]:
             used_keywords.update(usage.names_to_check())
         used_variables.update(project_file.used_variables)
     return used_keywords, used_variables
-
-
-def _is_used(
-    resource: ProjectFile,
-    context: ProjectContext,
-    used_keywords: set[str],
-    used_variables: set[str],
-) -> bool:
-    """
-    Check whether anything provided by the resource is used.
-
-    Resources without keywords and variables are never reported, since they may be imported only for the imports
-    they make themselves. Keywords coming from libraries are ignored, since the importing file can use them without
-    importing the resource.
-
-    Returns:
-        True if the resource provides nothing or if any of its keywords or variables is used.
-
-    """
-    index = KeywordIndex()
-    for keyword in context.visible_keywords(resource.path):
-        if not keyword.is_from_library:
-            index.add(keyword)
-    variables = {
-        variable.normalized_name for file in context.imported_files(resource.path) for variable in file.variables
-    }
-    if not variables and not any(True for _ in index):
-        return True
-    if used_variables & variables:
-        return True
-    return any(index.find(name) for name in used_keywords)
@@ -22,6 +22,8 @@ if TYPE_CHECKING:
 class ArgumentsChecker(VisitorChecker):
     """Checker for rules reported for the keyword arguments."""
 
+    single_pass = True
+
     first_argument_in_new_line: spacing.FirstArgumentInNewLineRule
     arguments_per_line: arguments.ArgumentsPerLineRule
     undefined_argument_default: arguments.UndefinedArgumentDefaultRule
@@ -42,6 +44,7 @@ class ArgumentsChecker(VisitorChecker):
 class ProjectArgumentsChecker(ProjectChecker):
     """Checker for keyword arguments validated against definitions from the whole project."""
 
+    incremental = True
     invalid_argument_count: arguments.InvalidArgumentCountRule
 
     def scan_project(
@@ -51,7 +54,7 @@ class ProjectArgumentsChecker(ProjectChecker):
         context: ProjectContext,
     ) -> list[Diagnostic]:
         self.issues = []
-        for project_file, usage in context.iter_usages():
+        for project_file, usage in context.iter_usages(reported_only=True):
             mismatch = self._validate_usage(context, usage)
             if mismatch is None:
                 continue
@@ -93,6 +96,7 @@ class ProjectArgumentsChecker(ProjectChecker):
 class ProjectArgumentNamesChecker(ProjectChecker):
     """Checker for rules that require argument names from the keyword definitions in the whole project."""
 
+    incremental = True
     missing_argument_name: arguments.MissingArgumentNameRule
 
     def scan_project(
@@ -102,7 +106,7 @@ class ProjectArgumentNamesChecker(ProjectChecker):
         context: ProjectContext,
     ) -> list[Diagnostic]:
         self.issues = []
-        for project_file, usage in context.iter_usages():
+        for project_file, usage in context.iter_usages(reported_only=True):
             named_arguments = self._find_positional_arguments(context, usage)
             if len(named_arguments) < self.missing_argument_name.min_arguments:
                 continue
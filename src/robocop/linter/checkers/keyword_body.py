@@ -14,6 +14,8 @@ if TYPE_CHECKING:
 class BodyChecker(VisitorChecker):
     """Checker for rules that scan the direct children of a keyword or a block."""
 
+    single_pass = True
+
     keyword_after_return: misc.KeywordAfterReturnRule
     empty_return: misc.EmptyReturnRule
     unreachable_code: misc.UnreachableCodeRule
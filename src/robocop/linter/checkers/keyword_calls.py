@@ -17,6 +17,8 @@ if TYPE_CHECKING:
 class KeywordCallChecker(VisitorChecker):
     """Checker for rules reported for keyword calls and keyword names used in the settings."""
 
+    single_pass = True
+
     sleep_keyword_used: keywords.SleepKeywordUsedRule
     not_allowed_keyword: keywords.NotAllowedKeywordRule
     number_of_returned_values: lengths.NumberOfReturnedValuesRule
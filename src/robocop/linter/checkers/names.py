@@ -25,6 +25,8 @@ class NamesChecker(VisitorChecker):
     templates), and variable names wherever a variable can be assigned.
     """
 
+    single_pass = True
+
     wrong_case_in_keyword_name: naming.WrongCaseInKeywordNameRule
     wrong_case_in_keyword_call: naming.WrongCaseInKeywordCallRule
     keyword_name_is_reserved_word: naming.KeywordNameIsReservedWordRule
@@ -18,6 +18,8 @@ if TYPE_CHECKING:
 class SectionsChecker(VisitorChecker):
     """Checker for rules reported for the sections and their headers."""
 
+    single_pass = True
+
     can_be_resource_file: misc.CanBeResourceFileRule
     empty_section: lengths.EmptySectionRule
     too_many_test_cases: lengths.TooManyTestCasesRule
@@ -35,6 +35,8 @@ class SettingsChecker(VisitorChecker):
     naming conventions and whether the imports are placed in the recommended order.
     """
 
+    single_pass = True
+
     empty_metadata: lengths.EmptyMetadataRule
     empty_documentation: lengths.EmptyDocumentationRule
     variable_in_documentation: documentation.VariableInDocumentationRule
@@ -242,6 +242,8 @@ class EmptyLinesChecker(VisitorChecker):
 class InconsistentUseOfTabsAndSpacesChecker(VisitorChecker):  # TODO: add found tab in file rule (to list them all)
     """Checker for inconsistent use of tabs and spaces."""
 
+    single_pass = True
+
     mixed_tabs_and_spaces: spacing.MixedTabsAndSpacesRule
 
     def __init__(self) -> None:
@@ -435,6 +437,8 @@ class UnevenIndentChecker(VisitorChecker):
 class MisalignedContinuation(VisitorChecker):
     """Checker for misaligned continuation line markers."""
 
+    single_pass = True
+
     misaligned_continuation: spacing.MisalignedContinuationRule
     misaligned_continuation_row: spacing.MisalignedContinuationRowRule
     # detect if run keyword, but not parse it
@@ -26,6 +26,8 @@ if TYPE_CHECKING:
 class TagsChecker(VisitorChecker):
     """Checker for tag names, tag scopes and keyword tags."""
 
+    single_pass = True
+
     tag_with_space: tags.TagWithSpaceRule
     tag_with_or_and: tags.TagWithOrAndRule
     tag_with_reserved_word: tags.TagWithReservedWordRule
@@ -15,6 +15,8 @@ if TYPE_CHECKING:
 class TestCaseKeywordChecker(VisitorChecker):
     """Checker for rules reported for the whole test case or keyword definition."""
 
+    single_pass = True
+
     missing_doc_keyword: documentation.MissingDocKeywordRule
     missing_doc_test_case: documentation.MissingDocTestCaseRule
     missing_doc_test_suite: documentation.MissingDocTestSuiteRule
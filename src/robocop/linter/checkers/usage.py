@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from typing import TYPE_CHECKING
 
 from robot.libraries import STDLIBS
@@ -10,11 +11,12 @@ from robocop.files import path_relative_to_cwd
 from robocop.linter.rules import ProjectChecker, usage
 from robocop.linter.utils.misc import normalize_robot_name
 from robocop.project.context import BUILTIN_LIBRARY
-from robocop.project.definitions import ImportStatus, ImportType, usage_name_pattern
+from robocop.project.definitions import ImportStatus, ImportType, embedded_match_key, usage_name_pattern
 from robocop.source_file import SourceFile
 
 if TYPE_CHECKING:
     import re
+    from collections.abc import Iterator
     from pathlib import Path
 
     from robocop.config.manager import ConfigManager
@@ -25,12 +27,20 @@ if TYPE_CHECKING:
 
 
 class UsedKeywordNames:
-    """Names used to call keywords, collected from a set of files."""
+    """
+    Names used to call keywords, collected from a set of files.
+
+    Keywords with embedded arguments are matched only against names starting (or ending) with the literal text of
+    the keyword name. Names are sorted by their beginning and ending for that, once all names are collected.
+    """
 
     def __init__(self) -> None:
         self.normalized: set[str] = set()
         self.names: list[str] = []
         self.dynamic_patterns: list[re.Pattern[str]] = []
+        self._by_prefix: list[tuple[str, str]] | None = None
+        self._by_suffix: list[tuple[str, str]] = []
+        self._not_indexed: list[str] = []
 
     def add(self, name: str, name_contains_variable: bool) -> None:
         """Record a name used to call a keyword."""
@@ -39,6 +49,7 @@ class UsedKeywordNames:
             if pattern is not None:
                 self.dynamic_patterns.append(pattern)
             return
+        self._by_prefix = None
         self.names.append(name)
         self.normalized.add(normalize_robot_name(name))
         if "." in name:
@@ -55,12 +66,59 @@ class UsedKeywordNames:
 
         """
         if keyword.has_embedded_arguments:
-            if any(keyword.matches(name) for name in self.names):
+            if any(keyword.matches(name) for name in self._embedded_candidates(keyword)):
                 return True
         elif keyword.normalized_name in self.normalized:
             return True
         return any(pattern.fullmatch(keyword.normalized_name) for pattern in self.dynamic_patterns)
 
+    def _embedded_candidates(self, keyword: KeywordDefinition) -> Iterator[str]:
+        """
+        Find names that may call the keyword with embedded arguments.
+
+        Yields:
+            Names starting and ending with the literal text of the keyword name.
+
+        """
+        if self._by_prefix is None:
+            self._index_names()
+        prefix, suffix = keyword.embedded_affixes
+        if prefix:
+            candidates = _with_prefix(self._by_prefix, prefix)
+        elif suffix:
+            candidates = [(key[::-1], name) for key, name in _with_prefix(self._by_suffix, suffix[::-1])]
+        else:
+            candidates = self._by_prefix
+        for key, name in candidates:
+            if key.startswith(prefix) and key.endswith(suffix):
+                yield name
+        yield from self._not_indexed
+
+    def _index_names(self) -> None:
+        keys = []
+        self._not_indexed = []
+        for name in dict.fromkeys(self.names):
+            key = embedded_match_key(name)
+            if key is None:
+                self._not_indexed.append(name)
+            else:
+                keys.append((key, name))
+        self._by_prefix = sorted(keys)
+        self._by_suffix = sorted((key[::-1], name) for key, name in keys)
+
+
+def _with_prefix(sorted_keys: list[tuple[str, str]], prefix: str) -> list[tuple[str, str]]:
+    """
+    Select entries with keys starting with the prefix from the list of ``(key, name)`` sorted by the keys.
+
+    Returns:
+        Slice of the list with matching keys.
+
+    """
+    start = bisect_left(sorted_keys, (prefix,))
+    end = bisect_left(sorted_keys, (prefix[:-1] + chr(ord(prefix[-1]) + 1),))
+    return sorted_keys[start:end]
+
 
 DYNAMIC_IMPORT_KEYWORDS = frozenset({"importlibrary", "importresource"})
 """Keywords that add keywords to the file at runtime, making static analysis incomplete."""
@@ -72,6 +130,7 @@ RESERVED_KEYWORD_NAMES = frozenset({"none"})
 class KeywordNotFound(ProjectChecker):
     """Reports keyword calls that do not match any known keyword."""
 
+    incremental = True
     keyword_not_found: usage.KeywordNotFoundRule
 
     def scan_project(
@@ -84,7 +143,7 @@ class KeywordNotFound(ProjectChecker):
         if context.library_loader is None:
             return self.issues  # without libraries almost every call would be reported
         can_check: dict[Path, bool] = {}
-        for project_file, keyword_usage in context.iter_usages():
+        for project_file, keyword_usage in context.iter_usages(reported_only=True):
             if not self._is_known(context, keyword_usage) and self._can_be_checked(context, project_file, can_check):
                 self.report(
                     self.keyword_not_found,
@@ -170,6 +229,7 @@ class KeywordNotFound(ProjectChecker):
 class AmbiguousKeywordNames(ProjectChecker):
     """Reports keyword calls matching keywords defined in more than one place."""
 
+    incremental = True
     ambiguous_keyword_name: usage.AmbiguousKeywordNameRule
 
     def scan_project(
@@ -179,7 +239,7 @@ class AmbiguousKeywordNames(ProjectChecker):
         context: ProjectContext,
     ) -> list[Diagnostic]:
         self.issues = []
-        for project_file, keyword_usage in context.iter_usages():
+        for project_file, keyword_usage in context.iter_usages(reported_only=True):
             candidates = self._ambiguous_definitions(context, keyword_usage)
             if not candidates:
                 continue
@@ -283,6 +343,7 @@ def _describe_sources(definitions: list[KeywordDefinition]) -> str:
 class MissingKeywordPrefix(ProjectChecker):
     """Reports keyword calls that do not use the name of the resource file or library the keyword comes from."""
 
+    incremental = True
     missing_keyword_prefix: usage.MissingKeywordPrefixRule
 
     def scan_project(
@@ -292,7 +353,7 @@ class MissingKeywordPrefix(ProjectChecker):
         context: ProjectContext,
     ) -> list[Diagnostic]:
         self.issues = []
-        for project_file, keyword_usage in context.iter_usages():
+        for project_file, keyword_usage in context.iter_usages(reported_only=True):
             prefix = self._find_prefix(context, keyword_usage)
             if prefix is None:
                 continue
@@ -363,7 +424,7 @@ class UnusedKeywords(ProjectChecker):
     ) -> list[Diagnostic]:
         self.issues = []
         project_usages, file_usages = self._collect_usages(context)
-        for project_file in context.iter_files():
+        for project_file in context.iter_files(reported_only=True):
             private_usages = file_usages.get(project_file.resolved_path)
             for keyword in project_file.keywords:
                 usages = private_usages if keyword.is_private else project_usages
@@ -18,6 +18,8 @@ if TYPE_CHECKING:
 class VariablesChecker(VisitorChecker):
     """Checker for rules reported for variable definitions, assignments and their scopes."""
 
+    single_pass = True
+
     empty_variable: variables.EmptyVariableRule
     no_global_variable: variables.NoGlobalVariableRule
     no_suite_variable: variables.NoSuiteVariableRule
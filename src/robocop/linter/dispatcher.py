@@ -0,0 +1,217 @@
+"""
+Running several visitor checkers in a single walk over the Robot Framework model.
+
+Every ``VisitorChecker`` is a ``ModelVisitor``: scanning a file with it walks the whole model, even though most
+checkers are only interested in a few node types. ``CheckerDispatcher`` walks the model once and passes every node
+only to the checkers that define a visitor method for it.
+
+Only the checkers that set ``single_pass = True`` are dispatched. Their visitor methods decide on their own whether
+the children of the node are visited, by calling (or not calling) ``self.generic_visit(node)``:
+
+- if the visitor method does not call ``generic_visit``, the children are not passed to the checker,
+- if it does, the visitor methods of the other checkers and the children of the node are visited by the dispatcher
+  inside this call. Visitor methods that do some work after visiting the children (for example ``visit_File``
+  reporting issues collected from the whole file) are called one inside another, so that every checker sees the node,
+  its children and the rest of its visitor method in the same order as it would outside the dispatcher.
+
+Checkers that do not opt in, or that override ``scan_file``, ``visit`` or ``generic_visit``, are scanned separately.
+
+If the timings are collected, the visitor methods are wrapped to measure the time of every checker. Wrapped methods
+are used only while the timings are collected, so the dispatcher is not slowed down otherwise.
+"""
+
+from __future__ import annotations
+
+import ast
+from typing import TYPE_CHECKING, Any
+
+from robocop.linter.rules import VisitorChecker
+from robocop.parsing.context import Context
+from robocop.runtime import timings
+
+try:
+    from robot.api.parsing import ModelVisitor
+except ImportError:
+    from robot.parsing.model.visitor import ModelVisitor
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from robocop.linter.diagnostics import Diagnostic
+    from robocop.linter.rules import BaseChecker
+    from robocop.runtime.timings import Timings
+    from robocop.source_file import SourceFile
+
+Handler = tuple[int, "VisitorChecker", "Callable[[Any, Any], Any]"]
+"""Checker index, checker and visitor method."""
+
+BACKWARDS_COMPATIBLE_VISITORS = {"visit_TestTags": "visit_ForceTags", "visit_Return": "visit_ReturnStatement"}
+
+
+def can_be_dispatched(checker: BaseChecker) -> bool:
+    """
+    Check if the checker can be scanned by the dispatcher.
+
+    Returns:
+        True if the checker is a visitor checker that opted in with ``single_pass`` and does not change how the
+        model is scanned or walked.
+
+    """
+    if not isinstance(checker, VisitorChecker) or not checker.single_pass:
+        return False
+    checker_cls = type(checker)
+    return (
+        checker_cls.scan_file is VisitorChecker.scan_file
+        and checker_cls.visit is ModelVisitor.visit
+        and checker_cls.generic_visit is VisitorChecker.generic_visit
+    )
+
+
+def find_visitor(checker_cls: type, node_cls: type) -> Callable[[Any, Any], Any] | None:
+    """
+    Find the visitor method used for the node type, the same way ``ModelVisitor`` does.
+
+    Visitor method can be defined for the node class or for any of its base classes.
+
+    Returns:
+        Unbound visitor method or None if the checker does not define a visitor for the node type.
+
+    """
+    method_name = f"visit_{node_cls.__name__}"
+    method = getattr(checker_cls, method_name, None)
+    if callable(method):
+        return method  # type: ignore[no-any-return]
+    if method_name in BACKWARDS_COMPATIBLE_VISITORS:
+        method = getattr(checker_cls, BACKWARDS_COMPATIBLE_VISITORS[method_name], None)
+        if callable(method):
+            return method  # type: ignore[no-any-return]
+    for base in node_cls.__bases__:
+        if issubclass(base, ast.AST) and base is not ast.AST:
+            method = find_visitor(checker_cls, base)
+            if method is not None:
+                return method
+    return None
+
+
+def _iter_child_nodes(node: ast.AST) -> Iterator[ast.AST]:
+    """Yield child nodes in the same order as ``ast.NodeVisitor.generic_visit`` visits them."""
+    for field in node._fields:
+        value = getattr(node, field, None)
+        if isinstance(value, list):
+            for item in value:
+                if isinstance(item, ast.AST):
+                    yield item
+        elif isinstance(value, ast.AST):
+            yield value
+
+
+class CheckerDispatcher:
+    """Scan the file with several visitor checkers in a single walk over the model."""
+
+    def __init__(self, checkers: list[BaseChecker]) -> None:
+        self.checkers: list[VisitorChecker] = [checker for checker in checkers if can_be_dispatched(checker)]  # type: ignore[misc]
+        self._handlers: dict[type, tuple[Handler, ...]] = {}
+        self._timings: Timings | None = None
+        self._profiled_handlers: dict[type, tuple[Handler, ...]] = {}
+
+    def __contains__(self, checker: BaseChecker) -> bool:
+        return any(checker is dispatched for dispatched in self.checkers)
+
+    def _get_handlers(self, node_cls: type) -> tuple[Handler, ...]:
+        handlers = self._handlers.get(node_cls)
+        if handlers is None:
+            found = []
+            for index, checker in enumerate(self.checkers):
+                method = find_visitor(type(checker), node_cls)
+                if method is None or method is ModelVisitor.generic_visit or method is VisitorChecker.generic_visit:
+                    continue
+                found.append((index, checker, method))
+            handlers = tuple(found)
+            self._handlers[node_cls] = handlers
+        if self._timings is not None:
+            return self._get_profiled_handlers(node_cls, handlers, self._timings)
+        return handlers
+
+    def _get_profiled_handlers(
+        self, node_cls: type, handlers: tuple[Handler, ...], active: Timings
+    ) -> tuple[Handler, ...]:
+        profiled = self._profiled_handlers.get(node_cls)
+        if profiled is None:
+            profiled = tuple(
+                (index, checker, active.profile(method, active.checker(type(checker).__name__)))
+                for index, checker, method in handlers
+            )
+            self._profiled_handlers[node_cls] = profiled
+        return profiled
+
+    def scan_file(self, source_file: SourceFile, templated: bool = False) -> dict[int, list[Diagnostic]]:
+        """
+        Scan the file with every dispatched checker.
+
+        Returns:
+            Issues found by every checker, by the checker ``id``.
+
+        """
+        active = timings.active_timings()
+        if active is not self._timings:  # visitor methods are wrapped again for every collected timings
+            self._timings = active
+            self._profiled_handlers = {}
+        for checker in self.checkers:
+            checker.issues = []
+            checker.source_file = source_file
+            checker.templated_suite = templated
+            checker.context = Context()
+        self._visit(source_file.model, frozenset(range(len(self.checkers))))
+        return {id(checker): checker.issues for checker in self.checkers}
+
+    def _visit(self, node: ast.AST, active: frozenset[int]) -> None:
+        handlers = [handler for handler in self._get_handlers(type(node)) if handler[0] in active]
+        if handlers:
+            self._call_handlers(node, handlers, 0, set(active))
+        else:
+            self._visit_children(node, active)
+
+    def _call_handlers(self, node: ast.AST, handlers: list[Handler], position: int, active: set[int]) -> None:
+        """
+        Call visitor methods of the node starting from the given position, and visit the node children.
+
+        When the visitor method calls ``self.generic_visit(node)``, the rest of the handlers and the children of the
+        node are visited inside this call. If it does not, the checker does not visit the children.
+        """
+        for current in range(position, len(handlers)):
+            index, checker, method = handlers[current]
+            continued: list[bool] = []
+
+            def continue_handlers(position: int = current + 1, continued: list[bool] = continued) -> None:
+                continued.append(True)
+                if self._timings is None:
+                    self._call_handlers(node, handlers, position, active)
+                    return
+                # walking the children inside the visitor method is not the time of the checker
+                self._timings.enter(self._timings.phase(timings.LINTING), count=False)
+                try:
+                    self._call_handlers(node, handlers, position, active)
+                finally:
+                    self._timings.exit()
+
+            checker.dispatched_children = (node, continue_handlers)
+            try:
+                method(checker, node)
+            finally:
+                checker.dispatched_children = None
+            if continued:  # the rest of the handlers and the children were visited inside the visitor method
+                return
+            active.discard(index)
+        self._visit_children(node, frozenset(active))
+
+    def _visit_children(self, node: ast.AST, active: frozenset[int]) -> None:
+        if not active:
+            return
+        for child in _iter_child_nodes(node):
+            if child._fields:
+                self._visit(child, active)
+                continue
+            # statements do not have child nodes, so their visitor methods can be called directly
+            for index, checker, method in self._get_handlers(type(child)):
+                if index in active:
+                    method(checker, child)
@@ -0,0 +1,212 @@
+"""
+Merging the reports generated by separate runs of Robocop, for example by the shards of a CI pipeline.
+
+Reports saved to files are supported: ``json_report``, ``sarif``, ``sonarqube`` and ``gitlab``. The format is
+detected from the content of the files, and all merged files need to have the same format. Issues from the files are
+combined in one report of the same format, and the severities of the issues are returned, so the exit code can be
+calculated the same way as in a single run.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from robocop import exceptions
+from robocop.linter.reports import get_reports
+from robocop.linter.rules import RuleSeverity
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from robocop.config.schema import Config
+
+SARIF_LEVELS = {"error": RuleSeverity.ERROR, "warning": RuleSeverity.WARNING, "note": RuleSeverity.INFO}
+GITLAB_SEVERITIES = {
+    "info": RuleSeverity.INFO,
+    "minor": RuleSeverity.WARNING,
+    "major": RuleSeverity.ERROR,
+    "critical": RuleSeverity.ERROR,
+    "blocker": RuleSeverity.ERROR,
+}
+SONARQUBE_SEVERITIES = {
+    "INFO": RuleSeverity.INFO,
+    "LOW": RuleSeverity.INFO,
+    "MINOR": RuleSeverity.WARNING,
+    "MEDIUM": RuleSeverity.WARNING,
+    "MAJOR": RuleSeverity.ERROR,
+    "HIGH": RuleSeverity.ERROR,
+    "BLOCKER": RuleSeverity.ERROR,
+}
+
+
+@dataclass
+class MergedReport:
+    """
+    Report combined from the reports of several runs.
+
+    Attributes:
+        report_type: Name of the report the merged files were generated by.
+        content: Merged content, ready to be saved as JSON.
+        severities: Severity of every merged issue.
+
+    """
+
+    report_type: str
+    content: list[dict[str, Any]] | dict[str, Any]
+    severities: list[RuleSeverity]
+
+
+def detect_report_type(report: Any, path: Path) -> str | None:
+    """
+    Detect the name of the report that generated the file.
+
+    Returns:
+        Name of the report, or None if the report is empty and could be generated by any list based report.
+
+    Raises:
+        FatalError: If the file was not generated by a supported report.
+
+    """
+    if isinstance(report, dict):
+        if "runs" in report:
+            return "sarif"
+        if "issues" in report and "rules" in report:
+            return "sonarqube"
+    elif isinstance(report, list):
+        if not report:
+            return None
+        if isinstance(report[0], dict) and "fingerprint" in report[0]:
+            return "gitlab"
+        if isinstance(report[0], dict) and "rule_id" in report[0]:
+            return "json_report"
+    raise exceptions.FatalError(
+        f"File '{path}' is not a supported report. Supported reports: json_report, sarif, sonarqube and gitlab."
+    )
+
+
+def merge_json_reports(reports: list[Any]) -> MergedReport:
+    issues = [issue for report in reports for issue in report]
+    issues.sort(key=lambda issue: (issue["source"], issue["line"], issue["column"], issue["rule_id"]))
+    return MergedReport("json_report", issues, [RuleSeverity(issue["severity"]) for issue in issues])
+
+
+def merge_gitlab_reports(reports: list[Any]) -> MergedReport:
+    issues: dict[str, dict[str, Any]] = {}
+    for report in reports:
+        for issue in report:
+            issues.setdefault(issue["fingerprint"], issue)
+    return MergedReport(
+        "gitlab", list(issues.values()), [GITLAB_SEVERITIES[issue["severity"]] for issue in issues.values()]
+    )
+
+
+def merge_sarif_reports(reports: list[Any]) -> MergedReport:
+    rules: dict[str, dict[str, Any]] = {}
+    results: list[dict[str, Any]] = []
+    for report in reports:
+        for run in report["runs"]:
+            for rule in run["tool"]["driver"]["rules"]:
+                rules.setdefault(rule["id"], rule)
+            results.extend(run["results"])
+    merged = reports[0]
+    merged_run = merged["runs"][0]
+    merged["runs"] = [merged_run]
+    merged_run["tool"]["driver"]["rules"] = [rules[rule_id] for rule_id in sorted(rules)]
+    merged_run["results"] = results
+    return MergedReport("sarif", merged, [SARIF_LEVELS[result["level"]] for result in results])
+
+
+def sonarqube_rule_severity(rule: dict[str, Any]) -> RuleSeverity:
+    if "impacts" in rule:  # SonarQube 10.3 onwards
+        return SONARQUBE_SEVERITIES[rule["impacts"][0]["severity"]]
+    return SONARQUBE_SEVERITIES[rule["severity"]]
+
+
+def merge_sonarqube_reports(reports: list[Any]) -> MergedReport:
+    rules: dict[str, dict[str, Any]] = {}
+    issues: list[dict[str, Any]] = []
+    for report in reports:
+        for rule in report["rules"]:
+            rules.setdefault(rule["id"], rule)
+        issues.extend(report["issues"])
+    severities = [sonarqube_rule_severity(rules[issue["ruleId"]]) for issue in issues]
+    return MergedReport("sonarqube", {"rules": list(rules.values()), "issues": issues}, severities)
+
+
+MERGERS: dict[str, Callable[[list[Any]], MergedReport]] = {
+    "json_report": merge_json_reports,
+    "gitlab": merge_gitlab_reports,
+    "sarif": merge_sarif_reports,
+    "sonarqube": merge_sonarqube_reports,
+}
+
+
+def load_report(path: Path) -> Any:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as err:
+        raise exceptions.FatalError(f"Failed to read the report from '{path}': {err}") from None
+
+
+def merge_reports(paths: list[Path]) -> MergedReport:
+    """
+    Merge the report files generated by the same report.
+
+    Returns:
+        Merged report.
+
+    Raises:
+        FatalError: If any file cannot be read, or the files were generated by different reports.
+
+    """
+    reports = [load_report(path) for path in paths]
+    report_types = {path: detect_report_type(report, path) for path, report in zip(paths, reports, strict=True)}
+    found_types = {report_type for report_type in report_types.values() if report_type is not None}
+    if len(found_types) > 1:
+        found = ", ".join(f"{path} ({report_type})" for path, report_type in report_types.items() if report_type)
+        raise exceptions.FatalError(f"Only reports of the same type can be merged. Found: {found}")
+    report_type = found_types.pop() if found_types else "json_report"
+    if report_type in ("json_report", "gitlab"):  # empty reports have no issues to merge
+        reports = [report for report in reports if report]
+    return MERGERS[report_type](reports)
+
+
+def save_report(report: MergedReport, output: Path) -> None:
+    try:
+        output.parent.mkdir(exist_ok=True, parents=True)
+        with open(output, "w") as fp:
+            json.dump(report.content, fp, indent=4)
+    except OSError as err:
+        raise exceptions.FatalError(f"Failed to write merged report to {output}: {err}") from None
+
+
+def calculate_exit_code(report: MergedReport, config: Config) -> int:
+    """
+    Calculate the exit code of the merged report, the same way as ``robocop check`` does for a single run.
+
+    The exit code is 0 with ``exit_zero``. If the ``return_status`` report is enabled, its quality gates decide the
+    exit code. Otherwise, the exit code is 1 if there is any issue.
+
+    Returns:
+        Exit code.
+
+    """
+    if config.linter.exit_zero:
+        return 0
+    enabled_reports = get_reports(config)
+    if "return_status" not in enabled_reports:
+        return 1 if report.severities else 0
+    return_status = enabled_reports["return_status"]
+    for configured in config.linter.configure:
+        try:
+            name, param_and_value = configured.split(".", maxsplit=1)
+            param, value = param_and_value.split("=", maxsplit=1)
+        except ValueError:
+            raise exceptions.InvalidConfigurationFormatError(configured) from None
+        if name == "return_status":
+            return_status.configure(param, value)
+    return_status.calculate_return_status(report.severities)  # type: ignore[attr-defined]
+    return return_status.return_status  # type: ignore[attr-defined]
@@ -0,0 +1,95 @@
+"""
+Linting of the source files in separate processes.
+
+Diagnostics reference rules and checkers loaded in the process that found them, so they cannot be sent between
+the processes as they are. Worker processes return them in the same serialized form that is used by the cache, and
+the main process restores them using its own rules.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+from robot.errors import DataError
+
+from robocop.cache import CachedDiagnostic
+from robocop.linter.fix import FixApplier
+from robocop.runtime import timings
+from robocop.runtime.resolver import ConfigResolver
+
+if TYPE_CHECKING:
+    from robocop.source_file import SourceFile
+
+
+@dataclass
+class FileCheckResult:
+    """Result of linting a single file in the worker process."""
+
+    diagnostics: tuple[CachedDiagnostic, ...] | None
+    """Found diagnostics, or None if the file could not be decoded."""
+    error: str | None = None
+    """Error raised while decoding the file."""
+    fixes: dict[tuple[str, str], int] = field(default_factory=dict)
+    """Number of applied fixes per ``(rule_id, rule_name)``."""
+    total_fixes: int = 0
+    modified: bool = False
+    source_lines: list[str] | None = None
+    """Fixed source lines. Only set in the diff mode, where the fixed file is not saved."""
+    original_source_lines: list[str] | None = None
+    timings: dict[str, Any] | None = None
+    """Timings collected while linting the file, if requested."""
+
+
+@cache
+def _worker_config_resolver() -> ConfigResolver:
+    """Return the config resolver shared by all files linted in the current worker process."""
+    return ConfigResolver(load_rules=True, lazy_rules=True)
+
+
+def check_file(source_file: SourceFile, collect_timings: bool = False) -> FileCheckResult:
+    """
+    Lint the source file in the worker process.
+
+    Rules are loaded separately in every worker process, using the configuration of the linted file.
+
+    Args:
+        source_file: Linted source file.
+        collect_timings: Measure the time of linting the file, to be merged into the timings of the main process.
+
+    Returns:
+        Serialized result of linting the file.
+
+    """
+    if not collect_timings:
+        return _check_file(source_file)
+    timings.start_timings()
+    try:
+        result = _check_file(source_file)
+    finally:
+        collected = timings.stop_timings()
+    result.timings = collected.to_dict() if collected is not None else None
+    return result
+
+
+def _check_file(source_file: SourceFile) -> FileCheckResult:
+    from robocop.linter.runner import check_source_file  # noqa: PLC0415
+
+    fix_applier = FixApplier()
+    resolved_config = _worker_config_resolver().resolve_config(source_file.config)
+    try:
+        with timings.file(str(source_file.path)):
+            diagnostics = check_source_file(source_file, resolved_config, fix_applier)
+    except DataError as error:
+        return FileCheckResult(diagnostics=None, error=str(error))
+    result = FileCheckResult(
+        diagnostics=tuple(CachedDiagnostic.from_diagnostic(diagnostic) for diagnostic in diagnostics),
+        fixes=fix_applier.fix_stats.by_file.get(source_file.path, {}),
+        total_fixes=fix_applier.fix_stats.total_fixes,
+        modified=source_file.modified,
+    )
+    if source_file.modified and source_file.config.linter.diff:
+        result.source_lines = source_file.source_lines
+        result.original_source_lines = source_file.original_source_lines
+    return result
@@ -6,6 +6,8 @@ from typing import TYPE_CHECKING
 import robocop.linter.reports
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from robocop.config.schema import Config
     from robocop.linter.diagnostics import Diagnostics
     from robocop.linter.rules import RuleSeverity
@@ -40,9 +42,13 @@ class ReturnStatusReport(robocop.linter.reports.Report):
                 continue
 
     def generate_report(self, diagnostics: Diagnostics, **kwargs: object) -> None:  # type: ignore[override]  # noqa: ARG002
+        self.calculate_return_status(diagnostic.severity for diagnostic in diagnostics)
+
+    def calculate_return_status(self, severities: Iterable[RuleSeverity]) -> None:
+        """Calculate the return status from the severities of the issues, for example read from merged reports."""
         severity_counter: defaultdict[RuleSeverity, int] = defaultdict(int)
-        for diagnostic in diagnostics:
-            severity_counter[diagnostic.severity] += 1
+        for severity in severities:
+            severity_counter[severity] += 1
         for severity, count in severity_counter.items():
             threshold = self.quality_gate.get(severity.value, 0)
             if -1 < threshold < count:
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import robocop.linter.reports
+from robocop import exceptions
+from robocop.files import get_relative_path
+from robocop.runtime import timings
+
+if TYPE_CHECKING:
+    from robocop.config.schema import Config
+    from robocop.runtime.timings import Timing, Timings
+
+
+class TimingsReport(robocop.linter.reports.JsonFileReport):
+    """
+    **Report name**: ``timings``
+
+    Report that prints how long the phases of the run and every checker took, and which files were the slowest
+    to lint.
+
+    Time is always counted for the innermost measured section, so the sections do not overlap. For example, the time
+    of parsing the files imported by the project checkers counts as ``parsing``. Files linted with several
+    ``--jobs`` are measured in the worker processes and their times are summed.
+
+    This report is not included in the default reports. The ``--reports all`` option will not enable this report.
+    You can still enable it using the report name directly: ``--reports timings`` or ``--reports all,timings``.
+
+    Number of the reported slowest files can be configured with ``slowest_files`` (default ``10``):
+
+        robocop check --reports timings --configure timings.slowest_files=20
+
+    Timings can be also saved to the JSON file, by configuring the ``output_path``:
+
+        robocop check --reports timings --configure timings.output_path=timings.json
+
+    Example:
+        Timings (total 2.153s):
+        Phase                 Time       %   Calls
+        parsing             0.912s   42.4%     240
+        linting             0.301s   14.0%     120
+        ...
+
+    """
+
+    NO_ALL = False
+
+    def __init__(self, config: Config) -> None:
+        self.name = "timings"
+        self.description = "Prints time of the run phases, checkers and the slowest files"
+        self.slowest_files = 10
+        super().__init__(output_path="", config=config)
+
+    def configure(self, name: str, value: str) -> None:
+        if name == "slowest_files":
+            try:
+                self.slowest_files = int(value)
+            except ValueError:
+                raise exceptions.ConfigurationError(
+                    f"Invalid value '{value}' for report 'timings' parameter 'slowest_files'. Expected an integer."
+                ) from None
+        else:
+            super().configure(name, value)
+
+    def generate_report(self, **kwargs: object) -> None:  # type: ignore[override]  # noqa: ARG002
+        collected = timings.active_timings()
+        if collected is None:  # not collected in this process, for example when the run is not started by the linter
+            return
+        collected.flush()
+        if self.output_path:
+            super().generate_report_with_type(self.to_json(collected), "timings")
+        if self.config.silent:
+            return
+        print(self.get_report(collected))
+
+    def get_slowest_files(self, collected: Timings) -> list[tuple[str, float]]:
+        return [
+            (get_relative_path(Path(path), Path.cwd()).as_posix(), seconds)
+            for path, seconds in collected.slowest_files(self.slowest_files)
+        ]
+
+    def to_json(self, collected: Timings) -> dict[str, Any]:
+        return {
+            "total": collected.total,
+            "phases": {name: timing.to_dict() for name, timing in self.ordered(collected.phases)},
+            "checkers": {name: timing.to_dict() for name, timing in self.ordered(collected.checkers)},
+            "slowest_files": [
+                {"source": source, "seconds": seconds} for source, seconds in self.get_slowest_files(collected)
+            ],
+        }
+
+    @staticmethod
+    def ordered(section: dict[str, Timing]) -> list[tuple[str, Timing]]:
+        return sorted(section.items(), key=lambda item: (-item[1].seconds, item[0]))
+
+    def get_report(self, collected: Timings) -> str:
+        total = collected.total
+        report = f"\nTimings (total {total:.3f}s):"
+        for header, section in (("Phase", collected.phases), ("Checker", collected.checkers)):
+            ordered = self.ordered(section)
+            if not ordered:
+                continue
+            longest_name = max(len(header), *(len(name) for name, _ in ordered))
+            report += f"\n{header:{longest_name}}  {'Time':>9}  {'%':>6}  {'Calls':>7}"
+            for name, timing in ordered:
+                share = timing.seconds / total * 100 if total else 0.0
+                report += f"\n{name:{longest_name}}  {timing.seconds:8.3f}s  {share:5.1f}%  {timing.calls:7}"
+        slowest_files = self.get_slowest_files(collected)
+        if slowest_files:
+            report += "\nSlowest files:"
+            report += "".join(f"\n{seconds:8.3f}s  {source}" for source, seconds in slowest_files)
+        return report
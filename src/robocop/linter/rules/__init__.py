@@ -22,6 +22,7 @@ You can optionally configure rule severity or other parameters.
 
 from __future__ import annotations
 
+import copy
 from enum import Enum
 from functools import total_ordering
 from textwrap import dedent
@@ -368,6 +369,8 @@ class Rule:
         self.load_config()
 
     def load_config(self) -> None:
+        if self.severity_threshold is not None:
+            self.severity_threshold = copy.copy(self.severity_threshold)
         self.version_spec = VersionSpecifier(self.version) if self.version else None
         self.default_enabled = self.enabled
         self.default_severity = self.severity  # used for defaultConfiguration in Sarif report
@@ -378,7 +381,8 @@ class Rule:
         """
         Create internal config of the rule.
 
-        By default, each rule contains severity parameter.
+        By default, each rule contains severity parameter. Parameters are copied from the class, so that configuring
+        the rule does not change other instances of the same rule - every configuration has its own instances.
         """
         config: dict[str, RuleParam | SeverityThreshold] = {
             "severity": RuleParam(
@@ -394,7 +398,7 @@ class Rule:
         if not self.parameters:
             return config
         for param in self.parameters:
-            config[param.name] = param
+            config[param.name] = copy.copy(param)
         return config
 
     def __getattr__(self, name: str) -> Any:
@@ -607,6 +611,17 @@ class BaseChecker:
 
 
 class VisitorChecker(BaseChecker, ModelVisitor):  # type: ignore[misc]
+    single_pass: bool = False
+    """
+    Scan the file with this checker and other single pass checkers in one walk over the model.
+
+    Visitor methods of such checker can visit the children of the node only by calling ``self.generic_visit(node)``
+    at most once. They must not traverse the model in any other way, for example by calling ``self.visit(child)``.
+    Other checkers are scanned separately with ``scan_file``.
+    """
+    dispatched_children: tuple[object, Callable[[], None]] | None = None
+    """Node whose children are visited by the dispatcher, and the callback visiting them."""
+
     def scan_file(self, source_file: SourceFile, templated: bool = False) -> list[Diagnostic]:
         self.issues: list[Diagnostic] = []
         self.source_file = source_file
@@ -619,8 +634,26 @@ class VisitorChecker(BaseChecker, ModelVisitor):  # type: ignore[misc]
         """Perform generic ast visit on file node."""
         self.generic_visit(node)
 
+    def generic_visit(self, node: Node) -> None:
+        """Visit the children of the node, or let the dispatcher visit them if the checker is dispatched."""
+        dispatched = self.dispatched_children
+        if dispatched is not None and dispatched[0] is node:
+            self.dispatched_children = None
+            dispatched[1]()
+            return
+        super().generic_visit(node)
+
 
 class ProjectChecker(BaseChecker):
+    incremental: bool = False
+    """
+    Report issues in a file based only on the file itself and the files it imports, directly or not.
+
+    When some project files change, such checker is run only on the files affected by the changes and the cached
+    issues of the other files are kept. The checker must iterate over the files with ``reported_only=True`` and report
+    issues only in the iterated files. Other checkers analyse the whole project again.
+    """
+
     def scan_project(
         self,
         project_source_file: SourceFile | VirtualSourceFile,
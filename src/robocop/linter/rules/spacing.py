@@ -950,11 +950,13 @@ def count_indents(node: Node) -> Counter[int]:
     indents: Counter[int] = Counter()
     if node is None:
         return indents
+    # block lineno is calculated by searching the first statement of the block, so it is calculated only once
+    test_lineno = node.lineno if isinstance(node, TestCase) else None
     for line in node.body:
         if isinstance(line, (EmptyLine, Comment)):
             continue
         # for templated suite, there can be data on the same line where the test case name is
-        if node.lineno == line.lineno and isinstance(node, TestCase):
+        if test_lineno == line.lineno:
             indents[len(node.name) + (get_indent(line))] += 1
         else:
             indents[(get_indent(line))] += 1
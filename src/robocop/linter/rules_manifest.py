@@ -0,0 +1,146 @@
+"""
+Manifest of the built-in rules, used to import only the checkers with the rules that can be enabled.
+
+Importing every checker module and creating every rule takes a large part of the startup time, even if only a single
+rule is selected. The manifest describes every built-in rule - its id, name, severity and other properties that decide
+whether the rule is enabled - together with the checker modules reporting it. It is stored next to this module and
+regenerated after any change in the rules or the checkers with::
+
+    python -m robocop.linter.rules_manifest
+
+The manifest stores the hash of the rules and checkers sources and is ignored if they changed since it was generated,
+so an outdated manifest only makes Robocop import all the checkers as before.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from robocop.linter.rules import RuleSeverity
+from robocop.version_handling import VersionSpecifier
+
+if TYPE_CHECKING:
+    from robocop.version_handling import Version
+
+LINTER_DIR = Path(__file__).parent
+MANIFEST_PATH = LINTER_DIR / "rules_manifest.json"
+SOURCE_DIRS = (LINTER_DIR / "rules", LINTER_DIR / "checkers")
+
+
+@dataclass(frozen=True)
+class RuleManifestEntry:
+    """
+    Built-in rule described by the manifest.
+
+    It provides the same attributes as the ``Rule`` used by ``RuleMatcher``, so it can be matched against the rule
+    filters before the rule itself is imported.
+    """
+
+    rule_id: str
+    name: str
+    severity: RuleSeverity
+    enabled: bool
+    deprecated: bool
+    project_rule: bool
+    version: str | None
+    has_severity_threshold: bool
+    modules: tuple[str, ...]
+
+    @property
+    def config(self) -> dict[str, bool]:
+        return {"severity_threshold": True} if self.has_severity_threshold else {}
+
+    def is_disabled(self, target_version: Version) -> bool:
+        return self.deprecated or (self.version is not None and target_version not in VersionSpecifier(self.version))
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["severity"] = self.severity.value
+        data["modules"] = list(self.modules)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> RuleManifestEntry:
+        return cls(**{**data, "severity": RuleSeverity(data["severity"]), "modules": tuple(data["modules"])})
+
+
+def sources_hash() -> str:
+    """
+    Calculate the hash of the rules and checkers sources.
+
+    Line endings are normalized, so the hash does not depend on how the sources were checked out.
+
+    Returns:
+        Hash of the sources.
+
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    for directory in SOURCE_DIRS:
+        for path in sorted(directory.glob("*.py")):
+            hasher.update(path.name.encode("utf-8"))
+            hasher.update(path.read_bytes().replace(b"\r\n", b"\n"))
+    return hasher.hexdigest()
+
+
+def build_manifest() -> dict[str, Any]:
+    """
+    Import all built-in checkers and describe their rules.
+
+    Returns:
+        Manifest ready to be saved as JSON.
+
+    """
+    from robocop.runtime.resolver import LinterImporter  # noqa: PLC0415
+
+    entries: dict[str, RuleManifestEntry] = {}
+    modules: dict[str, list[str]] = {}
+    for checker in LinterImporter().get_initialized_checkers():
+        for rule in checker.rules.values():
+            rule_modules = modules.setdefault(rule.rule_id, [])
+            if checker.__module__ not in rule_modules:
+                rule_modules.append(checker.__module__)
+            entries[rule.rule_id] = RuleManifestEntry(
+                rule_id=rule.rule_id,
+                name=rule.name,
+                severity=rule.severity,
+                enabled=rule.enabled,
+                deprecated=rule.deprecated,
+                project_rule=rule.project_rule,
+                version=rule.version,
+                has_severity_threshold=bool(rule.config.get("severity_threshold")),
+                modules=(),
+            )
+    rules = [
+        {**entries[rule_id].to_dict(), "modules": sorted(modules[rule_id])} for rule_id in sorted(entries, key=str)
+    ]
+    return {"sources_hash": sources_hash(), "rules": rules}
+
+
+def load_manifest() -> list[RuleManifestEntry] | None:
+    """
+    Load the manifest of the built-in rules.
+
+    Returns:
+        Rules from the manifest, or None if the manifest does not exist or the rules changed since it was generated.
+
+    """
+    try:
+        manifest = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if manifest.get("sources_hash") != sources_hash():
+        return None
+    return [RuleManifestEntry.from_dict(rule) for rule in manifest["rules"]]
+
+
+def save_manifest() -> None:
+    """Generate the manifest and save it next to this module."""
+    MANIFEST_PATH.write_text(json.dumps(build_manifest(), indent=2) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    save_manifest()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, NoReturn
 
@@ -9,33 +10,110 @@ from robot.api import get_init_model, get_model, get_resource_model
 from robot.errors import DataError
 
 from robocop import exceptions
-from robocop.cache import restore_diagnostics
+from robocop.cache import restore_cached_diagnostics, restore_diagnostics
 from robocop.files import resolve_path
 from robocop.linter import reports
 from robocop.linter.diagnostics import Diagnostics, RunStatistic
 from robocop.linter.fix import FixApplier
+from robocop.linter.parallel import check_file
 from robocop.linter.reports import save_reports_result_to_cache
 from robocop.linter.utils.disablers import DisablersFinder
 from robocop.linter.utils.file_types import get_resource_with_lang
 from robocop.linter.utils.misc import is_suite_templated
-from robocop.project.context import build_project_context
-from robocop.runtime.resolver import ConfigResolver
+from robocop.project.context import build_project_context, project_checks_hash, project_files_hash
+from robocop.runtime import session, timings
+from robocop.runtime.parallel import chunk_size, create_executor, resolve_jobs
 from robocop.source_file import SourceFile, VirtualSourceFile
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from robot.parsing import File
 
     from robocop.config.manager import ConfigManager
     from robocop.config.schema import Config
     from robocop.linter.diagnostics import Diagnostic
+    from robocop.linter.parallel import FileCheckResult
     from robocop.linter.rules import ProjectChecker
     from robocop.project.context import ProjectContext
+    from robocop.runtime.resolved_config import ResolvedConfig
+
+
+def check_source_file(
+    source_file: SourceFile, resolved_config: ResolvedConfig, fix_applier: FixApplier
+) -> list[Diagnostic]:
+    """
+    Run all rules on file model and return list of diagnostics.
+
+    If fixes are enabled, the file is scanned again after applying the fixes, until there is nothing left to fix.
+
+    Args:
+        source_file: SourceFile representing robot source file under the check.
+        resolved_config: Resolved configuration of the file, with loaded checkers.
+        fix_applier: The applier responsible for applying fixes to the source file.
+
+    Returns:
+        List of diagnostics found in the file.
+
+    """
+    templated = is_suite_templated(source_file.model)
+    prev_fixable = 0
+    # Iteratively scans, filters, applies fixes, and reloads model until convergence or no fixes remain
+    for _ in range(20):
+        found_diagnostics = []
+        disablers = DisablersFinder(source_file.model)
+        dispatched_issues = resolved_config.checker_dispatcher.scan_file(source_file, templated)
+        for checker in resolved_config.checkers:
+            issues = dispatched_issues.get(id(checker))
+            if issues is None:
+                with timings.checker(type(checker).__name__):
+                    issues = checker.scan_file(source_file, templated)  # type: ignore[attr-defined]
+            found_diagnostics += [
+                diagnostic
+                for diagnostic in issues
+                if not (
+                    diagnostic.severity < source_file.config.linter.threshold or disablers.is_rule_disabled(diagnostic)
+                )
+            ]
+            if disablers.file_disabled and found_diagnostics:  # special case to not report disabler as not used
+                return []
+        for checker in resolved_config.after_run_checkers:
+            with timings.checker(type(checker).__name__):
+                issues = checker.scan_file(source_file, disablers=disablers)
+            found_diagnostics += [
+                diagnostic
+                for diagnostic in issues
+                if not (
+                    diagnostic.severity < source_file.config.linter.threshold or disablers.is_rule_disabled(diagnostic)
+                )
+            ]
+        if found_diagnostics and source_file.config.linter.per_file_ignores:
+            for ignored_file, ignored_rules in source_file.config.linter.per_file_ignores.items():
+                if source_file.path.match(ignored_file):
+                    found_diagnostics = [
+                        diagnostic
+                        for diagnostic in found_diagnostics
+                        if diagnostic.rule.rule_id not in ignored_rules and diagnostic.rule.name not in ignored_rules
+                    ]
+        if not found_diagnostics or not (source_file.config.linter.fix or source_file.config.linter.diff):
+            fix_applier.fix_stats.total_fixes += prev_fixable
+            break
+        fixable_diagnostics = [diag for diag in found_diagnostics if diag.rule.fixable]
+        fix_applier.fix_stats.total_fixes += max(prev_fixable - len(fixable_diagnostics), 0)
+        prev_fixable = len(fixable_diagnostics)
+        # Collect fixes from diagnostics
+        fixes = [diag.fix or diag.rule.fix(diag, source_file.source_lines) for diag in fixable_diagnostics]
+        if not fix_applier.apply_fixes(source_file, [fix for fix in fixes if fix]):
+            break
+    if source_file.config.linter.fix and not source_file.config.linter.diff:
+        source_file.write_changes()
+    return found_diagnostics
 
 
 class RobocopLinter:
     def __init__(self, config_manager: ConfigManager) -> None:
         self.config_manager = config_manager
-        self.config_resolver = ConfigResolver(load_rules=True)
+        self.config_resolver = session.config_resolver(load_rules=True, lazy_rules=True)
         self.current_model: File = None
         # TODO: we can move reports to config resolver
         self.reports: dict[str, reports.Report] = reports.get_reports(self.config_manager.default_config)
@@ -55,13 +133,17 @@ class RobocopLinter:
         """
         Return cached diagnostics if available.
 
+        Diagnostics kept by the previous runs in the same session are used even if the cache is disabled.
+
         Returns:
             List of cached diagnostics or None if no cache is available.
 
         """
-        if not config.cache.enabled:
-            return None
-        cached_entry = self.config_manager.cache.get_linter_entry(source, config.hash)
+        cached_entry = session.previous_linter_entry(source, config.hash)
+        if cached_entry is None and config.cache.enabled:
+            cached_entry = self.config_manager.cache.get_linter_entry(source, config.hash)
+            if cached_entry is not None:
+                session.keep_linter_entry(source, config.hash, cached_entry)
 
         if cached_entry is not None:
             resolved_config = self.config_resolver.resolve_config(config)
@@ -104,45 +186,151 @@ class RobocopLinter:
             configuration language.
 
         """
-        self.diagnostics = []
-        files = 0
-        cached_files = 0
-        checked_paths: set[Path] = set()
-        fix_applier = FixApplier()
-        for source_file in self.config_manager.paths:
-            if source_file.config.verbose:
-                print(f"Scanning file: {source_file.path}")
-            checked_paths.add(source_file.resolved_path)
-            diagnostics = self.get_cached_diagnostics(source_file.config, source_file.path)
-            if diagnostics is not None:
-                no_fixables = all(not diag.rule.fixable for diag in diagnostics)
-                if no_fixables or not (source_file.config.linter.fix or source_file.config.linter.diff):
-                    self.diagnostics.extend(diagnostics)
-                    files += 1
+        # timings may be already collected by the caller, then the caller reports them
+        collect_timings = "timings" in self.reports and timings.active_timings() is None
+        if collect_timings:
+            timings.start_timings()
+        try:
+            self.diagnostics = []
+            files = 0
+            cached_files = 0
+            checked_paths: set[Path] = set()
+            fix_applier = FixApplier()
+            for source_file, diagnostics, from_cache in self.check_files(fix_applier):
+                checked_paths.add(source_file.resolved_path)
+                if diagnostics is None:
+                    continue
+                self.diagnostics.extend(diagnostics)
+                files += 1
+                if from_cache:
                     cached_files += 1
+                elif not source_file.config.linter.diff:  # diff simulate fixes, so it's best to ignore the results
+                    self.config_manager.cache.set_linter_entry(source_file.path, source_file.config.hash, diagnostics)
+                    session.keep_linter_entry(source_file.path, source_file.config.hash, diagnostics)
+            with timings.phase("cache save"):
+                self.config_manager.cache.save()
+            self.diagnostics.extend(self.run_project_checks(fix_applier, checked_paths))
+            with timings.phase("cache save"):
+                self.config_manager.cache.save()  # project analysis may cache imported libraries
+
+            if not files and not self.config_manager.default_config.silent:
+                print("No Robot files were found with the existing configuration.")
+            if self.config_manager.default_config.verbose and cached_files > 0:
+                print(f"Used cached results for {cached_files} of {files} files.")
+            run_stats = RunStatistic(
+                files_count=files, fix_stats=fix_applier.fix_stats, modified_files=fix_applier.modified_files
+            )
+            self.make_reports(run_stats=run_stats)
+            if self.config_manager.default_config.linter.return_result:
+                return self.diagnostics
+            return self.return_with_exit_code(len(self.diagnostics))
+        finally:
+            if collect_timings:
+                timings.stop_timings()
+
+    def check_files(self, fix_applier: FixApplier) -> Iterator[tuple[SourceFile, list[Diagnostic] | None, bool]]:
+        """
+        Lint every selected file, reusing the cached results where possible.
+
+        If more than one job is configured, files without cached results are linted in parallel, in separate
+        processes. Results are always returned in the order of the selected files, so the output does not depend
+        on the number of jobs. Every result is returned as soon as the file and the files before it are checked,
+        without waiting for the remaining files.
+
+        Yields:
+            Tuple of the source file, its diagnostics (None if the file cannot be decoded) and whether the
+            diagnostics were restored from the cache.
+
+        """
+        with timings.phase("discovery"):
+            source_files = list(self.config_manager.paths)
+        if self.config_manager.default_config.jobs == 1:
+            for source_file in source_files:
+                diagnostics = self.get_reusable_cached_diagnostics(source_file)
+                if diagnostics is not None:
+                    yield source_file, diagnostics, True
                     continue
-            diagnostics = self.get_model_diagnostics(source_file, fix_applier)
-            if diagnostics is None:
-                continue
-            self.diagnostics.extend(diagnostics)
-            files += 1
-            if not source_file.config.linter.diff:  # diff simulate fixes, so it's best to ignore the results
-                self.config_manager.cache.set_linter_entry(source_file.path, source_file.config.hash, diagnostics)
-        self.config_manager.cache.save()
-        self.diagnostics.extend(self.run_project_checks(fix_applier, checked_paths))
-        self.config_manager.cache.save()  # project analysis may cache imported libraries
-
-        if not files and not self.config_manager.default_config.silent:
-            print("No Robot files were found with the existing configuration.")
-        if self.config_manager.default_config.verbose and cached_files > 0:
-            print(f"Used cached results for {cached_files} of {files} files.")
-        run_stats = RunStatistic(
-            files_count=files, fix_stats=fix_applier.fix_stats, modified_files=fix_applier.modified_files
-        )
-        self.make_reports(run_stats=run_stats)
-        if self.config_manager.default_config.linter.return_result:
-            return self.diagnostics
-        return self.return_with_exit_code(len(self.diagnostics))
+                yield source_file, self.get_model_diagnostics(source_file, fix_applier), False
+            return
+        cached = [self.get_reusable_cached_diagnostics(source_file) for source_file in source_files]
+        not_cached = [
+            source_file for source_file, diagnostics in zip(source_files, cached, strict=True) if diagnostics is None
+        ]
+        jobs = resolve_jobs(self.config_manager.default_config.jobs, len(not_cached))
+        if jobs == 1:
+            for source_file, diagnostics in zip(source_files, cached, strict=True):
+                if diagnostics is not None:
+                    yield source_file, diagnostics, True
+                else:
+                    yield source_file, self.get_model_diagnostics(source_file, fix_applier), False
+            return
+        collected_timings = timings.active_timings()
+        check = partial(check_file, collect_timings=collected_timings is not None)
+        with create_executor(jobs) as executor:
+            # results are returned in the order of the files, while the later files are still being checked
+            checked = executor.map(check, not_cached, chunksize=chunk_size(jobs, len(not_cached)))
+            for source_file, diagnostics in zip(source_files, cached, strict=True):
+                if diagnostics is not None:
+                    yield source_file, diagnostics, True
+                    continue
+                with timings.phase("waiting for workers"):
+                    result = next(checked)
+                if collected_timings is not None and result.timings is not None:
+                    collected_timings.merge(result.timings)
+                yield source_file, self.restore_check_result(source_file, result, fix_applier), False
+
+    def get_reusable_cached_diagnostics(self, source_file: SourceFile) -> list[Diagnostic] | None:
+        """
+        Return cached diagnostics of the file, unless it needs to be linted again.
+
+        Files with fixable issues are linted again in the fix mode, so that the fixes can be applied.
+
+        Returns:
+            List of cached diagnostics or None if the file needs to be linted.
+
+        """
+        if source_file.config.verbose:
+            print(f"Scanning file: {source_file.path}")
+        with timings.phase("cache load"):
+            diagnostics = self.get_cached_diagnostics(source_file.config, source_file.path)
+        if diagnostics is None:
+            return None
+        no_fixables = all(not diag.rule.fixable for diag in diagnostics)
+        if no_fixables or not (source_file.config.linter.fix or source_file.config.linter.diff):
+            return diagnostics
+        return None
+
+    def restore_check_result(
+        self, source_file: SourceFile, result: FileCheckResult, fix_applier: FixApplier
+    ) -> list[Diagnostic] | None:
+        """
+        Restore the result of linting the file in the worker process.
+
+        Applied fixes are added to the statistics of the run. In the diff mode the fixed file is not saved, so its
+        source lines are taken from the worker process.
+
+        Returns:
+            List of diagnostics or None if file cannot be decoded.
+
+        """
+        if result.diagnostics is None:
+            if not source_file.config.silent:
+                print(f"Failed to decode {source_file.path} with an error: {result.error}. Skipping file")
+            return None
+        if result.fixes:
+            fix_applier.fix_stats.by_file[source_file.path] = result.fixes
+        fix_applier.fix_stats.total_fixes += result.total_fixes
+        if result.modified:
+            modified_file = SourceFile(
+                path=source_file.path,
+                config=source_file.config,
+                modified=True,
+                _source_lines=result.source_lines,
+                _original_source_lines=result.original_source_lines,
+            )
+            fix_applier.modified_files.append(modified_file)
+        resolved_config = self.config_resolver.resolve_config(source_file.config)
+        return restore_cached_diagnostics(result.diagnostics, source_file.path, source_file.config, resolved_config)
 
     def run_check(self, source_file: SourceFile, fix_applier: FixApplier | None = None) -> list[Diagnostic]:
         """
@@ -156,54 +344,8 @@ class RobocopLinter:
         resolved_config = self.config_resolver.resolve_config(source_file.config)
         if fix_applier is None:
             fix_applier = FixApplier()
-        templated = is_suite_templated(source_file.model)
-        prev_fixable = 0
-        # Iteratively scans, filters, applies fixes, and reloads model until convergence or no fixes remain
-        for _ in range(20):
-            found_diagnostics = []
-            disablers = DisablersFinder(source_file.model)
-            for checker in resolved_config.checkers:
-                found_diagnostics += [
-                    diagnostic
-                    for diagnostic in checker.scan_file(source_file, templated)  # type: ignore[attr-defined]
-                    if not (
-                        diagnostic.severity < source_file.config.linter.threshold
-                        or disablers.is_rule_disabled(diagnostic)
-                    )
-                ]
-                if disablers.file_disabled and found_diagnostics:  # special case to not report disabler as not used
-                    return []
-            for checker in resolved_config.after_run_checkers:
-                found_diagnostics += [
-                    diagnostic
-                    for diagnostic in checker.scan_file(source_file, disablers=disablers)
-                    if not (
-                        diagnostic.severity < source_file.config.linter.threshold
-                        or disablers.is_rule_disabled(diagnostic)
-                    )
-                ]
-            if found_diagnostics and source_file.config.linter.per_file_ignores:
-                for ignored_file, ignored_rules in source_file.config.linter.per_file_ignores.items():
-                    if source_file.path.match(ignored_file):
-                        found_diagnostics = [
-                            diagnostic
-                            for diagnostic in found_diagnostics
-                            if diagnostic.rule.rule_id not in ignored_rules
-                            and diagnostic.rule.name not in ignored_rules
-                        ]
-            if not found_diagnostics or not (source_file.config.linter.fix or source_file.config.linter.diff):
-                fix_applier.fix_stats.total_fixes += prev_fixable
-                break
-            fixable_diagnostics = [diag for diag in found_diagnostics if diag.rule.fixable]
-            fix_applier.fix_stats.total_fixes += max(prev_fixable - len(fixable_diagnostics), 0)
-            prev_fixable = len(fixable_diagnostics)
-            # Collect fixes from diagnostics
-            fixes = [diag.fix or diag.rule.fix(diag, source_file.source_lines) for diag in fixable_diagnostics]
-            if not fix_applier.apply_fixes(source_file, [fix for fix in fixes if fix]):
-                break
-        if source_file.config.linter.fix and not source_file.config.linter.diff:
-            source_file.write_changes()
-        return found_diagnostics
+        with timings.file(str(source_file.path)):
+            return check_source_file(source_file, resolved_config, fix_applier)
 
     def run_project_checks(
         self, fix_applier: FixApplier | None = None, checked_paths: set[Path] | None = None
@@ -214,6 +356,10 @@ class RobocopLinter:
         Project checkers are only run if the project analysis is enabled. By default it happens whenever
         at least one project rule is enabled. It can be forced or disabled with the ``project`` option.
 
+        If only files changed since the git reference are linted, issues are reported only in files whose import
+        closure intersects the changed files. If the files are split into shards, every shard reports issues only in
+        its own files.
+
         Args:
             fix_applier: The applier responsible for applying fixes to the source files. Project checks are
                 repeated after applying the fixes, so that the reported issues match the fixed files.
@@ -234,40 +380,205 @@ class RobocopLinter:
             fix_applier = FixApplier()
         project_name = self.config_manager.root.name
         project_source_file = VirtualSourceFile(Path(project_name), config)
-        diagnostics = self.scan_project(project_source_file, resolved_config.project_checkers, config)
+        context = None
+        if self.config_manager.changed_paths is not None or self.config_manager.shard is not None:
+            # reported files are only known from the import graph and the project files, so the context is always built
+            context = self.build_context(config)
+        if not (config.linter.fix or config.linter.diff):
+            with timings.phase("cache load"):
+                cached = self.get_cached_project_diagnostics(config, resolved_config)
+            if cached is not None:
+                return cached if context is None else self.filter_reported(cached, context)
+        if context is None:
+            context = self.build_context(config)
+        outdated = None
+        if not (config.linter.fix or config.linter.diff) and context.reported_paths is None:
+            with timings.phase("cache load"):
+                outdated = self.get_outdated_project_diagnostics(config, resolved_config, context)
+        diagnostics = self.scan_project(
+            project_source_file, resolved_config.project_checkers, config, context, outdated
+        )
         if not (config.linter.fix or config.linter.diff):
+            # results limited to the files affected by the changes do not describe the whole project
+            if context.reported_paths is None:
+                self.cache_project_diagnostics(config, context, diagnostics)
             return diagnostics
         # Fixes may reveal or resolve other issues, so the project is scanned again until it converges.
         # In the diff mode files are not saved, so repeating the analysis would produce the same diagnostics.
+        # Only the fixed files are collected again, the rest of the context is reused from the previous scan.
         attempts = 5 if config.linter.fix and not config.linter.diff else 1
         for _ in range(attempts):
-            if not self.apply_project_fixes(diagnostics, fix_applier, checked_paths, save=not config.linter.diff):
+            fixed_paths = self.apply_project_fixes(diagnostics, fix_applier, checked_paths, save=not config.linter.diff)
+            if not fixed_paths:
                 break
-            diagnostics = self.scan_project(project_source_file, resolved_config.project_checkers, config)
+            context = self.build_context(config, previous=context, modified=fixed_paths)
+            diagnostics = self.scan_project(project_source_file, resolved_config.project_checkers, config, context)
+        return diagnostics
+
+    def get_cached_project_diagnostics(
+        self, config: Config, resolved_config: ResolvedConfig
+    ) -> list[Diagnostic] | None:
+        """
+        Return diagnostics of the project checkers stored in the cache, if the project did not change since.
+
+        Returns:
+            List of cached diagnostics or None if the project needs to be analysed.
+
+        """
+        if not config.cache.enabled:
+            return None
+        cached = self.config_manager.cache.get_project_checks_entry(
+            self.config_manager.root,
+            project_checks_hash(config, self.config_manager.root),
+            project_files_hash(self.config_manager),
+        )
+        if cached is None:
+            return None
+        diagnostics = []
+        for source, cached_diagnostic in cached:
+            restored = restore_cached_diagnostics([cached_diagnostic], Path(source), config, resolved_config)
+            if restored is None:  # rule no longer exists
+                return None
+            diagnostics.extend(restored)
+        if config.verbose and not config.silent:
+            print("Used cached results of the project checks.")
         return diagnostics
 
+    def get_outdated_project_diagnostics(
+        self, config: Config, resolved_config: ResolvedConfig, context: ProjectContext
+    ) -> tuple[set[Path], list[Diagnostic]] | None:
+        """
+        Return cached diagnostics of the project checkers that are still valid after some project files changed.
+
+        Diagnostics of the incremental checkers are kept for the files not affected by the changes, so that these
+        checkers only analyse the affected files. Nothing is kept if a changed file is not imported by the project
+        files, for example a variable file from the configuration or a library installed in the environment.
+
+        Returns:
+            Resolved paths of the files to check again with the incremental checkers and the kept diagnostics, or
+            None if the whole project needs to be analysed.
+
+        """
+        if not config.cache.enabled:
+            return None
+        root = self.config_manager.root
+        outdated = self.config_manager.cache.get_outdated_project_checks_entry(root, project_checks_hash(config, root))
+        if outdated is None:
+            return None
+        entry, changed = outdated
+        file_configs = self.project_file_configs()
+        previous_files = {Path(path) for path in entry.file_configs}
+        changed.update(
+            path for path, file_config in file_configs.items() if entry.file_configs.get(str(path)) != file_config
+        )
+        changed.update(previous_files - set(file_configs))
+        previous_imported_by = {
+            Path(path): {Path(importer) for importer in importers} for path, importers in entry.imported_by.items()
+        }
+        rechecked = context.changed_dependants(changed, previous_files, previous_imported_by)
+        if rechecked is None:
+            return None
+        incremental_rules = {
+            rule.name
+            for checker in resolved_config.project_checkers
+            if checker.incremental
+            for rule in checker.rules.values()
+        }
+        kept = []
+        for source, cached_diagnostic in entry.diagnostics:
+            path = Path(source)
+            if cached_diagnostic.rule_name not in incremental_rules or path in rechecked or path not in context.files:
+                continue
+            restored = restore_cached_diagnostics([cached_diagnostic], path, config, resolved_config)
+            if restored is None:  # rule no longer exists
+                return None
+            kept.extend(restored)
+        if config.verbose and not config.silent:
+            print(f"Updating cached results of the project checks for {len(rechecked)} files.")
+        return rechecked, kept
+
+    def cache_project_diagnostics(self, config: Config, context: ProjectContext, diagnostics: list[Diagnostic]) -> None:
+        """Store diagnostics of the project checkers, together with every file they depend on."""
+        if not config.cache.enabled:
+            return
+        if context.library_loader is not None and context.library_loader.budget_exceeded:
+            return  # libraries skipped because of the import budget would be missing from the cached results
+        self.config_manager.cache.set_project_checks_entry(
+            self.config_manager.root,
+            project_checks_hash(config, self.config_manager.root),
+            project_files_hash(self.config_manager),
+            context.dependencies(),
+            diagnostics,
+            file_configs=self.project_file_configs(),
+            imported_by=context.imported_by(),
+        )
+
+    def project_file_configs(self) -> dict[Path, str]:
+        """
+        Return the hashes of the configurations of the project source files.
+
+        Returns:
+            Dictionary of resolved path of every project source file to the hash of its configuration.
+
+        """
+        return {source_file.resolved_path: source_file.config.hash for source_file in self.config_manager.project_paths}
+
     def scan_project(
         self,
         project_source_file: VirtualSourceFile,
         project_checkers: list[ProjectChecker],
         config: Config,
+        context: ProjectContext,
+        outdated: tuple[set[Path], list[Diagnostic]] | None = None,
     ) -> list[Diagnostic]:
         """
-        Build the project context and run every project checker on it.
+        Run every project checker on the project context.
+
+        Args:
+            project_source_file: Virtual source file representing the whole project.
+            project_checkers: Enabled project checkers.
+            config: Default configuration of the project.
+            context: Project context with every project file.
+            outdated: Files affected by the changes since the cached results and the cached diagnostics of the
+                incremental checkers that are still valid. Incremental checkers only analyse the affected files.
 
         Returns:
             List of diagnostics found by the project checkers.
 
         """
-        context = self.build_context(config)
         diagnostics: list[Diagnostic] = []
+        reported_paths = context.reported_paths
         for checker in project_checkers:
             checker.issues = []
-            checker.scan_project(project_source_file, self.config_manager, context)
+            if outdated is not None and checker.incremental:
+                context.reported_paths = outdated[0]
+            try:
+                with timings.checker(type(checker).__name__):
+                    checker.scan_project(project_source_file, self.config_manager, context)
+            finally:
+                context.reported_paths = reported_paths
             diagnostics.extend(
                 [diagnostic for diagnostic in checker.issues if not (diagnostic.severity < config.linter.threshold)]
             )
-        return diagnostics
+        if outdated is not None:
+            diagnostics.extend(outdated[1])
+        return self.filter_reported(diagnostics, context)
+
+    @staticmethod
+    def filter_reported(diagnostics: list[Diagnostic], context: ProjectContext) -> list[Diagnostic]:
+        """
+        Keep only diagnostics from the files whose issues are reported.
+
+        Checkers analysing the whole project, such as the search for circular imports, still find issues in files
+        not affected by the changes. They are dropped here.
+
+        Returns:
+            Diagnostics from the reported files.
+
+        """
+        if context.reported_paths is None:
+            return diagnostics
+        return [diagnostic for diagnostic in diagnostics if diagnostic.source.resolved_path in context.reported_paths]
 
     def apply_project_fixes(
         self,
@@ -275,7 +586,7 @@ class RobocopLinter:
         fix_applier: FixApplier,
         checked_paths: set[Path] | None,
         save: bool,
-    ) -> bool:
+    ) -> set[Path]:
         """
         Apply fixes for the issues reported by the project checkers.
 
@@ -290,7 +601,7 @@ class RobocopLinter:
             save: Whether the fixed files should be saved. Disabled in the diff mode.
 
         Returns:
-            True if any fix was applied.
+            Resolved paths of the fixed files. Empty if no fix was applied.
 
         """
         diag_by_source: dict[Path, list[Diagnostic]] = defaultdict(list)
@@ -301,10 +612,10 @@ class RobocopLinter:
                 continue
             diag_by_source[diagnostic.source.path].append(diagnostic)
         if not diag_by_source:
-            return False
+            return set()
         modified_files = {source_file.resolved_path: source_file for source_file in fix_applier.modified_files}
         project_files = {source_file.resolved_path: source_file for source_file in self.config_manager.project_paths}
-        fixed = False
+        fixed: set[Path] = set()
         for path, source_diagnostics in diag_by_source.items():
             # reuse source file already parsed for the project context, so that the next scan sees fixed model
             resolved_path = resolve_path(path)
@@ -316,7 +627,7 @@ class RobocopLinter:
             if not fix_applier.apply_fixes(source_file, [fix for fix in fixes if fix]):
                 continue
             fix_applier.fix_stats.total_fixes += self.count_applied_fixes(fix_applier) - fixes_before
-            fixed = True
+            fixed.add(resolved_path)
             if save:
                 source_file.write_changes()
         return fixed
@@ -325,19 +636,55 @@ class RobocopLinter:
     def count_applied_fixes(fix_applier: FixApplier) -> int:
         return sum(sum(rules.values()) for rules in fix_applier.fix_stats.by_file.values())
 
-    def build_context(self, config: Config) -> ProjectContext:
+    def build_context(
+        self, config: Config, previous: ProjectContext | None = None, modified: set[Path] | None = None
+    ) -> ProjectContext:
         """
         Parse the whole project and build the context shared by all project checkers.
 
+        Args:
+            config: Default configuration of the project.
+            previous: Context from the previous scan. Only files changed since then are parsed again.
+            modified: Resolved paths of the files modified by the fixes.
+
         Returns:
             ProjectContext with parsed files, keyword index and resolved imports.
 
         """
-        context = build_project_context(self.config_manager, silent=config.silent)
+        root = self.config_manager.root
+        if previous is None:
+            previous = session.previous_project_context(root)
+        with timings.phase("project context"):
+            context = build_project_context(
+                self.config_manager, silent=config.silent, previous=previous, modified=modified
+            )
+        context.reported_paths = self.reported_paths(context)
         if config.verbose and not config.silent:
             print(f"Built project context from {len(context.files)} files.")
+        # in the diff mode fixed files are not saved, so the context does not match the files on the disk
+        if not config.linter.diff:
+            session.keep_project_context(root, context)
         return context
 
+    def reported_paths(self, context: ProjectContext) -> set[Path] | None:
+        """
+        Return files whose issues are reported by the project checkers.
+
+        With ``changed_since`` only files affected by the changes are reported. With ``shard`` every shard reports
+        its own files, so the issues are not repeated by every shard.
+
+        Returns:
+            Resolved paths of the reported files, or None if issues in every file are reported.
+
+        """
+        changed_paths = self.config_manager.changed_paths
+        reported = None if changed_paths is None else context.affected_paths(changed_paths)
+        if self.config_manager.shard is None:
+            return reported
+        return {
+            path for path in (context.files if reported is None else reported) if self.config_manager.in_shard(path)
+        }
+
     def return_with_exit_code(self, issues_count: int) -> NoReturn:
         """
         Exit the Robocop with exit code.
@@ -380,15 +727,17 @@ class RobocopLinter:
         prev_results = prev_results.get(str(self.config_manager.root)) if prev_results is not None else None
         is_persistent = self.config_manager.default_config.linter.persistent
         diagnostics = Diagnostics(self.diagnostics)
-        for report in self.reports.values():
+        # timings are reported last, so that they include the time of generating other reports
+        for report in sorted(self.reports.values(), key=lambda report: report.name == "timings"):
             prev_result = prev_results.get(report.name) if prev_results is not None else None
-            report.generate_report(
-                diagnostics=diagnostics,
-                config_manager=self.config_manager,
-                prev_results=prev_result,
-                run_stats=run_stats,
-                resolved_config=self.config_resolver.resolve_config(self.config_manager.default_config),
-            )
+            with timings.phase("reports"):
+                report.generate_report(
+                    diagnostics=diagnostics,
+                    config_manager=self.config_manager,
+                    prev_results=prev_result,
+                    run_stats=run_stats,
+                    resolved_config=self.config_resolver.resolve_config(self.config_manager.default_config),
+                )
             if is_persistent and isinstance(report, reports.ComparableReport):
                 result = report.persist_result()
                 if result is not None:
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 from functools import lru_cache
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from pathlib import Path
-
+    from robocop.config.manager import ConfigManager
+    from robocop.config.schema import Config
+    from robocop.linter.diagnostics import Diagnostic
+    from robocop.linter.runner import RobocopLinter
     from robocop.runtime.resolved_config import ResolvedConfig
 
 
@@ -53,6 +56,98 @@ def get_formatter_config(config_path: Path | None) -> ResolvedConfig:
     return resolver.resolve_config(manager.default_config)
 
 
+class LintSession:
+    """
+    Linter reused by every lint call with the same options.
+
+    The configuration and the checkers are loaded on the first call, and the content is parsed directly from the
+    memory, so linting a snippet costs only parsing it and running the checkers. Configuration files found next to
+    the linted files are read once per session - use ``clear_cache`` to reload them.
+    """
+
+    def __init__(self, config_manager: ConfigManager, linter: RobocopLinter) -> None:
+        self.config_manager = config_manager
+        self.linter = linter
+
+    def config_for_file(self, path: Path) -> Config:
+        """
+        Find the configuration of the linted file.
+
+        Returns:
+            Configuration from the ``config_path`` if it was given, otherwise the closest configuration file.
+
+        """
+        if self.config_manager.overridden_config:
+            return self.config_manager.default_config
+        directory = path.resolve().parent
+        return self.config_manager.find_config_in_dirs([directory, *directory.parents], default=None)
+
+    def lint_content(self, content: str, filename: str) -> list[Diagnostic]:
+        """
+        Lint the content without writing it to the disk.
+
+        Since it is the content and not the file, the default configuration is used instead of the closest one.
+
+        Returns:
+            List of diagnostics found in the content.
+
+        """
+        from robocop.source_file import SourceFile
+
+        source_file = SourceFile.from_content(Path(filename), self.config_manager.default_config, content)
+        return self.linter.run_check(source_file)
+
+    def lint_file(self, path: Path) -> list[Diagnostic]:
+        """
+        Lint the file with the configuration closest to it.
+
+        Returns:
+            List of diagnostics found in the file.
+
+        """
+        from robocop.source_file import SourceFile
+
+        source_file = SourceFile(path=path, config=self.config_for_file(path))
+        return self.linter.run_check(source_file)
+
+
+@lru_cache
+def get_lint_session(
+    config_path: Path | None,
+    select: tuple[str, ...] | None,
+    ignore: tuple[str, ...] | None,
+    configure: tuple[str, ...] | None,
+    threshold: str,
+) -> LintSession:
+    """
+    Get cached LintSession for the given linter options.
+
+    The session is created and cached on first call, then reused for subsequent calls with the same options.
+    Options are tuples, so that they can be used as the cache key.
+
+    Returns:
+        LintSession: The cached session with rules loaded.
+
+    """
+    from robocop.config.manager import ConfigManager
+    from robocop.config.schema import RawConfig
+    from robocop.linter.runner import RobocopLinter
+    from robocop.mcp.tools.linting import _create_linter_config
+
+    linter_config = _create_linter_config(
+        list(select) if select is not None else None,
+        list(ignore) if ignore is not None else None,
+        threshold,
+        list(configure) if configure is not None else None,
+    )
+    manager = ConfigManager(
+        config=config_path,
+        ignore_file_config=True,
+        overwrite_config=RawConfig(linter=linter_config, silent=True),
+    )
+    return LintSession(manager, RobocopLinter(manager))
+
+
 def clear_cache() -> None:
     """
     Clear the cached configurations.
@@ -61,3 +156,4 @@ def clear_cache() -> None:
     """
     get_linter_config.cache_clear()
     get_formatter_config.cache_clear()
+    get_lint_session.cache_clear()
@@ -7,17 +7,15 @@ from pathlib import Path
 from fastmcp.exceptions import ToolError
 from robot.errors import DataError
 
-from robocop.config.manager import ConfigManager
-from robocop.config.schema import RawConfig, RawLinterConfig
+from robocop.config.schema import RawLinterConfig
+from robocop.mcp.cache import get_lint_session
 from robocop.mcp.tools.models import DiagnosticResult
 from robocop.mcp.tools.utils.constants import VALID_EXTENSIONS
 from robocop.mcp.tools.utils.helpers import (
     _diagnostic_to_dict,
     _normalize_suffix,
     _parse_threshold,
-    _temp_robot_file,
 )
-from robocop.source_file import SourceFile
 
 
 def _create_linter_config(
@@ -26,7 +24,7 @@ def _create_linter_config(
     threshold: str = "I",
     configure: list[str] | None = None,
 ) -> RawLinterConfig:
-    """Create a RawConfig with the given options."""
+    """Create a RawLinterConfig with the given options."""
     return RawLinterConfig(
         select=select,
         ignore=ignore,
@@ -36,6 +34,11 @@ def _create_linter_config(
     )
 
 
+def _as_key(values: list[str] | None) -> tuple[str, ...] | None:
+    """Convert the list of options to the tuple, used as the key of the cached lint session."""
+    return tuple(values) if values is not None else None
+
+
 def _lint_content_impl(
     content: str,
     filename: str = "stdin.robot",
@@ -66,26 +69,16 @@ def _lint_content_impl(
         ToolError: If the content cannot be parsed.
 
     """
-    from robocop.linter.runner import RobocopLinter
-
     suffix = _normalize_suffix(filename)
+    session = get_lint_session(config_path, _as_key(select), _as_key(ignore), _as_key(configure), threshold)
 
-    with _temp_robot_file(content, suffix) as tmp_path:
-        try:
-            linter_config = _create_linter_config(select, ignore, threshold, configure)
-            config = RawConfig(sources=[str(tmp_path)], linter=linter_config, silent=True)
-            config_manager = ConfigManager(sources=[str(tmp_path)], overwrite_config=config, config=config_path)
-
-            linter = RobocopLinter(config_manager)
-            # Since it's content, not file - we are using the default project configuration instead of a specific one.
-            source_file = SourceFile(path=tmp_path, config=config_manager.default_config)
-            diagnostics = linter.run_check(source_file)
-
-            result = [_diagnostic_to_dict(d) for d in diagnostics]
-            return result[:limit] if limit else result
+    try:
+        diagnostics = session.lint_content(content, f"{Path(filename).stem or 'stdin'}{suffix}")
+    except DataError as e:
+        raise ToolError(f"Failed to parse Robot Framework content: {e}") from e
 
-        except DataError as e:
-            raise ToolError(f"Failed to parse Robot Framework content: {e}") from e
+    result = [_diagnostic_to_dict(d) for d in diagnostics]
+    return result[:limit] if limit else result
 
 
 def _lint_file_impl(
@@ -118,8 +111,6 @@ def _lint_file_impl(
         ToolError: If the file does not exist or is of invalid type.
 
     """
-    from robocop.linter.runner import RobocopLinter
-
     path = Path(file_path)
 
     if not path.exists():
@@ -128,19 +119,13 @@ def _lint_file_impl(
     if path.suffix not in VALID_EXTENSIONS:
         raise ToolError(f"Invalid file type: {path.suffix}. Expected .robot or .resource file.")
 
-    try:
-        linter_config = _create_linter_config(select, ignore, threshold, configure)
-        config = RawConfig(sources=[str(path)], linter=linter_config, silent=True)
-        config_manager = ConfigManager(sources=[str(path)], overwrite_config=config, config=config_path)
-
-        linter = RobocopLinter(config_manager)
-        # FIXME, and what's the diff from _lint_content_impl -> could be merged
-        source_file = SourceFile(path=path, config=config_manager.default_config)
-        diagnostics = linter.run_check(source_file)
-
-        file_str = str(path) if include_file_in_result else None
-        result = [_diagnostic_to_dict(d, file_str) for d in diagnostics]
-        return result[:limit] if limit else result
+    session = get_lint_session(config_path, _as_key(select), _as_key(ignore), _as_key(configure), threshold)
 
+    try:
+        diagnostics = session.lint_file(path)
     except DataError as e:
         raise ToolError(f"Failed to parse Robot Framework file: {e}") from e
+
+    file_str = str(path) if include_file_in_result else None
+    result = [_diagnostic_to_dict(d, file_str) for d in diagnostics]
+    return result[:limit] if limit else result
@@ -2,11 +2,12 @@
 Worker used to import Robot Framework libraries and read their keywords.
 
 Importing a library executes user code, which can be slow, can fail in unexpected ways or can even never finish.
-By default Robocop calls :func:`load_library` directly, but with the ``--library-workers`` option the import happens
-in a separate process started with ``python -m robocop.project._libdoc_worker`` and communicating with Robocop over
-JSON. The request is read from the standard input and the response is written to the file provided in the request,
-so that anything the library prints during the import does not corrupt the response. The parent process can safely
-kill this process on timeout.
+By default Robocop calls :func:`load_library` directly, but with the ``--library-workers`` option the imports happen
+in long living processes started with ``python -m robocop.project._libdoc_worker``. Every process reads the
+requests from the standard input and writes the responses to the standard output, one JSON document per line, and
+handles many imports before it exits. The standard streams of the process are replaced with the null device before
+any library is imported, so that anything the library prints or reads does not corrupt the communication. The
+parent process can safely kill this process on timeout.
 
 The module does not import Robocop, so that it can be started even if the inspected library modifies ``sys.path``.
 """
@@ -15,11 +16,13 @@ from __future__ import annotations
 
 import io
 import json
+import os
 import sys
 import traceback
 import warnings
 from contextlib import contextmanager, redirect_stderr, redirect_stdout, suppress
-from typing import TYPE_CHECKING, Any
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TextIO
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
@@ -107,10 +110,22 @@ def load_library(request: dict[str, Any]) -> dict[str, Any]:
     """
     Import the library described by the request and read its keywords.
 
+    Modules imported from the ``local_paths`` of the request are removed from ``sys.modules`` after the import.
+    Such modules may change between the imports and different libraries may even share the module name, so they are
+    read from the disk again next time.
+
     Returns:
         Response with either the library keywords or the description of the failure.
 
     """
+    already_imported = set(sys.modules)
+    try:
+        return _load_library(request)
+    finally:
+        forget_modules(already_imported, request.get("local_paths") or [])
+
+
+def _load_library(request: dict[str, Any]) -> dict[str, Any]:
     for search_path in reversed(request.get("search_paths") or []):
         if search_path not in sys.path:
             sys.path.insert(0, search_path)
@@ -139,12 +154,49 @@ def load_library(request: dict[str, Any]) -> dict[str, Any]:
         }
 
 
+def forget_modules(already_imported: set[str], local_paths: list[str]) -> None:
+    """Remove modules imported since ``already_imported`` from files located in any of the local paths."""
+    if not local_paths:
+        return
+    resolved_paths = [Path(path).resolve() for path in local_paths]
+    for name in set(sys.modules) - already_imported:
+        source = getattr(sys.modules.get(name), "__file__", None)
+        if not source:
+            continue
+        parents = Path(source).resolve().parents
+        if any(local_path in parents for local_path in resolved_paths):
+            sys.modules.pop(name, None)
+
+
+def _private_streams() -> tuple[TextIO, TextIO]:
+    """
+    Move the standard input and output of the process to new file descriptors, used only for the communication.
+
+    The original descriptors are replaced with the null device, so that the libraries, including their compiled
+    extensions, cannot read the requests or write to the responses.
+
+    Returns:
+        Streams to read the requests from and to write the responses to.
+
+    """
+    requests = os.fdopen(os.dup(0), encoding="utf-8")
+    responses = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    null_device = os.open(os.devnull, os.O_RDWR)
+    os.dup2(null_device, 0)
+    os.dup2(null_device, 1)
+    os.close(null_device)
+    return requests, responses
+
+
 def main() -> None:
-    """Read the request from the standard input and write the response to the file requested by the parent."""
-    request = json.loads(sys.stdin.read())
-    response = load_library(request)
-    with open(request["output"], "w", encoding="utf-8") as output:
-        json.dump(response, output)
+    """Import the libraries requested by the parent process, one request per line, until the input is closed."""
+    requests, responses = _private_streams()
+    for line in requests:
+        if not line.strip():
+            continue
+        response = load_library(json.loads(line))
+        responses.write(json.dumps(response) + "\n")
+        responses.flush()
 
 
 if __name__ == "__main__":
@@ -9,31 +9,45 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from hashlib import sha256
+from pathlib import PurePath
 from typing import TYPE_CHECKING
 
 from robot.errors import DataError
+from robot.variables.search import contains_variable
 
+from robocop.cache import FileMetadata
 from robocop.files import resolve_path
 from robocop.linter.utils.misc import normalize_robot_name
 from robocop.project.collector import ProjectFileCollector
-from robocop.project.definitions import ImportStatus, ImportType, KeywordDefinition
+from robocop.project.definitions import ImportStatus, ImportType, KeywordDefinition, embedded_match_key
 from robocop.project.imports import ImportResolver, build_search_paths
-from robocop.project.libraries import LibraryRequest, build_library_loader
-from robocop.project.serialization import collected_file_from_dict, collected_file_to_dict
-from robocop.project.variables import VariableScope
+from robocop.project.libraries import LibraryRequest, build_library_loader, environment_hash
+from robocop.project.library_cache import SharedLibraryCache, default_library_cache_dir
+from robocop.project.library_specs import LibrarySpecIndex
+from robocop.project.serialization import (
+    collected_file_from_dict,
+    collected_file_to_dict,
+    resolved_imports_from_dict,
+    resolved_imports_to_dict,
+)
+from robocop.project.variables import VariableScope, find_variable_files
 from robocop.version_handling import ROBOT_VERSION
 
 BUILTIN_LIBRARY = LibraryRequest(name="BuiltIn")
 """BuiltIn library is always available, without being imported."""
 
+EMBEDDED_KEY_LENGTH = 4
+"""Number of characters of the literal prefix or suffix used to group keywords with embedded arguments."""
+
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Iterator
     from pathlib import Path
 
     from robot.api import Languages  # RF 6.0
 
     from robocop.cache import RobocopCache
     from robocop.config.manager import ConfigManager
+    from robocop.config.schema import Config
     from robocop.project.collector import CollectedFile
     from robocop.project.definitions import KeywordUsage, ResolvedImport, VariableDefinition
     from robocop.project.libraries import LibraryLoader
@@ -47,6 +61,7 @@ class ProjectFile:
     source_file: SourceFile
     collected: CollectedFile
     imports: list[ResolvedImport] = field(default_factory=list)
+    metadata: FileMetadata | None = field(default=None, repr=False)
 
     @property
     def path(self) -> Path:
@@ -111,20 +126,84 @@ class ProjectFile:
             if imported.import_type == ImportType.LIBRARY:
                 yield imported
 
+    def library_requests(self) -> Iterator[LibraryRequest]:
+        """
+        Iterate over libraries imported by this file that can be imported.
+
+        Yields:
+            LibraryRequest for every library import that was resolved together with its arguments.
+
+        """
+        for imported in self.library_imports():
+            if imported.status not in (ImportStatus.RESOLVED, ImportStatus.EXTERNAL) or not imported.args_resolved:
+                continue
+            yield LibraryRequest(
+                name=imported.resolved_name,
+                args=imported.args,
+                source=imported.path,
+                alias=imported.alias,
+            )
+
 
 class KeywordIndex:
-    """Index of keyword definitions in the whole project, allowing lookup by name."""
+    """
+    Index of keyword definitions in the whole project, allowing lookup by name.
+
+    Keywords with embedded arguments cannot be looked up by the name, so they are grouped by the first or the last
+    characters of the literal text their names start or end with. The embedded arguments pattern is matched only
+    against names with the same beginning or ending.
+    """
 
     def __init__(self) -> None:
         self._by_name: dict[str, list[KeywordDefinition]] = {}
         self._embedded: list[KeywordDefinition] = []
+        self._embedded_by_prefix: dict[str, list[int]] = {}
+        self._embedded_by_suffix: dict[str, list[int]] = {}
+        self._embedded_not_indexed: list[int] = []
 
     def add(self, keyword: KeywordDefinition) -> None:
         if keyword.has_embedded_arguments:
-            self._embedded.append(keyword)
+            self._add_embedded(keyword)
         else:
             self._by_name.setdefault(keyword.normalized_name, []).append(keyword)
 
+    def _add_embedded(self, keyword: KeywordDefinition) -> None:
+        position = len(self._embedded)
+        self._embedded.append(keyword)
+        prefix, suffix = keyword.embedded_affixes
+        if len(prefix) >= EMBEDDED_KEY_LENGTH:
+            self._embedded_by_prefix.setdefault(prefix[:EMBEDDED_KEY_LENGTH], []).append(position)
+        elif len(suffix) >= EMBEDDED_KEY_LENGTH:
+            self._embedded_by_suffix.setdefault(suffix[-EMBEDDED_KEY_LENGTH:], []).append(position)
+        else:
+            self._embedded_not_indexed.append(position)
+
+    def _find_embedded(self, name: str) -> list[KeywordDefinition]:
+        """
+        Find keywords with embedded arguments matching the name.
+
+        Returns:
+            Matching keyword definitions, in the order they were added to the index.
+
+        """
+        if not self._embedded:
+            return []
+        key = embedded_match_key(name)
+        if key is None:
+            return [keyword for keyword in self._embedded if keyword.matches(name)]
+        positions = [
+            *self._embedded_by_prefix.get(key[:EMBEDDED_KEY_LENGTH], ()),
+            *self._embedded_by_suffix.get(key[-EMBEDDED_KEY_LENGTH:], ()),
+            *self._embedded_not_indexed,
+        ]
+        matches = []
+        for position in sorted(positions):
+            keyword = self._embedded[position]
+            prefix, suffix = keyword.embedded_affixes
+            if key.startswith(prefix) and key.endswith(suffix) and keyword.matches(name):
+                matches.append(keyword)
+        return matches
+
     def find(self, name: str) -> list[KeywordDefinition]:
         """
         Find all definitions that can be called using given name.
@@ -151,7 +230,7 @@ class KeywordIndex:
 
         """
         matches = list(self._by_name.get(normalize_robot_name(name), []))
-        matches.extend(keyword for keyword in self._embedded if keyword.matches(name))
+        matches.extend(self._find_embedded(name))
         return matches
 
     def __iter__(self) -> Iterator[KeywordDefinition]:
@@ -160,6 +239,73 @@ class KeywordIndex:
         yield from self._embedded
 
 
+class ImportClosures:
+    """
+    Files visible through transitive resource imports, computed once for the whole project.
+
+    Files importing each other form a strongly connected component of the import graph and see exactly the same
+    files, so the closure is computed once per component, in a single pass over the condensed graph. Closures are
+    stored as bitsets over positions of the files in the project, so merging closures of imported components is
+    cheap, and files with identical closures share the list of files.
+    """
+
+    def __init__(self, context: ProjectContext) -> None:
+        self._files = list(context.files.values())
+        positions = {path: position for position, path in enumerate(context.files)}
+        graph = context.import_graph()
+        component_of = strongly_connected_components(graph)
+        components = max(component_of.values(), default=-1) + 1
+        members = [0] * components
+        successors: list[set[int]] = [set() for _ in range(components)]
+        for path, imported_paths in graph.items():
+            component = component_of[path]
+            members[component] |= 1 << positions[path]
+            for imported_path in imported_paths:
+                if component_of[imported_path] != component:
+                    successors[component].add(component_of[imported_path])
+        # components are numbered in the reverse topological order, imported components come first
+        imported = list(members)
+        for component in range(components):
+            for successor in successors[component]:
+                imported[component] |= imported[successor]
+        importing = list(members)
+        for component in reversed(range(components)):
+            for successor in successors[component]:
+                importing[successor] |= importing[component]
+        self.imported = {path: imported[component_of[path]] for path in graph}
+        self.importing = {path: importing[component_of[path]] for path in graph}
+        self._decoded: dict[int, list[ProjectFile]] = {}
+
+    def files_of(self, closure: int) -> list[ProjectFile]:
+        """
+        Return files from the closure, in the project order. The list is shared and must not be modified.
+
+        Returns:
+            List of project files.
+
+        """
+        decoded = self._decoded.get(closure)
+        if decoded is None:
+            decoded = []
+            remaining = closure
+            while remaining:
+                lowest = remaining & -remaining
+                decoded.append(self._files[lowest.bit_length() - 1])
+                remaining ^= lowest
+            self._decoded[closure] = decoded
+        return decoded
+
+    def with_file_first(self, project_file: ProjectFile, closure: int) -> list[ProjectFile]:
+        """
+        Return files from the closure, starting with given file.
+
+        Returns:
+            New list of project files.
+
+        """
+        return [project_file, *(other for other in self.files_of(closure) if other is not project_file)]
+
+
 @dataclass
 class ProjectContext:
     """
@@ -170,6 +316,11 @@ class ProjectContext:
         files: All parsed source files, keyed by resolved path.
         keywords: Index of all keyword definitions found in the project.
         library_loader: Loader used to import libraries, or None when library analysis is disabled.
+        resolution_key: Hash of the configuration used to collect files and resolve imports. The context can only be
+            reused by the next build if the configuration did not change.
+        variable_files: Variable files provided in the configuration.
+        reported_paths: Resolved paths of the files whose issues are reported, or None to report issues in every
+            file. Set when only files affected by the changes are linted.
 
     """
 
@@ -177,8 +328,12 @@ class ProjectContext:
     files: dict[Path, ProjectFile] = field(default_factory=dict)
     keywords: KeywordIndex = field(default_factory=KeywordIndex)
     library_loader: LibraryLoader | None = None
+    resolution_key: str = ""
+    variable_files: list[Path] = field(default_factory=list)
+    reported_paths: set[Path] | None = None
     _visible_keywords: dict[Path, KeywordIndex] = field(default_factory=dict, repr=False)
     _library_keywords: dict[Path, list[KeywordDefinition]] = field(default_factory=dict, repr=False)
+    _closures: ImportClosures | None = field(default=None, repr=False)
 
     def get_file(self, path: Path) -> ProjectFile | None:
         """
@@ -190,12 +345,46 @@ class ProjectContext:
         """
         return self.files.get(resolve_path(path))
 
+    def import_graph(self) -> dict[Path, list[Path]]:
+        """
+        Build the graph of resource imports between project files.
+
+        Returns:
+            Dictionary of resolved path of every project file to the files it imports, in the order of the imports.
+
+        """
+        return {
+            path: [imported.resolved_path for imported in self.project_resource_imports(project_file)]
+            for path, project_file in self.files.items()
+        }
+
+    def project_resource_imports(self, project_file: ProjectFile) -> Iterator[ResolvedImport]:
+        """
+        Iterate over resource imports of the file pointing to other files in the project.
+
+        Yields:
+            Resolved resource imports of project files.
+
+        """
+        for imported in project_file.resource_imports():
+            if (
+                imported.status == ImportStatus.RESOLVED
+                and imported.path is not None
+                and imported.resolved_path in self.files
+            ):
+                yield imported
+
+    def _import_closures(self) -> ImportClosures:
+        if self._closures is None:
+            self._closures = ImportClosures(self)
+        return self._closures
+
     def imported_files(self, path: Path) -> list[ProjectFile]:
         """
         Return files visible from given file through resource imports.
 
         Resource imports are transitive in Robot Framework, so keywords from a resource imported by another resource
-        are visible as well. The list starts with the file itself.
+        are visible as well. The list starts with the file itself, other files follow in the project order.
 
         Returns:
             List of project files, starting with the file itself.
@@ -204,24 +393,156 @@ class ProjectContext:
         start = self.get_file(path)
         if start is None:
             return []
-        visible = [start]
-        seen = {start.resolved_path}
-        queue = [start]
-        while queue:
-            current = queue.pop()
-            for imported in current.resource_imports():
-                if imported.status != ImportStatus.RESOLVED or imported.path is None:
-                    continue
-                resolved_path = imported.resolved_path
-                if resolved_path is None or resolved_path in seen:
-                    continue
-                imported_file = self.files.get(resolved_path)
-                if imported_file is None:
-                    continue
-                seen.add(resolved_path)
-                visible.append(imported_file)
-                queue.append(imported_file)
-        return visible
+        closures = self._import_closures()
+        return closures.with_file_first(start, closures.imported[start.resolved_path])
+
+    def importing_files(self, path: Path) -> list[ProjectFile]:
+        """
+        Return files that see given file through resource imports.
+
+        It is the reverse of :meth:`imported_files`. The list starts with the file itself, files importing it,
+        directly or through other resources, follow in the project order.
+
+        Returns:
+            List of project files, starting with the file itself.
+
+        """
+        start = self.get_file(path)
+        if start is None:
+            return []
+        closures = self._import_closures()
+        return closures.with_file_first(start, closures.importing[start.resolved_path])
+
+    def import_closure_groups(self) -> list[list[ProjectFile]]:
+        """
+        Group project files that see exactly the same files through resource imports.
+
+        Anything computed from the files visible from a file is the same for every file in the group, so checkers
+        can compute it once per group.
+
+        Returns:
+            List of groups, each with files in the project order.
+
+        """
+        groups: dict[int, list[ProjectFile]] = {}
+        for path, closure in self._import_closures().imported.items():
+            groups.setdefault(closure, []).append(self.files[path])
+        return list(groups.values())
+
+    def dependants(self, path: Path) -> set[Path]:
+        """
+        Return files that see keywords of given file through resource imports.
+
+        It is the reverse of :meth:`imported_files` - the result contains every file importing the given file,
+        directly or through other resources. The file itself is not included.
+
+        Returns:
+            Resolved paths of the dependent files.
+
+        """
+        start = resolve_path(path)
+        return {project_file.resolved_path for project_file in self.importing_files(start)} - {start}
+
+    def affected_paths(self, changed: set[Path]) -> set[Path]:
+        """
+        Return project files whose import closure intersects the changed files.
+
+        A project file is affected if it changed, if it imports a changed resource, library or variable file, or if
+        it sees such file through other resources.
+
+        Args:
+            changed: Resolved paths of the changed files. They do not need to be a part of the project.
+
+        Returns:
+            Resolved paths of the affected project files.
+
+        """
+        affected = {path for path in changed if path in self.files}
+        for project_file, imported in self.iter_imports():
+            if imported.resolved_path is not None and imported.resolved_path in changed:
+                affected.add(project_file.resolved_path)
+        for path in list(affected):
+            affected.update(self.dependants(path))
+        return affected
+
+    def imported_by(self) -> dict[Path, set[Path]]:
+        """
+        Build the reverse of the imports of the project files.
+
+        Unlike :meth:`import_graph`, it also contains library, variable and resource files outside of the project, so
+        the files importing any changed dependency can be found.
+
+        Returns:
+            Dictionary of resolved path of every imported file to the project files importing it directly.
+
+        """
+        importers: dict[Path, set[Path]] = {}
+        for project_file, imported in self.iter_imports():
+            if imported.resolved_path is not None:
+                importers.setdefault(imported.resolved_path, set()).add(project_file.resolved_path)
+        return importers
+
+    def changed_dependants(
+        self, changed: set[Path], previous_files: set[Path], previous_imported_by: dict[Path, set[Path]]
+    ) -> set[Path] | None:
+        """
+        Return project files affected by the files changed since the previous analysis of the project.
+
+        Files importing the changed files are searched for both in the current imports and in the imports from the
+        previous analysis, since imports of the removed files are no longer resolved to their paths.
+
+        Args:
+            changed: Resolved paths of the changed, added and removed files.
+            previous_files: Resolved paths of the project files from the previous analysis.
+            previous_imported_by: Project files importing every imported file, from the previous analysis.
+
+        Returns:
+            Resolved paths of the affected project files, or None if any of the changed files is neither a project
+            file nor imported by one, for example a variable file from the configuration.
+
+        """
+        known = set(self.files) | previous_files | set(previous_imported_by) | set(self.imported_by())
+        if not changed <= known:
+            return None
+        affected = set(changed)
+        pending = list(changed)
+        while pending:
+            for importer in previous_imported_by.get(pending.pop(), ()):
+                if importer not in affected:
+                    affected.add(importer)
+                    pending.append(importer)
+        return self.affected_paths(affected)
+
+    def is_reported(self, project_file: ProjectFile) -> bool:
+        """Check if issues found in given file are reported."""
+        return self.reported_paths is None or project_file.resolved_path in self.reported_paths
+
+    def reuse_keyword_indexes(self, previous: ProjectContext, changed: set[Path], removed: set[Path]) -> None:
+        """
+        Copy keyword indexes computed by the previous context for files not affected by the changes.
+
+        Keywords visible from a file depend on every file it imports, so visible keywords of files importing
+        a changed file, directly or not, are computed again as well. Library keywords only depend on the file itself.
+
+        Args:
+            previous: Context built before the files changed.
+            changed: Resolved paths of files collected or resolved again.
+            removed: Resolved paths of files no longer present in the project.
+
+        """
+        affected = changed | removed
+        for path in changed:
+            affected |= self.dependants(path)
+        for path in affected & set(previous.files):
+            affected |= previous.dependants(path)
+        self._visible_keywords = {
+            path: index for path, index in previous._visible_keywords.items() if path not in affected
+        }
+        self._library_keywords = {
+            path: keywords
+            for path, keywords in previous._library_keywords.items()
+            if path not in changed and path in self.files
+        }
 
     def visible_keywords(self, path: Path) -> KeywordIndex:
         """
@@ -296,37 +617,69 @@ class ProjectContext:
                 return matches
         return []
 
-    def iter_files(self) -> Iterator[ProjectFile]:
+    def dependencies(self) -> set[Path]:
+        """
+        Return every file the results of the project analysis depend on.
+
+        Contains the project source files, files imported by them (also from outside of the project), variable files
+        from the configuration and source files of the libraries imported so far.
+
+        Returns:
+            Paths of the files.
+
+        """
+        paths = set(self.files)
+        paths.update(self.variable_files)
+        for _, imported in self.iter_imports():
+            if imported.status == ImportStatus.RESOLVED and imported.resolved_path is not None:
+                paths.add(imported.resolved_path)
+        if self.library_loader is not None:
+            paths.update(self.library_loader.sources())
+        return paths
+
+    def iter_files(self, reported_only: bool = False) -> Iterator[ProjectFile]:
         """
         Iterate over all files in the project.
 
+        Args:
+            reported_only: Skip files whose issues are not reported. Checkers reporting issues in the iterated
+                files use it to avoid analysing files not affected by the changes.
+
         Yields:
             ProjectFile for every parsed source file.
 
         """
-        yield from self.files.values()
+        for project_file in self.files.values():
+            if not reported_only or self.is_reported(project_file):
+                yield project_file
 
-    def iter_usages(self) -> Iterator[tuple[ProjectFile, KeywordUsage]]:
+    def iter_usages(self, reported_only: bool = False) -> Iterator[tuple[ProjectFile, KeywordUsage]]:
         """
         Iterate over all keyword usages in the project.
 
+        Args:
+            reported_only: Skip usages in files whose issues are not reported.
+
         Yields:
             Tuples of the file containing the call and the keyword usage.
 
         """
-        for project_file in self.files.values():
+        for project_file in self.iter_files(reported_only):
             for usage in project_file.usages:
                 yield project_file, usage
 
-    def iter_imports(self) -> Iterator[tuple[ProjectFile, ResolvedImport]]:
+    def iter_imports(self, reported_only: bool = False) -> Iterator[tuple[ProjectFile, ResolvedImport]]:
         """
         Iterate over all imports in the project.
 
+        Args:
+            reported_only: Skip imports in files whose issues are not reported.
+
         Yields:
             Tuples of the importing file and the resolved import.
 
         """
-        for project_file in self.files.values():
+        for project_file in self.iter_files(reported_only):
             for imported in project_file.imports:
                 yield project_file, imported
 
@@ -371,13 +724,86 @@ def collect_file(source_file: SourceFile, cache: RobocopCache | None, config_has
     return collected
 
 
-def build_project_context(config_manager: ConfigManager, silent: bool = False) -> ProjectContext:
+def resolution_hash(config: Config, search_paths: list[Path], config_hash: str) -> str:
+    """
+    Describe the configuration that affects the project context built from the collected files.
+
+    Returns:
+        Hash used to decide whether the context from the previous build can be reused.
+
+    """
+    parts = [
+        config_hash,
+        *(str(path) for path in search_paths),
+        *config.variable_files,
+        *(f"{name}={value}" for name, value in sorted(config.variables.items())),
+        str(config.analyze_libraries),
+        str(config.load_library_timeout),
+        *config.ignored_libraries,
+        str(config.library_workers),
+        str(config.library_import_budget),
+        str(config.shared_library_cache),
+        *config.library_specs,
+    ]
+    return sha256("|".join(parts).encode()).hexdigest()
+
+
+def project_checks_hash(config: Config, root: Path) -> str:
+    """
+    Describe the configuration that affects diagnostics reported by the project checkers.
+
+    Returns:
+        Hash used to invalidate the cached diagnostics of the project checkers.
+
+    """
+    search_paths = build_search_paths(config.python_path, root)
+    parts = [config.hash, resolution_hash(config, search_paths, collection_hash(config.languages))]
+    if config.analyze_libraries:
+        parts.append(environment_hash())
+    return sha256("|".join(parts).encode()).hexdigest()
+
+
+def project_files_hash(config_manager: ConfigManager) -> str:
+    """
+    Describe the source files of the project together with the configuration used for each of them.
+
+    Returns:
+        Hash that changes when a file is added to or removed from the project, or when its configuration changes.
+
+    """
+    parts = sorted(
+        f"{source_file.resolved_path}|{source_file.config.hash}" for source_file in config_manager.project_paths
+    )
+    return sha256("\n".join(parts).encode()).hexdigest()
+
+
+def build_project_context(
+    config_manager: ConfigManager,
+    silent: bool = False,
+    previous: ProjectContext | None = None,
+    modified: set[Path] | None = None,
+) -> ProjectContext:
     """
     Parse all source files in the project and build the shared context.
 
     Files that cannot be parsed are skipped, so a single broken file does not prevent project level checks from
     running on the rest of the project.
 
+    If the context from the previous build is given, for example when the project is scanned again after applying
+    fixes, only files changed since then are collected and have their imports resolved again. Keyword indexes of
+    files not affected by the changes and libraries already imported are reused as well.
+
+    Imports of every file are resolved as soon as the file is collected, and with the library workers the imported
+    libraries start loading in the background while the remaining files are parsed. Imports without variables are
+    stored in the cache and reused while none of the paths checked to resolve them changes.
+
+    Args:
+        config_manager: Configuration manager with the project files.
+        silent: Do not print files that could not be parsed.
+        previous: Context built earlier by the same process. Ignored if it was built with different configuration.
+        modified: Resolved paths of files modified in memory. Such changes cannot be detected from the file
+            metadata, so the files are always collected again.
+
     Returns:
         ProjectContext with parsed files, keyword index and resolved imports.
 
@@ -386,7 +812,13 @@ def build_project_context(config_manager: ConfigManager, silent: bool = False) -
     config = config_manager.default_config
     search_paths = build_search_paths(config.python_path, config_manager.root)
     cache = config_manager.cache if config.cache.enabled else None
-    if config.analyze_libraries:
+    config_hash = collection_hash(config.languages)
+    context.resolution_key = resolution_hash(config, search_paths, config_hash)
+    if previous is not None and previous.resolution_key != context.resolution_key:
+        previous = None
+    if previous is not None and previous.library_loader is not None:
+        context.library_loader = previous.library_loader
+    elif config.analyze_libraries:
         context.library_loader = build_library_loader(
             search_paths=search_paths,
             timeout=config.load_library_timeout,
@@ -394,40 +826,181 @@ def build_project_context(config_manager: ConfigManager, silent: bool = False) -
             cache=cache,
             project_root=config_manager.root,
             workers=config.library_workers,
+            shared_cache=SharedLibraryCache(default_library_cache_dir())
+            if cache is not None and config.shared_library_cache
+            else None,
+            specs=LibrarySpecIndex(resolve_path(config_manager.root / path) for path in config.library_specs)
+            if config.library_specs
+            else None,
+            budget=config.library_import_budget,
+            verbose=config.verbose and not silent,
         )
+    library_loader = context.library_loader
+    if library_loader is not None:
+        library_loader.start_budget()
+        library_loader.preload([BUILTIN_LIBRARY])
+    context.variable_files = find_variable_files(config.variable_files, search_paths)
     global_scope = VariableScope()
     global_scope.add_variable_files(config.variable_files, search_paths)
     global_scope.add_command_line(config.variables)
-    config_hash = collection_hash(config.languages)
+    # the same directories are searched for imports of many files, so the lookups are shared between the files
+    found_paths: dict[Path, Path | None] = {}
+    checked_paths: dict[str, bool] = {}
+
+    def resolve_imports(project_file: ProjectFile) -> None:
+        imports_cache = cache if cache is not None and _has_static_imports(project_file) else None
+        cached = (
+            imports_cache.get_project_imports(project_file.path, config_hash, context.resolution_key, checked_paths)
+            if imports_cache is not None
+            else None
+        )
+        imports = resolved_imports_from_dict(cached, project_file.path) if cached is not None else None
+        if imports is not None:
+            project_file.imports = imports
+        else:
+            scope = global_scope.copy_for(project_file.path)
+            scope.add_own(project_file.variables)
+            resolver = ImportResolver(scope, search_paths, found_paths)
+            base_dir = project_file.path.parent
+            project_file.imports = [
+                resolver.resolve(raw.import_type, raw.name, raw.location, base_dir, raw.args, raw.alias)
+                for raw in project_file.collected.imports
+            ]
+            if imports_cache is not None:
+                imports_cache.set_project_imports(
+                    project_file.path,
+                    config_hash,
+                    context.resolution_key,
+                    resolved_imports_to_dict(project_file.imports),
+                    resolver.checked_paths,
+                )
+        if library_loader is not None:
+            # libraries are imported in the background while the rest of the project is parsed
+            library_loader.preload(project_file.library_requests())
+
+    changed = _collect_files(
+        context,
+        config_manager,
+        cache=cache,
+        config_hash=config_hash,
+        previous=previous,
+        modified=modified or set(),
+        silent=silent,
+        on_collected=resolve_imports,
+    )
+    removed = set(previous.files) - set(context.files) if previous is not None else set()
+    changed_names = {path.name for path in changed | removed} if previous is not None else set()
+    for project_file in context.files.values():
+        if project_file.resolved_path not in changed and _imports_may_change(project_file, changed_names, removed):
+            changed.add(project_file.resolved_path)
+            resolve_imports(project_file)
+        for keyword in project_file.keywords:
+            context.keywords.add(keyword)
+
+    if previous is not None:
+        context.reuse_keyword_indexes(previous, changed, removed)
+
+    return context
+
+
+def _collect_files(
+    context: ProjectContext,
+    config_manager: ConfigManager,
+    *,
+    cache: RobocopCache | None,
+    config_hash: str,
+    previous: ProjectContext | None,
+    modified: set[Path],
+    silent: bool,
+    on_collected: Callable[[ProjectFile], None],
+) -> set[Path]:
+    """
+    Collect data from every project file, reusing files from the previous context that did not change.
 
+    Every file collected again is passed to ``on_collected`` right away, before the next file is parsed.
+
+    Returns:
+        Resolved paths of files that were collected again, including files new in the project.
+
+    """
+    changed: set[Path] = set()
     for source_file in config_manager.project_paths:
+        resolved_path = source_file.resolved_path
+        metadata = _file_metadata(source_file.path)
+        previous_file = previous.files.get(resolved_path) if previous is not None else None
+        if (
+            previous_file is not None
+            and metadata is not None
+            and previous_file.metadata == metadata
+            and resolved_path not in modified
+        ):
+            context.files[resolved_path] = ProjectFile(
+                source_file=source_file,
+                collected=previous_file.collected,
+                imports=previous_file.imports,
+                metadata=metadata,
+            )
+            continue
         try:
             collected = collect_file(source_file, cache, config_hash)
         except DataError as error:
             if not silent:
                 print(f"Failed to parse {source_file.path} with an error: {error}. Skipping file")
             continue
-        context.files[source_file.resolved_path] = ProjectFile(source_file=source_file, collected=collected)
+        project_file = ProjectFile(source_file=source_file, collected=collected, metadata=metadata)
+        context.files[resolved_path] = project_file
+        changed.add(resolved_path)
+        on_collected(project_file)
+    return changed
 
-    for project_file in context.files.values():
-        scope = global_scope.copy_for(project_file.path)
-        scope.add_own(project_file.variables)
-        resolver = ImportResolver(scope, search_paths)
-        base_dir = project_file.path.parent
-        project_file.imports = [
-            resolver.resolve(raw.import_type, raw.name, raw.location, base_dir, raw.args, raw.alias)
-            for raw in project_file.collected.imports
-        ]
-        for keyword in project_file.keywords:
-            context.keywords.add(keyword)
 
-    if context.library_loader is not None:
-        context.library_loader.schedule_preload(_project_library_requests(context))
+def _file_metadata(path: Path) -> FileMetadata | None:
+    try:
+        return FileMetadata.from_path(path)
+    except OSError:
+        return None
 
-    return context
 
+def _has_static_imports(project_file: ProjectFile) -> bool:
+    """
+    Check if imports of the file can be resolved without variables.
+
+    Such imports only depend on the paths checked on the disk, so they can be cached. Variables may come from the
+    environment or from the current directory, which are not tracked by the cache.
 
-def _project_library_requests(context: ProjectContext) -> Iterator[LibraryRequest]:
+    Returns:
+        True if no import name or argument contains a variable.
+
+    """
+    return not any(
+        contains_variable(raw.name, "$@&%") or any(contains_variable(arg, "$@&%") for arg in raw.args)
+        for raw in project_file.collected.imports
+    )
+
+
+def _imports_may_change(project_file: ProjectFile, changed_names: set[str], removed: set[Path]) -> bool:
+    """
+    Check if imports of a file that did not change could now be resolved differently.
+
+    It can only happen when files were added to or removed from the project. Imports that were not found and
+    imports that may point to the added or removed files are resolved again. Imports pointing outside of the project
+    files are not tracked and are only resolved again when the importing file changes.
+
+    Returns:
+        True if imports of the file need to be resolved again.
+
+    """
+    if not changed_names:
+        return False
+    for imported in project_file.imports:
+        if imported.status == ImportStatus.NOT_FOUND or imported.resolved_path in removed:
+            return True
+        if PurePath(imported.resolved_name.replace("\\", "/")).name in changed_names:
+            return True
+    return False
+
+
+def project_library_requests(context: ProjectContext) -> Iterator[LibraryRequest]:
     """
     Collect every library imported in the project.
 
@@ -437,12 +1010,58 @@ def _project_library_requests(context: ProjectContext) -> Iterator[LibraryReques
     """
     yield BUILTIN_LIBRARY
     for project_file in context.files.values():
-        for imported in project_file.library_imports():
-            if imported.status not in (ImportStatus.RESOLVED, ImportStatus.EXTERNAL) or not imported.args_resolved:
-                continue
-            yield LibraryRequest(
-                name=imported.resolved_name,
-                args=imported.args,
-                source=imported.path,
-                alias=imported.alias,
-            )
+        yield from project_file.library_requests()
+
+
+def strongly_connected_components(graph: dict[Path, list[Path]]) -> dict[Path, int]:
+    """
+    Find strongly connected components of the graph using the Tarjan's algorithm.
+
+    Files in the same component import each other, directly or indirectly. Components are numbered in the reverse
+    topological order - a component is numbered after all components reachable from it. The algorithm is iterative,
+    so deep import chains do not hit the recursion limit.
+
+    Returns:
+        Dictionary of every node to the identifier of its component.
+
+    """
+    index_of: dict[Path, int] = {}
+    lowlink: dict[Path, int] = {}
+    component_of: dict[Path, int] = {}
+    stack: list[Path] = []
+    on_stack: set[Path] = set()
+    work: list[tuple[Path, Iterator[Path]]] = []
+    components = 0
+
+    def visit(node: Path) -> None:
+        index_of[node] = lowlink[node] = len(index_of)
+        stack.append(node)
+        on_stack.add(node)
+        work.append((node, iter(graph[node])))
+
+    for root in graph:
+        if root in index_of:
+            continue
+        visit(root)
+        while work:
+            node, successors = work[-1]
+            for successor in successors:
+                if successor not in index_of:
+                    visit(successor)
+                    break
+                if successor in on_stack:
+                    lowlink[node] = min(lowlink[node], index_of[successor])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index_of[node]:
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component_of[member] = components
+                        if member == node:
+                            break
+                    components += 1
+    return component_of
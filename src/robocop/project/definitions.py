@@ -5,6 +5,7 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from robot.errors import DataError
@@ -52,6 +53,95 @@ def embedded_name_pattern(name: str) -> re.Pattern[str] | None:
     return embedded.name if embedded is not None else None
 
 
+REGEX_SPECIAL_CHARACTERS = frozenset(".^$|")
+"""Characters with a special meaning in a regular expression that are not a literal text when unescaped."""
+REGEX_QUANTIFIERS = frozenset("?*+{")
+_WHITESPACE_TO_SPACE = str.maketrans("\t\n\r\x0b\x0c", "     ")
+
+
+def embedded_literal_affixes(pattern: re.Pattern[str]) -> tuple[str, str]:
+    """
+    Find the literal text every name matching the embedded arguments pattern starts and ends with.
+
+    Affixes are used to index keywords with embedded arguments, so the pattern is only matched against names that can
+    match it. The result is lowercase and whitespace is replaced with a single space, the same way as in
+    :func:`embedded_match_key`. Whenever the pattern is not understood, empty affixes are returned, which never
+    exclude any name.
+
+    Returns:
+        Tuple with the literal prefix and the literal suffix of the pattern. Empty if there is none.
+
+    """
+    literals: list[str | None] = []  # None stands for any part of the pattern that is not a plain character
+    depth = 0
+    in_class = False
+    index = 0
+    source = pattern.pattern
+    while index < len(source):
+        char = source[index]
+        if char == "\\":
+            escaped = source[index + 1 : index + 2]
+            if not depth and not in_class:
+                if escaped == "s":
+                    literals.append(" ")
+                elif escaped.isascii() and not escaped.isalnum():
+                    literals.append(escaped)
+                else:
+                    literals.append(None)
+            index += 2
+            continue
+        if in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+            literals.append(None)
+        elif char == "(":
+            depth += 1
+            literals.append(None)
+        elif char == ")":
+            depth -= 1
+        elif depth:
+            pass
+        elif char == "|":
+            return "", ""
+        elif char in REGEX_QUANTIFIERS:
+            literals[-1:] = [None]  # quantified character is optional or repeated
+        elif char in REGEX_SPECIAL_CHARACTERS or not char.isascii():
+            literals.append(None)
+        else:
+            literals.append(char)
+        index += 1
+    prefix = []
+    for literal in literals:
+        if literal is None:
+            break
+        prefix.append(literal)
+    suffix = []
+    for literal in reversed(literals):
+        if literal is None:
+            break
+        suffix.append(literal)
+    if len(prefix) == len(literals):  # pattern without embedded arguments
+        return "", ""
+    return embedded_match_key("".join(prefix)) or "", embedded_match_key("".join(reversed(suffix))) or ""
+
+
+def embedded_match_key(name: str) -> str | None:
+    """
+    Prepare the name for comparing with the literal affixes of the embedded arguments patterns.
+
+    Only ASCII names are supported, since case-insensitive matching of other characters does not always agree with
+    converting them to lowercase.
+
+    Returns:
+        Lowercase name with whitespace replaced with a single space, or None if the name is not ASCII.
+
+    """
+    if not name.isascii():
+        return None
+    return name.lower().translate(_WHITESPACE_TO_SPACE)
+
+
 def usage_name_pattern(name: str) -> re.Pattern[str] | None:
     """
     Build a pattern matching keyword names that a dynamic call may refer to.
@@ -301,6 +391,13 @@ class KeywordDefinition:
     def has_embedded_arguments(self) -> bool:
         return self.embedded is not None
 
+    @cached_property
+    def embedded_affixes(self) -> tuple[str, str]:
+        """Literal prefix and suffix of names matching the embedded arguments."""
+        if self.embedded is None:
+            return "", ""
+        return embedded_literal_affixes(self.embedded)
+
     @property
     def owner_name(self) -> str:
         """Name of the library or resource file the keyword can be prefixed with."""
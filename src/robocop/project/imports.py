@@ -57,11 +57,25 @@ def build_search_paths(entries: Iterable[str], root: Path) -> list[Path]:
 
 
 class ImportResolver:
-    """Resolves import names to paths, using variables visible in the importing file."""
+    """
+    Resolves import names to paths, using variables visible in the importing file.
+
+    Paths checked on the disk are remembered in ``found_paths``. The same dictionary can be shared by resolvers
+    of different files, since many files import the same resources from the same directories. Every path the
+    resolver looked for is also added to ``checked_paths``, so that the resolved imports can be cached and reused
+    as long as none of those paths is created, removed or modified.
+    """
 
-    def __init__(self, scope: VariableScope, search_paths: list[Path] | None = None) -> None:
+    def __init__(
+        self,
+        scope: VariableScope,
+        search_paths: list[Path] | None = None,
+        found_paths: dict[Path, Path | None] | None = None,
+    ) -> None:
         self.scope = scope
         self.search_paths = search_paths if search_paths is not None else []
+        self.found_paths = found_paths if found_paths is not None else {}
+        self.checked_paths: set[Path] = set()
 
     def replace_variables(self, name: str) -> str | None:
         """
@@ -183,6 +197,7 @@ class ImportResolver:
         relative = Path(*name.split("."))
         for search_path in self.search_paths:
             for candidate in (search_path / f"{relative}.py", search_path / relative / "__init__.py"):
+                self.checked_paths.add(candidate)
                 if candidate.is_file():
                     return candidate.resolve()
         return None
@@ -207,8 +222,7 @@ class ImportResolver:
                 return found
         return None
 
-    @staticmethod
-    def _existing_file(candidate: Path) -> Path | None:
+    def _existing_file(self, candidate: Path) -> Path | None:
         """
         Return the resolved path if it points to an existing file.
 
@@ -216,9 +230,14 @@ class ImportResolver:
             Resolved path, or None if it is not an existing file.
 
         """
+        self.checked_paths.add(candidate)
+        if candidate in self.found_paths:
+            return self.found_paths[candidate]
+        found = None
         try:
             if candidate.is_file():
-                return candidate.resolve()
+                found = candidate.resolve()
         except OSError:  # pragma: no cover - defensive, invalid path characters
-            return None
-        return None
+            found = None
+        self.found_paths[candidate] = found
+        return found
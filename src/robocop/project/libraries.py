@@ -6,9 +6,13 @@ Unlike the rest of the project analysis, which is based purely on the abstract s
 with the ``--no-analyze-libraries`` option.
 
 By default libraries are imported synchronously, in the Robocop process itself. With the ``--library-workers``
-option every library is instead imported in a separate process, several of them at the same time. Separate
+option libraries are instead imported by a pool of separate processes, several of them at the same time. Separate
 processes are slower to start, but they can be killed on timeout and they keep the imported code out of the
-Robocop process.
+Robocop process. Worker processes also allow importing the libraries in the background, while the rest of the
+project is still being parsed.
+
+With ``--library-import-budget`` the time spent on the library imports is limited for the whole run. Libraries that
+are not imported when the budget runs out are treated as unknown, the same way as libraries that failed to import.
 
 Libraries that fail to import are not reported as an internal error. Such library simply provides no keywords, so
 rules using this information stay silent instead of reporting false positives.
@@ -16,70 +20,38 @@ rules using this information stay silent instead of reporting false positives.
 
 from __future__ import annotations
 
-import json
-import os
-import subprocess
+import importlib.util
 import sys
-import tempfile
-from concurrent.futures import ThreadPoolExecutor
+import threading
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from fnmatch import fnmatch
 from functools import cache
 from hashlib import sha256
+from importlib.machinery import PathFinder
 from pathlib import Path
+from time import monotonic, perf_counter
 from typing import TYPE_CHECKING, Any
 
+from robot.libraries import STDLIBS
+
 from robocop.linter.utils.misc import normalize_robot_name
 from robocop.project.definitions import ArgumentsSpec, KeywordDefinition, Location, embedded_name_pattern
+from robocop.project.library_workers import LibraryWorkerPool, default_worker_count
+from robocop.runtime import timings
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
     from robocop.cache import RobocopCache
     from robocop.project.definitions import ResolvedImport
+    from robocop.project.library_cache import SharedLibraryCache
+    from robocop.project.library_specs import LibrarySpecIndex
 
-WORKER_MODULE = "robocop.project._libdoc_worker"
 DEFAULT_TIMEOUT = 10
 DEFAULT_LIBRARY_WORKERS = False
-MAX_WORKERS = 8
-
-
-def worker_environment() -> dict[str, str]:
-    """
-    Build environment variables for the process importing the library.
-
-    The current environment is passed to the worker, so that libraries can be configured with environment variables.
-    On Windows ``SystemRoot`` is restored if it is missing, since without it the standard library cannot import
-    modules using sockets.
-
-    Returns:
-        Environment variables for the worker process.
-
-    """
-    env = dict(os.environ)
-    if sys.platform == "win32" and not any(name.upper() == "SYSTEMROOT" for name in env):
-        windows_directory = _windows_directory()
-        if windows_directory:
-            env["SystemRoot"] = windows_directory
-    return env
-
-
-def _windows_directory() -> str | None:
-    """
-    Read the Windows directory without relying on the environment variables.
-
-    Returns:
-        Path to the Windows directory, or None if it could not be read.
-
-    """
-    import ctypes  # noqa: PLC0415
-
-    buffer = ctypes.create_unicode_buffer(260)
-    try:
-        length = ctypes.windll.kernel32.GetWindowsDirectoryW(buffer, len(buffer))
-    except (AttributeError, OSError):  # pragma: no cover - defensive, not available outside Windows
-        return None
-    return buffer.value if length else None
+DEFAULT_IMPORT_BUDGET = 0
 
 
 @dataclass(frozen=True)
@@ -89,6 +61,7 @@ class LibrarySpec:
     name: str
     keywords: tuple[KeywordDefinition, ...] = ()
     error: str | None = None
+    source: Path | None = None
 
     @property
     def loaded(self) -> bool:
@@ -147,14 +120,24 @@ class LibraryLoader:
     Every library is imported only once, even if it is used in several files. Libraries imported with different
     arguments are treated as different libraries, since the arguments may change the provided keywords.
 
-    By default libraries are imported synchronously, in the Robocop process. With ``workers`` enabled every library
-    is imported in a separate process instead and libraries are imported in parallel. Only such imports can be
-    stopped with the timeout, since a library imported in the Robocop process cannot be safely interrupted.
+    By default libraries are imported synchronously, in the Robocop process. With ``workers`` enabled libraries are
+    imported in parallel by a pool of worker processes instead, started with the first import and reused until the
+    loader is closed. Only such imports can be stopped with the timeout, since a library imported in the Robocop
+    process cannot be safely interrupted.
 
     Successful imports are also stored in the persistent Robocop cache, so that the library does not have to be
     imported again in the next run. Cached results are only used for libraries installed outside of the analyzed
     project and are invalidated when the library source file, the Python interpreter or the Robot Framework
-    version changes.
+    version changes. With ``shared_cache`` they are also stored in the cache shared by all projects of the user, so
+    that other clones of the project do not have to import the library either.
+
+    Libraries documented in the Libdoc specification files found by ``specs`` are not imported at all, their
+    keywords are read from the specification files.
+
+    With ``workers`` enabled, libraries passed to ``preload`` start importing immediately in the background, so that
+    the imports overlap with the rest of the project analysis. With ``budget`` set, no library is imported or waited
+    for once the budget (in seconds, counted from ``start_budget``) is spent - such libraries are returned as
+    unknown, and ``budget_exceeded`` is set.
     """
 
     search_paths: list[Path] = field(default_factory=list)
@@ -163,8 +146,18 @@ class LibraryLoader:
     cache: RobocopCache | None = None
     project_root: Path | None = None
     workers: bool = DEFAULT_LIBRARY_WORKERS
+    shared_cache: SharedLibraryCache | None = None
+    specs: LibrarySpecIndex | None = None
+    budget: int = DEFAULT_IMPORT_BUDGET
+    verbose: bool = False
+    budget_exceeded: bool = field(default=False, init=False)
     _cache: dict[tuple[str, tuple[str, ...]], LibrarySpec] = field(default_factory=dict, init=False)
-    _scheduled: list[LibraryRequest] = field(default_factory=list, init=False)
+    _pending: dict[tuple[str, tuple[str, ...]], Future[LibrarySpec]] = field(default_factory=dict, init=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _deadline: float | None = field(default=None, init=False, repr=False)
+    _executor: ThreadPoolExecutor | None = field(default=None, init=False, repr=False)
+    _pool: LibraryWorkerPool | None = field(default=None, init=False, repr=False)
+    _pool_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
 
     def load(self, request: LibraryRequest) -> LibrarySpec:
         """
@@ -174,42 +167,112 @@ class LibraryLoader:
             LibrarySpec with the library keywords, or with the error if it could not be imported.
 
         """
-        cached = self._cache.get(request.cache_key)
-        if cached is None:
-            self._preload_scheduled()
+        with self._lock:
             cached = self._cache.get(request.cache_key)
+            pending = self._pending.get(request.cache_key)
+        if cached is None and pending is not None:
+            with timings.phase("library imports"):
+                cached = self._wait(pending)
         if cached is None:
-            cached = self._load(request)
-            self._cache[request.cache_key] = cached
+            if self._out_of_budget():
+                return self._over_budget(request.alias or request.name)
+            with timings.phase("library imports"):
+                spec = self._timed_load(request)
+            with self._lock:
+                cached = self._cache.setdefault(request.cache_key, spec)
         return self._with_name(cached, request.alias or cached.name)
 
-    def schedule_preload(self, requests: Iterable[LibraryRequest]) -> None:
+    def start_budget(self) -> None:
+        """Start counting the library import budget, for example at the beginning of the project analysis."""
+        self._deadline = monotonic() + self.budget if self.budget else None
+        self.budget_exceeded = False
+
+    def preload(self, requests: Iterable[LibraryRequest]) -> None:
         """
-        Remember libraries used in the project, so that they can be imported in parallel.
+        Start importing the libraries in the background, so that they are ready when they are needed.
 
-        Nothing is imported here. The libraries are imported together, in parallel, when the first library is
-        needed. With the default, synchronous loading this method does nothing and every library is imported
-        separately when it is used for the first time.
+        Libraries are imported by the worker processes, one thread waiting for every worker process. With the
+        default, synchronous loading this method does nothing and every library is imported in the Robocop process
+        when it is used for the first time, since such imports cannot run next to the rest of the analysis.
         """
         if not self.workers:
             return
-        self._scheduled.extend(requests)
+        for request in requests:
+            with self._lock:
+                if request.cache_key in self._cache or request.cache_key in self._pending:
+                    continue
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=default_worker_count(), thread_name_prefix="robocop-library"
+                    )
+                self._pending[request.cache_key] = self._executor.submit(self._preload, request)
+
+    def _preload(self, request: LibraryRequest) -> LibrarySpec:
+        if self._out_of_budget():
+            # libraries skipped because of the budget are not stored, so that they are imported in the next run
+            spec = self._over_budget(request.name)
+            with self._lock:
+                self._pending.pop(request.cache_key, None)
+            return spec
+        spec = self._timed_load(request)
+        with self._lock:
+            self._cache.setdefault(request.cache_key, spec)
+            self._pending.pop(request.cache_key, None)
+        return spec
 
-    def _preload_scheduled(self) -> None:
-        """Import all scheduled libraries at once, using a pool of worker processes."""
-        if not self._scheduled:
-            return
-        pending: dict[tuple[str, tuple[str, ...]], LibraryRequest] = {}
-        for request in self._scheduled:
-            if request.cache_key not in self._cache and request.cache_key not in pending:
-                pending[request.cache_key] = request
-        self._scheduled = []
-        if len(pending) < 2:  # a single library does not benefit from the worker pool
-            return
-        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(pending))) as executor:
-            specs = executor.map(self._load, pending.values())
-            for cache_key, spec in zip(pending, specs, strict=False):
-                self._cache.setdefault(cache_key, spec)
+    def _wait(self, pending: Future[LibrarySpec]) -> LibrarySpec | None:
+        """
+        Wait for the library imported in the background, at most until the import budget is spent.
+
+        Returns:
+            LibrarySpec, or None if the library is not imported within the budget.
+
+        """
+        timeout = None if self._deadline is None else max(0.0, self._deadline - monotonic())
+        wait([pending], timeout=timeout)
+        if not pending.done() or pending.cancelled():
+            return None
+        return pending.result()
+
+    def _over_budget(self, name: str) -> LibrarySpec:
+        return LibrarySpec(name=name, error=f"Library was not imported within the import budget of {self.budget}s")
+
+    def _out_of_budget(self) -> bool:
+        if self._deadline is None or monotonic() < self._deadline:
+            return False
+        self.budget_exceeded = True
+        return True
+
+    def _timed_load(self, request: LibraryRequest) -> LibrarySpec:
+        """
+        Import the library, printing the time of the import in the verbose mode.
+
+        Returns:
+            LibrarySpec with the library keywords, or with the error if it could not be imported.
+
+        """
+        start = perf_counter()
+        spec = self._load(request)
+        if self.verbose:
+            outcome = "Loaded" if spec.loaded else "Failed to load"
+            print(f"{outcome} library {spec.name} in {perf_counter() - start:.2f}s")
+        return spec
+
+    def close(self) -> None:
+        """
+        Stop the background imports and the worker processes.
+
+        The loader can still be used, the next import starts new workers.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._pending = {}
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.close()
 
     def load_import(self, resolved: ResolvedImport) -> LibrarySpec | None:
         """
@@ -230,6 +293,18 @@ class LibraryLoader:
             )
         )
 
+    def sources(self) -> set[Path]:
+        """
+        Return source files of all libraries imported so far.
+
+        Returns:
+            Paths of the imported library files.
+
+        """
+        with self._lock:  # libraries imported in the background are added to the cache at the same time
+            specs = list(self._cache.values())
+        return {spec.source for spec in specs if spec.source is not None}
+
     def is_ignored(self, name: str) -> bool:
         """
         Check if the library is excluded from the analysis with the ``ignored-libraries`` option.
@@ -254,7 +329,7 @@ class LibraryLoader:
         if spec.name == name:
             return spec
         keywords = tuple(replace_library_name(keyword, name) for keyword in spec.keywords)
-        return LibrarySpec(name=name, keywords=keywords, error=spec.error)
+        return LibrarySpec(name=name, keywords=keywords, error=spec.error, source=spec.source)
 
     def _load(self, request: LibraryRequest) -> LibrarySpec:
         """
@@ -266,7 +341,9 @@ class LibraryLoader:
         """
         if self.is_ignored(request.name):
             return LibrarySpec(name=request.name, error="Library is excluded from the analysis")
-        response = self._import_library(request)
+        response = self.specs.find(request) if self.specs is not None else None
+        if response is None or response.get("status") != "ok":  # invalid specification file falls back to import
+            response = self._import_library(request)
         if response.get("status") != "ok":
             return LibrarySpec(name=request.name, error=response.get("error", "Unknown error"))
         name = response.get("name") or request.name
@@ -274,7 +351,8 @@ class LibraryLoader:
         keywords = tuple(
             _keyword_definition(keyword, name, fallback_source) for keyword in response.get("keywords", [])
         )
-        return LibrarySpec(name=name, keywords=keywords)
+        source = response.get("source")
+        return LibrarySpec(name=name, keywords=keywords, source=Path(source) if source else None)
 
     def _import_library(self, request: LibraryRequest) -> dict[str, Any]:
         """
@@ -289,13 +367,62 @@ class LibraryLoader:
             cached = self.cache.get_library_entry(cache_key, environment_hash())
             if cached is not None:
                 return cached
-        response = self._run_worker(request) if self.workers else self._import_in_process(request)
-        if self.cache is not None and response.get("status") == "ok":
+        origin = self._library_origin(request) if self.shared_cache is not None else None
+        response = self._shared_response(cache_key, origin) if origin is not None else None
+        imported = response is None
+        if response is None:
+            response = self._run_worker(request) if self.workers else self._import_in_process(request)
+        if response.get("status") == "ok":
             source = response.get("source")
             if source and self._can_be_cached(Path(source)):
-                self.cache.set_library_entry(cache_key, environment_hash(), Path(source), response)
+                if self.cache is not None:
+                    self.cache.set_library_entry(cache_key, environment_hash(), Path(source), response)
+                if self.shared_cache is not None and origin is not None and imported:
+                    self.shared_cache.set(cache_key, origin, Path(source), response)
+        return response
+
+    def _shared_response(self, cache_key: str, origin: Path) -> dict[str, Any] | None:
+        """
+        Get the response stored in the shared cache, if it can still be used for the project.
+
+        Returns:
+            Cached response, or None if there is no response or the library is now a part of the project.
+
+        """
+        if self.shared_cache is None or not self._can_be_cached(origin):
+            return None
+        response = self.shared_cache.get(cache_key, origin)
+        source = response.get("source") if response is not None else None
+        if not source or not self._can_be_cached(Path(source)):
+            return None
         return response
 
+    def _library_origin(self, request: LibraryRequest) -> Path | None:
+        """
+        Find the module the library name resolves to, without importing it.
+
+        The same library name may resolve to different modules depending on the search paths and the virtual
+        environment, so the shared cache is addressed by the found module. Only the top level package is looked up,
+        since finding a submodule would import its parent packages.
+
+        Returns:
+            Path to the library file or to the top level module of the library, or None if it cannot be found.
+
+        """
+        if request.source is not None:
+            return request.source
+        try:
+            if request.name in STDLIBS:
+                spec = importlib.util.find_spec(f"robot.libraries.{request.name}")
+            else:
+                search_paths = [str(path) for path in self.search_paths] + sys.path
+                spec = PathFinder.find_spec(request.name.split(".")[0], search_paths)
+        except (ImportError, ValueError):
+            return None
+        if spec is None or not spec.has_location or spec.origin is None:
+            return None
+        return Path(spec.origin)
+
     def _can_be_cached(self, source: Path) -> bool:
         """
         Check if the imported library can be stored in the persistent cache.
@@ -317,14 +444,22 @@ class LibraryLoader:
         """
         Build the request describing the library import.
 
+        Modules imported from the project and the search paths are removed from ``sys.modules`` after the import,
+        both in the Robocop process and in the workers. Libraries installed in the environment are left imported,
+        since they do not change while Robocop runs. Libraries coming from the analyzed project may be modified
+        between the runs, which matters when Robocop is used from a long living process such as the MCP server, and
+        different libraries may even share the module name.
+
         Returns:
             Request understood by the library import worker.
 
         """
+        local_paths = (*self.search_paths, self.project_root, request.source.parent if request.source else None)
         return {
             "name": str(request.source) if request.source else request.name,
             "args": list(request.args),
             "search_paths": [str(path) for path in self.search_paths],
+            "local_paths": [str(path) for path in local_paths if path is not None],
         }
 
     def _import_in_process(self, request: LibraryRequest) -> dict[str, Any]:
@@ -341,69 +476,23 @@ class LibraryLoader:
         """
         from robocop.project._libdoc_worker import load_library  # noqa: PLC0415
 
-        already_imported = set(sys.modules)
-        try:
-            return load_library(self._worker_request(request))
-        finally:
-            self._forget_local_modules(already_imported, request)
-
-    def _forget_local_modules(self, already_imported: set[str], request: LibraryRequest) -> None:
-        """
-        Remove modules imported from the project and the search paths from ``sys.modules``.
-
-        Libraries installed in the environment are left imported, since they do not change while Robocop runs.
-        Libraries coming from the analyzed project may be modified between the runs, which matters when Robocop
-        is used from a long living process such as the MCP server, and different libraries may even share the
-        module name. Such modules are removed, so that they are read from the disk again next time.
-        """
-        local_paths = [
-            path.resolve()
-            for path in (*self.search_paths, self.project_root, request.source.parent if request.source else None)
-            if path is not None
-        ]
-        if not local_paths:
-            return
-        for name in set(sys.modules) - already_imported:
-            module = sys.modules.get(name)
-            source = getattr(module, "__file__", None)
-            if not source:
-                continue
-            parents = Path(source).resolve().parents
-            if any(local_path in parents for local_path in local_paths):
-                sys.modules.pop(name, None)
+        return load_library(self._worker_request(request))
 
     def _run_worker(self, request: LibraryRequest) -> dict[str, Any]:
         """
-        Run the worker process importing the library.
+        Import the library in one of the worker processes, starting the pool with the first import.
 
         Returns:
             Response from the worker, or an error description if the worker failed or timed out.
 
         """
-        with tempfile.TemporaryDirectory(prefix="robocop_libdoc_") as directory:
-            output = Path(directory) / "response.json"
-            payload = json.dumps({**self._worker_request(request), "output": str(output)})
-            try:
-                subprocess.run(  # noqa: S603
-                    [sys.executable, "-m", WORKER_MODULE],
-                    input=payload,
-                    capture_output=True,
-                    text=True,
-                    env=worker_environment(),
-                    timeout=self.timeout,
-                    check=False,
-                )
-            except subprocess.TimeoutExpired:
-                return {"status": "error", "error": f"Importing the library timed out after {self.timeout}s"}
-            except OSError as error:  # pragma: no cover - defensive, failure to start the process
-                return {"status": "error", "error": f"Failed to start the library import process: {error}"}
-            if not output.is_file():
-                return {"status": "error", "error": "Library import process did not return any data"}
-            try:
-                response: dict[str, Any] = json.loads(output.read_text(encoding="utf-8"))
-            except (OSError, ValueError) as error:  # pragma: no cover - defensive, corrupted response
-                return {"status": "error", "error": f"Invalid response from the library import process: {error}"}
-            return response
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = LibraryWorkerPool(timeout=self.timeout)
+                # idle workers are stopped when the loader is discarded without closing it
+                weakref.finalize(self, self._pool.close)
+            pool = self._pool
+        return pool.run(self._worker_request(request))
 
 
 def _persistent_cache_key(request: LibraryRequest) -> str:
@@ -460,6 +549,10 @@ def build_library_loader(
     cache: RobocopCache | None = None,
     project_root: Path | None = None,
     workers: bool = DEFAULT_LIBRARY_WORKERS,
+    shared_cache: SharedLibraryCache | None = None,
+    specs: LibrarySpecIndex | None = None,
+    budget: int = DEFAULT_IMPORT_BUDGET,
+    verbose: bool = False,
 ) -> LibraryLoader:
     """
     Create the loader used to import libraries during the project analysis.
@@ -475,4 +568,8 @@ def build_library_loader(
         cache=cache,
         project_root=project_root,
         workers=workers,
+        shared_cache=shared_cache,
+        specs=specs,
+        budget=budget,
+        verbose=verbose,
     )
@@ -0,0 +1,220 @@
+"""
+Library keywords cache shared by all projects of the current user.
+
+The project cache (``.robocop_cache``) stores the keywords of imported libraries, but every clone and every git
+worktree of the project has its own cache, so libraries such as SeleniumLibrary or Browser are imported again in
+each of them. Successful imports are therefore also stored in the user cache directory, shared between the
+projects.
+
+Entries are addressed by the hash of the Python version, the Robot Framework version, the library name, its
+arguments and the content of the module the name resolves to in the importing project. The same library installed in
+the virtual environment of every clone or CI job shares the entry, while a different library imported with the same
+name does not. Paths in the stored responses are relative to the directory of the module, and are resolved against
+the module found by the importing project when the response is read. Every entry keeps the responses for a few
+library source files, identified by their path and the hash of their content - the response is used only if the
+resolved module and the library source file are still the same. Entries are replaced atomically, so concurrent runs
+never read a partially written entry, and the modifications of the cache are serialized with a lock file. The least
+recently used entries are removed when the cache exceeds its size limit.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import platform
+import sys
+import tempfile
+from functools import cache
+from hashlib import sha256
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from robocop.cache import file_content_hash
+from robocop.config import defaults
+from robocop.files import file_lock
+from robocop.linter.utils.misc import get_robocop_cache_directory
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+LIBRARY_CACHE_ENV_VARIABLE = "ROBOCOP_LIBRARY_CACHE_DIR"
+LIBRARY_CACHE_DIR_NAME = "libraries"
+LOCK_FILE_NAME = ".lock"
+FORMAT_VERSION = 3
+MAX_SOURCES_PER_ENTRY = 4
+
+
+def default_library_cache_dir() -> Path:
+    """
+    Return the directory of the shared library cache.
+
+    Returns:
+        Path from the ``ROBOCOP_LIBRARY_CACHE_DIR`` environment variable, or the directory in the user cache.
+
+    """
+    from_env = os.environ.get(LIBRARY_CACHE_ENV_VARIABLE)
+    if from_env:
+        return Path(from_env)
+    return get_robocop_cache_directory(ensure_exists=False) / LIBRARY_CACHE_DIR_NAME
+
+
+@cache
+def shared_environment_key() -> str:
+    """
+    Describe the environment the libraries are imported in, independently of the virtual environment used.
+
+    Returns:
+        Python implementation and version, and the Robot Framework version.
+
+    """
+    from robot.version import VERSION as RF_VERSION  # noqa: PLC0415
+
+    return f"{platform.python_implementation()}|{sys.version_info[:3]}|{RF_VERSION}"
+
+
+def _relative_to(path: str | None, base: Path) -> str | None:
+    """Return the path relative to the base directory, or unchanged if it is outside of it."""
+    if not path:
+        return path
+    with contextlib.suppress(ValueError):
+        return Path(path).relative_to(base).as_posix()
+    return path
+
+
+def _resolved_against(path: str | None, base: Path) -> str | None:
+    """Return the path stored relative to the base directory as an absolute path."""
+    if not path or Path(path).is_absolute():
+        return path
+    return str(base / path)
+
+
+def _with_paths(response: dict[str, Any], convert: Callable[[str | None], str | None]) -> dict[str, Any]:
+    """Return the copy of the response with the library and keyword sources converted."""
+    converted = dict(response)
+    if "source" in response:
+        converted["source"] = convert(response["source"])
+    if isinstance(response.get("keywords"), list):
+        converted["keywords"] = [
+            {**keyword, "source": convert(keyword["source"])} if "source" in keyword else keyword
+            for keyword in response["keywords"]
+        ]
+    return converted
+
+
+class SharedLibraryCache:
+    """
+    Responses of the library imports, stored in the user cache directory.
+
+    The cache is best-effort: a cache that cannot be read or written behaves like an empty cache.
+    """
+
+    def __init__(self, directory: Path, max_size: int = defaults.LIBRARY_CACHE_MAX_SIZE) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Directory with the cache entries.
+            max_size: Maximum size of the cache in megabytes. 0 means no limit.
+
+        """
+        self.directory = directory
+        self.max_size = max_size * 1024 * 1024
+
+    def _entry_path(self, key: str, origin_hash: str) -> Path:
+        digest = sha256(f"{FORMAT_VERSION}|{shared_environment_key()}|{key}|{origin_hash}".encode()).hexdigest()
+        return self.directory / digest[:2] / f"{digest}.json"
+
+    @staticmethod
+    def _read_sources(path: Path) -> list[dict[str, Any]]:
+        try:
+            sources: list[dict[str, Any]] = json.loads(path.read_text(encoding="utf-8"))["sources"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return []
+        return sources
+
+    def get(self, key: str, origin: Path) -> dict[str, Any] | None:
+        """
+        Get the response of the library import, if the library files did not change since it was stored.
+
+        Args:
+            key: Key identifying the library import (name and arguments).
+            origin: Module the library name resolves to, before the library is imported.
+
+        Returns:
+            Cached import response, or None if there is no valid entry.
+
+        """
+        try:
+            origin_hash = file_content_hash(origin)
+        except OSError:
+            return None
+        path = self._entry_path(key, origin_hash)
+        for stored in self._read_sources(path):
+            try:
+                if stored["origin_hash"] != origin_hash:
+                    continue
+                source = _resolved_against(stored["source"], origin.parent)
+                if file_content_hash(Path(source)) != stored["content_hash"]:
+                    continue
+                os.utime(path)  # the modification time is the last access time used by the eviction
+            except (OSError, KeyError, TypeError):
+                continue
+            return _with_paths(stored["response"], lambda stored_path: _resolved_against(stored_path, origin.parent))
+        return None
+
+    def set(self, key: str, origin: Path, source: Path, response: dict[str, Any]) -> None:
+        """
+        Store the response of the library import.
+
+        Args:
+            key: Key identifying the library import (name and arguments).
+            origin: Module the library name resolved to before the library was imported.
+            source: Source file of the imported library, used to validate the entry.
+            response: Response returned by the library import.
+
+        """
+        try:
+            origin_hash = file_content_hash(origin)
+            content_hash = file_content_hash(source)
+            self.directory.mkdir(parents=True, exist_ok=True)
+            stored_source = _relative_to(str(source), origin.parent)
+            with file_lock(self.directory / LOCK_FILE_NAME):
+                path = self._entry_path(key, origin_hash)
+                sources = [stored for stored in self._read_sources(path) if stored.get("source") != stored_source]
+                stored = {
+                    "source": stored_source,
+                    "content_hash": content_hash,
+                    "origin_hash": origin_hash,
+                    "response": _with_paths(response, lambda path: _relative_to(path, origin.parent)),
+                }
+                sources.insert(0, stored)
+                self._write(path, {"sources": sources[:MAX_SOURCES_PER_ENTRY]})
+                self._evict()
+        except OSError:
+            return
+
+    @staticmethod
+    def _write(path: Path, data: dict[str, Any]) -> None:
+        """Write the entry to the temporary file and replace the entry with it, so it is never read partially."""
+        path.parent.mkdir(exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=path.parent, suffix=".tmp", delete=False) as file:
+            json.dump(data, file)
+        os.replace(file.name, path)
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries until the cache fits in the size limit."""
+        if not self.max_size:
+            return
+        entries = []
+        for path in self.directory.glob("*/*.json"):
+            with contextlib.suppress(OSError):
+                stat = path.stat()
+                entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            with contextlib.suppress(OSError):
+                path.unlink()
+                total -= size
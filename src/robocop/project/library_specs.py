@@ -0,0 +1,319 @@
+"""
+Library keywords read from the specification files generated by Libdoc, instead of importing the libraries.
+
+Importing some libraries is slow or has side effects, and the result may depend on the machine. Libdoc can save the
+library documentation to the JSON or XML specification file (``python -m robot.libdoc Browser Browser.json``), and
+such files can be used by Robocop with the ``library-specs`` option. Specification files for all libraries used in
+the project are generated with ``robocop libspec build``.
+
+Directories with the specification files are scanned once, reading only the library name from the beginning of every
+file. The whole file is parsed only when the library is used in the project.
+"""
+
+from __future__ import annotations
+
+import html
+import json
+import re
+import subprocess
+import sys
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from robocop.project.library_workers import default_worker_count, worker_environment
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from robocop.project.libraries import LibraryRequest
+
+SPEC_SUFFIXES = (".json", ".xml", ".libspec")
+HEADER_SIZE = 4096
+"""Number of bytes read from the beginning of the file to find the library name."""
+JSON_NAME_PATTERN = re.compile(rb'"name"\s*:\s*"((?:[^"\\]|\\.)*)"')
+XML_NAME_PATTERN = re.compile(rb'<keywordspec\b[^>]*?\bname="([^"]*)"')
+
+
+def _read_header(path: Path) -> bytes:
+    """
+    Read the beginning of the file, without reading the whole file to the memory.
+
+    Returns:
+        First bytes of the file.
+
+    """
+    with open(path, "rb") as file:
+        return file.read(HEADER_SIZE)
+
+
+def spec_library_name(path: Path) -> str | None:
+    """
+    Find the name of the library documented in the specification file.
+
+    Returns:
+        Library name, or None if the file is not a Libdoc specification file.
+
+    """
+    try:
+        header = _read_header(path)
+    except OSError:
+        return None
+    if path.suffix == ".json":
+        match = JSON_NAME_PATTERN.search(header)
+        if match is None or b'"specversion"' not in header:
+            return None
+        name: str = json.loads(b'"' + match.group(1) + b'"')
+        return name
+    match = XML_NAME_PATTERN.search(header)
+    if match is None:
+        return None
+    return html.unescape(match.group(1).decode("utf-8"))
+
+
+def _arguments(args: list[Any]) -> dict[str, Any]:
+    """
+    Convert the arguments of the keyword from the specification file.
+
+    Arguments are described with the kind (Robot Framework 4+) or, in older specification files, as strings such as
+    ``name=default`` or ``*varargs``.
+
+    Returns:
+        Dictionary matching the fields of the ``ArgumentsSpec`` used by Robocop.
+
+    """
+    arguments: dict[str, Any] = {
+        "positional": [],
+        "defaults": [],
+        "var_positional": None,
+        "var_named": None,
+        "named_only": [],
+    }
+    for arg in args:
+        if isinstance(arg, str):
+            name, has_default, _ = arg.partition("=")
+            if name.startswith("**"):
+                kind, name = "VAR_NAMED", name[2:]
+            elif name.startswith("*"):
+                kind, name = "VAR_POSITIONAL", name[1:]
+            else:
+                kind = "POSITIONAL_OR_NAMED"
+            required = not has_default
+        else:
+            name, kind, required = arg["name"], arg.get("kind", "POSITIONAL_OR_NAMED"), arg.get("required", True)
+        if kind == "VAR_POSITIONAL":
+            arguments["var_positional"] = name
+        elif kind == "VAR_NAMED":
+            arguments["var_named"] = name
+        elif kind in ("POSITIONAL_ONLY", "POSITIONAL_OR_NAMED"):
+            arguments["positional"].append(name)
+        elif kind == "NAMED_ONLY":
+            arguments["named_only"].append(name)
+        else:  # markers, such as the separator of the named-only arguments
+            continue
+        if not required and kind not in ("VAR_POSITIONAL", "VAR_NAMED"):
+            arguments["defaults"].append(name)
+    return arguments
+
+
+def _read_json_spec(path: Path) -> dict[str, Any]:
+    data = json.loads(path.read_bytes())
+    source = data.get("source")
+    return {
+        "status": "ok",
+        "name": data["name"],
+        "source": source,
+        "keywords": [
+            {
+                "name": keyword["name"],
+                "arguments": _arguments(keyword.get("args") or []),
+                "source": keyword.get("source") or source,
+                "lineno": keyword.get("lineno") or 0,
+            }
+            for keyword in data.get("keywords", [])
+        ],
+    }
+
+
+def _read_xml_spec(path: Path) -> dict[str, Any]:
+    root = ET.parse(path).getroot()  # noqa: S314 - specification files are provided by the user
+    source = root.get("source")
+    keywords = []
+    # keywords are grouped in the ``keywords`` element since Robot Framework 4
+    for keyword in root.findall("keywords/kw") or root.findall("kw"):
+        args: list[Any] = []
+        for arg in keyword.iterfind("arguments/arg"):
+            name = arg.find("name")
+            if name is None:  # Robot Framework 3 specification files
+                args.append(arg.text or "")
+            else:
+                args.append(
+                    {"name": name.text or "", "kind": arg.get("kind"), "required": arg.get("required") == "true"}
+                )
+        keywords.append(
+            {
+                "name": keyword.get("name", ""),
+                "arguments": _arguments(args),
+                "source": keyword.get("source") or source,
+                "lineno": int(keyword.get("lineno") or 0),
+            }
+        )
+    return {"status": "ok", "name": root.get("name", ""), "source": source, "keywords": keywords}
+
+
+def read_spec(path: Path) -> dict[str, Any]:
+    """
+    Read the keywords from the specification file.
+
+    Returns:
+        Response in the same format as the response of the library import, or the description of the failure.
+
+    """
+    try:
+        return _read_json_spec(path) if path.suffix == ".json" else _read_xml_spec(path)
+    except (OSError, ValueError, KeyError, TypeError, ET.ParseError) as error:
+        return {"status": "error", "error": f"Invalid library specification file {path}: {error}"}
+
+
+class LibrarySpecIndex:
+    """
+    Specification files found in the configured directories, by the library name.
+
+    If the same library is documented in several files, the file found first is used. A specification file is used
+    for every import of the library, regardless of the arguments the library is imported with.
+    """
+
+    def __init__(self, paths: Iterable[Path]) -> None:
+        self.paths = list(paths)
+        self._specs: dict[str, Path] | None = None
+        self._responses: dict[Path, dict[str, Any]] = {}
+
+    @property
+    def specs(self) -> dict[str, Path]:
+        """Specification files by the library name, found when they are needed for the first time."""
+        if self._specs is None:
+            specs: dict[str, Path] = {}
+            for path in self.paths:
+                files = sorted(path.iterdir()) if path.is_dir() else [path]
+                for spec_file in files:
+                    if spec_file.suffix not in SPEC_SUFFIXES or not spec_file.is_file():
+                        continue
+                    name = spec_library_name(spec_file)
+                    if name is not None:
+                        specs.setdefault(name, spec_file)
+            self._specs = specs
+        return self._specs
+
+    def find(self, request: LibraryRequest) -> dict[str, Any] | None:
+        """
+        Read the keywords of the requested library from its specification file.
+
+        Libraries imported by name are matched with the name of the library in the specification file, and
+        libraries imported by path with the name of the file.
+
+        Returns:
+            Response in the same format as the response of the library import, or None if there is no
+            specification file for the library.
+
+        """
+        name = request.source.stem if request.source else request.name
+        spec_file = self.specs.get(name)
+        if spec_file is None:
+            return None
+        response = self._responses.get(spec_file)
+        if response is None:
+            response = self._responses[spec_file] = read_spec(spec_file)
+        return response
+
+
+def spec_file_name(request: LibraryRequest) -> str:
+    """
+    Return the name of the specification file generated for the library.
+
+    Returns:
+        File name, matching the name used to find the specification of the library.
+
+    """
+    return f"{request.source.stem if request.source else request.name}.json"
+
+
+def build_specs(
+    requests: Iterable[LibraryRequest],
+    output_dir: Path,
+    search_paths: list[Path],
+    timeout: int,
+    project_root: Path | None = None,
+) -> dict[str, str | None]:
+    """
+    Generate the JSON specification files of the libraries with Libdoc.
+
+    Every library is documented in a separate process, several libraries at the same time. Libraries that are a
+    part of the project are skipped, since their specification files would get outdated with every change.
+
+    Args:
+        requests: Libraries to document. Only the first import of every library is documented.
+        output_dir: Directory where the specification files are saved.
+        search_paths: Additional locations to search for the libraries.
+        timeout: Maximum time in seconds for documenting a single library.
+        project_root: Root of the project. Libraries from the project are not documented.
+
+    Returns:
+        Name of every documented library mapped to None, or to the reason why its specification was not generated.
+
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    pending: dict[str, LibraryRequest] = {}
+    for request in requests:
+        pending.setdefault(spec_file_name(request), request)
+
+    def build(file_name: str, request: LibraryRequest) -> str | None:
+        output = output_dir / file_name
+        return _run_libdoc(request, output, search_paths, timeout, project_root)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(default_worker_count(), len(pending)))) as executor:
+        results = executor.map(build, pending.keys(), pending.values())
+        return {Path(file_name).stem: result for file_name, result in zip(pending, results, strict=True)}
+
+
+def _is_in_project(source: str | Path | None, project_root: Path | None) -> bool:
+    if not source or project_root is None:
+        return False
+    return project_root.resolve() in Path(source).resolve().parents
+
+
+def _run_libdoc(
+    request: LibraryRequest, output: Path, search_paths: list[Path], timeout: int, project_root: Path | None
+) -> str | None:
+    """
+    Document the library with Libdoc, in a separate process.
+
+    Returns:
+        None if the specification file was generated, otherwise the reason why it was not generated.
+
+    """
+    if _is_in_project(request.source, project_root):
+        return "Library is a part of the project"
+    name = "::".join([str(request.source) if request.source else request.name, *request.args])
+    command = [sys.executable, "-m", "robot.libdoc", "--format", "JSON", "--specdocformat", "RAW", "--quiet"]
+    for search_path in search_paths:
+        command.extend(["--pythonpath", str(search_path)])
+    try:
+        result = subprocess.run(  # noqa: S603
+            [*command, name, str(output)],
+            capture_output=True,
+            text=True,
+            env=worker_environment(),
+            timeout=timeout,
+            check=False,
+        )
+    except subprocess.TimeoutExpired:
+        output.unlink(missing_ok=True)
+        return f"Documenting the library timed out after {timeout}s"
+    if result.returncode or not output.is_file():
+        error = (result.stderr or result.stdout).strip().splitlines()
+        return error[0] if error else f"Libdoc failed with the exit code {result.returncode}"
+    if _is_in_project(read_spec(output).get("source"), project_root):
+        output.unlink()
+        return "Library is a part of the project"
+    return None
@@ -0,0 +1,233 @@
+"""
+Pool of long living processes importing Robot Framework libraries.
+
+Starting a new Python process and importing Robot Framework takes longer than importing most of the libraries, so
+the processes started with the ``--library-workers`` option are reused for many imports. Every process handles one
+import at a time: the request is written to its standard input and the response is read from its standard output,
+one JSON document per line (see ``robocop.project._libdoc_worker``).
+
+A worker that does not respond within the timeout is killed and only this worker is replaced, the other imports
+continue. Every library import leaves its modules in the worker process, so the workers are also replaced after a
+number of imports, to limit the memory used and the chance that the modules of one library affect the next one.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+from dataclasses import dataclass, field
+from typing import Any
+
+WORKER_MODULE = "robocop.project._libdoc_worker"
+MAX_IMPORTS_PER_WORKER = 50
+MIN_WORKERS = 2
+
+
+def default_worker_count() -> int:
+    """
+    Return the number of libraries imported at the same time.
+
+    Importing a library is mostly CPU bound, so one worker process is started for every CPU available to Robocop.
+    At least two workers are used, so that a single library that hangs on import does not stop all other imports.
+
+    Returns:
+        Number of the worker processes.
+
+    """
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+    return max(MIN_WORKERS, cpus)
+
+
+def worker_environment() -> dict[str, str]:
+    """
+    Build environment variables for the process importing the library.
+
+    The current environment is passed to the worker, so that libraries can be configured with environment variables.
+    On Windows ``SystemRoot`` is restored if it is missing, since without it the standard library cannot import
+    modules using sockets.
+
+    Returns:
+        Environment variables for the worker process.
+
+    """
+    env = dict(os.environ)
+    if sys.platform == "win32" and not any(name.upper() == "SYSTEMROOT" for name in env):
+        windows_directory = _windows_directory()
+        if windows_directory:
+            env["SystemRoot"] = windows_directory
+    return env
+
+
+def _windows_directory() -> str | None:
+    """
+    Read the Windows directory without relying on the environment variables.
+
+    Returns:
+        Path to the Windows directory, or None if it could not be read.
+
+    """
+    import ctypes  # noqa: PLC0415
+
+    buffer = ctypes.create_unicode_buffer(260)
+    try:
+        length = ctypes.windll.kernel32.GetWindowsDirectoryW(buffer, len(buffer))
+    except (AttributeError, OSError):  # pragma: no cover - defensive, not available outside Windows
+        return None
+    return buffer.value if length else None
+
+
+class WorkerError(Exception):
+    """The worker process failed to return the response."""
+
+
+class LibraryWorker:
+    """
+    Single worker process, importing the requested libraries one by one.
+
+    Responses are read by a separate thread, so that waiting for the response can be stopped on timeout on every
+    platform.
+    """
+
+    def __init__(self) -> None:
+        self.imports = 0
+        self.process = subprocess.Popen(  # noqa: S603
+            [sys.executable, "-m", WORKER_MODULE],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            env=worker_environment(),
+        )
+        self._responses: queue.SimpleQueue[str | None] = queue.SimpleQueue()
+        threading.Thread(target=self._read_responses, daemon=True).start()
+
+    def _read_responses(self) -> None:
+        for line in self.process.stdout:  # type: ignore[union-attr]
+            self._responses.put(line)
+        self.process.stdout.close()  # type: ignore[union-attr]
+        self._responses.put(None)  # the process exited
+
+    def request(self, request: dict[str, Any], timeout: float) -> dict[str, Any]:
+        """
+        Send the request to the worker and wait for the response.
+
+        Returns:
+            Response from the worker.
+
+        Raises:
+            TimeoutError: If the worker did not respond within the timeout.
+            WorkerError: If the worker exited or returned invalid data.
+
+        """
+        try:
+            self.process.stdin.write(json.dumps(request) + "\n")  # type: ignore[union-attr]
+            self.process.stdin.flush()  # type: ignore[union-attr]
+        except OSError as error:
+            raise WorkerError(f"Failed to send the request to the library import process: {error}") from None
+        try:
+            line = self._responses.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError from None
+        if line is None:
+            raise WorkerError("Library import process did not return any data")
+        self.imports += 1
+        try:
+            response: dict[str, Any] = json.loads(line)
+        except ValueError as error:  # pragma: no cover - defensive, corrupted response
+            raise WorkerError(f"Invalid response from the library import process: {error}") from None
+        return response
+
+    def close(self) -> None:
+        """Ask the worker to exit by closing its input, and kill it if it does not exit in time."""
+        try:
+            self.process.stdin.close()  # type: ignore[union-attr]
+            self.process.wait(timeout=1)
+        except (OSError, subprocess.TimeoutExpired):
+            self.kill()
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.wait()
+        with contextlib.suppress(OSError):  # the pipe may be broken
+            self.process.stdin.close()  # type: ignore[union-attr]
+
+
+@dataclass
+class LibraryWorkerPool:
+    """
+    Pool of worker processes, started when they are needed and reused by the next imports.
+
+    The pool can be used from several threads at once: every thread takes an idle worker, or starts a new one if
+    fewer than ``size`` workers are running.
+
+    Attributes:
+        timeout: Maximum time in seconds for a single import.
+        size: Maximum number of the worker processes running at the same time. Defaults to the number of CPUs.
+        max_imports: Number of imports after which the worker is replaced with a new process.
+
+    """
+
+    timeout: float
+    size: int = field(default_factory=default_worker_count)
+    max_imports: int = MAX_IMPORTS_PER_WORKER
+    _idle: list[LibraryWorker] = field(default_factory=list, init=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False)
+    _slots: threading.Semaphore = field(init=False)
+    _closed: bool = field(default=False, init=False)
+
+    def __post_init__(self) -> None:
+        self._slots = threading.Semaphore(self.size)
+
+    def run(self, request: dict[str, Any]) -> dict[str, Any]:
+        """
+        Import the library in one of the workers.
+
+        Returns:
+            Response from the worker, or an error description if the worker failed or timed out.
+
+        """
+        with self._slots:
+            try:
+                worker = self._acquire()
+            except OSError as error:  # pragma: no cover - defensive, failure to start the process
+                return {"status": "error", "error": f"Failed to start the library import process: {error}"}
+            try:
+                response = worker.request(request, self.timeout)
+            except TimeoutError:
+                worker.kill()  # only the hung worker is stopped, the next import starts a new one
+                return {"status": "error", "error": f"Importing the library timed out after {self.timeout}s"}
+            except WorkerError as error:
+                worker.kill()
+                return {"status": "error", "error": str(error)}
+            self._release(worker)
+            return response
+
+    def _acquire(self) -> LibraryWorker:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return LibraryWorker()
+
+    def _release(self, worker: LibraryWorker) -> None:
+        with self._lock:
+            if worker.imports < self.max_imports and not self._closed:
+                self._idle.append(worker)
+                return
+        worker.close()
+
+    def close(self) -> None:
+        """Stop all idle workers. Workers still importing a library are stopped when they are released."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.close()
@@ -8,21 +8,23 @@ again when nothing changed. Only plain types are used, so that the result can be
 from __future__ import annotations
 
 import re
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from robocop.project.collector import CollectedFile, RawImport
 from robocop.project.definitions import (
     ArgumentsSpec,
+    ImportStatus,
     ImportType,
     KeywordDefinition,
     KeywordUsage,
     Location,
+    ResolvedImport,
     VariableDefinition,
 )
 
 if TYPE_CHECKING:
     from collections.abc import Callable
-    from pathlib import Path
 
 SERIALIZATION_VERSION = 2
 """Version of the format used to store the collected data. Bump it whenever the format changes."""
@@ -159,6 +161,37 @@ def _import_from_dict(data: dict[str, Any], source: Path) -> RawImport:
     )
 
 
+def _resolved_import_to_dict(resolved: ResolvedImport) -> dict[str, Any]:
+    return {
+        "import_type": resolved.import_type.value,
+        "name": resolved.name,
+        "resolved_name": resolved.resolved_name,
+        "status": resolved.status.value,
+        "location": _location_to_dict(resolved.location),
+        "path": str(resolved.path) if resolved.path is not None else None,
+        "error": resolved.error,
+        "args": list(resolved.args),
+        "alias": resolved.alias,
+        "args_resolved": resolved.args_resolved,
+    }
+
+
+def _resolved_import_from_dict(data: dict[str, Any], source: Path) -> ResolvedImport:
+    path = data["path"]
+    return ResolvedImport(
+        import_type=ImportType(data["import_type"]),
+        name=data["name"],
+        resolved_name=data["resolved_name"],
+        status=ImportStatus(data["status"]),
+        location=_location_from_dict(data["location"], source),
+        path=Path(path) if path is not None else None,
+        error=data["error"],
+        args=tuple(data["args"]),
+        alias=data["alias"],
+        args_resolved=data["args_resolved"],
+    )
+
+
 def collected_file_to_dict(collected: CollectedFile) -> dict[str, Any]:
     """
     Convert data collected from a single file into plain types.
@@ -211,3 +244,33 @@ def collected_file_from_dict(data: dict[str, Any], path: Path) -> CollectedFile
         )
     except (KeyError, TypeError, ValueError, re.error):  # pragma: no cover - defensive, corrupted cache
         return None
+
+
+def resolved_imports_to_dict(imports: list[ResolvedImport]) -> dict[str, Any]:
+    """
+    Convert imports of a single file, resolved to paths, into plain types.
+
+    Returns:
+        Dictionary that can be stored in the cache.
+
+    """
+    return {
+        "version": SERIALIZATION_VERSION,
+        "imports": [_resolved_import_to_dict(resolved) for resolved in imports],
+    }
+
+
+def resolved_imports_from_dict(data: dict[str, Any], path: Path) -> list[ResolvedImport] | None:
+    """
+    Restore imports of a single file resolved to paths.
+
+    Returns:
+        List of resolved imports, or None if the stored data was saved in a different format and cannot be restored.
+
+    """
+    if data.get("version") != SERIALIZATION_VERSION:
+        return None
+    try:
+        return _restore_all(data, "imports", _resolved_import_from_dict, path)
+    except (KeyError, TypeError, ValueError):  # pragma: no cover - defensive, corrupted cache
+        return None
@@ -159,6 +159,22 @@ def load_variable_files(paths: list[str], search_paths: list[Path] | None = None
     return loaded
 
 
+def find_variable_files(paths: list[str], search_paths: list[Path] | None = None) -> list[Path]:
+    """
+    Find variable files provided with the ``--variablefile`` option, without loading them.
+
+    Returns:
+        Paths to the existing variable files.
+
+    """
+    found = []
+    for entry in paths:
+        path, _ = _split_variable_file_args(entry, search_paths)
+        if path is not None:
+            found.append(path)
+    return found
+
+
 def _split_variable_file_args(entry: str, search_paths: list[Path] | None) -> tuple[Path | None, list[str]]:
     """
     Split variable file definition into the path and its arguments and find the file.
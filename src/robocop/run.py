@@ -1,4 +1,6 @@
 import textwrap
+from fnmatch import fnmatch
+from functools import partial
 from pathlib import Path
 from typing import Annotated, Any
 
@@ -6,16 +8,20 @@ import typer
 from rich.console import Console
 
 from robocop import __version__, plugins
+from robocop.cache import SectionStatistics
 from robocop.config import defaults, manager, parser, schema
 from robocop.formatter.runner import RobocopFormatter
 from robocop.linter import rules_list
 from robocop.linter.diagnostics import Diagnostic
+from robocop.linter.merge_reports import calculate_exit_code, merge_reports, save_report
 from robocop.linter.reports import load_all_reports, print_reports
 from robocop.linter.rules import Rule, RuleSeverity
 from robocop.linter.runner import RobocopLinter
 from robocop.linter.utils.misc import ROBOCOP_RULES_URL, get_plural_form  # TODO: move higher up
 from robocop.migrate_config import migrate_deprecated_configs
 from robocop.runtime.resolver import ConfigResolver
+from robocop.runtime.shard import Shard
+from robocop.runtime.watch import watch_files
 
 
 class CliWithVersion(typer.core.TyperGroup):
@@ -38,6 +44,12 @@ app = typer.Typer(
 )
 list_app = typer.Typer(help="List available rules, reports, formatters or plugins.")
 app.add_typer(list_app, name="list")
+cache_app = typer.Typer(help="Show statistics of the cache or remove stale entries from it.")
+app.add_typer(cache_app, name="cache")
+libspec_app = typer.Typer(help="Generate Libdoc specification files of the libraries used in the project.")
+app.add_typer(libspec_app, name="libspec")
+daemon_app = typer.Typer(help="Run Robocop daemon, which keeps Robocop loaded between the runs of robocop-client.")
+app.add_typer(daemon_app, name="daemon")
 
 
 def version_callback(value: bool | None) -> None:
@@ -216,6 +228,38 @@ library_workers_option = Annotated[
         rich_help_panel="Project analysis",
     ),
 ]
+library_import_budget_option = Annotated[
+    int | None,
+    typer.Option(
+        "--library-import-budget",
+        min=0,
+        show_default="0 (no limit)",
+        metavar="SECONDS",
+        help="Maximum time for importing all libraries. Libraries not imported in time are treated as unknown.",
+        rich_help_panel="Project analysis",
+    ),
+]
+shared_library_cache_option = Annotated[
+    bool | None,
+    typer.Option(
+        "--shared-library-cache/--no-shared-library-cache",
+        show_default="--shared-library-cache",
+        help="Reuse keywords of libraries imported by other projects, stored in the user cache directory. "
+        "Only used when the cache is enabled.",
+        rich_help_panel="Project analysis",
+    ),
+]
+library_specs_option = Annotated[
+    list[str] | None,
+    typer.Option(
+        "--library-spec",
+        show_default=False,
+        metavar="PATH",
+        help="Directory or file with Libdoc specifications (JSON or XML) used instead of importing the libraries. "
+        "Generate them with robocop libspec build.",
+        rich_help_panel="Project analysis",
+    ),
+]
 ignored_libraries_option = Annotated[
     list[str] | None,
     typer.Option(
@@ -226,6 +270,26 @@ ignored_libraries_option = Annotated[
         rich_help_panel="Project analysis",
     ),
 ]
+jobs_option = Annotated[
+    int | None,
+    typer.Option(
+        "--jobs",
+        "-j",
+        min=0,
+        show_default="1",
+        metavar="N",
+        help="Number of files processed in parallel, in separate processes. Use 0 to use all available CPUs.",
+        rich_help_panel="Other",
+    ),
+]
+watch_option = Annotated[
+    bool,
+    typer.Option(
+        "--watch",
+        help="Keep running and process the changed files again whenever any file in the project changes.",
+        rich_help_panel="Other",
+    ),
+]
 verbose_option = Annotated[
     bool | None,
     typer.Option(
@@ -272,6 +336,40 @@ cache_dir_option = Annotated[
         rich_help_panel="Caching",
     ),
 ]
+cache_content_hash_option = Annotated[
+    bool | None,
+    typer.Option(
+        "--cache-content-hash/--no-cache-content-hash",
+        help="Validate cached results of the files with modified mtime using the hash of the file content. "
+        "Allows reusing the cache after a fresh checkout of the repository.",
+        show_default=False,
+        rich_help_panel="Caching",
+    ),
+]
+cache_max_size_option = Annotated[
+    int | None,
+    typer.Option(
+        "--cache-max-size",
+        min=0,
+        show_default="0 (no limit)",
+        metavar="MB",
+        help="Maximum size of the cache in megabytes. The least recently used entries are removed when the cache "
+        "is pruned.",
+        rich_help_panel="Caching",
+    ),
+]
+cache_max_config_hashes_option = Annotated[
+    int | None,
+    typer.Option(
+        "--cache-max-config-hashes",
+        min=0,
+        show_default=str(defaults.CACHE_MAX_CONFIG_HASHES),
+        metavar="N",
+        help="Number of the most recently used configurations to keep cached project checks results for, per "
+        "project, when the cache is pruned. Use 0 to keep all.",
+        rich_help_panel="Caching",
+    ),
+]
 select_rules_option = Annotated[
     list[str] | None,
     typer.Option("--select", "-s", help="Select rules to run", show_default=False, rich_help_panel="Selecting rules"),
@@ -456,12 +554,41 @@ def check_files(
     analyze_libraries: analyze_libraries_option = None,
     load_library_timeout: load_library_timeout_option = None,
     library_workers: library_workers_option = None,
+    library_import_budget: library_import_budget_option = None,
+    shared_library_cache: shared_library_cache_option = None,
+    library_spec: library_specs_option = None,
     ignored_library: ignored_libraries_option = None,
+    jobs: jobs_option = None,
+    watch: watch_option = False,
+    changed_since: Annotated[
+        str | None,
+        typer.Option(
+            "--changed-since",
+            help="Lint only files changed since given git reference (for example origin/main), including "
+            "uncommitted and untracked files. Project rules report issues only in files affected by the changes.",
+            metavar="REF",
+            rich_help_panel="File discovery",
+        ),
+    ] = None,
+    shard: Annotated[
+        Shard | None,
+        typer.Option(
+            "--shard",
+            help="Lint only a part of the files, to split the work between several runs. Files are split by size into "
+            "given number of parts. Merge the reports of the runs with robocop merge-reports.",
+            parser=Shard.from_string,
+            metavar="INDEX/COUNT",
+            rich_help_panel="File discovery",
+        ),
+    ] = None,
     verbose: verbose_option = None,
     silent: silent_option = None,
     cache: cache_option = None,
     clear_cache: clear_cache_option = False,
     cache_dir: cache_dir_option = None,
+    cache_content_hash: cache_content_hash_option = None,
+    cache_max_size: cache_max_size_option = None,
+    cache_max_config_hashes: cache_max_config_hashes_option = None,
 ) -> list[Diagnostic]:
     """
     Lint Robot Framework files.
@@ -495,7 +622,13 @@ def check_files(
         unsafe_fixes=unsafe_fixes,
         diff=diff,
     )
-    cache_config = schema.RawCacheConfig(enabled=cache, cache_dir=cache_dir)
+    cache_config = schema.RawCacheConfig(
+        enabled=cache,
+        cache_dir=cache_dir,
+        content_hash=cache_content_hash,
+        max_size=cache_max_size,
+        max_config_hashes=cache_max_config_hashes,
+    )
     overwrite_config = schema.RawConfig(
         linter=linter_config,
         formatter=None,
@@ -509,12 +642,17 @@ def check_files(
         analyze_libraries=analyze_libraries,
         load_library_timeout=load_library_timeout,
         library_workers=library_workers,
+        library_import_budget=library_import_budget,
+        shared_library_cache=shared_library_cache,
+        library_specs=library_spec,
         ignored_libraries=ignored_library,
+        jobs=jobs,
         silent=silent,
         verbose=verbose,
         target_version=target_version,
     )
-    config_manager = manager.ConfigManager(
+    create_config_manager = partial(
+        manager.ConfigManager,
         sources=sources,
         config=configuration_file,
         root=root,
@@ -523,13 +661,68 @@ def check_files(
         skip_gitignore=skip_gitignore,
         force_exclude=force_exclude,
         overwrite_config=overwrite_config,
+        changed_since=changed_since,
+        shard=shard,
     )
+    config_manager = create_config_manager()
     if clear_cache:
         config_manager.cache.invalidate_all()
+    if watch:
+        watch_files(config_manager, lambda watched: RobocopLinter(watched).run(), create_config_manager)
+        return []
     runner = RobocopLinter(config_manager)
     return runner.run()
 
 
+@app.command(name="merge-reports")
+def merge_report_files(
+    report_files: Annotated[
+        list[Path], typer.Argument(help="Report files generated by the runs to merge.", show_default=False)
+    ],
+    output: Annotated[Path, typer.Option("--output", "-o", help="Path to the merged report file.", show_default=False)],
+    configuration_file: config_option = None,
+    ignore_file_config: ignore_file_config_option = False,
+    reports: reports_option = None,
+    configure: linter_configure_option = None,
+    exit_zero: Annotated[
+        bool | None,
+        typer.Option(
+            help="Always exit with 0 unless Robocop terminates abnormally.",
+            show_default="--no-exit-zero",
+            rich_help_panel="Other",
+        ),
+    ] = None,
+    silent: silent_option = None,
+    return_result: Annotated[
+        bool,
+        typer.Option(
+            help="Return the exit code instead of exiting from the application.",
+            hidden=True,
+        ),
+    ] = False,
+) -> int:
+    """
+    Merge reports generated by separate runs, for example by ``robocop check --shard``.
+
+    Supported are ``json_report``, ``sarif``, ``sonarqube`` and ``gitlab`` reports. All files have to be generated by
+    the same report. The exit code is calculated from the merged issues, the same way as by ``robocop check`` - with
+    the ``return_status`` report if it is enabled in the configuration or with ``--reports``.
+    """
+    linter_config = schema.RawLinterConfig(reports=reports, configure=configure, exit_zero=exit_zero)
+    overwrite_config = schema.RawConfig(linter=linter_config, silent=silent)
+    config_manager = manager.ConfigManager(
+        config=configuration_file, ignore_file_config=ignore_file_config, overwrite_config=overwrite_config
+    )
+    merged = merge_reports(report_files)
+    save_report(merged, output)
+    if not config_manager.default_config.silent:
+        print(f"Merged {len(merged.severities)} issues from {len(report_files)} reports into {output}")
+    exit_code = calculate_exit_code(merged, config_manager.default_config)
+    if return_result:
+        return exit_code
+    raise typer.Exit(code=exit_code)
+
+
 @app.command(name="check-project", hidden=True, deprecated=True)
 def check_project() -> None:
     """Fail with a message pointing to the ``check`` command."""
@@ -697,6 +890,11 @@ def format_files(
     cache: cache_option = None,
     clear_cache: clear_cache_option = False,
     cache_dir: cache_dir_option = None,
+    cache_content_hash: cache_content_hash_option = None,
+    cache_max_size: cache_max_size_option = None,
+    cache_max_config_hashes: cache_max_config_hashes_option = None,
+    jobs: jobs_option = None,
+    watch: watch_option = False,
     return_result: Annotated[
         bool,
         typer.Option(
@@ -740,7 +938,13 @@ def format_files(
     file_filters = schema.RawFileFiltersOptions(
         include=include, default_include=default_include, exclude=exclude, default_exclude=default_exclude
     )
-    cache_config = schema.RawCacheConfig(enabled=cache, cache_dir=cache_dir)
+    cache_config = schema.RawCacheConfig(
+        enabled=cache,
+        cache_dir=cache_dir,
+        content_hash=cache_content_hash,
+        max_size=cache_max_size,
+        max_config_hashes=cache_max_config_hashes,
+    )
     overwrite_config = schema.RawConfig(
         formatter=formatter_config,
         language=language,
@@ -749,8 +953,10 @@ def format_files(
         verbose=verbose,
         silent=silent,
         target_version=target_version,
+        jobs=jobs,
     )
-    config_manager = manager.ConfigManager(
+    create_config_manager = partial(
+        manager.ConfigManager,
         sources=sources,
         config=configuration_file,
         root=root,
@@ -760,8 +966,12 @@ def format_files(
         force_exclude=force_exclude,
         overwrite_config=overwrite_config,
     )
+    config_manager = create_config_manager()
     if clear_cache:
         config_manager.cache.invalidate_all()
+    if watch:
+        watch_files(config_manager, lambda watched: RobocopFormatter(watched).run(), create_config_manager)
+        return 0
     runner = RobocopFormatter(config_manager)
     return runner.run()
 
@@ -961,6 +1171,245 @@ def list_plugins(
     console.print(table)
 
 
+@cache_app.command(name="stats")
+def cache_statistics(
+    configuration_file: config_option = None,
+    cache_dir: cache_dir_option = None,
+    silent: silent_option = None,
+    return_result: Annotated[
+        bool,
+        typer.Option(
+            help="Return statistics of the cache instead of exiting from the application.",
+            hidden=True,
+        ),
+    ] = False,
+) -> dict[str, SectionStatistics] | None:
+    """
+    Show the number of entries, size and hit rate of the cache sections.
+
+    Hit rate is the ratio of the cache lookups that returned a valid entry, counted over all runs since the cache
+    was created.
+    """
+    from rich.box import MINIMAL  # noqa: PLC0415
+    from rich.table import Table  # noqa: PLC0415
+
+    overwrite_config = schema.RawConfig(cache=schema.RawCacheConfig(cache_dir=cache_dir), silent=silent)
+    config_manager = manager.ConfigManager(config=configuration_file, overwrite_config=overwrite_config)
+    statistics = config_manager.cache.get_statistics()
+    if not silent:
+        console = Console(soft_wrap=True)
+        table = Table(title=f"Cache {config_manager.cache.cache_dir}", header_style="bold", box=MINIMAL)
+        table.add_column("Section", justify="left", no_wrap=True)
+        for column in ("Entries", "Size (MB)", "Hits", "Misses", "Hit rate"):
+            table.add_column(column, justify="right")
+        for name, section in statistics.items():
+            hit_rate = "-" if section.hit_rate is None else f"{section.hit_rate:.1%}"
+            size = f"{section.size / 1024 / 1024:.2f}"
+            table.add_row(name, str(section.entries), size, str(section.hits), str(section.misses), hit_rate)
+        console.print(table)
+    if return_result:
+        return statistics
+    return None
+
+
+@cache_app.command(name="prune")
+def prune_cache(
+    configuration_file: config_option = None,
+    cache_dir: cache_dir_option = None,
+    cache_max_size: cache_max_size_option = None,
+    cache_max_config_hashes: cache_max_config_hashes_option = None,
+    silent: silent_option = None,
+    return_result: Annotated[
+        bool,
+        typer.Option(
+            help="Return the number of removed entries instead of exiting from the application.",
+            hidden=True,
+        ),
+    ] = False,
+) -> dict[str, int] | None:
+    """
+    Remove stale entries from the cache.
+
+    Removed are the entries of the files that no longer exist and the entries created with configurations other
+    than the most recently used ones. If the cache is bigger than ``--cache-max-size``, the least recently used
+    entries are removed as well. The cache is also pruned automatically once a day.
+    """
+    cache_config = schema.RawCacheConfig(
+        cache_dir=cache_dir, max_size=cache_max_size, max_config_hashes=cache_max_config_hashes
+    )
+    overwrite_config = schema.RawConfig(cache=cache_config, silent=silent)
+    config_manager = manager.ConfigManager(config=configuration_file, overwrite_config=overwrite_config)
+    removed = config_manager.cache.prune()
+    config_manager.cache.save()
+    if not silent:
+        for name, count in removed.items():
+            print(f"Removed {count} {name} cache {'entry' if count == 1 else 'entries'}")
+    if return_result:
+        return removed
+    return None
+
+
+@libspec_app.command(name="build")
+def build_library_specs(
+    sources: sources_argument = None,
+    output: Annotated[
+        Path | None,
+        typer.Option(
+            "--output",
+            "-o",
+            show_default="first of the library-specs paths, or libspecs",
+            help="Directory where the specification files are saved.",
+        ),
+    ] = None,
+    configuration_file: config_option = None,
+    root: project_root_option = None,
+    variable: variable_option = None,
+    variable_file: variable_file_option = None,
+    python_path: python_path_option = None,
+    load_library_timeout: load_library_timeout_option = None,
+    ignored_library: ignored_libraries_option = None,
+    ignore_git_dir: ignore_git_dir_option = False,
+    ignore_file_config: ignore_file_config_option = False,
+    silent: silent_option = None,
+    return_result: Annotated[
+        bool,
+        typer.Option(
+            help="Return the result of generating the specification files instead of exiting from the application.",
+            hidden=True,
+        ),
+    ] = False,
+) -> dict[str, str | None] | None:
+    """
+    Generate Libdoc specification files of all libraries imported in the project.
+
+    The generated files are used with the ``library-specs`` option instead of importing the libraries. Libraries
+    that are a part of the project are not documented, since their specification files would get outdated with
+    every change.
+    """
+    from robocop.project.context import build_project_context, project_library_requests  # noqa: PLC0415
+    from robocop.project.imports import build_search_paths  # noqa: PLC0415
+    from robocop.project.library_specs import build_specs  # noqa: PLC0415
+
+    overwrite_config = schema.RawConfig(
+        variables=parser.parse_variables(variable),
+        variable_files=variable_file,
+        python_path=python_path,
+        analyze_libraries=False,
+        load_library_timeout=load_library_timeout,
+        ignored_libraries=ignored_library,
+        silent=silent,
+    )
+    config_manager = manager.ConfigManager(
+        sources=sources,
+        config=configuration_file,
+        root=root,
+        ignore_git_dir=ignore_git_dir,
+        ignore_file_config=ignore_file_config,
+        overwrite_config=overwrite_config,
+    )
+    config = config_manager.default_config
+    if output is None:
+        output = Path(config.library_specs[0]) if config.library_specs else Path("libspecs")
+    output = config_manager.root / output
+    context = build_project_context(config_manager, silent=config.silent)
+    requests = [
+        request
+        for request in project_library_requests(context)
+        if not any(fnmatch(request.name, pattern) for pattern in config.ignored_libraries)
+    ]
+    results = build_specs(
+        requests,
+        output,
+        search_paths=build_search_paths(config.python_path, config_manager.root),
+        timeout=config.load_library_timeout,
+        project_root=config_manager.root,
+    )
+    if not config.silent:
+        generated = sum(1 for error in results.values() if error is None)
+        for name, error in results.items():
+            if error is not None:
+                print(f"Skipped {name}: {error}")
+        print(f"Generated {generated} specification file{get_plural_form(generated)} in {output}")
+    if return_result:
+        return results
+    return None
+
+
+daemon_socket_option = Annotated[
+    Path | None,
+    typer.Option(
+        "--socket",
+        show_default="ROBOCOP_DAEMON_SOCKET environment variable or a file in the user runtime directory",
+        help="Path to the Unix domain socket of the daemon.",
+    ),
+]
+
+
+@daemon_app.command(name="start")
+def start_daemon(
+    socket_path: daemon_socket_option = None,
+    idle_timeout: Annotated[
+        float | None,
+        typer.Option(
+            show_default=False, help="Stop the daemon after given number of seconds without any command.", min=0
+        ),
+    ] = None,
+) -> None:
+    """
+    Start the daemon and run the commands sent by robocop-client until the daemon is stopped.
+
+    The daemon runs in the foreground. It keeps Robot Framework, loaded rules and formatters and the analysed
+    projects in memory, so the commands run with ``robocop-client`` start immediately and only the changed files
+    are processed again. ``robocop-client`` accepts the same arguments as ``robocop``:
+
+    > robocop-client check --select unused-keyword
+
+    Restart the daemon after upgrading Robocop, Robot Framework or the libraries, or after changing custom rules.
+    """
+    from robocop.daemon.protocol import default_socket_path  # noqa: PLC0415
+    from robocop.daemon.server import DaemonServer  # noqa: PLC0415
+
+    server = DaemonServer(socket_path or default_socket_path(), idle_timeout=idle_timeout)
+    print(f"Robocop daemon is listening on {server.socket_path}")
+    server.serve()
+
+
+@daemon_app.command(name="stop")
+def stop_daemon(socket_path: daemon_socket_option = None) -> None:
+    """Stop the running daemon."""
+    from robocop.daemon.client import request  # noqa: PLC0415
+
+    if request({"command": "stop"}, socket_path) is None:
+        print("Robocop daemon is not running.")
+        raise typer.Exit(code=1)
+    print("Robocop daemon stopped.")
+
+
+@daemon_app.command(name="status")
+def daemon_status(
+    socket_path: daemon_socket_option = None,
+    return_result: Annotated[
+        bool,
+        typer.Option(help="Return the status of the daemon instead of exiting from the application.", hidden=True),
+    ] = False,
+) -> dict[str, Any] | None:
+    """Show whether the daemon is running, with the number of commands it ran."""
+    from robocop.daemon.client import request  # noqa: PLC0415
+
+    answer = request({"command": "status"}, socket_path, timeout=5)
+    if answer is None:
+        print("Robocop daemon is not running.")
+        raise typer.Exit(code=1)
+    status = answer["status"]
+    if return_result:
+        return status
+    print(
+        f"Robocop daemon is running (pid {status['pid']}, listening on {status['socket']}). "
+        f"Uptime: {status['uptime']} s, commands: {status['runs']}, analysed projects: {status['projects']}."
+    )
+    return None
+
+
 @app.command("docs")
 def print_resource_documentation(
     name: Annotated[str, typer.Argument(help="Rule name")],
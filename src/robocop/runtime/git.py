@@ -0,0 +1,67 @@
+"""
+Files changed in the local git repository, used to lint only the files touched since given reference.
+
+Changes are compared with the merge base of the reference and ``HEAD``, so the files changed on the target branch
+after the current branch was created are not included - the same files a merge request would show. Uncommitted
+changes and untracked files that are not ignored are included as well.
+"""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+from robocop import exceptions
+
+
+def run_git(args: list[str], directory: Path) -> str:
+    """
+    Run the git command in given directory.
+
+    Returns:
+        Standard output of the command.
+
+    Raises:
+        FatalError: If git is not installed or the command failed.
+
+    """
+    try:
+        result = subprocess.run(  # noqa: S603
+            ["git", *args],  # noqa: S607
+            cwd=directory,
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            check=False,
+        )
+    except OSError as err:
+        raise exceptions.FatalError(f"Failed to run git to find the changed files: {err}") from None
+    if result.returncode != 0:
+        raise exceptions.FatalError(f"Command 'git {' '.join(args)}' failed: {result.stderr.strip()}")
+    return result.stdout
+
+
+def split_paths(output: str, top_level: Path) -> set[Path]:
+    """Convert NUL separated paths relative to the top level directory of the repository to resolved paths."""
+    return {(top_level / name).resolve() for name in output.split("\0") if name}
+
+
+def changed_files(ref: str, directory: Path) -> set[Path]:
+    """
+    Find files changed since the merge base of given reference and ``HEAD``.
+
+    Deleted and renamed files are included with their old paths, so the files depending on them can be found.
+
+    Args:
+        ref: Git reference (branch, tag or commit) to compare with, for example ``origin/main``.
+        directory: Directory inside the git repository.
+
+    Returns:
+        Resolved paths of the changed files.
+
+    """
+    top_level = Path(run_git(["rev-parse", "--show-toplevel"], directory).strip())
+    merge_base = run_git(["merge-base", ref, "HEAD"], top_level).strip()
+    changed = run_git(["diff", "--name-only", "--no-renames", "-z", merge_base, "--"], top_level)
+    untracked = run_git(["ls-files", "--others", "--exclude-standard", "-z"], top_level)
+    return split_paths(changed, top_level) | split_paths(untracked, top_level)
@@ -0,0 +1,53 @@
+"""Helpers for processing the source files in parallel, in separate processes."""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+MIN_FILES_PER_JOB = 2
+"""Minimal number of files per process. Starting a process for fewer files costs more than it saves."""
+
+
+def resolve_jobs(jobs: int, files_count: int) -> int:
+    """
+    Return the number of processes that should be used to process given number of files.
+
+    ``0`` means all available CPUs. The number of processes is limited by the number of files, so that every process
+    has some work to do.
+
+    Returns:
+        Number of processes. ``1`` means that the files should be processed in the Robocop process.
+
+    """
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    return max(1, min(jobs, files_count // MIN_FILES_PER_JOB))
+
+
+def create_executor(jobs: int) -> ProcessPoolExecutor:
+    """
+    Create the process pool used for processing the files.
+
+    Every process loads rules or formatters on its own. Only the source files and the serialized results are
+    exchanged between the processes.
+
+    Returns:
+        Process pool executor with given number of processes.
+
+    """
+    return ProcessPoolExecutor(max_workers=jobs)
+
+
+def chunk_size(jobs: int, files_count: int) -> int:
+    """
+    Return the number of files sent to a process at once.
+
+    Sending files in chunks reduces the communication overhead, while keeping enough chunks for balancing the work
+    between the processes.
+
+    Returns:
+        Number of files in a single chunk.
+
+    """
+    return max(1, files_count // (jobs * 4))
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from robocop.formatter.formatters import Formatter
+    from robocop.linter.dispatcher import CheckerDispatcher
     from robocop.linter.rules import (
         AfterRunChecker,
         BaseChecker,
@@ -20,3 +22,10 @@ class ResolvedConfig:
     project_checkers: list[ProjectChecker]
     rules: dict[str, Rule]
     formatters: dict[str, Formatter]
+
+    @cached_property
+    def checker_dispatcher(self) -> CheckerDispatcher:
+        """Dispatcher scanning the files with all visitor checkers in a single walk over the model."""
+        from robocop.linter.dispatcher import CheckerDispatcher  # noqa: PLC0415
+
+        return CheckerDispatcher(self.checkers)
@@ -23,6 +23,8 @@ from robocop import exceptions, plugins
 from robocop.config.parser import compile_rule_pattern
 from robocop.formatter.formatters import FORMATTERS, import_formatter
 from robocop.linter.rules import AfterRunChecker, BaseChecker, ProjectChecker, Rule, RuleSeverity, VisitorChecker
+from robocop.linter.rules_manifest import load_manifest
+from robocop.runtime import timings
 from robocop.runtime.resolved_config import ResolvedConfig
 from robocop.version_handling import ROBOT_VERSION, Version
 
@@ -33,6 +35,7 @@ if TYPE_CHECKING:
 
     from robocop.config.schema import Config, SkipConfig, WhitespaceConfig
     from robocop.formatter.formatters import Formatter
+    from robocop.linter.rules_manifest import RuleManifestEntry
 
 
 class RulePattern(NamedTuple):
@@ -62,7 +65,7 @@ class RuleFilter:
             patterns=[RulePattern(compile_rule_pattern(rule), rule) for rule in rules if "*" in rule],
         )
 
-    def matches(self, rule: Rule) -> bool:
+    def matches(self, rule: Rule | RuleManifestEntry) -> bool:
         """
         Check if the rule matches any filter and track the match.
 
@@ -124,7 +127,7 @@ class RuleMatcher:
         self.fixable_filter = RuleFilter(exact_matches=set(fixable))
         self.unfixable_filter = RuleFilter(exact_matches=set(unfixable))
 
-    def is_rule_enabled(self, rule: Rule) -> bool:
+    def is_rule_enabled(self, rule: Rule | RuleManifestEntry) -> bool:
         if self._is_rule_disabled(rule):
             return False
 
@@ -143,7 +146,7 @@ class RuleMatcher:
 
         return self.select_filter.matches(rule)
 
-    def _is_rule_disabled(self, rule: Rule) -> bool:
+    def _is_rule_disabled(self, rule: Rule | RuleManifestEntry) -> bool:
         if rule.is_disabled(self.target_version):
             return True
         # Evaluate --ignore first so the filter is recorded as matched even when the rule is
@@ -238,40 +241,35 @@ class LinterImporter:
         self.seen_checkers: defaultdict[str, list[list[str]]] = defaultdict(list)
         self.deprecated_rules: dict[str, Rule] = {}
 
-    def get_initialized_checkers(self) -> Generator[BaseChecker, None, None]:
-        for module in self.get_internal_modules():
+    def get_initialized_checkers(self, internal_modules: set[str] | None = None) -> Generator[BaseChecker, None, None]:
+        for module in self.get_internal_modules(internal_modules):
             yield from self._get_initialized_checkers_from_module(module)
         yield from self._get_checkers_from_modules(self.get_external_modules())
 
-    @staticmethod
-    def _purge_internal_modules() -> None:
-        """
-        Remove previously imported checkers and rules from the module cache.
-
-        When robocop is used as a module (in pytest or in IDE tools) the rule classes would otherwise be reused
-        between the runs, and any configuration applied to their parameters would leak into the next run.
-        """
-        for mod in list(sys.modules.keys()):
-            if mod.startswith(("robocop.linter.checkers.", "robocop.linter.rules.")):
-                del sys.modules[mod]
-
     @staticmethod
     def _import_package_modules(package_name: str, directory: Path) -> Generator[types.ModuleType, None, None]:
         for _, module_name, _ in pkgutil.iter_modules([str(directory)]):
             yield importlib.import_module(f"{package_name}{module_name}")
 
-    def get_internal_modules(self) -> Generator[types.ModuleType, None, None]:
-        """Import internal modules with the checkers. Rules are imported by the checkers themselves."""
-        self._purge_internal_modules()
-        # rules have to be reimported first: `from robocop.linter.rules import <module>` inside a checker would
-        # otherwise resolve to the stale module still referenced by the rules package
-        for _ in self._import_package_modules("robocop.linter.rules.", self.internal_rules_dir):
-            pass
+    def get_internal_modules(self, names: set[str] | None = None) -> Generator[types.ModuleType, None, None]:
+        """
+        Import internal modules with the checkers. Rules are imported by the checkers themselves.
+
+        Modules are imported once per process. Every configuration creates its own checker and rule instances, so
+        their configuration is not shared.
+
+        Args:
+            names: Full names of the checker modules to import. All checker modules are imported if not set.
+
+        """
+        if names is not None:
+            for name in sorted(names):
+                yield importlib.import_module(name)
+            return
         yield from self._import_package_modules("robocop.linter.checkers.", self.internal_checkers_dir)
 
     def get_internal_rule_modules(self) -> Generator[types.ModuleType, None, None]:
         """Import internal modules with the rule definitions."""
-        self._purge_internal_modules()
         yield from self._import_package_modules("robocop.linter.rules.", self.internal_rules_dir)
 
     def get_external_modules(self) -> Generator[types.ModuleType, None, None]:
@@ -507,7 +505,14 @@ def validate_enabled_param(formatter_name: str, value: str) -> None:
 
 class RulesLoader:
     def __init__(
-        self, rule_matcher: RuleMatcher, custom_rules: list[str], configure: list[str], silent: bool, config_source: str
+        self,
+        rule_matcher: RuleMatcher,
+        custom_rules: list[str],
+        configure: list[str],
+        silent: bool,
+        config_source: str,
+        *,
+        lazy: bool = False,
     ) -> None:
         self.rule_matcher = rule_matcher
         self.custom_rules = custom_rules
@@ -518,6 +523,7 @@ class RulesLoader:
         self.project_checkers: list[ProjectChecker] = []
         self.rules: dict[str, Rule] = {}
         self.config_source = config_source
+        self.lazy = lazy
 
     def apply_configuration(self, rule: Rule, rule_name_or_id: str) -> None:
         if rule_name_or_id not in self.configurables:
@@ -531,11 +537,34 @@ class RulesLoader:
 
     def load_rules(self) -> None:
         robocop_importer = LinterImporter(external_rules_paths=self.custom_rules)
-        for checker in robocop_importer.get_initialized_checkers():
+        internal_modules = self.selected_internal_modules() if self.lazy else None
+        for checker in robocop_importer.get_initialized_checkers(internal_modules):
             self.register_checker(checker)
         # linter.rules.update(robocop_importer.deprecated_rules)
         self.validate_any_rule_enabled()
 
+    def selected_internal_modules(self) -> set[str] | None:
+        """
+        Find the internal checker modules with the rules that can be enabled, using the rules manifest.
+
+        Rules that are configured are also included, since the configuration can change whether they are enabled
+        (for example, their severity) or print a warning. Filters are matched against all rules from the manifest,
+        so the filters not matching any rule are reported the same way as when all rules are loaded.
+
+        Returns:
+            Full names of the checker modules, or None if the manifest is outdated and all modules have to be imported.
+
+        """
+        manifest = load_manifest()
+        if manifest is None:
+            return None
+        modules: set[str] = set()
+        for rule in manifest:
+            configured = rule.name in self.configurables or rule.rule_id in self.configurables
+            if configured or self.rule_matcher.is_rule_enabled(rule):
+                modules.update(rule.modules)
+        return modules
+
     def register_checker(self, checker: BaseChecker | AfterRunChecker | ProjectChecker) -> None:
         any_enabled = False
 
@@ -645,14 +674,34 @@ class FormattersLoader:
 
 
 class ConfigResolver:
-    def __init__(self, load_rules: bool = False, load_formatters: bool = False) -> None:
+    """
+    Loads the rules and formatters for the configuration.
+
+    Args:
+        load_rules: Load the rules and the checkers.
+        load_formatters: Load the formatters.
+        lazy_rules: Import only the built-in checkers with the rules that can be enabled by the configuration. Other
+            rules are then missing from the resolved configuration, so it should not be used to list or document the
+            rules.
+
+    """
+
+    def __init__(self, load_rules: bool = False, load_formatters: bool = False, lazy_rules: bool = False) -> None:
         self.load_rules = load_rules
         self.load_formatters = load_formatters
+        self.lazy_rules = lazy_rules
         self._resolved_configs: dict[str, ResolvedConfig] = {}
 
     def resolve_config(self, config: Config) -> ResolvedConfig:
         if config.hash in self._resolved_configs:
             return self._resolved_configs[config.hash]
+        with timings.phase("config resolution"):
+            resolved_config = self._load(config)
+        self._resolved_configs[config.hash] = resolved_config
+        return resolved_config
+
+    def _load(self, config: Config) -> ResolvedConfig:
+        """Load the rules and formatters selected by the configuration."""
         checkers: list[BaseChecker] = []
         after_run_checkers: list[AfterRunChecker] = []
         project_checkers: list[ProjectChecker] = []
@@ -669,7 +718,12 @@ class ConfigResolver:
                 config.linter.unfixable,
             )
             loader = RulesLoader(
-                rule_matcher, config.linter.custom_rules, config.linter.configure, config.silent, config.config_source
+                rule_matcher,
+                config.linter.custom_rules,
+                config.linter.configure,
+                config.silent,
+                config.config_source,
+                lazy=self.lazy_rules,
             )
             loader.load_rules()
             checkers = loader.base_checkers
@@ -690,6 +744,4 @@ class ConfigResolver:
             )
             formatters_loader.load_formatters()
             formatters = formatters_loader.formatters
-        resolved_config = ResolvedConfig(checkers, after_run_checkers, project_checkers, rules, formatters)
-        self._resolved_configs[config.hash] = resolved_config
-        return resolved_config
+        return ResolvedConfig(checkers, after_run_checkers, project_checkers, rules, formatters)
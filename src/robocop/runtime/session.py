@@ -0,0 +1,208 @@
+"""
+State kept between the runs of a long living Robocop process, such as the daemon.
+
+Robocop commands normally run once and exit, so everything they load is discarded at the end. When a session is
+started, loaded rules and formatters, the contexts of analysed projects and the results of linted and formatted files
+are kept and reused by the next runs in the same process.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from robocop.cache import CachedDiagnostic, FileMetadata, FormatterCacheEntry, LinterCacheEntry
+from robocop.runtime.resolver import ConfigResolver
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from robocop.linter.diagnostics import Diagnostic
+    from robocop.project.context import ProjectContext
+
+
+@dataclass
+class Session:
+    """
+    State shared by the runs in the current process.
+
+    Attributes:
+        config_resolvers: Resolvers with loaded rules or formatters, keyed by what they load. Resolved configurations
+            are cached by the configuration hash, so the rules are loaded again only if the configuration changes.
+        project_contexts: Last context built for every project root. The next build only collects again the files
+            that changed since.
+        linter_entries: Diagnostics of the linted files, keyed by the path of the file. Entries are used only if the
+            file and its configuration did not change since, the same way as the entries of the cache.
+        formatter_entries: Files that did not need formatting (or were formatted), keyed by the path of the file.
+        runs: Number of runs served in the session.
+
+    """
+
+    config_resolvers: dict[tuple[bool, bool, bool], ConfigResolver] = field(default_factory=dict)
+    project_contexts: dict[Path, ProjectContext] = field(default_factory=dict)
+    linter_entries: dict[Path, LinterCacheEntry] = field(default_factory=dict)
+    formatter_entries: dict[Path, FormatterCacheEntry] = field(default_factory=dict)
+    runs: int = 0
+
+
+_active_session: Session | None = None
+
+
+def start_session() -> Session:
+    """
+    Start keeping the state between the runs in the current process.
+
+    Returns:
+        The active session.
+
+    """
+    global _active_session  # noqa: PLW0603
+    if _active_session is None:
+        _active_session = Session()
+    return _active_session
+
+
+def end_session() -> None:
+    """Stop keeping the state between the runs and discard the state kept so far."""
+    global _active_session  # noqa: PLW0603
+    _active_session = None
+
+
+def active_session() -> Session | None:
+    """
+    Return the session started in the current process.
+
+    Returns:
+        The active session, or None if no session was started.
+
+    """
+    return _active_session
+
+
+def config_resolver(
+    load_rules: bool = False, load_formatters: bool = False, lazy_rules: bool = False
+) -> ConfigResolver:
+    """
+    Return the config resolver for the run. Arguments are passed to the ``ConfigResolver``.
+
+    Returns:
+        Resolver shared with the previous runs if a session is active, otherwise a new resolver.
+
+    """
+    if _active_session is None:
+        return ConfigResolver(load_rules=load_rules, load_formatters=load_formatters, lazy_rules=lazy_rules)
+    key = (load_rules, load_formatters, lazy_rules)
+    resolver = _active_session.config_resolvers.get(key)
+    if resolver is None:
+        resolver = _active_session.config_resolvers[key] = ConfigResolver(
+            load_rules=load_rules, load_formatters=load_formatters, lazy_rules=lazy_rules
+        )
+    return resolver
+
+
+def previous_project_context(root: Path) -> ProjectContext | None:
+    """
+    Return the context built for the project by the previous run in the session.
+
+    Returns:
+        The project context, or None if no session is active or the project was not analysed yet.
+
+    """
+    if _active_session is None:
+        return None
+    return _active_session.project_contexts.get(root)
+
+
+def keep_project_context(root: Path, context: ProjectContext) -> None:
+    """Keep the project context for the next runs, if a session is active."""
+    if _active_session is not None:
+        _active_session.project_contexts[root] = context
+
+
+def previous_linter_entry(path: Path, config_hash: str) -> LinterCacheEntry | None:
+    """
+    Return diagnostics of the file found by the previous run in the session.
+
+    Returns:
+        The entry with diagnostics, or None if the file or its configuration changed since.
+
+    """
+    if _active_session is None:
+        return None
+    entry = _active_session.linter_entries.get(path)
+    if entry is None or not _is_valid(entry, path, config_hash):
+        return None
+    return entry
+
+
+def keep_linter_entry(path: Path, config_hash: str, diagnostics: list[Diagnostic] | LinterCacheEntry) -> None:
+    """Keep diagnostics of the linted file, or the entry restored from the cache, if a session is active."""
+    if _active_session is None:
+        return
+    if isinstance(diagnostics, LinterCacheEntry):
+        _active_session.linter_entries[path] = diagnostics
+        return
+    metadata = _file_metadata(path)
+    if metadata is None:
+        return
+    _active_session.linter_entries[path] = LinterCacheEntry(
+        metadata=metadata,
+        config_hash=config_hash,
+        diagnostics=tuple(CachedDiagnostic.from_diagnostic(diagnostic) for diagnostic in diagnostics),
+    )
+
+
+def is_formatted(path: Path, config_hash: str) -> bool:
+    """
+    Check if the file did not need formatting in the previous run in the session and did not change since.
+
+    Returns:
+        True if the file can be skipped.
+
+    """
+    if _active_session is None:
+        return False
+    entry = _active_session.formatter_entries.get(path)
+    return entry is not None and _is_valid(entry, path, config_hash)
+
+
+def keep_formatted(path: Path, config_hash: str) -> None:
+    """Remember that the file does not need formatting, if a session is active."""
+    if _active_session is None:
+        return
+    metadata = _file_metadata(path)
+    if metadata is not None:
+        _active_session.formatter_entries[path] = FormatterCacheEntry(
+            metadata=metadata, config_hash=config_hash, needs_formatting=False
+        )
+
+
+def is_up_to_date(path: Path) -> bool:
+    """
+    Check if the file did not change since it was linted or formatted in the session.
+
+    Files modified by Robocop itself (with ``--fix`` or when formatting) are up to date, since their results are kept
+    after saving them.
+
+    Returns:
+        True if the results kept for the file are still valid.
+
+    """
+    if _active_session is None:
+        return False
+    entry = _active_session.linter_entries.get(path) or _active_session.formatter_entries.get(path)
+    return entry is not None and _is_valid(entry, path, entry.config_hash)
+
+
+def _is_valid(entry: LinterCacheEntry | FormatterCacheEntry, path: Path, config_hash: str) -> bool:
+    if entry.config_hash != config_hash:
+        return False
+    metadata = _file_metadata(path)
+    return metadata is not None and (metadata.mtime, metadata.size) == (entry.metadata.mtime, entry.metadata.size)
+
+
+def _file_metadata(path: Path) -> FileMetadata | None:
+    try:
+        return FileMetadata.from_path(path)
+    except OSError:
+        return None
@@ -0,0 +1,91 @@
+"""
+Splitting the linted files between several runs of Robocop, for example between the runners of a CI pipeline.
+
+Files are assigned to the shards by their size, so every shard gets a similar amount of work. The assignment only
+depends on the selected files, their paths relative to the project root and their sizes, so every runner computes the
+same shards on its own. Results of the shards can be combined with the ``robocop merge-reports`` command.
+"""
+
+from __future__ import annotations
+
+import heapq
+import os
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from robocop.files import get_relative_path
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+FILE_COST = 1024
+"""Cost of processing any file, in bytes of the file size. It spreads many small files evenly between the shards."""
+
+
+@dataclass(frozen=True)
+class Shard:
+    """
+    Part of the files processed by a single run.
+
+    Attributes:
+        index: Index of the shard, starting from 1.
+        count: Total number of the shards.
+
+    """
+
+    index: int
+    count: int
+
+    @classmethod
+    def from_string(cls, value: str) -> Shard:
+        """
+        Parse the shard in the ``index/count`` format, for example ``3/8``.
+
+        Raises:
+            ValueError: If the value is not a valid shard.
+
+        """
+        try:
+            index, count = (int(part) for part in value.split("/"))
+        except ValueError:
+            raise ValueError(f"Invalid shard '{value}'. Expected index/count, for example 1/4.") from None
+        if not 1 <= index <= count:
+            raise ValueError(f"Invalid shard '{value}'. Index should be between 1 and the number of shards.")
+        return cls(index, count)
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count}"
+
+
+def file_cost(path: Path) -> int:
+    try:
+        return os.stat(path).st_size + FILE_COST
+    except OSError:
+        return FILE_COST
+
+
+def split_into_shards(paths: Iterable[Path], count: int, root: Path) -> list[set[Path]]:
+    """
+    Split the files into shards with similar total cost.
+
+    The most expensive files are assigned first, every file to the shard with the lowest total cost so far. Files
+    with the same cost are ordered by their path relative to the root, so the result does not depend on where the
+    project is located.
+
+    Returns:
+        Paths assigned to every shard, in the order of the shards.
+
+    """
+    root = root.resolve()
+    shards: list[set[Path]] = [set() for _ in range(count)]
+    totals = [(0, index) for index in range(count)]
+    costs = sorted(
+        ((file_cost(path), get_relative_path(path, root).as_posix(), path) for path in paths),
+        key=lambda item: (-item[0], item[1]),
+    )
+    for cost, _, path in costs:
+        total, index = heapq.heappop(totals)
+        shards[index].add(path)
+        heapq.heappush(totals, (total + cost, index))
+    return shards
@@ -0,0 +1,275 @@
+"""
+Time spent in the phases of the run and in every checker, collected for the ``timings`` report.
+
+Timings are collected only while they are started, so the run is not slowed down when the report is disabled. Time is
+always charged to the innermost measured section: for example, the time spent parsing the file imported by a project
+checker counts as parsing, not as the time of the checker. Sections never overlap, so the sum of all sections is the
+duration of the run - the time not spent in any named section is counted as ``other``.
+
+Files linted in separate processes are measured by the worker processes and merged into the timings of the main
+process. Their times are summed, so with several jobs the total may exceed the duration of the run.
+"""
+
+from __future__ import annotations
+
+import contextlib
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+T = TypeVar("T")
+
+OTHER = "other"
+"""Name of the phase with the time not spent in any other measured section."""
+LINTING = "linting"
+"""Name of the phase with the time of linting the files, not spent in the parsing or any of the checkers."""
+
+
+@dataclass
+class Timing:
+    """
+    Time spent in the measured section.
+
+    Attributes:
+        seconds: Cumulative time spent in the section, excluding the nested sections.
+        calls: How many times the section was entered.
+
+    """
+
+    seconds: float = 0.0
+    calls: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"seconds": self.seconds, "calls": self.calls}
+
+
+@dataclass
+class Timings:
+    """
+    Timings collected during the run.
+
+    Attributes:
+        phases: Time of the run phases, such as parsing or the report generation, by the phase name.
+        checkers: Time of the checkers, by the checker class name.
+        files: Time of linting every file, by the path of the file. It includes the parsing and all checkers.
+
+    """
+
+    phases: dict[str, Timing] = field(default_factory=dict)
+    checkers: dict[str, Timing] = field(default_factory=dict)
+    files: dict[str, float] = field(default_factory=dict)
+    _stack: list[Timing] = field(default_factory=list, init=False, repr=False)
+    _last: float = field(default=0.0, init=False, repr=False)
+
+    def phase(self, name: str) -> Timing:
+        timing = self.phases.get(name)
+        if timing is None:
+            timing = self.phases[name] = Timing()
+        return timing
+
+    def checker(self, name: str) -> Timing:
+        timing = self.checkers.get(name)
+        if timing is None:
+            timing = self.checkers[name] = Timing()
+        return timing
+
+    def enter(self, timing: Timing, count: bool = True) -> None:
+        """
+        Start measuring the section, pausing the section it is nested in.
+
+        Args:
+            timing: Timing of the measured section.
+            count: Count the call of the section. Disable it to resume the section that is already counted.
+
+        """
+        self.flush()
+        self._stack.append(timing)
+        if count:
+            timing.calls += 1
+
+    def exit(self) -> None:
+        """Stop measuring the innermost section and resume the section it is nested in."""
+        self.flush()
+        self._stack.pop()
+
+    def flush(self) -> None:
+        """Charge the time elapsed so far to the section in progress."""
+        now = perf_counter()
+        if self._stack:
+            self._stack[-1].seconds += now - self._last
+        self._last = now
+
+    def profile(self, function: Callable[..., T], timing: Timing) -> Callable[..., T]:
+        """
+        Wrap the function, so that the time of every call is added to given timing.
+
+        The wrapper does the same as ``enter`` and ``exit``, without calling them, because it is used for the
+        functions called many times, such as the visitor methods of the checkers.
+
+        Returns:
+            Wrapped function.
+
+        """
+        stack = self._stack
+
+        def profiled(*args: Any) -> T:
+            now = perf_counter()
+            if stack:
+                stack[-1].seconds += now - self._last
+            stack.append(timing)
+            timing.calls += 1
+            self._last = now
+            try:
+                return function(*args)
+            finally:
+                now = perf_counter()
+                stack.pop().seconds += now - self._last
+                self._last = now
+
+        return profiled
+
+    @contextlib.contextmanager
+    def measure(self, timing: Timing) -> Iterator[None]:
+        self.enter(timing)
+        try:
+            yield
+        finally:
+            self.exit()
+
+    def close(self) -> None:
+        """Stop measuring all sections still in progress."""
+        while self._stack:
+            self.exit()
+
+    @contextlib.contextmanager
+    def measure_file(self, path: str) -> Iterator[None]:
+        started = perf_counter()
+        with self.measure(self.phase(LINTING)):
+            yield
+        self.add_file(path, perf_counter() - started)
+
+    def add_file(self, path: str, seconds: float) -> None:
+        self.files[path] = self.files.get(path, 0.0) + seconds
+
+    @property
+    def total(self) -> float:
+        """Sum of the time of every phase and checker."""
+        return sum(timing.seconds for timing in (*self.phases.values(), *self.checkers.values()))
+
+    def slowest_files(self, count: int) -> list[tuple[str, float]]:
+        return sorted(self.files.items(), key=lambda item: (-item[1], item[0]))[:count]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "phases": {name: timing.to_dict() for name, timing in self.phases.items()},
+            "checkers": {name: timing.to_dict() for name, timing in self.checkers.items()},
+            "files": dict(self.files),
+        }
+
+    def merge(self, data: dict[str, Any]) -> None:
+        """Add the timings collected in another process, in the format returned by ``to_dict``."""
+        for timings, category in ((self.phases, "phases"), (self.checkers, "checkers")):
+            for name, timing in data.get(category, {}).items():
+                merged = timings.setdefault(name, Timing())
+                merged.seconds += timing["seconds"]
+                merged.calls += timing["calls"]
+        for path, seconds in data.get("files", {}).items():
+            self.add_file(path, seconds)
+
+
+_active_timings: Timings | None = None
+_NOT_MEASURED = contextlib.nullcontext()
+
+
+def start_timings() -> Timings:
+    """
+    Start collecting the timings in the current process.
+
+    The time until the timings are stopped is counted as the ``other`` phase, unless it is measured by any other
+    section.
+
+    Returns:
+        Started timings.
+
+    """
+    global _active_timings  # noqa: PLW0603
+    _active_timings = Timings()
+    _active_timings.enter(_active_timings.phase(OTHER))
+    _active_timings.phase(OTHER).calls = 0
+    return _active_timings
+
+
+def stop_timings() -> Timings | None:
+    """
+    Stop collecting the timings.
+
+    Returns:
+        Collected timings, or None if the timings were not started.
+
+    """
+    global _active_timings  # noqa: PLW0603
+    timings = _active_timings
+    _active_timings = None
+    if timings is not None:
+        timings.close()
+    return timings
+
+
+def active_timings() -> Timings | None:
+    """
+    Return the timings collected in the current process.
+
+    Returns:
+        Active timings, or None if the timings are not collected.
+
+    """
+    return _active_timings
+
+
+def phase(name: str) -> contextlib.AbstractContextManager[None]:
+    """
+    Measure the time of the code block as the phase with given name.
+
+    It does nothing if the timings are not collected.
+
+    Returns:
+        Context manager measuring the code block.
+
+    """
+    if _active_timings is None:
+        return _NOT_MEASURED
+    return _active_timings.measure(_active_timings.phase(name))
+
+
+def checker(name: str) -> contextlib.AbstractContextManager[None]:
+    """
+    Measure the time of the code block as the time of the checker with given name.
+
+    It does nothing if the timings are not collected.
+
+    Returns:
+        Context manager measuring the code block.
+
+    """
+    if _active_timings is None:
+        return _NOT_MEASURED
+    return _active_timings.measure(_active_timings.checker(name))
+
+
+def file(path: str) -> contextlib.AbstractContextManager[None]:
+    """
+    Measure the time of linting the file with given path.
+
+    The time is counted as the ``linting`` phase, unless it is measured by the nested sections, and added to the time
+    of the file. It does nothing if the timings are not collected.
+
+    Returns:
+        Context manager measuring the code block.
+
+    """
+    if _active_timings is None:
+        return _NOT_MEASURED
+    return _active_timings.measure_file(path)
@@ -0,0 +1,322 @@
+"""
+Watch mode - running the command again whenever the watched files change.
+
+Watched directories are monitored with inotify on Linux, or by periodically comparing the modification times of the
+files on other platforms. Changes are collected until no file changes for a short while, so a burst of writes (for
+example when switching branches) results in a single run.
+
+A session is started for the lifetime of the watch mode, so every run reuses loaded rules and formatters, the project
+context and the results of the files that did not change. Only the changed files are linted or formatted again.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import typer
+from typer._click.exceptions import ClickException
+
+from robocop.runtime import session
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from robocop.config.manager import ConfigManager
+
+DEBOUNCE_SECONDS = 0.5
+"""Time without any change after which the collected changes are processed."""
+
+POLL_INTERVAL_SECONDS = 1.0
+"""Time between the scans of the watched directories, if inotify is not available."""
+
+IGNORED_NAMES = frozenset({"__pycache__", "node_modules"})
+"""Names of the files and directories that are not watched, in addition to the hidden ones and backup files."""
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_CLOEXEC = 0o2000000
+INOTIFY_EVENTS = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+INOTIFY_EVENT = struct.Struct("iIII")
+
+
+def is_ignored(name: str) -> bool:
+    """Check if changes of the file or directory with given name are ignored."""
+    return name.startswith(".") or name.endswith("~") or name in IGNORED_NAMES
+
+
+class Watcher:
+    """Base class of the watchers detecting changes of the files in the watched directories."""
+
+    def read_changes(self, timeout: float | None) -> set[Path]:
+        """
+        Wait for the changes of the watched files.
+
+        Args:
+            timeout: Maximum time to wait, in seconds. None to wait until any file changes.
+
+        Returns:
+            Paths of the changed, created or removed files. Empty if nothing changed within the timeout.
+
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Stop watching the files."""
+
+
+class PollingWatcher(Watcher):
+    """Detects changes by comparing the modification times and sizes of the files between the scans."""
+
+    def __init__(self, directories: list[Path], interval: float = POLL_INTERVAL_SECONDS) -> None:
+        self.directories = directories
+        self.interval = interval
+        self.snapshot = self.scan()
+
+    def scan(self) -> dict[Path, tuple[int, int]]:
+        """
+        Read the modification times and sizes of all watched files.
+
+        Returns:
+            Modification time in nanoseconds and size of every file, keyed by the path of the file.
+
+        """
+        snapshot: dict[Path, tuple[int, int]] = {}
+        for directory in self.directories:
+            for dirpath, dirnames, filenames in os.walk(directory):
+                dirnames[:] = [name for name in dirnames if not is_ignored(name)]
+                for name in filenames:
+                    if is_ignored(name):
+                        continue
+                    path = Path(dirpath, name)
+                    try:
+                        stat = path.stat()
+                    except OSError:
+                        continue
+                    snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def read_changes(self, timeout: float | None) -> set[Path]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.interval if deadline is None else max(0.0, min(self.interval, deadline - time.monotonic()))
+            time.sleep(wait)
+            snapshot = self.scan()
+            changed = {
+                path for path in snapshot.keys() | self.snapshot.keys() if snapshot.get(path) != self.snapshot.get(path)
+            }
+            self.snapshot = snapshot
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+
+class InotifyWatcher(Watcher):
+    """
+    Detects changes with inotify, available on Linux.
+
+    Every watched directory and its subdirectories are watched separately, and directories created later are added
+    as they appear.
+
+    Raises:
+        OSError: If inotify is not available or the limit of the watched directories is reached.
+
+    """
+
+    def __init__(self, directories: list[Path]) -> None:
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_CLOEXEC)
+        if self._fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+        self._watches: dict[int, Path] = {}
+        try:
+            for directory in directories:
+                self._watch_tree(directory)
+        except OSError:
+            self.close()
+            raise
+
+    def _watch_tree(self, directory: Path) -> set[Path]:
+        """
+        Watch the directory and all its subdirectories.
+
+        Returns:
+            Paths of the files already in the directories. Files created in a new directory before it is watched
+            do not produce any events, so they are reported as changed.
+
+        """
+        files: set[Path] = set()
+        for dirpath, dirnames, filenames in os.walk(directory):
+            dirnames[:] = [name for name in dirnames if not is_ignored(name)]
+            self._watch(Path(dirpath))
+            files.update(Path(dirpath, name) for name in filenames if not is_ignored(name))
+        return files
+
+    def _watch(self, directory: Path) -> None:
+        watch_descriptor = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), INOTIFY_EVENTS | IN_ONLYDIR)
+        if watch_descriptor < 0:
+            error = ctypes.get_errno()
+            if error in {errno.ENOENT, errno.ENOTDIR}:  # removed in the meantime
+                return
+            raise OSError(error, os.strerror(error), str(directory))
+        self._watches[watch_descriptor] = directory
+
+    def read_changes(self, timeout: float | None) -> set[Path]:
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+        data = os.read(self._fd, 64 * 1024)
+        changed: set[Path] = set()
+        offset = 0
+        while offset < len(data):
+            watch_descriptor, mask, _, length = INOTIFY_EVENT.unpack_from(data, offset)
+            offset += INOTIFY_EVENT.size
+            name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+            offset += length
+            if mask & IN_Q_OVERFLOW:  # events were lost, so every watched directory could have changed
+                changed.update(self._watches.values())
+                continue
+            if mask & IN_IGNORED:
+                self._watches.pop(watch_descriptor, None)
+                continue
+            directory = self._watches.get(watch_descriptor)
+            if directory is None or not name or is_ignored(name):
+                continue
+            path = directory / name
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                try:
+                    changed.update(self._watch_tree(path))
+                except OSError:  # limit of the watched directories reached, the new directory is not watched
+                    pass
+            changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def create_watcher(directories: list[Path]) -> Watcher:
+    """
+    Create the watcher of given directories.
+
+    Returns:
+        Watcher using inotify if it is available, otherwise the watcher polling the files.
+
+    """
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(directories)
+        except (OSError, AttributeError):  # AttributeError if the C library does not provide inotify
+            pass
+    return PollingWatcher(directories)
+
+
+def watched_directories(config_manager: ConfigManager) -> list[Path]:
+    """
+    Return the directories to watch - the project root and the sources outside of it.
+
+    The whole project is watched, even if only selected paths are processed, since project checks depend on every
+    file in the project.
+
+    Returns:
+        Resolved paths of the directories.
+
+    """
+    directories = [config_manager.root.resolve()]
+    for source in config_manager.sources:
+        path = Path(source).resolve()
+        if not path.is_dir():
+            path = path.parent
+        if not any(path.is_relative_to(directory) for directory in directories):
+            directories.append(path)
+    return directories
+
+
+def wait_for_changes(watcher: Watcher, debounce: float = DEBOUNCE_SECONDS) -> set[Path]:
+    """
+    Wait until any watched file changes and collect all changes until no file changes for ``debounce`` seconds.
+
+    Files that did not change since they were processed by the previous run, such as the files saved by Robocop
+    itself, are not reported.
+
+    Returns:
+        Paths of the changed files.
+
+    """
+    changes: set[Path] = set()
+    while not changes:
+        changes = {path for path in watcher.read_changes(None) if not session.is_up_to_date(path)}
+    while more := watcher.read_changes(debounce):
+        changes.update(path for path in more if not session.is_up_to_date(path))
+    return changes
+
+
+def watch_files(
+    config_manager: ConfigManager,
+    run: Callable[[ConfigManager], object],
+    create_config_manager: Callable[[], ConfigManager],
+    watcher: Watcher | None = None,
+) -> None:
+    """
+    Run the command, and run it again whenever the watched files change, until interrupted with Ctrl+C.
+
+    Args:
+        config_manager: Configuration manager for the first run.
+        run: Runs the command with given configuration manager.
+        create_config_manager: Creates the configuration manager for every next run, so that new files and changes in
+            the configuration files are taken into account.
+        watcher: Detects the changes. By default, the project root and the sources outside of it are watched.
+
+    """
+    owns_session = session.active_session() is None
+    session.start_session()
+    directories = watched_directories(config_manager)
+    if watcher is None:
+        watcher = create_watcher(directories)
+    silent = config_manager.default_config.silent
+    try:
+        while True:
+            if config_manager is not None:
+                try:
+                    run(config_manager)
+                except typer.Exit:  # the exit code of a single run does not stop the watch mode
+                    pass
+            if not silent:
+                print(
+                    f"\nWatching for changes in {', '.join(str(path) for path in directories)}. Press Ctrl+C to stop."
+                )
+            changes = wait_for_changes(watcher)
+            if not silent:
+                files = "file" if len(changes) == 1 else "files"
+                print(f"\nDetected changes in {len(changes)} {files}.\n")
+            try:
+                config_manager = create_config_manager()
+            except typer.Exit:  # invalid configuration is already reported, and the next change may fix it
+                config_manager = None
+            except ClickException as error:
+                error.show()
+                config_manager = None
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+        if owns_session:
+            session.end_session()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -12,11 +13,13 @@ except ImportError:
     Languages = None
 
 from robocop.files import path_relative_to_cwd, resolve_path
+from robocop.runtime import timings
 from robocop.version_handling import LANG_SUPPORTED
 
 if TYPE_CHECKING:
     from collections.abc import Callable
     from pathlib import Path
+    from typing import TextIO
 
     from robot.parsing.model import File
     from robot.parsing.model.statements import Statement
@@ -47,6 +50,22 @@ class SourceFile:
     _original_source_lines: list[str] | None = None
     _resolved_path: Path | None = None
 
+    @classmethod
+    def from_content(cls, path: Path, config: Config, content: str) -> SourceFile:
+        """
+        Create the source file from the content held in memory, for example by an editor.
+
+        The content is parsed directly, without writing it to the disk, and the file under ``path`` is never read.
+
+        Returns:
+            SourceFile with the model and source lines of the content.
+
+        """
+        source_file = cls(path=path, config=config, _source_lines=content.splitlines(keepends=True))
+        # text without a newline could be taken for a path by Robot Framework, so it is passed as a stream
+        source_file._model = source_file._load_model(io.StringIO(content))
+        return source_file
+
     @property
     def resolved_path(self) -> Path:
         """Resolved path of the file, computed once per source file."""
@@ -116,7 +135,7 @@ class SourceFile:
         with open(self.path, encoding="utf-8", newline="") as f:
             return f.readlines()
 
-    def _load_model(self, path_or_text: Path | str) -> File:
+    def _load_model(self, path_or_text: Path | str | TextIO) -> File:
         """Determine the correct model loader based on the file type and loads it."""
         if "__init__" in self.path.name:
             loader: Callable[..., File] = get_init_model
@@ -125,9 +144,10 @@ class SourceFile:
         else:
             loader = get_model
 
-        if LANG_SUPPORTED:
-            return loader(path_or_text, lang=self.config.languages)
-        return loader(path_or_text)
+        with timings.phase("parsing"):
+            if LANG_SUPPORTED:
+                return loader(path_or_text, lang=self.config.languages)
+            return loader(path_or_text)
 
     def reload_model(self) -> None:
         """
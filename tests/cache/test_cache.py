@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import os
+import threading
+import time
 from pathlib import Path
 from unittest.mock import MagicMock
 
@@ -13,13 +15,19 @@ from robocop import __version__
 from robocop.cache import (
     CacheData,
     CachedDiagnostic,
+    CacheSection,
     FileMetadata,
     FormatterCacheEntry,
     LinterCacheEntry,
     RobocopCache,
     restore_diagnostics,
 )
-from robocop.config.defaults import CACHE_DIR_NAME, CACHE_FILE_NAME
+from robocop.config.defaults import (
+    CACHE_ACCESS_RESOLUTION,
+    CACHE_DIR_NAME,
+    CACHE_PRUNE_INTERVAL,
+    LEGACY_CACHE_FILE_NAME,
+)
 from robocop.config.schema import RawCacheConfig
 from robocop.linter.diagnostics import Diagnostic
 from robocop.linter.rules import RuleSeverity
@@ -27,6 +35,20 @@ from robocop.runtime.resolved_config import ResolvedConfig
 from robocop.source_file import SourceFile
 
 
+def shard_file(cache_dir: Path, section: str, key: str) -> Path:
+    return cache_dir / section / f"{CacheSection.shard_name(key)}.msgpack"
+
+
+def write_shard(cache_dir: Path, section: str, entries: dict, robocop_version: str = __version__) -> None:
+    """Write cache entries to the shard files as they would be saved by the cache."""
+    for key, entry in entries.items():
+        path = shard_file(cache_dir, section, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(
+            msgpack.packb({"robocop_version": robocop_version, "entries": {key: entry}}, use_bin_type=True)
+        )
+
+
 class TestFileMetadata:
     def test_from_path(self, tmp_path: Path):
         test_file = tmp_path / "test.robot"
@@ -45,6 +67,18 @@ class TestFileMetadata:
         with pytest.raises(AttributeError):
             metadata.mtime = 0
 
+    def test_from_path_with_content_hash(self, tmp_path: Path):
+        test_file = tmp_path / "test.robot"
+        test_file.write_text("content")
+        other_file = tmp_path / "other.robot"
+        other_file.write_text("content")
+
+        metadata = FileMetadata.from_path(test_file, content_hash=True)
+
+        assert metadata.content_hash is not None
+        assert metadata.content_hash == FileMetadata.from_path(other_file, content_hash=True).content_hash
+        assert FileMetadata.from_path(test_file).content_hash is None
+
 
 class TestCachedDiagnostic:
     def test_to_dict(self):
@@ -180,24 +214,17 @@ class TestCacheData:
 class TestRobocopCache:
     def test_load_from_existing_file(self, tmp_path: Path):
         cache_dir = tmp_path / CACHE_DIR_NAME
-        cache_dir.mkdir()
-        cache_file = cache_dir / CACHE_FILE_NAME
-        cache_file.write_bytes(
-            msgpack.packb(
-                {
-                    "robocop_version": __version__,
-                    "linter": {
-                        "/path/to/file.robot": {
-                            "mtime": 1234567890.0,
-                            "size": 100,
-                            "config_hash": "abc",
-                            "diagnostics": [],
-                        }
-                    },
-                    "formatter": {},
-                },
-                use_bin_type=True,
-            )
+        write_shard(
+            cache_dir,
+            "linter",
+            {
+                "/path/to/file.robot": {
+                    "mtime": 1234567890.0,
+                    "size": 100,
+                    "config_hash": "abc",
+                    "diagnostics": [],
+                }
+            },
         )
 
         cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False)
@@ -206,24 +233,18 @@ class TestRobocopCache:
 
     def test_load_invalidates_on_version_mismatch(self, tmp_path: Path):
         cache_dir = tmp_path / CACHE_DIR_NAME
-        cache_dir.mkdir()
-        cache_file = cache_dir / CACHE_FILE_NAME
-        cache_file.write_bytes(
-            msgpack.packb(
-                {
-                    "robocop_version": "0.0.0",  # Different version
-                    "linter": {
-                        "/path/to/file.robot": {
-                            "mtime": 123,
-                            "size": 1,
-                            "config_hash": "x",
-                            "diagnostics": [],
-                        }
-                    },
-                    "formatter": {},
-                },
-                use_bin_type=True,
-            )
+        write_shard(
+            cache_dir,
+            "linter",
+            {
+                "/path/to/file.robot": {
+                    "mtime": 123,
+                    "size": 1,
+                    "config_hash": "x",
+                    "diagnostics": [],
+                }
+            },
+            robocop_version="0.0.0",  # Different version
         )
 
         cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False)
@@ -233,8 +254,8 @@ class TestRobocopCache:
 
     def test_load_handles_corrupted_cache(self, tmp_path: Path):
         cache_dir = tmp_path / CACHE_DIR_NAME
-        cache_dir.mkdir()
-        cache_file = cache_dir / CACHE_FILE_NAME
+        cache_file = shard_file(cache_dir, "linter", "/path/to/file.robot")
+        cache_file.parent.mkdir(parents=True)
         cache_file.write_bytes(b"not valid msgpack data")
 
         cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False)
@@ -256,12 +277,13 @@ class TestRobocopCache:
         cache.save()
 
         # Verify file exists
-        cache_file = cache_dir / CACHE_FILE_NAME
+        cache_file = shard_file(cache_dir, "linter", str(test_file.resolve()))
         assert cache_file.exists()
 
         # Verify content
         data = msgpack.unpackb(cache_file.read_bytes(), raw=False, strict_map_key=False)
-        assert str(test_file.resolve()) in data["linter"]
+        assert data["robocop_version"] == __version__
+        assert str(test_file.resolve()) in data["entries"]
 
     def test_save_does_nothing_when_disabled(self, tmp_path: Path):
         cache_dir = tmp_path / CACHE_DIR_NAME
@@ -667,6 +689,86 @@ class TestCacheConfigFromToml:
 
         assert cache_config.cache_dir == absolute_path
 
+    def test_from_toml_content_hash(self, tmp_path: Path):
+        config = {"cache_content_hash": True}
+        cache_config = RawCacheConfig.from_dict(config, tmp_path)
+
+        assert cache_config.content_hash is True
+
+
+class TestContentHashValidation:
+    @staticmethod
+    def touch(path: Path) -> None:
+        """Change the file mtime without changing the content, as a fresh checkout of the repository does."""
+        stat = path.stat()
+        os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+
+    def test_entry_with_modified_mtime_and_same_content_is_valid(self, tmp_path: Path):
+        cache = RobocopCache(cache_dir=tmp_path, enabled=True, verbose=False, content_hash=True)
+        test_file = tmp_path / "test.robot"
+        test_file.write_text("content")
+        cache.set_linter_entry(test_file, "hash123", [])
+
+        self.touch(test_file)
+
+        assert cache.get_linter_entry(test_file, "hash123") is not None
+
+    def test_entry_with_modified_content_of_the_same_size_is_invalid(self, tmp_path: Path):
+        cache = RobocopCache(cache_dir=tmp_path, enabled=True, verbose=False, content_hash=True)
+        test_file = tmp_path / "test.robot"
+        test_file.write_text("content")
+        cache.set_formatter_entry(test_file, "hash123", needs_formatting=False)
+
+        test_file.write_text("CONTENT")
+        self.touch(test_file)
+
+        assert cache.get_formatter_entry(test_file, "hash123") is None
+        assert cache.data.formatter == {}
+
+    def test_entry_metadata_is_refreshed(self, tmp_path: Path, monkeypatch):
+        cache_dir = tmp_path / CACHE_DIR_NAME
+        cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False, content_hash=True)
+        test_file = tmp_path / "test.robot"
+        test_file.write_text("content")
+        cache.set_project_entry(test_file, "hash123", {"keywords": []})
+        cache.save()
+        self.touch(test_file)
+
+        cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False, content_hash=True)
+        assert cache.get_project_entry(test_file, "hash123") == {"keywords": []}
+        cache.save()
+
+        # the content is not hashed again once the entry has the new mtime
+        monkeypatch.setattr("robocop.cache.file_content_hash", MagicMock(side_effect=AssertionError))
+        cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False, content_hash=True)
+        assert cache.get_project_entry(test_file, "hash123") == {"keywords": []}
+
+    def test_content_hash_is_not_used_when_disabled(self, tmp_path: Path):
+        cache_dir = tmp_path / CACHE_DIR_NAME
+        cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False, content_hash=True)
+        test_file = tmp_path / "test.robot"
+        test_file.write_text("content")
+        cache.set_linter_entry(test_file, "hash123", [])
+        cache.save()
+        self.touch(test_file)
+
+        cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False)
+
+        assert cache.get_linter_entry(test_file, "hash123") is None
+
+    def test_entry_without_content_hash_is_invalid(self, tmp_path: Path):
+        cache_dir = tmp_path / CACHE_DIR_NAME
+        cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False)
+        test_file = tmp_path / "test.robot"
+        test_file.write_text("content")
+        cache.set_linter_entry(test_file, "hash123", [])
+        cache.save()
+        self.touch(test_file)
+
+        cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False, content_hash=True)
+
+        assert cache.get_linter_entry(test_file, "hash123") is None
+
 
 class TestCacheEdgeCases:
     """Additional edge case tests for cache functionality."""
@@ -829,24 +931,17 @@ class TestCacheEdgeCases:
     def test_cache_data_lazy_loading(self, tmp_path: Path):
         """Test that cache data is loaded lazily on first access."""
         cache_dir = tmp_path / CACHE_DIR_NAME
-        cache_dir.mkdir()
-        cache_file = cache_dir / CACHE_FILE_NAME
-        cache_file.write_bytes(
-            msgpack.packb(
-                {
-                    "robocop_version": __version__,
-                    "linter": {
-                        "test": {
-                            "mtime": 123,
-                            "size": 1,
-                            "config_hash": "x",
-                            "diagnostics": [],
-                        }
-                    },
-                    "formatter": {},
-                },
-                use_bin_type=True,
-            )
+        write_shard(
+            cache_dir,
+            "linter",
+            {
+                "test": {
+                    "mtime": 123,
+                    "size": 1,
+                    "config_hash": "x",
+                    "diagnostics": [],
+                }
+            },
         )
 
         cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False)
@@ -939,5 +1034,482 @@ class TestGitignoreCreation:
         cache.save()
 
         # Cache should still be saved
-        cache_file = cache_dir / CACHE_FILE_NAME
+        cache_file = shard_file(cache_dir, "linter", str(test_file.resolve()))
         assert cache_file.exists(), "Cache should be saved even if .gitignore creation fails"
+
+
+class TestShardedStorage:
+    @staticmethod
+    def create_files(tmp_path: Path, count: int) -> list[Path]:
+        files = []
+        for index in range(count):
+            test_file = tmp_path / f"test{index}.robot"
+            test_file.write_text(f"content {index}")
+            files.append(test_file)
+        return files
+
+    def test_only_accessed_shard_is_loaded(self, tmp_path: Path):
+        cache_dir = tmp_path / CACHE_DIR_NAME
+        files = self.create_files(tmp_path, 20)
+        cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False)
+        for test_file in files:
+            cache.set_linter_entry(test_file, "hash", [])
+        cache.save()
+
+        cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False)
+
+        assert cache.get_linter_entry(files[0], "hash") is not None
+        assert list(cache.data.linter._shards) == [CacheSection.shard_name(str(files[0].resolve()))]  # noqa: SLF001
+        assert len(cache.data.linter) == 20
+
+    def test_only_modified_shards_are_written(self, tmp_path: Path):
+        cache_dir = tmp_path / CACHE_DIR_NAME
+        first_file, second_file = self.create_files(tmp_path, 2)
+        cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False)
+        cache.set_linter_entry(first_file, "hash", [])
+        cache.set_formatter_entry(first_file, "hash", needs_formatting=False)
+        cache.save()
+        formatter_shard = shard_file(cache_dir, "formatter", str(first_file.resolve()))
+        formatter_shard_mtime = formatter_shard.stat().st_mtime_ns
+
+        cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False)
+        cache.set_linter_entry(second_file, "hash", [])
+        cache.save()
+
+        assert shard_file(cache_dir, "linter", str(second_file.resolve())).exists()
+        assert formatter_shard.stat().st_mtime_ns == formatter_shard_mtime
+        assert not list(cache_dir.rglob("*.tmp"))
+
+    def test_concurrent_writers_keep_entries_of_each_other(self, tmp_path: Path):
+        cache_dir = tmp_path / CACHE_DIR_NAME
+        # find two files stored in the same shard
+        files_by_shard: dict[str, list[Path]] = {}
+        index = 0
+        while True:
+            test_file = tmp_path / f"test{index}.robot"
+            same_shard = files_by_shard.setdefault(CacheSection.shard_name(str(test_file.resolve())), [])
+            same_shard.append(test_file)
+            if len(same_shard) == 2:
+                break
+            index += 1
+        first_file, second_file = same_shard
+        first_file.write_text("first")
+        second_file.write_text("second")
+        first_cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False)
+        second_cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False)
+        # load the shard before any of the caches is saved
+        assert first_cache.get_linter_entry(first_file, "hash") is None
+        assert second_cache.get_linter_entry(second_file, "hash") is None
+
+        first_cache.set_linter_entry(first_file, "hash", [])
+        second_cache.set_linter_entry(second_file, "hash", [])
+        first_cache.save()
+        second_cache.save()
+
+        cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False)
+        assert cache.get_linter_entry(first_file, "hash") is not None
+        assert cache.get_linter_entry(second_file, "hash") is not None
+
+    def test_concurrent_saves_of_the_same_shard_are_serialized(self, tmp_path: Path, monkeypatch):
+        cache_dir = tmp_path / CACHE_DIR_NAME
+        files = self.create_files(tmp_path, 4)
+        monkeypatch.setattr(CacheSection, "shard_name", staticmethod(lambda key: "shared"))  # noqa: ARG005
+        caches = [RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False) for _ in files]
+        for cache, test_file in zip(caches, files, strict=True):
+            cache.set_linter_entry(test_file, "hash", [])
+        read_shard = CacheSection._read_shard  # noqa: SLF001
+
+        def slow_read_shard(self, shard):
+            entries = read_shard(self, shard)
+            time.sleep(0.05)  # other writers would read the same shard in the meantime without the lock
+            return entries
+
+        monkeypatch.setattr(CacheSection, "_read_shard", slow_read_shard)
+        barrier = threading.Barrier(len(caches))
+
+        def save(cache: RobocopCache) -> None:
+            barrier.wait()
+            cache.data.save()
+
+        threads = [threading.Thread(target=save, args=(cache,)) for cache in caches]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False)
+        assert all(cache.get_linter_entry(test_file, "hash") is not None for test_file in files)
+
+    def test_invalidated_entry_is_removed_from_disk(self, tmp_path: Path):
+        cache_dir = tmp_path / CACHE_DIR_NAME
+        (test_file,) = self.create_files(tmp_path, 1)
+        cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False)
+        cache.set_linter_entry(test_file, "hash", [])
+        cache.save()
+
+        cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False)
+        assert cache.get_linter_entry(test_file, "other_hash") is None
+        cache.save()
+
+        assert not shard_file(cache_dir, "linter", str(test_file.resolve())).exists()
+
+    def test_invalidate_all_removes_not_loaded_shards(self, tmp_path: Path):
+        cache_dir = tmp_path / CACHE_DIR_NAME
+        files = self.create_files(tmp_path, 5)
+        cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False)
+        for test_file in files:
+            cache.set_project_entry(test_file, "hash", {"keywords": []})
+        cache.save()
+
+        cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False)
+        cache.invalidate_all()
+        cache.set_project_entry(files[0], "hash", {"keywords": []})
+        cache.save()
+
+        cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False)
+        assert list(cache.data.project) == [str(files[0].resolve())]
+
+    def test_legacy_cache_file_is_removed(self, tmp_path: Path):
+        cache_dir = tmp_path / CACHE_DIR_NAME
+        cache_dir.mkdir()
+        legacy_file = cache_dir / LEGACY_CACHE_FILE_NAME
+        legacy_file.write_bytes(msgpack.packb({"robocop_version": __version__, "linter": {}}, use_bin_type=True))
+        (test_file,) = self.create_files(tmp_path, 1)
+        cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False)
+        cache.set_linter_entry(test_file, "hash", [])
+
+        cache.save()
+
+        assert not legacy_file.exists()
+
+
+class TestCachePruning:
+    @staticmethod
+    def create_file(tmp_path: Path, name: str) -> Path:
+        test_file = tmp_path / name
+        test_file.write_text(f"content of {name}")
+        return test_file
+
+    def test_prune_removes_entries_of_missing_files(self, tmp_path: Path):
+        cache = RobocopCache(cache_dir=tmp_path / CACHE_DIR_NAME, enabled=True, verbose=False)
+        kept_file = self.create_file(tmp_path, "kept.robot")
+        removed_file = self.create_file(tmp_path, "removed.robot")
+        for test_file in (kept_file, removed_file):
+            cache.set_linter_entry(test_file, "hash", [])
+            cache.set_project_entry(test_file, "hash", {"keywords": []})
+        cache.set_library_entry("Library", "env", removed_file, {"keywords": []})
+        removed_file.unlink()
+
+        removed = cache.prune()
+
+        assert removed == {"linter": 1, "formatter": 0, "libraries": 1, "project": 1, "project_checks": 0}
+        assert list(cache.data.linter) == [str(kept_file.resolve())]
+        assert list(cache.data.project) == [str(kept_file.resolve())]
+
+    def test_prune_keeps_entries_of_files_with_different_config_hashes(self, tmp_path: Path, monkeypatch):
+        cache = RobocopCache(cache_dir=tmp_path / CACHE_DIR_NAME, enabled=True, verbose=False, max_config_hashes=2)
+        for index in range(4):
+            monkeypatch.setattr("robocop.cache.time.time", lambda index=index: 1000.0 + index)
+            test_file = self.create_file(tmp_path, f"test{index}.robot")
+            cache.set_formatter_entry(test_file, f"hash{index}", needs_formatting=False)
+
+        removed = cache.prune()
+
+        assert removed["formatter"] == 0
+        assert len(cache.data.formatter) == 4
+
+    def test_prune_keeps_project_checks_of_most_recently_used_configurations(self, tmp_path: Path, monkeypatch):
+        cache = RobocopCache(cache_dir=tmp_path / CACHE_DIR_NAME, enabled=True, verbose=False, max_config_hashes=2)
+        project, other_project = tmp_path / "project", tmp_path / "other_project"
+        for root in (project, other_project):
+            root.mkdir()
+        # configurations last accessed at the same time are all kept
+        for index, last_access in enumerate([1000.0, 1001.0, 1002.0, 1002.0, 1003.0]):
+            monkeypatch.setattr("robocop.cache.time.time", lambda last_access=last_access: last_access)
+            cache.set_project_checks_entry(project, f"config{index}", "files", [], [])
+        cache.set_project_checks_entry(other_project, "config0", "files", [], [])
+
+        removed = cache.prune()
+
+        assert removed["project_checks"] == 2
+        assert sorted(entry.config_hash for entry in cache.data.project_checks.values()) == [
+            "config0",
+            "config2",
+            "config3",
+            "config4",
+        ]
+        assert cache.get_project_checks_entry(other_project, "config0", "files") == ()
+
+    def test_prune_without_config_hashes_limit(self, tmp_path: Path):
+        cache = RobocopCache(cache_dir=tmp_path / CACHE_DIR_NAME, enabled=True, verbose=False)
+        for index in range(3):
+            cache.set_project_checks_entry(tmp_path, f"config{index}", "files", [], [])
+
+        assert cache.prune(max_config_hashes=0)["project_checks"] == 0
+
+    def test_prune_removes_least_recently_used_entries_over_max_size(self, tmp_path: Path, monkeypatch):
+        cache = RobocopCache(cache_dir=tmp_path / CACHE_DIR_NAME, enabled=True, verbose=False)
+        files = []
+        for index in range(3):
+            monkeypatch.setattr("robocop.cache.time.time", lambda index=index: 1000.0 + index)
+            files.append(self.create_file(tmp_path, f"test{index}.robot"))
+            cache.set_linter_entry(files[-1], "hash", [])
+        entry_size = len(msgpack.packb(cache.data.linter[str(files[0].resolve())].to_dict(), use_bin_type=True))
+
+        removed = cache.prune(max_size=entry_size * 2)
+
+        assert removed["linter"] == 1
+        assert str(files[0].resolve()) not in cache.data.linter
+        assert len(cache.data.linter) == 2
+
+    def test_used_entry_last_access_is_updated(self, tmp_path: Path, monkeypatch):
+        cache_dir = tmp_path / CACHE_DIR_NAME
+        test_file = self.create_file(tmp_path, "test.robot")
+        monkeypatch.setattr("robocop.cache.time.time", lambda: 1000.0)
+        cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False)
+        cache.set_linter_entry(test_file, "hash", [])
+        cache.save()
+
+        monkeypatch.setattr("robocop.cache.time.time", lambda: 1000.0 + CACHE_ACCESS_RESOLUTION + 1)
+        cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False)
+
+        assert cache.get_linter_entry(test_file, "hash").last_access == 1000.0 + CACHE_ACCESS_RESOLUTION + 1
+
+    def test_cache_is_pruned_automatically(self, tmp_path: Path, monkeypatch):
+        cache_dir = tmp_path / CACHE_DIR_NAME
+        kept_file = self.create_file(tmp_path, "kept.robot")
+        removed_file = self.create_file(tmp_path, "removed.robot")
+        monkeypatch.setattr("robocop.cache.time.time", lambda: 1000.0)
+        cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False)
+        cache.set_linter_entry(removed_file, "hash", [])
+        cache.save()
+        removed_file.unlink()
+
+        # not pruned again before the prune interval passes
+        cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False)
+        cache.set_linter_entry(kept_file, "hash", [])
+        cache.save()
+        assert str(removed_file.resolve()) in RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False).data.linter
+
+        monkeypatch.setattr("robocop.cache.time.time", lambda: 1000.0 + CACHE_PRUNE_INTERVAL + 1)
+        cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False)
+        cache.set_linter_entry(kept_file, "hash", [])
+        cache.save()
+
+        cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False)
+        assert list(cache.data.linter) == [str(kept_file.resolve())]
+
+    def test_statistics(self, tmp_path: Path):
+        cache_dir = tmp_path / CACHE_DIR_NAME
+        test_file = self.create_file(tmp_path, "test.robot")
+        cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False)
+        assert cache.get_linter_entry(test_file, "hash") is None
+        cache.set_linter_entry(test_file, "hash", [])
+        cache.save()
+        for _ in range(3):
+            cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False)
+            assert cache.get_linter_entry(test_file, "hash") is not None
+            cache.save()
+
+        statistics = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False).get_statistics()
+
+        assert statistics["linter"].entries == 1
+        assert statistics["linter"].size > 0
+        assert statistics["linter"].hits == 3
+        assert statistics["linter"].misses == 1
+        assert statistics["linter"].hit_rate == 0.75
+        assert statistics["formatter"].hit_rate is None
+
+
+class TestProjectChecksCache:
+    @staticmethod
+    def create_project(tmp_path: Path) -> tuple[Path, list[Path]]:
+        project = tmp_path / "project"
+        project.mkdir()
+        files = []
+        for name in ("test.robot", "common.resource"):
+            source = project / name
+            source.write_text(f"content of {name}")
+            files.append(source)
+        return project, files
+
+    @staticmethod
+    def diagnostic(source: Path, empty_config) -> Diagnostic:
+        rule = MagicMock()
+        rule.rule_id = "KW01"
+        rule.name = "unused-keyword"
+        rule.message = "Keyword '{name}' is not used"
+        rule.get_severity_with_threshold.return_value = RuleSeverity.WARNING
+        return Diagnostic(
+            rule=rule,
+            source=SourceFile(path=source, config=empty_config),
+            lineno=2,
+            col=1,
+            end_lineno=2,
+            end_col=10,
+            name="Keyword",
+        )
+
+    def test_entry_is_reused_in_next_run(self, tmp_path: Path, empty_config):
+        cache_dir = tmp_path / CACHE_DIR_NAME
+        project, files = self.create_project(tmp_path)
+        cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False)
+        cache.set_project_checks_entry(project, "config", "files", files, [self.diagnostic(files[1], empty_config)])
+        cache.save()
+
+        cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False)
+        cached = cache.get_project_checks_entry(project, "config", "files")
+
+        assert cached is not None
+        [(source, diagnostic)] = cached
+        assert source == str(files[1].resolve())
+        assert diagnostic.rule_id == "KW01"
+        assert dict(diagnostic.arguments) == {"name": "Keyword"}
+
+    def test_entry_is_invalid_when_dependency_changes(self, tmp_path: Path):
+        project, files = self.create_project(tmp_path)
+        cache = RobocopCache(cache_dir=tmp_path / CACHE_DIR_NAME, enabled=True, verbose=False)
+        cache.set_project_checks_entry(project, "config", "files", files, [])
+
+        files[1].write_text("changed content")
+
+        assert cache.get_project_checks_entry(project, "config", "files") is None
+        outdated = cache.get_outdated_project_checks_entry(project, "config")
+        assert outdated is not None
+        assert outdated[1] == {files[1].resolve()}
+
+    def test_entry_is_invalid_when_dependency_is_removed(self, tmp_path: Path):
+        project, files = self.create_project(tmp_path)
+        cache = RobocopCache(cache_dir=tmp_path / CACHE_DIR_NAME, enabled=True, verbose=False)
+        cache.set_project_checks_entry(project, "config", "files", files, [])
+
+        files[0].unlink()
+
+        assert cache.get_project_checks_entry(project, "config", "files") is None
+
+    def test_outdated_entry_keeps_reverse_dependencies(self, tmp_path: Path):
+        cache_dir = tmp_path / CACHE_DIR_NAME
+        project, files = self.create_project(tmp_path)
+        cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False)
+        cache.set_project_checks_entry(
+            project,
+            "config",
+            "files",
+            files,
+            [],
+            file_configs={files[0]: "hash"},
+            imported_by={files[1]: {files[0]}},
+        )
+        cache.save()
+        files[0].unlink()
+
+        cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False)
+        outdated = cache.get_outdated_project_checks_entry(project, "config")
+
+        assert outdated is not None
+        entry, changed = outdated
+        assert changed == {files[0].resolve()}
+        assert entry.file_configs == {str(files[0]): "hash"}
+        assert entry.imported_by == {str(files[1]): (str(files[0]),)}
+        assert cache.get_outdated_project_checks_entry(project, "other config") is None
+
+    def test_entry_is_invalid_when_project_files_change(self, tmp_path: Path):
+        project, files = self.create_project(tmp_path)
+        cache = RobocopCache(cache_dir=tmp_path / CACHE_DIR_NAME, enabled=True, verbose=False)
+        cache.set_project_checks_entry(project, "config", "files", files, [])
+
+        assert cache.get_project_checks_entry(project, "config", "other files") is None
+
+    def test_entries_of_different_configurations_are_kept(self, tmp_path: Path):
+        project, files = self.create_project(tmp_path)
+        cache = RobocopCache(cache_dir=tmp_path / CACHE_DIR_NAME, enabled=True, verbose=False)
+        cache.set_project_checks_entry(project, "config1", "files", files, [])
+        cache.set_project_checks_entry(project, "config2", "files", files, [])
+
+        assert cache.get_project_checks_entry(project, "config1", "files") == ()
+        assert cache.get_project_checks_entry(project, "config2", "files") == ()
+        assert cache.get_project_checks_entry(project, "config3", "files") is None
+
+    def test_dependency_with_modified_mtime_and_same_content(self, tmp_path: Path):
+        project, files = self.create_project(tmp_path)
+        cache = RobocopCache(cache_dir=tmp_path / CACHE_DIR_NAME, enabled=True, verbose=False, content_hash=True)
+        cache.set_project_checks_entry(project, "config", "files", files, [])
+
+        TestContentHashValidation.touch(files[0])
+
+        assert cache.get_project_checks_entry(project, "config", "files") == ()
+        [entry] = cache.data.project_checks.values()
+        assert entry.dependencies[str(files[0].resolve())].mtime == files[0].stat().st_mtime
+
+    def test_entry_of_removed_project_is_pruned(self, tmp_path: Path):
+        project, files = self.create_project(tmp_path)
+        cache = RobocopCache(cache_dir=tmp_path / CACHE_DIR_NAME, enabled=True, verbose=False)
+        cache.set_project_checks_entry(project, "config", "files", files, [])
+        for source in files:
+            source.unlink()
+        project.rmdir()
+
+        assert cache.prune()["project_checks"] == 1
+
+
+class TestProjectImportsCache:
+    def test_imports_are_reused_in_next_run(self, tmp_path: Path):
+        cache_dir = tmp_path / CACHE_DIR_NAME
+        source, resource = tmp_path / "test.robot", tmp_path / "keywords.resource"
+        source.write_text("*** Settings ***\nResource    keywords.resource\n")
+        resource.write_text("*** Keywords ***\n")
+        cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False)
+        cache.set_project_entry(source, "hash", {"keywords": []})
+        cache.set_project_imports(source, "hash", "resolution", {"imports": []}, [resource, tmp_path / "missing.py"])
+        cache.save()
+
+        cache = RobocopCache(cache_dir=cache_dir, enabled=True, verbose=False)
+
+        assert cache.get_project_imports(source, "hash", "resolution") == {"imports": []}
+        assert cache.get_project_entry(source, "hash") == {"keywords": []}
+
+    def test_imports_are_not_stored_without_collected_data(self, tmp_path: Path):
+        source = tmp_path / "test.robot"
+        source.write_text("*** Settings ***\n")
+        cache = RobocopCache(cache_dir=tmp_path / CACHE_DIR_NAME, enabled=True, verbose=False)
+        cache.set_project_imports(source, "hash", "resolution", {"imports": []}, [])
+
+        assert cache.get_project_imports(source, "hash", "resolution") is None
+
+    @pytest.mark.parametrize(("config_hash", "resolution_hash"), [("other", "resolution"), ("hash", "other")])
+    def test_imports_are_invalid_for_other_configuration(self, tmp_path: Path, config_hash, resolution_hash):
+        source = tmp_path / "test.robot"
+        source.write_text("*** Settings ***\n")
+        cache = RobocopCache(cache_dir=tmp_path / CACHE_DIR_NAME, enabled=True, verbose=False)
+        cache.set_project_entry(source, "hash", {"keywords": []})
+        cache.set_project_imports(source, "hash", "resolution", {"imports": []}, [])
+
+        assert cache.get_project_imports(source, config_hash, resolution_hash) is None
+
+    def test_imports_are_invalid_when_checked_path_changes(self, tmp_path: Path):
+        source, resource = tmp_path / "test.robot", tmp_path / "keywords.resource"
+        source.write_text("*** Settings ***\n")
+        resource.write_text("*** Keywords ***\n")
+        cache = RobocopCache(cache_dir=tmp_path / CACHE_DIR_NAME, enabled=True, verbose=False)
+        cache.set_project_entry(source, "hash", {"keywords": []})
+        cache.set_project_imports(source, "hash", "resolution", {"imports": []}, [resource])
+
+        resource.write_text("*** Keywords ***\nKeyword\n    No Operation\n")
+
+        assert cache.get_project_imports(source, "hash", "resolution") is None
+        assert cache.get_project_entry(source, "hash") == {"keywords": []}
+
+    def test_imports_are_invalid_when_missing_path_is_created(self, tmp_path: Path):
+        source, library = tmp_path / "test.robot", tmp_path / "Library.py"
+        source.write_text("*** Settings ***\n")
+        cache = RobocopCache(cache_dir=tmp_path / CACHE_DIR_NAME, enabled=True, verbose=False)
+        cache.set_project_entry(source, "hash", {"keywords": []})
+        cache.set_project_imports(source, "hash", "resolution", {"imports": []}, [library])
+        checked: dict[str, bool] = {}
+
+        assert cache.get_project_imports(source, "hash", "resolution", checked) == {"imports": []}
+        assert checked == {str(library): True}
+
+        library.write_text("")
+
+        assert cache.get_project_imports(source, "hash", "resolution") is None
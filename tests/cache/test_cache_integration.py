@@ -39,10 +39,12 @@ def get_cache_data(tmp_path: Path) -> dict:
         Dictionary containing cache data, or empty dict if cache doesn't exist.
 
     """
-    cache_file = tmp_path / ".robocop_cache" / "cache.msgpack"
-    if not cache_file.exists():
-        return {}
-    return msgpack.unpackb(cache_file.read_bytes(), raw=False, strict_map_key=False)
+    cache_dir = tmp_path / ".robocop_cache"
+    cache_data: dict = {}
+    for shard_file in cache_dir.glob("*/*.msgpack"):
+        shard = msgpack.unpackb(shard_file.read_bytes(), raw=False, strict_map_key=False)
+        cache_data.setdefault(shard_file.parent.name, {}).update(shard["entries"])
+    return cache_data
 
 
 def is_file_in_cache(tmp_path: Path, file_path: Path) -> bool:
@@ -165,7 +167,7 @@ class TestCacheIntegration:
             # First run - creates cache
             first_result = check_files(return_result=True)
             assert cache_dir.exists(), "Cache directory should be created"
-            assert (cache_dir / "cache.msgpack").exists(), "Cache file should be created"
+            assert list(cache_dir.glob("linter/*.msgpack")), "Cache file should be created"
 
             # Verify cache contains data
             cache_data = get_cache_data(tmp_path)
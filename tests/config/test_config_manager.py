@@ -6,6 +6,7 @@ import pytest
 import typer
 
 from robocop import exceptions
+from robocop.config import manager
 from robocop.config import schema as config_model
 from robocop.config.builder import ConfigBuilder
 from robocop.config.manager import ConfigManager
@@ -486,6 +487,65 @@ class TestConfigFinder:
         # Assert
         assert sorted(actual_results.keys()) == sorted(expected_paths)
 
+    @pytest.mark.skipif(sys.platform != "linux", reason="Test only runs on Linux")
+    def test_symlink_loop(self, tmp_path):
+        # Arrange
+        nested = tmp_path / "nested"
+        nested.mkdir()
+        (nested / "test.robot").write_text("*** Settings ***")
+        (nested / "loop").symlink_to(tmp_path, target_is_directory=True)
+
+        # Act
+        actual_results = get_sources_and_configs(tmp_path)
+
+        # Assert
+        assert list(actual_results.keys()) == [nested / "test.robot"]
+
+    @pytest.mark.parametrize("jobs", [1, 4])
+    def test_excluded_directories_are_not_listed(self, tmp_path, monkeypatch, jobs):
+        # Arrange
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".gitignore").write_text("results/\n")
+        for directory in ("tests/nested", "results/nested", "venv/lib", "resources"):
+            (tmp_path / directory).mkdir(parents=True)
+            (tmp_path / directory / "test.robot").write_text("*** Settings ***")
+            (tmp_path / directory / "data.txt").write_text("")
+        listed = []
+        list_directory = manager.list_directory
+
+        def spy_list_directory(directory):
+            listed.append(directory.relative_to(tmp_path).as_posix())
+            return list_directory(directory)
+
+        monkeypatch.setattr(manager, "list_directory", spy_list_directory)
+        overwrite_config = config_model.RawConfig(jobs=jobs)
+
+        # Act
+        actual_results = get_sources_and_configs(tmp_path, overwrite_config=overwrite_config)
+
+        # Assert
+        assert sorted(listed) == [".", "resources", "tests", "tests/nested"]
+        assert sorted(actual_results.keys()) == [
+            tmp_path / "resources" / "test.robot",
+            tmp_path / "tests" / "nested" / "test.robot",
+        ]
+
+    def test_files_are_found_in_the_same_order_with_jobs(self, tmp_path):
+        # Arrange
+        for index in range(20):
+            directory = tmp_path / f"suite_{index % 3}" / f"nested_{index % 5}"
+            directory.mkdir(parents=True, exist_ok=True)
+            (directory / f"test_{index}.robot").write_text("*** Settings ***")
+            (tmp_path / f"suite_{index % 3}" / f"keywords_{index}.resource").write_text("*** Keywords ***")
+        overwrite_config = config_model.RawConfig(jobs=4)
+
+        # Act
+        one_job = get_sources_and_configs(tmp_path)
+        many_jobs = get_sources_and_configs(tmp_path, overwrite_config=overwrite_config)
+
+        # Assert
+        assert list(many_jobs.keys()) == list(one_job.keys())
+
     def test_reports_loaded_from_top_config(self, test_data):
         # Arrange
         test_dir = test_data / "robot_toml_with_reports"
@@ -692,3 +752,22 @@ class TestCacheConfigOverride:
 
         # Assert - should use config file setting
         assert config_manager.default_config.cache.enabled is False
+
+
+@pytest.mark.parametrize(
+    "pattern", ["*.robot", "venv", ".git", "test_*", "tests/*.robot", "*/nested/*.resource", "[ab].robot"]
+)
+def test_file_filters_match_the_same_as_path_match(pattern):
+    paths = [
+        Path("test.robot"),
+        Path("tests/test_a.robot"),
+        Path("tests/nested/test.resource"),
+        Path("project/venv"),
+        Path("project/.git"),
+        Path("b.robot"),
+        Path("ab.robot"),
+        Path("."),
+    ]
+    file_filters = config_model.FileFiltersOptions(included_paths={pattern}, excluded_paths=set())
+
+    assert [file_filters.path_included(path) for path in paths] == [path.match(pattern) for path in paths]
@@ -0,0 +1,120 @@
+"""Tests comparing the directory walker with checking the paths one by one."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from robocop import exceptions
+from robocop.config import schema as config_model
+from robocop.config.manager import ConfigManager
+from robocop.source_file import SourceFile
+from tests import working_directory
+
+
+class PathByPathConfigManager(ConfigManager):
+    """
+    Reference discovery: resolve and filter every path separately, recursing with ``iterdir``.
+
+    It is how the files were found before the directories were walked with ``os.scandir``. It is slow, but every
+    step follows the documented rules directly, so the walker is expected to find the same files in the same order.
+    """
+
+    def resolve_paths(
+        self,
+        sources: list[Path] | list[str],
+        ignore_file_filters: bool = False,
+        target: dict[Path, SourceFile] | None = None,
+    ) -> None:
+        if target is None:
+            target = self._paths
+        for source in sources:
+            source_not_resolved = Path(source)
+            source_path = source_not_resolved.resolve()
+            if source_path in target:
+                continue
+            if not source_path.exists():
+                if source_not_resolved.is_symlink():
+                    continue
+                raise exceptions.FatalError(f"File '{source_path}' does not exist")
+            config = self.get_config_for_source_file(source_path)
+            if not ignore_file_filters:
+                if any(source_not_resolved.match(pattern) for pattern in config.file_filters.excluded_paths):
+                    continue
+                if source_path.is_file() and not any(
+                    source_not_resolved.match(pattern) for pattern in config.file_filters.included_paths
+                ):
+                    continue
+                if not self.skip_gitignore:
+                    source_gitignore = self.gitignore_resolver.resolve_path_ignores(source_not_resolved)
+                    if self.gitignore_resolver.path_excluded(source_not_resolved, source_gitignore):
+                        continue
+            if source_path.is_dir():
+                self.resolve_paths(list(source_path.iterdir()), target=target)
+            elif source_path.is_file():
+                target[source_path] = self._paths.get(source_path) or SourceFile(path=source_path, config=config)
+
+
+def write_files(directory: Path, names: list[str]) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    for name in names:
+        (directory / name).write_text("*** Settings ***\n", encoding="utf-8")
+
+
+@pytest.fixture
+def repository(tmp_path) -> Path:
+    """Generate the repository with nested configuration files, gitignores, excluded directories and symlinks."""
+    root = tmp_path / "repository"
+    (root / ".git").mkdir(parents=True)
+    (root / ".gitignore").write_text("node_modules/\n*.pyc\nignored_*.robot\n", encoding="utf-8")
+    for group in range(3):
+        for index in range(4):
+            directory = root / "tests" / f"group_{group}" / f"suite_{index}"
+            write_files(directory, [f"test_{index}.robot", f"keywords_{index}.resource", "notes.txt"])
+            write_files(directory, [f"ignored_{index}.robot", f"library_{index}.pyc"])
+    write_files(root / "tests" / "nested", ["test.robot"])
+    (root / "tests" / "nested" / ".gitignore").write_text("local/\n", encoding="utf-8")
+    write_files(root / "tests" / "nested" / "local", ["test.robot"])
+    write_files(root / "node_modules" / "package", ["test.robot", "index.js"])
+    write_files(root / ".venv" / "lib", ["test.robot"])
+    write_files(root / "results", ["output.xml", "log.html"])
+    sub_project = root / "sub_project"
+    write_files(sub_project / "tests", ["test.robot", "generated.robot"])
+    write_files(sub_project / "skipped", ["test.robot"])
+    (sub_project / "pyproject.toml").write_text(
+        '[tool.robocop]\nexclude = ["skipped", "generated.robot"]\ninclude = ["*.robot", "*.txt"]\n',
+        encoding="utf-8",
+    )
+    write_files(sub_project / "data", ["values.txt"])
+    (root / "linked").symlink_to(root / "tests" / "group_1", target_is_directory=True)
+    (root / "tests" / "broken.robot").symlink_to(root / "missing.robot")
+    return root
+
+
+def discover(manager_class: type[ConfigManager], directory: Path, **kwargs) -> list[tuple[Path, str]]:
+    with working_directory(directory):
+        config_manager = manager_class(**kwargs)
+        return [(source.path, str(source.config.config_source)) for source in config_manager.paths]
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_walker_finds_the_same_files_as_path_checks(repository, jobs):
+    overwrite_config = config_model.RawConfig(jobs=jobs)
+
+    expected = discover(PathByPathConfigManager, repository, overwrite_config=overwrite_config)
+    actual = discover(ConfigManager, repository, overwrite_config=overwrite_config)
+
+    assert actual == expected
+    found = {path.relative_to(repository).as_posix() for path, _ in actual}
+    assert "sub_project/data/values.txt" in found
+    assert not any(path.startswith(("node_modules", ".venv", "sub_project/skipped")) for path in found)
+    assert not any("ignored_" in path or path.endswith("generated.robot") for path in found)
+
+
+def test_walker_finds_the_same_files_without_gitignore(repository):
+    expected = discover(PathByPathConfigManager, repository, skip_gitignore=True)
+    actual = discover(ConfigManager, repository, skip_gitignore=True)
+
+    assert actual == expected
+    assert repository / "tests" / "nested" / "local" / "test.robot" in {path for path, _ in actual}
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 import pytest
 
 from robocop.config.builder import ConfigBuilder
+from robocop.project.library_cache import LIBRARY_CACHE_ENV_VARIABLE
 
 if TYPE_CHECKING:
     from robocop.config.schema import Config
@@ -18,3 +19,11 @@ sys.path.append(str(Path(__file__).parent.parent))
 @pytest.fixture
 def empty_config() -> Config:
     return ConfigBuilder().from_raw(None, None)
+
+
+@pytest.fixture(autouse=True)
+def library_cache_dir(tmp_path_factory, monkeypatch) -> Path:
+    """Keep the libraries imported by the tests out of the library cache of the user."""
+    cache_dir = tmp_path_factory.mktemp("library_cache")
+    monkeypatch.setenv(LIBRARY_CACHE_ENV_VARIABLE, str(cache_dir))
+    return cache_dir
@@ -0,0 +1,191 @@
+import io
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from robocop.daemon.client import request, run_in_daemon
+from robocop.daemon.protocol import SUPPORTED, default_socket_path, make_private_directory, socket_directory
+from robocop.daemon.server import DaemonServer
+from robocop.exceptions import DaemonError
+from robocop.runtime import session
+from tests import working_directory
+
+pytestmark = pytest.mark.skipif(not SUPPORTED, reason="Unix domain sockets are not supported")
+
+SUITE = """*** Test Cases ***
+Test
+    Keyword
+    Unknown Keyword
+
+
+*** Keywords ***
+Keyword
+    Log    message
+
+Unused Keyword
+    Log    message
+"""
+
+
+@pytest.fixture
+def daemon():
+    # Unix socket paths are limited to around 100 characters, so pytest temporary directories may be too long
+    directory = Path(tempfile.mkdtemp(prefix="robocop"))
+    server = DaemonServer(directory / "daemon.sock")
+    thread = threading.Thread(target=server.serve, daemon=True)
+    thread.start()
+    for _ in range(100):
+        if server.socket_path.exists():
+            break
+        time.sleep(0.05)
+    yield server
+    request({"command": "stop"}, server.socket_path)
+    thread.join(timeout=10)
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "test.robot").write_text(SUITE)
+    return tmp_path
+
+
+def run_command(daemon, project, *argv):
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with working_directory(project):
+        exit_code = run_in_daemon(list(argv), daemon.socket_path, stdout=stdout, stderr=stderr)
+    return exit_code, stdout.getvalue(), stderr.getvalue()
+
+
+class TestDaemon:
+    def test_run_check(self, daemon, project):
+        argv = ["check", "--select", "unused-keyword", "--select", "keyword-not-found", "--no-cache"]
+
+        first = run_command(daemon, project, *argv)
+        second = run_command(daemon, project, *argv)
+
+        exit_code, stdout, stderr = first
+        assert exit_code == 1
+        assert "Found 2 issues." in stdout
+        assert "Unused Keyword" in stdout
+        assert not stderr
+        assert second == first
+
+    def test_project_is_analysed_again_after_change(self, daemon, project):
+        argv = ["check", "--select", "unused-keyword", "--no-cache"]
+        run_command(daemon, project, *argv)
+        (project / "test.robot").write_text(SUITE.replace("    Unknown Keyword", "    Unused Keyword"))
+
+        exit_code, stdout, _ = run_command(daemon, project, *argv)
+
+        assert exit_code == 0
+        assert "Unused Keyword" not in stdout
+
+    def test_run_format(self, daemon, project):
+        (project / "test.robot").write_text(SUITE.replace("    Log    message", "  Log  message"))
+
+        exit_code, stdout, _ = run_command(daemon, project, "format", "--check", "--no-cache")
+
+        assert exit_code == 1
+        assert "1 file would be reformatted" in stdout
+
+    def test_errors_are_sent_to_client(self, daemon, project):
+        exit_code, _, stderr = run_command(daemon, project, "check", "--unknown-option")
+        assert exit_code == 2
+        assert "No such option" in stderr
+
+    def test_daemon_command_is_not_allowed(self, daemon, project):
+        exit_code, _, stderr = run_command(daemon, project, "daemon", "stop")
+        assert exit_code == 2
+        assert "cannot be run by the daemon" in stderr
+
+    def test_status(self, daemon, project):
+        run_command(daemon, project, "check", "--select", "unused-keyword", "--no-cache")
+
+        status = request({"command": "status"}, daemon.socket_path)["status"]
+
+        assert status["runs"] == 1
+        assert status["projects"] == 1
+
+    def test_stop(self, daemon):
+        assert request({"command": "stop"}, daemon.socket_path) == {"exit_code": 0}
+        for _ in range(100):
+            if not daemon.socket_path.exists():
+                break
+            time.sleep(0.05)
+        assert not daemon.socket_path.exists()
+        assert session.active_session() is None
+
+
+def test_client_without_daemon(tmp_path):
+    assert run_in_daemon(["check"], tmp_path / "missing.sock") is None
+    assert request({"command": "status"}, tmp_path / "missing.sock") is None
+
+
+class TestSocketPermissions:
+    def test_socket_is_created_in_runtime_directory(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("ROBOCOP_DAEMON_SOCKET", raising=False)
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+
+        assert default_socket_path() == tmp_path / "robocop" / "daemon.sock"
+
+    def test_socket_is_created_in_user_directory_without_runtime_directory(self, monkeypatch):
+        monkeypatch.delenv("ROBOCOP_DAEMON_SOCKET", raising=False)
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+
+        assert default_socket_path() == Path(tempfile.gettempdir()) / f"robocop-{os.getuid()}" / "daemon.sock"
+
+    def test_private_directory_is_created(self, tmp_path):
+        make_private_directory(tmp_path / "robocop")
+
+        assert (tmp_path / "robocop").stat().st_mode & 0o777 == 0o700
+
+    def test_directory_accessible_to_other_users_is_rejected(self, tmp_path):
+        directory = tmp_path / "robocop"
+        directory.mkdir()
+        directory.chmod(0o755)
+
+        with pytest.raises(PermissionError, match="accessible to other users"):
+            make_private_directory(directory)
+
+    def test_symlinked_directory_is_rejected(self, tmp_path):
+        (tmp_path / "other").mkdir(mode=0o700)
+        (tmp_path / "robocop").symlink_to(tmp_path / "other", target_is_directory=True)
+
+        with pytest.raises(PermissionError, match="is not a directory"):
+            make_private_directory(tmp_path / "robocop")
+
+    def test_daemon_does_not_use_insecure_directory(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        socket_directory().mkdir(mode=0o777)
+        socket_directory().chmod(0o777)
+
+        with pytest.raises(DaemonError, match="accessible to other users"):
+            DaemonServer(socket_directory() / "daemon.sock").serve()
+
+    def test_socket_is_accessible_only_to_current_user(self, daemon):
+        assert daemon.socket_path.stat().st_mode & 0o777 == 0o600
+
+    def test_client_does_not_connect_to_socket_of_other_user(self, daemon, monkeypatch):
+        monkeypatch.setattr("robocop.daemon.protocol.os.getuid", lambda: daemon.socket_path.stat().st_uid + 1)
+
+        assert request({"command": "status"}, daemon.socket_path) is None
+
+
+class TestSession:
+    def test_config_resolver_is_shared_in_session(self):
+        session.start_session()
+        try:
+            assert session.config_resolver(load_rules=True) is session.config_resolver(load_rules=True)
+            assert session.config_resolver(load_rules=True) is not session.config_resolver(load_formatters=True)
+        finally:
+            session.end_session()
+
+    def test_config_resolver_without_session(self):
+        assert session.config_resolver(load_rules=True) is not session.config_resolver(load_rules=True)
+        assert session.previous_project_context(Path.cwd()) is None
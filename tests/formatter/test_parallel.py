@@ -0,0 +1,67 @@
+from pathlib import Path
+from textwrap import dedent
+
+from robocop.run import format_files
+from tests import working_directory
+
+SUITE = dedent("""
+    *** Test Cases ***
+    Test {index}
+      Keyword {index}    ${{argument}}
+    *** Keywords ***
+    Keyword {index}
+      [Arguments]  ${{arg}}
+      Log  ${{arg}}
+    """).lstrip()
+
+
+def create_project(path: Path, files: int = 6) -> None:
+    path.mkdir(parents=True, exist_ok=True)
+    for index in range(files):
+        (path / f"suite_{index}.robot").write_text(SUITE.format(index=index), encoding="utf-8")
+    (path / "formatted.robot").write_text("*** Test Cases ***\nTest\n    No Operation\n", encoding="utf-8")
+    (path / "invalid.robot").write_bytes(b"*** Test Cases ***\nTest\n    Log    \xff\xfe\n")
+
+
+def run_format(path: Path, **kwargs) -> int:
+    with working_directory(path):
+        return format_files(return_result=True, **kwargs)
+
+
+class TestParallelFormatting:
+    def test_files_do_not_depend_on_jobs(self, tmp_path: Path):
+        create_project(tmp_path / "sequential")
+        create_project(tmp_path / "parallel")
+
+        assert run_format(tmp_path / "sequential", jobs=1, cache=False) == 0
+        assert run_format(tmp_path / "parallel", jobs=2, cache=False) == 0
+
+        for index in range(6):
+            formatted = (tmp_path / "parallel" / f"suite_{index}.robot").read_text(encoding="utf-8")
+            assert formatted != SUITE.format(index=index)
+            assert formatted == (tmp_path / "sequential" / f"suite_{index}.robot").read_text(encoding="utf-8")
+
+    def test_output_does_not_depend_on_jobs(self, tmp_path: Path, capsys):
+        create_project(tmp_path)
+
+        sequential_exit_code = run_format(tmp_path, jobs=1, check=True, diff=True, color=False, cache=False)
+        sequential, _ = capsys.readouterr()
+        parallel_exit_code = run_format(tmp_path, jobs=2, check=True, diff=True, color=False, cache=False)
+        parallel, _ = capsys.readouterr()
+
+        assert sequential_exit_code == parallel_exit_code == 1
+        assert "Would reformat" in parallel
+        assert "Failed to decode" in parallel
+        assert "6 files would be reformatted, 1 file would be left unchanged. 1 file would be skipped." in parallel
+        assert parallel == sequential
+        assert (tmp_path / "suite_0.robot").read_text(encoding="utf-8") == SUITE.format(index=0)
+
+    def test_cache_is_written_by_main_process(self, tmp_path: Path, capsys):
+        create_project(tmp_path)
+
+        run_format(tmp_path, jobs=2)
+        capsys.readouterr()
+        run_format(tmp_path, jobs=2, verbose=True)
+        out, _ = capsys.readouterr()
+
+        assert "Skipped 7 unchanged files from cache." in out
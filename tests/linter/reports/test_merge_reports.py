@@ -0,0 +1,133 @@
+import json
+
+import pytest
+import typer
+
+from robocop import exceptions
+from robocop.run import check_files, merge_report_files
+from robocop.runtime.shard import Shard
+from tests import working_directory
+
+SUITE = """*** Settings ***
+Resource    keywords.resource
+
+
+*** Test Cases ***
+Test {index}
+    Shared Keyword
+    Missing Keyword {index}
+    log    lowercase
+"""
+
+RESOURCE = """*** Keywords ***
+Shared Keyword
+    No Operation
+
+Unused Keyword
+    No Operation
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    for index in range(6):
+        (tmp_path / f"suite_{index}.robot").write_text(SUITE.format(index=index) * (index + 1))
+    (tmp_path / "keywords.resource").write_text(RESOURCE)
+    return tmp_path
+
+
+def generate_report(project, report, output, shard=None):
+    with working_directory(project), pytest.raises(typer.Exit):
+        check_files(
+            select=["ALL", "PROJECT"],
+            reports=[report],
+            configure=[f"{report}.output_path={output}"],
+            shard=shard,
+            root=project,
+            ignore_file_config=True,
+            cache=False,
+            silent=True,
+        )
+    return json.loads(output.read_text())
+
+
+def merge(project, *report_files, output, **kwargs):
+    with working_directory(project):
+        return merge_report_files(
+            report_files=list(report_files), output=output, ignore_file_config=True, silent=True, **kwargs
+        )
+
+
+def issues(report_type, report):
+    if report_type == "sarif":
+        issues = report["runs"][0]["results"]
+    elif report_type == "sonarqube":
+        issues = report["issues"]
+    else:
+        issues = report
+    return sorted(json.dumps(issue, sort_keys=True) for issue in issues)
+
+
+@pytest.mark.parametrize("report_type", ["json_report", "sarif", "sonarqube", "gitlab"])
+def test_merged_shards_match_single_run(project, tmp_path_factory, report_type):
+    reports_dir = tmp_path_factory.mktemp("reports")
+    expected = generate_report(project, report_type, reports_dir / "full.json")
+    shards = [reports_dir / f"shard_{index}.json" for index in (1, 2, 3)]
+    for index, shard in enumerate(shards, start=1):
+        generate_report(project, report_type, shard, shard=Shard(index, 3))
+
+    exit_code = merge(project, *shards, output=reports_dir / "merged.json", return_result=True)
+
+    merged = json.loads((reports_dir / "merged.json").read_text())
+    assert issues(report_type, merged) == issues(report_type, expected)
+    assert all(issues(report_type, json.loads(shard.read_text())) for shard in shards)
+    assert exit_code == 1
+    if report_type == "sarif":
+        assert merged["runs"][0]["tool"] == expected["runs"][0]["tool"]
+
+
+def test_exit_code_is_calculated_with_return_status(tmp_path):
+    report = [
+        {"source": "a.robot", "line": 1, "column": 1, "rule_id": "DOC01", "severity": "W"},
+        {"source": "b.robot", "line": 1, "column": 1, "rule_id": "DOC01", "severity": "W"},
+        {"source": "b.robot", "line": 2, "column": 1, "rule_id": "ERR01", "severity": "E"},
+    ]
+    first, second = tmp_path / "first.json", tmp_path / "second.json"
+    first.write_text(json.dumps(report[:2]))
+    second.write_text(json.dumps(report[2:]))
+    output = tmp_path / "merged.json"
+
+    assert merge(tmp_path, first, second, output=output, return_result=True) == 1
+    assert merge(tmp_path, first, second, output=output, reports=["return_status"], return_result=True) == 3
+    assert (
+        merge(
+            tmp_path,
+            first,
+            second,
+            output=output,
+            reports=["return_status"],
+            configure=["return_status.quality_gate=E=0:W=5"],
+            return_result=True,
+        )
+        == 1
+    )
+    assert merge(tmp_path, first, second, output=output, exit_zero=True, return_result=True) == 0
+    assert [issue["source"] for issue in json.loads(output.read_text())] == ["a.robot", "b.robot", "b.robot"]
+
+
+def test_empty_reports(tmp_path):
+    empty = tmp_path / "empty.json"
+    empty.write_text("[]")
+    output = tmp_path / "merged.json"
+
+    assert merge(tmp_path, empty, empty, output=output, return_result=True) == 0
+    assert json.loads(output.read_text()) == []
+
+
+def test_reports_of_different_types_are_not_merged(tmp_path):
+    json_report, sonarqube = tmp_path / "robocop.json", tmp_path / "sonarqube.json"
+    json_report.write_text(json.dumps([{"rule_id": "DOC01", "severity": "W"}]))
+    sonarqube.write_text(json.dumps({"rules": [], "issues": []}))
+
+    with pytest.raises(exceptions.FatalError):
+        merge(tmp_path, json_report, sonarqube, output=tmp_path / "merged.json")
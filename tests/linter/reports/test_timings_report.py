@@ -0,0 +1,150 @@
+import json
+from textwrap import dedent
+from unittest import mock
+
+import pytest
+
+from robocop import exceptions
+from robocop.linter.reports.timings_report import TimingsReport
+from robocop.run import check_files
+from robocop.runtime import timings
+from robocop.runtime.timings import Timings
+from tests import working_directory
+
+SUITE = dedent("""
+    *** Test Cases ***
+    Test {index}
+        #comment without space
+        Keyword {index}    ${{argument}}
+
+
+    *** Keywords ***
+    Keyword {index}
+        [Arguments]    ${{arg}}
+        Log    ${{arg}}
+    """).lstrip()
+
+
+@pytest.fixture
+def project(tmp_path):
+    for index in range(4):
+        (tmp_path / f"suite_{index}.robot").write_text(SUITE.format(index=index) * (index + 1), encoding="utf-8")
+    return tmp_path
+
+
+def lint(project, **kwargs):
+    with working_directory(project):
+        return check_files(return_result=True, silent=True, cache=False, ignore_file_config=True, **kwargs)
+
+
+def read_timings(project, **kwargs):
+    output = project / "timings.json"
+    lint(project, reports=["timings"], configure=[f"timings.output_path={output}"], **kwargs)
+    return json.loads(output.read_text())
+
+
+class TestTimings:
+    def test_nested_sections_are_exclusive(self):
+        collected = Timings()
+        with (
+            mock.patch("robocop.runtime.timings.perf_counter", side_effect=[0.0, 1.0, 3.0, 6.0]),
+            collected.measure(collected.phase("outer")),
+            collected.measure(collected.checker("Inner")),
+        ):
+            pass
+
+        assert collected.phases["outer"].seconds == 4.0
+        assert collected.checkers["Inner"].seconds == 2.0
+        assert collected.total == 6.0
+
+    def test_profiled_function(self):
+        collected = Timings()
+        profiled = collected.profile(lambda value: value * 2, collected.checker("Checker"))
+
+        assert [profiled(1), profiled(2)] == [2, 4]
+        assert collected.checkers["Checker"].calls == 2
+
+    def test_merge(self):
+        collected = Timings()
+        collected.phase("parsing").seconds = 1.0
+        collected.add_file("a.robot", 1.0)
+        other = Timings()
+        other.phase("parsing").seconds = 2.0
+        other.phase("parsing").calls = 3
+        other.checker("Checker").seconds = 0.5
+        other.add_file("a.robot", 0.5)
+        other.add_file("b.robot", 2.0)
+
+        collected.merge(other.to_dict())
+
+        assert collected.phases["parsing"].seconds == 3.0
+        assert collected.phases["parsing"].calls == 3
+        assert collected.checkers["Checker"].seconds == 0.5
+        assert collected.slowest_files(1) == [("b.robot", 2.0)]
+        assert collected.files["a.robot"] == 1.5
+
+    def test_not_measured_without_active_timings(self):
+        assert timings.active_timings() is None
+        with timings.phase("parsing"), timings.checker("Checker"), timings.file("a.robot"):
+            pass
+        assert timings.active_timings() is None
+
+
+class TestTimingsReport:
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_timings_of_the_run(self, project, jobs):
+        report = read_timings(project, jobs=jobs)
+
+        assert timings.active_timings() is None
+        assert report["phases"]["parsing"]["calls"] == 4
+        assert report["phases"]["linting"]["calls"] == 4
+        assert "CommentChecker" in report["checkers"]
+        assert "UnusedVariablesChecker" in report["checkers"]
+        assert sorted(file["source"] for file in report["slowest_files"]) == [
+            f"suite_{index}.robot" for index in range(4)
+        ]
+        assert report["total"] == pytest.approx(
+            sum(timing["seconds"] for section in ("phases", "checkers") for timing in report[section].values())
+        )
+
+    def test_timings_of_the_project_checkers(self, project):
+        report = read_timings(project, select=["PROJECT"])
+
+        assert report["phases"]["project context"]["calls"] == 1
+        assert report["checkers"]["UnusedKeywords"]["calls"] == 1
+
+    def test_slowest_files(self, project):
+        output = project / "timings.json"
+        lint(
+            project,
+            reports=["timings"],
+            configure=[f"timings.output_path={output}", "timings.slowest_files=2"],
+        )
+
+        report = json.loads(output.read_text())
+        assert len(report["slowest_files"]) == 2
+
+    def test_diagnostics_do_not_depend_on_timings(self, project):
+        def describe(diagnostics):
+            return [(diag.source.path.name, diag.rule.rule_id, diag.range.start.line) for diag in diagnostics]
+
+        expected = describe(lint(project))
+        profiled = describe(lint(project, reports=["timings"]))
+
+        assert expected
+        assert profiled == expected
+
+    def test_print_report(self, project, capsys):
+        with working_directory(project):
+            check_files(return_result=True, reports=["timings"], cache=False, ignore_file_config=True)
+        out, _ = capsys.readouterr()
+
+        assert "Timings (total " in out
+        assert "\nPhase " in out
+        assert "\nChecker " in out
+        assert "Slowest files:" in out
+
+    def test_invalid_slowest_files(self, empty_config):
+        report = TimingsReport(empty_config)
+        with pytest.raises(exceptions.ConfigurationError, match="Expected an integer"):
+            report.configure("slowest_files", "many")
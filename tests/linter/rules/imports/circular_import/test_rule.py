@@ -3,7 +3,9 @@ from tests.linter.utils import RuleAcceptance
 
 class TestRuleAcceptance(RuleAcceptance):
     def test_rule(self):
-        self.check_rule(src_files=["."], expected_file="expected_output.txt", project_check=True)
+        self.check_rule(
+            src_files=["."], expected_file="expected_output.txt", project_check=True, exclude=["components"]
+        )
 
     def test_extended(self):
         self.check_rule(
@@ -11,6 +13,7 @@ class TestRuleAcceptance(RuleAcceptance):
             expected_file="expected_extended.txt",
             output_format="extended",
             project_check=True,
+            exclude=["components"],
         )
 
     def test_no_cycle(self):
@@ -21,3 +24,11 @@ class TestRuleAcceptance(RuleAcceptance):
             project_check=True,
             test_dir=self.test_class_dir / "no_cycle",
         )
+
+    def test_separate_cycles(self):
+        self.check_rule(
+            src_files=["."],
+            expected_file="expected_output.txt",
+            project_check=True,
+            test_dir=self.test_class_dir / "components",
+        )
@@ -0,0 +1,37 @@
+from robocop.config import schema
+from robocop.config.manager import ConfigManager
+from robocop.runtime.resolver import ConfigResolver
+from tests import working_directory
+
+
+def get_config(tmp_path, configure: list[str]):
+    overwrite_config = schema.RawConfig(linter=schema.RawLinterConfig(select=["ALL"], configure=configure))
+    with working_directory(tmp_path):
+        return ConfigManager(overwrite_config=overwrite_config).default_config
+
+
+def test_configurations_do_not_share_rule_parameters(tmp_path):
+    resolver = ConfigResolver(load_rules=True)
+    configured = resolver.resolve_config(
+        get_config(tmp_path, ["line-too-long.line_length=80", "too-long-keyword.severity_threshold=error=50"])
+    )
+    default = resolver.resolve_config(get_config(tmp_path, []))
+
+    assert configured.rules["line-too-long"].line_length == 80
+    assert default.rules["line-too-long"].line_length == 120
+    assert configured.rules["too-long-keyword"].severity_threshold.thresholds
+    assert default.rules["too-long-keyword"].severity_threshold.thresholds is None
+    assert (
+        ConfigResolver(load_rules=True).resolve_config(get_config(tmp_path, [])).rules["line-too-long"].line_length
+        == 120
+    )
+
+
+def test_checkers_are_imported_once(tmp_path):
+    resolver = ConfigResolver(load_rules=True)
+    first = resolver.resolve_config(get_config(tmp_path, ["line-too-long.line_length=80"]))
+    second = resolver.resolve_config(get_config(tmp_path, ["line-too-long.line_length=100"]))
+
+    assert first.rules["line-too-long"] is not second.rules["line-too-long"]
+    assert type(first.rules["line-too-long"]) is type(second.rules["line-too-long"])
+    assert type(first.rules["line-too-long"].checker) is type(second.rules["line-too-long"].checker)
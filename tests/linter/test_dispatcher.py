@@ -0,0 +1,187 @@
+import functools
+from pathlib import Path
+
+import pytest
+from robot.api.parsing import ModelVisitor
+
+from robocop.config import schema
+from robocop.config.manager import ConfigManager
+from robocop.config.schema import Config
+from robocop.linter.dispatcher import CheckerDispatcher, can_be_dispatched
+from robocop.linter.rules import VisitorChecker
+from robocop.runtime.resolver import ConfigResolver
+from robocop.source_file import SourceFile
+
+LINTER_TESTS_DIR = Path(__file__).parent
+TEST_FILES = sorted(
+    path
+    for path in (LINTER_TESTS_DIR / "rules").glob("**/*.robot")
+    if "actual_fixed" not in path.parts and "expected_fixed" not in path.parts
+)
+
+
+@pytest.fixture(scope="module")
+def config() -> Config:
+    overwrite_config = schema.RawConfig(linter=schema.RawLinterConfig(select=["ALL"]))
+    return ConfigManager(sources=[str(LINTER_TESTS_DIR)], overwrite_config=overwrite_config).default_config
+
+
+@pytest.fixture(scope="module")
+def checkers(config) -> list:
+    return ConfigResolver(load_rules=True).resolve_config(config).checkers
+
+
+def scan_separately(checkers: list, source_file: SourceFile) -> dict[str, list[tuple]]:
+    return {type(checker).__name__: to_comparable(checker.scan_file(source_file)) for checker in checkers}
+
+
+def to_comparable(diagnostics) -> list[tuple]:
+    return [
+        (diag.rule.rule_id, diag.range.start.line, diag.range.start.character, diag.message) for diag in diagnostics
+    ]
+
+
+@pytest.mark.parametrize("source", TEST_FILES, ids=lambda path: str(path.relative_to(LINTER_TESTS_DIR)))
+def test_dispatcher_finds_the_same_issues(source: Path, config, checkers):
+    source_file = SourceFile(path=source, config=config)
+    try:
+        source_file.model  # noqa: B018
+    except Exception:  # noqa: BLE001
+        pytest.skip("File cannot be parsed with installed Robot Framework version")
+    dispatched_checkers = [checker for checker in checkers if can_be_dispatched(checker)]
+    expected = scan_separately(dispatched_checkers, source_file)
+
+    dispatched = CheckerDispatcher(checkers).scan_file(source_file)
+
+    actual = {type(checker).__name__: to_comparable(dispatched[id(checker)]) for checker in dispatched_checkers}
+    assert actual == expected
+
+
+class _RecordingChecker(VisitorChecker):
+    single_pass = True
+
+    def __init__(self) -> None:
+        self.rules = {}
+        self.visited: list[str] = []
+        super().__init__()
+
+
+class ChildrenLastChecker(_RecordingChecker):
+    def visit_Section(self, node):  # noqa: N802
+        self.visited.append(type(node).__name__)
+        self.generic_visit(node)
+
+    def visit_TestCase(self, node):  # noqa: N802
+        self.visited.append(node.name)
+
+    def visit_KeywordCall(self, node):  # noqa: N802
+        self.visited.append(node.keyword)
+
+
+class ChildrenFirstChecker(_RecordingChecker):
+    def visit_TestCase(self, node):  # noqa: N802
+        self.generic_visit(node)
+        self.visited.append(f"after {node.name}")
+
+    def visit_KeywordCall(self, node):  # noqa: N802
+        self.visited.append(node.keyword)
+
+
+def recorded(method):
+    @functools.wraps(method)
+    def wrapper(self, node):
+        self.visited.append("decorated")
+        return method(self, node)
+
+    return wrapper
+
+
+class DecoratedChecker(_RecordingChecker):
+    @recorded
+    def visit_TestCase(self, node):  # noqa: N802
+        self.generic_visit(node)
+        self.visited.append(f"after {node.name}")
+
+    def visit_KeywordCall(self, node):  # noqa: N802
+        self.visited.append(node.keyword)
+
+
+class NotSinglePassChecker(ChildrenLastChecker):
+    single_pass = False
+
+
+class CustomScanChecker(_RecordingChecker):
+    def scan_file(self, source_file, templated=False, **kwargs):  # noqa: ARG002
+        return []
+
+
+class CustomGenericVisitChecker(_RecordingChecker):
+    def generic_visit(self, node):
+        ModelVisitor.generic_visit(self, node)
+
+
+def scan_model(tmp_path: Path, config: Config, checkers: list) -> None:
+    source = tmp_path / "test.robot"
+    source.write_text(
+        "*** Test Cases ***\nFirst\n    Keyword 1\n\nSecond\n    Keyword 2\n\n"
+        "*** Keywords ***\nKeyword\n    Nested Keyword\n",
+        encoding="utf-8",
+    )
+    CheckerDispatcher(checkers).scan_file(SourceFile(path=source, config=config))
+
+
+def test_dispatcher_skips_children_not_visited_by_checker(tmp_path, config):
+    checker = ChildrenLastChecker()
+
+    scan_model(tmp_path, config, [checker])
+
+    assert checker.visited == ["TestCaseSection", "First", "Second", "KeywordSection", "Nested Keyword"]
+
+
+def test_dispatcher_keeps_order_of_visits_done_by_checker(tmp_path, config):
+    checker = ChildrenFirstChecker()
+    other = ChildrenLastChecker()
+
+    scan_model(tmp_path, config, [checker, other])
+
+    assert checker.visited == ["Keyword 1", "after First", "Keyword 2", "after Second", "Nested Keyword"]
+    assert other.visited == ["TestCaseSection", "First", "Second", "KeywordSection", "Nested Keyword"]
+
+
+def test_dispatcher_follows_decorated_visitor_methods(tmp_path, config):
+    checker = DecoratedChecker()
+
+    scan_model(tmp_path, config, [checker, ChildrenLastChecker()])
+
+    assert checker.visited == [
+        "decorated",
+        "Keyword 1",
+        "after First",
+        "decorated",
+        "Keyword 2",
+        "after Second",
+        "Nested Keyword",
+    ]
+
+
+def test_only_single_pass_checkers_are_dispatched():
+    checkers = [ChildrenLastChecker(), NotSinglePassChecker(), CustomScanChecker(), CustomGenericVisitChecker()]
+
+    dispatcher = CheckerDispatcher(checkers)
+
+    assert checkers[0] in dispatcher
+    assert checkers[1] not in dispatcher
+    assert checkers[2] not in dispatcher
+    assert checkers[3] not in dispatcher
+
+
+def test_dispatched_checker_can_be_scanned_separately(tmp_path, config):
+    checker = ChildrenFirstChecker()
+    scan_model(tmp_path, config, [checker])
+    dispatched_visits = checker.visited
+    checker.visited = []
+
+    checker.scan_file(SourceFile(path=tmp_path / "test.robot", config=config))
+
+    assert checker.dispatched_children is None
+    assert checker.visited == dispatched_visits
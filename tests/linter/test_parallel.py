@@ -0,0 +1,130 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from textwrap import dedent
+
+import pytest
+
+from robocop.config.manager import ConfigManager
+from robocop.config.schema import RawCacheConfig, RawConfig
+from robocop.linter import runner
+from robocop.linter.fix import FixApplier
+from robocop.run import check_files
+from robocop.runtime.parallel import resolve_jobs
+from tests import working_directory
+
+SUITE = dedent("""
+    *** Test Cases ***
+    Test {index}
+        #comment without space
+        Keyword {index}    ${{argument}}
+
+
+    *** Keywords ***
+    Keyword {index}
+        [Arguments]    ${{arg}}
+        Log    ${{arg}}
+    """).lstrip()
+
+
+def create_project(path: Path, files: int = 6) -> None:
+    path.mkdir(parents=True, exist_ok=True)
+    for index in range(files):
+        (path / f"suite_{index}.robot").write_text(SUITE.format(index=index), encoding="utf-8")
+    (path / "invalid.robot").write_bytes(b"*** Test Cases ***\nTest\n    Log    \xff\xfe\n")
+
+
+def lint(path: Path, **kwargs) -> list[tuple[str, str, int, int, str, str]]:
+    with working_directory(path):
+        diagnostics = check_files(return_result=True, silent=True, cache=False, **kwargs)
+    return [
+        (
+            diagnostic.source.path.name,
+            diagnostic.rule.rule_id,
+            diagnostic.range.start.line,
+            diagnostic.range.start.character,
+            diagnostic.severity.value,
+            diagnostic.message,
+        )
+        for diagnostic in diagnostics
+    ]
+
+
+class TestParallelLinting:
+    def test_results_do_not_depend_on_jobs(self, tmp_path: Path):
+        create_project(tmp_path)
+
+        sequential = lint(tmp_path, jobs=1)
+        parallel = lint(tmp_path, jobs=2)
+
+        assert sequential
+        assert parallel == sequential
+
+    def test_fix_in_parallel(self, tmp_path: Path):
+        create_project(tmp_path / "sequential")
+        create_project(tmp_path / "parallel")
+
+        sequential = lint(tmp_path / "sequential", jobs=1, fix=True)
+        parallel = lint(tmp_path / "parallel", jobs=2, fix=True)
+
+        assert parallel == sequential
+        for index in range(6):
+            fixed = (tmp_path / "parallel" / f"suite_{index}.robot").read_text(encoding="utf-8")
+            assert "# comment without space" in fixed
+            assert fixed == (tmp_path / "sequential" / f"suite_{index}.robot").read_text(encoding="utf-8")
+
+    def test_results_are_returned_before_all_files_are_checked(self, tmp_path: Path, monkeypatch):
+        create_project(tmp_path)
+        with working_directory(tmp_path):
+            config_manager = ConfigManager(
+                overwrite_config=RawConfig(jobs=2, cache=RawCacheConfig(enabled=False), silent=True)
+            )
+            expected = [source_file.path.name for source_file in config_manager.paths]
+        first_returned = threading.Event()
+        check_file = runner.check_file
+
+        def check_after_first_result(source_file, **kwargs):
+            if source_file.path.name == expected[-1] and not first_returned.wait(timeout=10):
+                pytest.fail("The first result was not returned while the last file was checked")
+            return check_file(source_file, **kwargs)
+
+        # threads instead of processes, so the check can wait for the result returned in the test
+        monkeypatch.setattr(runner, "create_executor", lambda jobs: ThreadPoolExecutor(max_workers=jobs))
+        monkeypatch.setattr(runner, "check_file", check_after_first_result)
+        with working_directory(tmp_path):
+            results = runner.RobocopLinter(config_manager).check_files(FixApplier())
+            first_file, *_ = next(results)
+            first_returned.set()
+            checked = [first_file.path.name] + [source_file.path.name for source_file, *_ in results]
+
+        assert checked == expected
+
+    def test_cache_is_written_by_main_process(self, tmp_path: Path):
+        create_project(tmp_path)
+
+        with working_directory(tmp_path):
+            first = check_files(return_result=True, silent=True, jobs=2)
+            second = check_files(return_result=True, silent=True, jobs=2, verbose=True)
+
+        assert [(diag.rule.rule_id, diag.source.path) for diag in first] == [
+            (diag.rule.rule_id, diag.source.path) for diag in second
+        ]
+
+
+@pytest.mark.parametrize(
+    ("jobs", "files", "expected"),
+    [
+        (1, 100, 1),
+        (4, 100, 4),
+        (4, 3, 1),
+        (4, 4, 2),
+        (8, 0, 1),
+    ],
+)
+def test_resolve_jobs(jobs, files, expected):
+    assert resolve_jobs(jobs, files) == expected
+
+
+def test_resolve_jobs_uses_all_cpus(monkeypatch):
+    monkeypatch.setattr("os.cpu_count", lambda: 3)
+    assert resolve_jobs(0, 100) == 3
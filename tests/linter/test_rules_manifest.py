@@ -0,0 +1,88 @@
+import json
+
+import pytest
+
+from robocop.config import schema
+from robocop.config.manager import ConfigManager
+from robocop.linter import rules_manifest
+from robocop.linter.rules import RuleSeverity
+from robocop.runtime.resolver import ConfigResolver
+from tests import working_directory
+
+
+def test_manifest_is_up_to_date():
+    manifest = json.loads(rules_manifest.MANIFEST_PATH.read_text(encoding="utf-8"))
+
+    assert manifest == rules_manifest.build_manifest(), (
+        "Rules manifest is outdated. Regenerate it with: python -m robocop.linter.rules_manifest"
+    )
+
+
+def resolve(tmp_path, lazy_rules: bool, **linter_config):
+    overwrite_config = schema.RawConfig(linter=schema.RawLinterConfig(**linter_config))
+    with working_directory(tmp_path):
+        config = ConfigManager(overwrite_config=overwrite_config).default_config
+    return ConfigResolver(load_rules=True, lazy_rules=lazy_rules).resolve_config(config)
+
+
+def describe(resolved_config) -> tuple:
+    """Describe what would be reported with the resolved configuration."""
+    enabled_rules = {
+        (
+            rule.rule_id,
+            rule.severity,
+            rule.fixable,
+            tuple(sorted((name, str(param.value)) for name, param in rule.config.items())),
+        )
+        for rule in resolved_config.rules.values()
+        if rule.enabled
+    }
+    checkers = [
+        [type(checker).__name__ for checker in checkers]
+        for checkers in (resolved_config.checkers, resolved_config.after_run_checkers, resolved_config.project_checkers)
+    ]
+    return enabled_rules, checkers
+
+
+@pytest.mark.parametrize(
+    "linter_config",
+    [
+        {},
+        {"select": ["line-too-long"]},
+        {"select": ["ALL"], "ignore": ["NAME*", "too-long-keyword"]},
+        {"select": ["PROJECT"]},
+        {"extend_select": ["unused-keyword", "DOC*"]},
+        {"threshold": RuleSeverity.ERROR},
+        {"threshold": RuleSeverity.ERROR, "configure": ["line-too-long.severity=E"]},
+        {"select": ["line-too-long", "not-existing-rule"], "ignore": ["too-long-keyword"]},
+        {"select": ["too-long-keyword"], "configure": ["too-long-keyword.max_len=5", "LEN08.severity=E"]},
+        {"unfixable": ["unused-variable"], "select": ["unused-variable", "ALL"]},
+    ],
+)
+def test_lazy_loading_enables_same_rules(tmp_path, capsys, linter_config):
+    expected = describe(resolve(tmp_path, lazy_rules=False, **linter_config))
+    expected_output = capsys.readouterr()
+
+    assert describe(resolve(tmp_path, lazy_rules=True, **linter_config)) == expected
+    assert capsys.readouterr() == expected_output
+
+
+def test_lazy_loading_imports_only_selected_checkers(tmp_path):
+    manifest = rules_manifest.load_manifest()
+    modules = {module for rule in manifest for module in rule.modules if rule.name == "line-too-long"}
+
+    resolved_config = resolve(tmp_path, lazy_rules=True, select=["line-too-long"])
+
+    assert {type(rule.checker).__module__ for rule in resolved_config.rules.values()} == modules
+    assert {rule.name for rule in resolved_config.rules.values() if rule.enabled} == {"line-too-long"}
+
+
+def test_outdated_manifest_loads_all_rules(tmp_path, monkeypatch):
+    monkeypatch.setattr(rules_manifest, "sources_hash", lambda: "outdated")
+
+    assert rules_manifest.load_manifest() is None
+    resolved_config = resolve(tmp_path, lazy_rules=True, select=["line-too-long"])
+
+    assert len({rule.rule_id for rule in resolved_config.rules.values()}) == len(
+        rules_manifest.build_manifest()["rules"]
+    )
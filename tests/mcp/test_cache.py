@@ -1,6 +1,8 @@
 """Tests for MCP caching module."""
 
-from robocop.mcp.cache import clear_cache, get_formatter_config, get_linter_config
+import tempfile
+
+from robocop.mcp.cache import clear_cache, get_formatter_config, get_lint_session, get_linter_config
 
 
 class TestCache:
@@ -38,3 +40,54 @@ class TestCache:
         clear_cache()
         config2 = get_linter_config(None)
         assert config1 is not config2
+
+
+class TestLintSession:
+    """Tests for the cached lint sessions."""
+
+    def teardown_method(self):
+        """Clear cache after each test."""
+        clear_cache()
+
+    def test_session_cached_by_options(self):
+        """Test that the session is reused only for the same options."""
+        session = get_lint_session(None, ("LEN*",), None, None, "I")
+        assert get_lint_session(None, ("LEN*",), None, None, "I") is session
+        assert get_lint_session(None, ("NAME*",), None, None, "I") is not session
+        assert get_lint_session(None, ("LEN*",), None, None, "E") is not session
+
+    def test_clear_cache_resets_sessions(self):
+        """Test that clear_cache allows new sessions to be created."""
+        session = get_lint_session(None, None, None, None, "I")
+        clear_cache()
+        assert get_lint_session(None, None, None, None, "I") is not session
+
+    def test_lint_content_in_memory(self, tmp_path, monkeypatch):
+        """Test that content is linted without writing it to the disk."""
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        session = get_lint_session(None, ("NAME18",), None, None, "I")
+
+        diagnostics = session.lint_content("*** Test Cases ***\nTest\n    log  1\n", "stdin.robot")
+
+        assert [diagnostic.rule.rule_id for diagnostic in diagnostics] == ["NAME18"]
+        assert list(tmp_path.iterdir()) == []
+
+    def test_lint_content_without_newline(self, tmp_path, monkeypatch):
+        """Test that content without a newline is not taken for a path."""
+        monkeypatch.chdir(tmp_path)
+        session = get_lint_session(None, None, None, None, "I")
+
+        empty = session.lint_content("", "stdin.robot")
+        settings = session.lint_content("*** Settings ***", "stdin.robot")
+
+        assert [diagnostic.rule.rule_id for diagnostic in empty] == ["DOC03"]
+        assert "DOC03" in {diagnostic.rule.rule_id for diagnostic in settings}
+
+    def test_lint_file_uses_closest_config(self, tmp_path):
+        """Test that the configuration file next to the linted file is used."""
+        (tmp_path / "pyproject.toml").write_text('[tool.robocop.lint]\nselect = ["NAME18"]\n')
+        source = tmp_path / "test.robot"
+        source.write_text("*** Test Cases ***\nTest\n    log  1\n")
+        session = get_lint_session(None, None, None, None, "I")
+
+        assert [diagnostic.rule.rule_id for diagnostic in session.lint_file(source)] == ["NAME18"]
@@ -0,0 +1,500 @@
+"""
+Benchmark suite running Robocop on generated projects of growing size.
+
+Usage::
+
+    python -m tests.performance.benchmark run [--sizes 25,50,100] [--scale suites] [--runs 3] [--baseline PATH]
+    python -m tests.performance.benchmark run --scale resources --cross-imports 3 --scenarios import_graph
+    python -m tests.performance.benchmark run --scenarios lint_cold,lint_per_checker
+    python -m tests.performance.benchmark compare BASELINE CURRENT [--threshold 0.2]
+
+Projects are generated with ``tests.performance.project_generator``, once for every size. The ``--scale`` option
+selects the ``ProjectSpec`` parameter set to the size: the number of suites (``suites``), the size of the suites
+(``tests_per_suite``), the number of resources on every import level (``resources``), the import fan-out
+(``resources_per_suite``) or the depth of the imports (``import_depth``). With ``--cross-imports`` every resource
+also imports other resources from its level, which turns the imports into a large graph with cycles.
+
+Every scenario is measured in a fresh Python process, on a fresh copy of the project, so the runs do not share
+imported modules, loaded rules or the cache. The median time of the runs and the peak memory usage (RSS) of the
+process are reported. Scenarios:
+
+- ``lint_cold``: lint with all rules and without the cache,
+- ``lint_per_checker``: the same as ``lint_cold``, but with every visitor checker walking the model with its own
+  ``scan_file`` instead of the single walk of the ``CheckerDispatcher``,
+- ``lint_warm``: lint with all rules, with the cache filled by the previous run,
+- ``format``: format all files without saving them,
+- ``fix``: lint with all rules and apply the fixes,
+- ``project_rules``: run only the project rules, without importing the libraries,
+- ``library_loading``: import every library used in the project,
+- ``import_graph``: run only the rules walking the resource import graph (``circular-import``).
+
+If both ``lint_cold`` and ``lint_per_checker`` are run, the same generated project is linted with and without the
+dispatcher, and both times are reported next to each other.
+
+The time of every checker is measured separately (with the same timings as the ``timings`` report), to catch the
+checkers that slow down the most when the project grows.
+
+A complexity exponent is fitted to the times of every scenario and checker: 1 means the time grows linearly with the
+size, 2 means it grows quadratically. The report is saved to ``reports/benchmark`` and can be compared with the
+baseline. The comparison fails if any scenario is slower (or uses more memory) than the threshold allows, or if the
+fitted exponent exceeds the limit and did not exceed it in the baseline. Timings depend on the machine, so the
+baseline should be generated on the same machine as the compared report.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import math
+import platform
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+from robocop import __version__
+from tests import working_directory
+from tests.performance.project_generator import ProjectSpec, generate_project
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+BENCHMARK_REPORTS = Path(__file__).parent / "reports" / "benchmark"
+SCALES = ("suites", "tests_per_suite", "resources", "resources_per_suite", "import_depth")
+DEFAULT_SIZES = (25, 50, 100)
+MIN_SECONDS = 0.05
+"""Differences shorter than this are treated as noise."""
+
+
+def cache_options(work_dir: Path, enabled: bool) -> dict:
+    return {"cache": enabled, "cache_dir": work_dir / "cache"}
+
+
+def lint_files(project: Path, work_dir: Path, cache: bool = False, **kwargs) -> None:
+    from robocop.run import check_files  # noqa: PLC0415
+
+    with working_directory(project):
+        check_files(
+            return_result=True,
+            select=["ALL"],
+            silent=True,
+            ignore_file_config=True,
+            **cache_options(work_dir, enabled=cache),
+            **kwargs,
+        )
+
+
+def lint_cold(project: Path, work_dir: Path) -> None:
+    lint_files(project, work_dir)
+
+
+def lint_per_checker(project: Path, work_dir: Path) -> None:
+    from robocop.linter import dispatcher  # noqa: PLC0415
+
+    # no checker is dispatched, so every checker is scanned with its own scan_file as before the single walk
+    with patch.object(dispatcher, "can_be_dispatched", return_value=False):
+        lint_files(project, work_dir)
+
+
+def lint_warm(project: Path, work_dir: Path) -> None:
+    lint_files(project, work_dir, cache=True)
+
+
+def format_project(project: Path, work_dir: Path) -> None:
+    from robocop.run import format_files  # noqa: PLC0415
+
+    with working_directory(project):
+        format_files(
+            overwrite=False,
+            return_result=True,
+            silent=True,
+            ignore_file_config=True,
+            **cache_options(work_dir, enabled=False),
+        )
+
+
+def fix(project: Path, work_dir: Path) -> None:
+    lint_files(project, work_dir, fix=True)
+
+
+def project_rules(project: Path, work_dir: Path) -> None:
+    from robocop.run import check_files  # noqa: PLC0415
+
+    with working_directory(project):
+        check_files(
+            return_result=True,
+            select=["PROJECT"],
+            analyze_libraries=False,
+            silent=True,
+            ignore_file_config=True,
+            **cache_options(work_dir, enabled=False),
+        )
+
+
+def import_graph(project: Path, work_dir: Path) -> None:
+    from robocop.run import check_files  # noqa: PLC0415
+
+    with working_directory(project):
+        check_files(
+            return_result=True,
+            select=["circular-import"],
+            analyze_libraries=False,
+            silent=True,
+            ignore_file_config=True,
+            **cache_options(work_dir, enabled=False),
+        )
+
+
+def library_loading(project: Path, work_dir: Path) -> None:  # noqa: ARG001
+    from robocop.project.libraries import LibraryLoader, LibraryRequest  # noqa: PLC0415
+
+    library_import = re.compile(r"^Library\s{2,}(\S+)", re.MULTILINE)
+    libraries = {
+        name
+        for path in project.rglob("*.resource")
+        for name in library_import.findall(path.read_text(encoding="utf-8"))
+    }
+    loader = LibraryLoader(project_root=project)
+    for name in sorted(libraries):
+        loader.load(LibraryRequest(name=name))
+
+
+SCENARIOS: dict[str, Callable[[Path, Path], None]] = {
+    "lint_cold": lint_cold,
+    "lint_per_checker": lint_per_checker,
+    "lint_warm": lint_warm,
+    "format": format_project,
+    "fix": fix,
+    "project_rules": project_rules,
+    "library_loading": library_loading,
+    "import_graph": import_graph,
+}
+SETUPS: dict[str, Callable[[Path, Path], None]] = {"lint_warm": lint_warm}
+"""Scenarios prepared by running the setup in a separate process first."""
+
+
+def peak_rss_mb() -> float | None:
+    """Return the peak memory usage of the current process, in megabytes."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024  # bytes on macOS, kilobytes on Linux
+
+
+def measure(scenario: str, project: Path, work_dir: Path, result_path: Path, collect_timings: bool) -> None:
+    """Run the scenario in the current process and save its time, peak memory and optionally checker timings."""
+    from robocop.runtime import timings  # noqa: PLC0415
+
+    if collect_timings:
+        timings.start_timings()
+    start = time.perf_counter()
+    SCENARIOS[scenario](project, work_dir)
+    seconds = time.perf_counter() - start
+    result = {"seconds": seconds, "peak_rss_mb": peak_rss_mb()}
+    collected = timings.stop_timings()
+    if collected is not None:
+        result["checkers"] = {name: timing.seconds for name, timing in collected.checkers.items()}
+    result_path.write_text(json.dumps(result), encoding="utf-8")
+
+
+def run_in_process(scenario: str, project: Path, work_dir: Path, collect_timings: bool = False) -> dict:
+    """Run the scenario in a fresh Python process and return its measurements."""
+    result_path = work_dir / "result.json"
+    command = [sys.executable, "-m", "tests.performance.benchmark", "measure", scenario, str(project), str(work_dir)]
+    if collect_timings:
+        command.append("--timings")
+    subprocess.run(command, check=True, cwd=Path(__file__).parent.parent.parent)  # noqa: S603
+    return json.loads(result_path.read_text(encoding="utf-8"))
+
+
+def run_scenario(scenario: str, source: Path, runs: int, collect_timings: bool = False) -> dict:
+    """
+    Run the scenario several times, every time on a fresh copy of the project.
+
+    Returns:
+        Median time, peak memory usage and, if collected, the median time of every checker.
+
+    """
+    results = []
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            work_dir = Path(temp_dir)
+            project = work_dir / "project"
+            shutil.copytree(source, project)
+            if scenario in SETUPS:
+                subprocess.run(  # noqa: S603
+                    [
+                        sys.executable,
+                        "-m",
+                        "tests.performance.benchmark",
+                        "setup",
+                        scenario,
+                        str(project),
+                        str(work_dir),
+                    ],
+                    check=True,
+                    cwd=Path(__file__).parent.parent.parent,
+                )
+            results.append(run_in_process(scenario, project, work_dir, collect_timings))
+    summary = {
+        "seconds": statistics.median(result["seconds"] for result in results),
+        "peak_rss_mb": max((result["peak_rss_mb"] for result in results), default=None),
+    }
+    if collect_timings:
+        checkers = {name for result in results for name in result.get("checkers", {})}
+        summary["checkers"] = {
+            name: statistics.median(result.get("checkers", {}).get(name, 0.0) for result in results)
+            for name in checkers
+        }
+    return summary
+
+
+def fit_exponent(sizes: list[int], seconds: list[float], constant_part: bool = True) -> float | None:
+    """
+    Fit ``seconds = constant + factor * size ** exponent`` with the least squares.
+
+    The constant part of the scenarios (starting Python, loading the rules) does not depend on the size, so it is
+    fitted separately - otherwise it would hide how fast the rest grows. The exponent is searched between 0.01 and 3,
+    with the constant and the factor calculated for every candidate. Checkers do not have the constant part, so
+    their exponent is the slope of the logarithms of the times and sizes.
+
+    Returns:
+        Fitted exponent, or None if there is not enough data or the time does not grow steadily enough to fit it.
+
+    """
+    points = sorted((size, value) for size, value in zip(sizes, seconds, strict=True) if size > 0 and value > 0)
+    if len({size for size, _ in points}) < 2 or max(seconds) - min(seconds) < MIN_SECONDS:
+        return None
+    if any(current < previous for (_, previous), (_, current) in itertools.pairwise(points)):
+        return None  # the time is dominated by the noise, not by the size
+    if not constant_part or len(points) == 2:  # two points are not enough to separate the constant part
+        return least_squares_slope([(math.log(size), math.log(value)) for size, value in points])[0]
+    best_error, best_exponent = math.inf, None
+    for step in range(1, 301):
+        exponent = step / 100
+        scaled = [(size**exponent, value) for size, value in points]
+        factor, constant = least_squares_slope(scaled)
+        if factor <= 0:
+            continue
+        error = sum((constant + factor * x - value) ** 2 for x, value in scaled)
+        if error < best_error:
+            best_error, best_exponent = error, exponent
+    return best_exponent
+
+
+def least_squares_slope(points: list[tuple[float, float]]) -> tuple[float, float]:
+    """
+    Fit the line to the points.
+
+    Returns:
+        Slope and intercept of the line.
+
+    """
+    mean_x = statistics.fmean(x for x, _ in points)
+    mean_y = statistics.fmean(y for _, y in points)
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in points) / sum((x - mean_x) ** 2 for x, _ in points)
+    return slope, mean_y - slope * mean_x
+
+
+def run_benchmark(spec: ProjectSpec, scale: str, sizes: list[int], scenarios: list[str], runs: int) -> dict:
+    """
+    Run the scenarios on the projects of every size.
+
+    Returns:
+        Benchmark report.
+
+    """
+    report: dict = {
+        "robocop_version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "spec": spec.to_dict(),
+        "scale": scale,
+        "sizes": sizes,
+        "runs": runs,
+        "scenarios": {scenario: {"seconds": [], "peak_rss_mb": []} for scenario in scenarios},
+        "checkers": {},
+    }
+    for index, size in enumerate(sizes):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            project = generate_project(spec.scaled(scale, size), Path(temp_dir) / "project")
+            for scenario in scenarios:
+                print(f"{scenario} ({scale}={size})", flush=True)
+                result = run_scenario(scenario, project, runs)
+                report["scenarios"][scenario]["seconds"].append(result["seconds"])
+                report["scenarios"][scenario]["peak_rss_mb"].append(result["peak_rss_mb"])
+            # checkers are measured in separate runs, so that measuring them does not slow down the scenarios
+            print(f"checkers ({scale}={size})", flush=True)
+            checkers = run_scenario("lint_cold", project, runs, collect_timings=True)["checkers"]
+            for name, seconds in checkers.items():
+                checker_seconds = report["checkers"].setdefault(name, {"seconds": [0.0] * len(sizes)})["seconds"]
+                checker_seconds[index] = seconds
+    for timing in report["scenarios"].values():
+        timing["exponent"] = fit_exponent(sizes, timing["seconds"])
+    for timing in report["checkers"].values():
+        timing["exponent"] = fit_exponent(sizes, timing["seconds"], constant_part=False)
+    return report
+
+
+def compare_reports(
+    baseline: dict, current: dict, threshold: float, memory_threshold: float, max_exponent: float
+) -> list[str]:
+    """
+    Compare the report with the baseline.
+
+    Returns:
+        Description of every regression. Empty if there is no regression.
+
+    """
+    regressions = []
+    baseline_sizes = baseline.get("sizes", []) if baseline.get("scale") == current["scale"] else []
+    for scenario, timing in current["scenarios"].items():
+        baseline_timing = baseline.get("scenarios", {}).get(scenario)
+        for index, size in enumerate(current["sizes"]):
+            if baseline_timing is None or size not in baseline_sizes:
+                continue
+            baseline_index = baseline_sizes.index(size)
+            seconds, baseline_seconds = timing["seconds"][index], baseline_timing["seconds"][baseline_index]
+            if seconds > baseline_seconds * (1 + threshold) and seconds - baseline_seconds > MIN_SECONDS:
+                regressions.append(
+                    f"{scenario} ({current['scale']}={size}) is slower: {seconds:.3f}s, "
+                    f"baseline {baseline_seconds:.3f}s"
+                )
+            memory, baseline_memory = timing["peak_rss_mb"][index], baseline_timing["peak_rss_mb"][baseline_index]
+            if memory and baseline_memory and memory > baseline_memory * (1 + memory_threshold):
+                regressions.append(
+                    f"{scenario} ({current['scale']}={size}) uses more memory: {memory:.1f}MB, "
+                    f"baseline {baseline_memory:.1f}MB"
+                )
+    for section in ("scenarios", "checkers"):
+        for name, timing in current[section].items():
+            exponent = timing.get("exponent")
+            if exponent is None or exponent <= max_exponent:
+                continue
+            baseline_exponent = baseline.get(section, {}).get(name, {}).get("exponent") if baseline_sizes else None
+            if baseline_exponent is None or baseline_exponent <= max_exponent:  # report only the new growth
+                regressions.append(
+                    f"{name} grows faster than allowed with {current['scale']}: exponent {exponent:.2f}, "
+                    f"limit {max_exponent:.2f}"
+                )
+    return regressions
+
+
+def print_report(report: dict) -> None:
+    sizes = report["sizes"]
+    header = f"{'Scenario':30}" + "".join(f"{f'{size}':>12}" for size in sizes) + f"{'exponent':>10}"
+    print(f"\nBenchmark ({report['scale']}):\n{header}")
+    for section in ("scenarios", "checkers"):
+        timings = sorted(report[section].items(), key=lambda item: -max(item[1]["seconds"]))
+        if section == "checkers":
+            timings = timings[:10]
+            print("Slowest checkers:")
+        for name, timing in timings:
+            exponent = timing.get("exponent")
+            exponent_text = f"{exponent:10.2f}" if exponent is not None else f"{'-':>10}"
+            print(f"{name:30}" + "".join(f"{seconds:11.3f}s" for seconds in timing["seconds"]) + exponent_text)
+    print_dispatcher_comparison(report)
+
+
+def print_dispatcher_comparison(report: dict) -> None:
+    """Print the linting times with and without the checker dispatcher, if both scenarios were run."""
+    dispatched = report["scenarios"].get("lint_cold")
+    per_checker = report["scenarios"].get("lint_per_checker")
+    if dispatched is None or per_checker is None:
+        return
+    print(f"\nChecker dispatcher ({report['scale']}):")
+    for size, dispatched_seconds, per_checker_seconds in zip(
+        report["sizes"], dispatched["seconds"], per_checker["seconds"], strict=True
+    ):
+        print(
+            f"{size:>8}: every checker separately {per_checker_seconds:.3f}s, "
+            f"single walk {dispatched_seconds:.3f}s, speedup {per_checker_seconds / dispatched_seconds:.2f}x"
+        )
+
+
+def check_regressions(baseline_path: Path, current: dict, args: argparse.Namespace) -> int:
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    regressions = compare_reports(baseline, current, args.threshold, args.memory_threshold, args.max_exponent)
+    if not regressions:
+        print(f"\nNo regressions compared to {baseline_path}.")
+        return 0
+    print(f"\nRegressions compared to {baseline_path}:")
+    for regression in regressions:
+        print(f"  {regression}")
+    return 1
+
+
+def add_comparison_options(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown, 0.2 means 20%%")
+    parser.add_argument("--memory-threshold", type=float, default=0.2, help="allowed increase of the peak memory")
+    parser.add_argument("--max-exponent", type=float, default=1.5, help="allowed complexity exponent")
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m tests.performance.benchmark")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run = commands.add_parser("run", help="run the benchmark and save the report")
+    run.add_argument("--sizes", default=",".join(str(size) for size in DEFAULT_SIZES))
+    run.add_argument("--scale", choices=SCALES, default="suites")
+    run.add_argument("--runs", type=int, default=3)
+    run.add_argument("--scenarios", default=",".join(SCENARIOS))
+    run.add_argument("--cross-imports", type=int, default=0, help="resources imported from the same import level")
+    run.add_argument("--output", type=Path, default=None)
+    run.add_argument("--baseline", type=Path, default=None, help="fail if the report regresses against the baseline")
+    add_comparison_options(run)
+    compare = commands.add_parser("compare", help="compare the saved report with the baseline")
+    compare.add_argument("baseline", type=Path)
+    compare.add_argument("current", type=Path)
+    add_comparison_options(compare)
+    for name in ("measure", "setup"):  # used internally to run the scenario in a fresh process
+        command = commands.add_parser(name)
+        command.add_argument("scenario", choices=SCENARIOS)
+        command.add_argument("project", type=Path)
+        command.add_argument("work_dir", type=Path)
+        command.add_argument("--timings", action="store_true")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str]) -> int:
+    args = parse_args(argv)
+    if args.command == "setup":
+        SETUPS[args.scenario](args.project, args.work_dir)
+        return 0
+    if args.command == "measure":
+        measure(args.scenario, args.project, args.work_dir, args.work_dir / "result.json", args.timings)
+        return 0
+    if args.command == "compare":
+        current = json.loads(args.current.read_text(encoding="utf-8"))
+        print_report(current)
+        return check_regressions(args.baseline, current, args)
+    sizes = [int(size) for size in args.sizes.split(",")]
+    scenarios = args.scenarios.split(",")
+    unknown = [scenario for scenario in scenarios if scenario not in SCENARIOS]
+    if unknown:
+        print(f"Unknown scenarios: {', '.join(unknown)}. Available scenarios: {', '.join(SCENARIOS)}")
+        return 2
+    report = run_benchmark(ProjectSpec(cross_imports=args.cross_imports), args.scale, sizes, scenarios, args.runs)
+    output = args.output or BENCHMARK_REPORTS / f"robocop_{__version__.replace('.', '_')}_{args.scale}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=4), encoding="utf-8")
+    print_report(report)
+    print(f"\nSaved the report to {output}")
+    if args.baseline is not None:
+        return check_regressions(args.baseline, report, args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,170 @@
+"""
+Generate synthetic Robot Framework projects for the benchmarks.
+
+Usage::
+
+    python -m tests.performance.project_generator OUTPUT_DIR [suites]
+
+The shape of the project is described by ``ProjectSpec``: the number and size of the suites, how many resources
+every suite imports, how deep the resources import other resources, how many keywords use embedded arguments and
+which libraries are imported. Generated content is deterministic - the same specification always produces the same
+files - so the benchmark results can be compared between the runs.
+
+Files contain some issues on purpose (missing documentation, comments without a space, keywords in lowercase,
+deprecated settings), so that the linter reports issues and the fix mode has something to fix.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+
+LIBRARY_KEYWORDS = {
+    "Collections": ("Append To List    ${list}    item", "Get From Dictionary    ${dict}    key"),
+    "String": ("Convert To Upper Case    ${value}", "Split String    ${value}    ,"),
+    "OperatingSystem": ("File Should Exist    ${path}", "Join Path    ${path}    file.txt"),
+    "DateTime": ("Get Current Date", "Add Time To Date    ${date}    1 day"),
+    "XML": ("Parse XML    ${xml}", "Get Element Text    ${xml}    tag"),
+    "Process": ("Run Process    echo    ${value}", "Get Process Id"),
+}
+
+
+@dataclass(frozen=True)
+class ProjectSpec:
+    """
+    Shape of the generated project.
+
+    Attributes:
+        suites: Number of the test suite files.
+        tests_per_suite: Number of test cases in every suite, which sets the size of the files.
+        steps_per_test: Number of keyword calls in every test case.
+        resources: Number of the resource files imported directly by the suites, on every import level.
+        resources_per_suite: Number of resources imported by every suite (fan-out of the imports).
+        keywords_per_resource: Number of keywords defined in every resource file.
+        embedded_ratio: Share of the keywords with embedded arguments, from 0 to 1.
+        import_depth: Number of resource levels. Resources import the resources from the next level.
+        cross_imports: Number of resources from the same level imported by every resource. Such imports close the
+            import graph into cycles, reported by the ``circular-import`` rule.
+        libraries: Standard libraries imported by the resources.
+        seed: Seed of the random generator, used to pick the called keywords and the issues.
+
+    """
+
+    suites: int = 50
+    tests_per_suite: int = 10
+    steps_per_test: int = 6
+    resources: int = 10
+    resources_per_suite: int = 3
+    keywords_per_resource: int = 20
+    embedded_ratio: float = 0.1
+    import_depth: int = 2
+    cross_imports: int = 0
+    libraries: tuple[str, ...] = ("Collections", "String", "OperatingSystem")
+    seed: int = 0
+
+    def scaled(self, parameter: str, size: int) -> ProjectSpec:
+        """Return the copy of the specification with the parameter set to given size."""
+        return replace(self, **{parameter: size})
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def keyword_name(spec: ProjectSpec, level: int, resource: int, keyword: int) -> tuple[str, str]:
+    """
+    Return the name of the keyword definition and the name used to call it.
+
+    Returns:
+        Tuple of the definition name and the call.
+
+    """
+    if (resource * spec.keywords_per_resource + keyword) % 100 < spec.embedded_ratio * 100:
+        name = f"Open Page ${{page}} In Level {level} Resource {resource} Number {keyword}"
+        return name, name.replace("${page}", f"home_{keyword}")
+    name = f"Level {level} Resource {resource} Keyword {keyword}"
+    return name, name
+
+
+def call_line(spec: ProjectSpec, level: int, resource: int, keyword: int, argument: str) -> str:
+    name, call = keyword_name(spec, level, resource, keyword)
+    if "${page}" in name:  # embedded arguments are passed in the name
+        return f"    {call}"
+    return f"    {call}    {argument}"
+
+
+def resource_content(spec: ProjectSpec, level: int, resource: int, rng: random.Random) -> str:
+    lines = ["*** Settings ***", f"Documentation    Resource {resource} on the level {level}."]
+    if level + 1 < spec.import_depth:
+        lines.append(f"Resource    ../level_{level + 1}/resource_{resource}.resource")
+    cross_imported = sorted({(resource + offset) % spec.resources for offset in range(1, spec.cross_imports + 1)})
+    lines.extend(f"Resource    resource_{other}.resource" for other in cross_imported if other != resource)
+    lines.extend(f"Library    {library}" for library in spec.libraries)
+    lines.extend(["", "", "*** Variables ***", "${VALUE}    value", "${path}    ${CURDIR}", "", "", "*** Keywords ***"])
+    library_calls = [call for library in spec.libraries for call in LIBRARY_KEYWORDS.get(library, ())]
+    for keyword in range(spec.keywords_per_resource):
+        name, _ = keyword_name(spec, level, resource, keyword)
+        lines.append(name)
+        if keyword % 3:
+            lines.append(f"    [Documentation]    Keyword {keyword}.")
+        lines.append("    Log    ${page}" if "${page}" in name else "    [Arguments]    ${value}=default")
+        if level + 1 < spec.import_depth and keyword % 2 == 0:
+            lines.append(call_line(spec, level + 1, resource, keyword, "x"))
+        if library_calls:
+            lines.append(f"    {rng.choice(library_calls)}")
+        if keyword % 5 == 0:
+            lines.append("    #comment without space")
+        lines.append("    log    ${VALUE}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def suite_content(spec: ProjectSpec, suite: int, rng: random.Random) -> str:
+    imported = sorted({(suite + offset) % spec.resources for offset in range(spec.resources_per_suite)})
+    lines = ["*** Settings ***", f"Documentation    Suite {suite}."]
+    lines.extend(f"Resource    ../resources/level_0/resource_{resource}.resource" for resource in imported)
+    lines.extend([f"Force Tags    suite_{suite}", "", "", "*** Test Cases ***"])
+    for test in range(spec.tests_per_suite):
+        lines.append(f"Test {test} Of Suite {suite}")
+        if test % 4 == 0:
+            lines.append("    [Documentation]    Test documentation.")
+        lines.append(f"    ${{variable}}    Set Variable    {test}")
+        for _ in range(spec.steps_per_test):
+            resource = rng.choice(imported)
+            lines.append(call_line(spec, 0, resource, rng.randrange(spec.keywords_per_resource), "${variable}"))
+        if test % 3 == 0:
+            lines.append("    IF    ${variable} == 1    log    one")
+        if test % 7 == 0:
+            lines.append("    Missing Keyword In Suite ${variable}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def generate_project(spec: ProjectSpec, directory: Path) -> Path:
+    """
+    Generate the project described by the specification in given directory.
+
+    Returns:
+        Path to the generated project.
+
+    """
+    rng = random.Random(spec.seed)  # noqa: S311
+    for level in range(spec.import_depth):
+        level_dir = directory / "resources" / f"level_{level}"
+        level_dir.mkdir(parents=True, exist_ok=True)
+        for resource in range(spec.resources):
+            content = resource_content(spec, level, resource, rng)
+            (level_dir / f"resource_{resource}.resource").write_text(content, encoding="utf-8")
+    tests_dir = directory / "tests"
+    tests_dir.mkdir(parents=True, exist_ok=True)
+    for suite in range(spec.suites):
+        (tests_dir / f"suite_{suite}.robot").write_text(suite_content(spec, suite, rng), encoding="utf-8")
+    return directory
+
+
+if __name__ == "__main__":
+    output_dir = Path(sys.argv[1])
+    suites = int(sys.argv[2]) if len(sys.argv) > 2 else ProjectSpec.suites
+    generate_project(ProjectSpec(suites=suites), output_dir)
+    print(f"Generated project with {suites} suites in {output_dir}")
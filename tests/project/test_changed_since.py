@@ -0,0 +1,104 @@
+"""Tests for linting only the files changed since the git reference."""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+
+import pytest
+
+from robocop import exceptions
+from robocop.run import check_files
+from robocop.runtime import git
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+RULES = ["keyword-not-found", "unused-keyword", "missing-doc-keyword"]
+
+
+def run_git(repository, *args):
+    subprocess.run(  # noqa: S603
+        ["git", "-c", "user.name=Robocop", "-c", "user.email=robocop@example.com", *args],  # noqa: S607
+        cwd=repository,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def repository(tmp_path):
+    (tmp_path / "common.resource").write_text(
+        "*** Keywords ***\nShared Keyword\n    Log    message\n\nUnused Shared Keyword\n    Log    message\n"
+    )
+    (tmp_path / "uses_common.robot").write_text(
+        "*** Settings ***\nResource    common.resource\n\n"
+        "*** Test Cases ***\nTest\n    Shared Keyword\n    Missing Keyword\n"
+    )
+    (tmp_path / "independent.robot").write_text(
+        "*** Test Cases ***\nTest\n    Other Missing Keyword\n\n*** Keywords ***\nNot Used\n    No Operation\n"
+    )
+    run_git(tmp_path, "init", "-q")
+    run_git(tmp_path, "add", ".")
+    run_git(tmp_path, "commit", "-q", "-m", "Initial commit")
+    return tmp_path
+
+
+def run(repository, **kwargs):
+    return check_files(
+        sources=[repository],
+        select=RULES,
+        root=repository,
+        ignore_file_config=True,
+        return_result=True,
+        cache=False,
+        silent=True,
+        **kwargs,
+    )
+
+
+def issues(diagnostics):
+    return sorted(
+        (diagnostic.source.path.name, diagnostic.rule.name, diagnostic.range.start.line) for diagnostic in diagnostics
+    )
+
+
+def test_changed_files_include_uncommitted_and_untracked(repository):
+    with (repository / "common.resource").open("a") as resource:
+        resource.write("\nNew Keyword\n    No Operation\n")
+    (repository / "new.robot").write_text("*** Test Cases ***\nTest\n    No Operation\n")
+    (repository / ".gitignore").write_text("ignored.robot\n")
+    (repository / "ignored.robot").write_text("")
+
+    assert git.changed_files("HEAD", repository) == {
+        (repository / name).resolve() for name in ("common.resource", "new.robot", ".gitignore")
+    }
+
+
+def test_only_changed_files_and_their_dependants_are_reported(repository):
+    with (repository / "common.resource").open("a") as resource:
+        resource.write("\nNew Keyword\n    No Operation\n")
+    expected = [issue for issue in issues(run(repository)) if issue[0] != "independent.robot"]
+
+    reported = issues(run(repository, changed_since="HEAD"))
+
+    assert reported == expected
+    assert {issue[0] for issue in reported} == {"common.resource", "uses_common.robot"}
+
+
+def test_changes_committed_on_branch_are_found_from_merge_base(repository):
+    run_git(repository, "checkout", "-q", "-b", "feature")
+    (repository / "independent.robot").write_text("*** Test Cases ***\nTest\n    Changed Missing Keyword\n")
+    run_git(repository, "commit", "-q", "-am", "Change")
+
+    reported = issues(run(repository, changed_since="HEAD~1"))
+
+    assert reported == [("independent.robot", "keyword-not-found", 3)]
+
+
+def test_nothing_is_reported_without_changes(repository):
+    assert run(repository, changed_since="HEAD") == []
+
+
+def test_unknown_reference(repository):
+    with pytest.raises(exceptions.FatalError):
+        run(repository, changed_since="not-existing-branch")
@@ -1,7 +1,13 @@
+from pathlib import Path
+
 import pytest
 
 from robocop.config.manager import ConfigManager
-from robocop.project.context import build_project_context
+from robocop.config.schema import RawConfig
+from robocop.linter.checkers.usage import UsedKeywordNames
+from robocop.linter.utils.misc import normalize_robot_name
+from robocop.project.context import KeywordIndex, build_project_context, strongly_connected_components
+from robocop.project.definitions import ImportStatus, KeywordDefinition, Location, embedded_name_pattern
 
 
 @pytest.fixture
@@ -122,6 +128,27 @@ class TestKeywordVisibility:
         assert len(context.resolve_keyword(by_name["Login As bob"])) == 1
 
 
+class TestChangedDependants:
+    def test_imported_by(self, context, project):
+        common = (project / "resources" / "common.resource").resolve()
+        assert context.imported_by() == {common: {(project / "test.robot").resolve()}}
+
+    def test_files_importing_changed_file_are_affected(self, context, project):
+        common = (project / "resources" / "common.resource").resolve()
+        test = (project / "test.robot").resolve()
+        assert context.changed_dependants({common}, set(context.files), {}) == {common, test}
+        assert context.changed_dependants({test}, set(context.files), {}) == {test}
+
+    def test_files_importing_removed_file_are_affected(self, context, project):
+        removed = (project / "resources" / "removed.resource").resolve()
+        test = (project / "test.robot").resolve()
+        assert context.changed_dependants({removed}, set(context.files) | {removed}, {}) == set()
+        assert context.changed_dependants({removed}, set(context.files), {removed: {test}}) == {test}
+
+    def test_file_not_imported_by_project_is_not_known(self, context, project):
+        assert context.changed_dependants({project / "variables.py"}, set(context.files), {}) is None
+
+
 class TestUsageArguments:
     def test_arguments_are_collected(self, context, project):
         usages = context.get_file(project / "test.robot").usages
@@ -226,3 +253,184 @@ class TestCircularImports:
     def test_usages_are_resolved(self, circular_context):
         usages = [usage for _, usage in circular_context.iter_usages() if usage.name == "Keyword A"]
         assert all(circular_context.resolve_keyword(usage) for usage in usages)
+
+    def test_importing_files(self, circular_context, circular_project):
+        first, *others = circular_context.importing_files(circular_project / "b.resource")
+        assert first.path.name == "b.resource"
+        assert sorted(file.path.name for file in others) == ["a.resource", "test.robot"]
+        importing = circular_context.importing_files(circular_project / "test.robot")
+        assert [file.path.name for file in importing] == ["test.robot"]
+        assert circular_context.importing_files(circular_project / "does_not_exist.robot") == []
+
+    def test_files_in_cycle_share_the_closure(self, circular_context):
+        groups = [sorted(file.path.name for file in group) for group in circular_context.import_closure_groups()]
+        assert sorted(groups) == [["a.resource", "b.resource"], ["self.resource"], ["test.robot"]]
+
+
+class TestImportClosures:
+    def test_long_import_chain(self, tmp_path):
+        """Closures are computed without recursion, so a very long chain of imports is handled."""
+        size = 1500
+        for index in range(size):
+            imported = f"Resource    res_{index + 1}.resource\n" if index + 1 < size else ""
+            (tmp_path / f"res_{index}.resource").write_text(
+                f"*** Settings ***\n{imported}\n*** Keywords ***\nKeyword {index}\n    No Operation\n"
+            )
+        context = rebuild(tmp_path, None)
+        assert len(context.imported_files(tmp_path / "res_0.resource")) == size
+        assert len(context.importing_files(tmp_path / f"res_{size - 1}.resource")) == size
+        assert context.visible_keywords(tmp_path / "res_0.resource").find(f"Keyword {size - 1}")
+
+    def test_strongly_connected_components(self, tmp_path):
+        a, b, c, d = (tmp_path / name for name in "abcd")
+        component_of = strongly_connected_components({a: [b], b: [a, c], c: [d], d: [c]})
+        assert component_of[a] == component_of[b]
+        assert component_of[c] == component_of[d]
+        # imported components are numbered first
+        assert component_of[c] < component_of[a]
+
+
+def rebuild(project, previous, modified=None, **config):
+    config_manager = ConfigManager(
+        sources=[str(project)], root=project, ignore_file_config=True, overwrite_config=RawConfig(**config)
+    )
+    return build_project_context(config_manager, silent=True, previous=previous, modified=modified)
+
+
+@pytest.fixture
+def layered_project(project):
+    """Project from the ``project`` fixture with an extra suite that does not import the common resource."""
+    (project / "other.robot").write_text("*** Test Cases ***\nTest\n    Log    hello\n")
+    return project
+
+
+class TestIncrementalBuild:
+    def test_unchanged_files_are_reused(self, layered_project):
+        previous = rebuild(layered_project, None)
+        context = rebuild(layered_project, previous)
+        for path, project_file in context.files.items():
+            assert project_file.collected is previous.files[path].collected
+            assert project_file.imports is previous.files[path].imports
+
+    def test_changed_file_is_collected_again(self, layered_project):
+        previous = rebuild(layered_project, None)
+        resource = layered_project / "resources" / "common.resource"
+        resource.write_text(resource.read_text() + "\nNew Keyword\n    Log    new\n")
+        context = rebuild(layered_project, previous)
+        assert context.get_file(resource).collected is not previous.get_file(resource).collected
+        assert context.keywords.find("New Keyword")
+
+    def test_visible_keywords_of_dependants_are_computed_again(self, layered_project):
+        previous = rebuild(layered_project, None)
+        suite = layered_project / "test.robot"
+        other = layered_project / "other.robot"
+        old_index = previous.visible_keywords(suite)
+        other_index = previous.visible_keywords(other)
+        resource = layered_project / "resources" / "common.resource"
+        resource.write_text(resource.read_text() + "\nNew Keyword\n    Log    new\n")
+        context = rebuild(layered_project, previous)
+        assert context.visible_keywords(suite) is not old_index
+        assert context.visible_keywords(suite).find("New Keyword")
+        assert context.visible_keywords(other) is other_index
+
+    def test_modified_file_is_collected_again(self, layered_project):
+        previous = rebuild(layered_project, None)
+        suite = (layered_project / "test.robot").resolve()
+        context = rebuild(layered_project, previous, modified={suite})
+        assert context.files[suite].collected is not previous.files[suite].collected
+        other = (layered_project / "other.robot").resolve()
+        assert context.files[other].collected is previous.files[other].collected
+
+    def test_added_file_resolves_missing_import(self, layered_project):
+        previous = rebuild(layered_project, None)
+        (layered_project / "resources" / "missing.resource").write_text(
+            "*** Keywords ***\nFound Keyword\n    Log    found\n"
+        )
+        context = rebuild(layered_project, previous)
+        statuses = {
+            imported.name: imported.status for imported in context.get_file(layered_project / "test.robot").imports
+        }
+        assert statuses["resources/missing.resource"] == ImportStatus.RESOLVED
+        assert context.visible_keywords(layered_project / "test.robot").find("Found Keyword")
+
+    def test_removed_file_is_not_found(self, layered_project):
+        previous = rebuild(layered_project, None)
+        (layered_project / "resources" / "common.resource").unlink()
+        context = rebuild(layered_project, previous)
+        statuses = {
+            imported.name: imported.status for imported in context.get_file(layered_project / "test.robot").imports
+        }
+        assert statuses["resources/common.resource"] == ImportStatus.NOT_FOUND
+        assert not context.visible_keywords(layered_project / "test.robot").find("Common Keyword")
+
+    def test_previous_context_with_different_configuration_is_not_reused(self, layered_project):
+        previous = rebuild(layered_project, None)
+        context = rebuild(layered_project, previous, variables={"NAME": "value"})
+        suite = (layered_project / "test.robot").resolve()
+        assert context.files[suite].collected is not previous.files[suite].collected
+
+    def test_dependants(self, circular_project):
+        context = rebuild(circular_project, None)
+        names = {path.name for path in context.dependants(circular_project / "b.resource")}
+        assert names == {"a.resource", "test.robot"}
+        assert context.dependants(circular_project / "test.robot") == set()
+
+
+class TestEmbeddedKeywordLookup:
+    NAMES = (
+        "Login As ${user}",
+        "Log In As ${user}",
+        "I have ${count:\\d+} apples",
+        "${a} plus ${b}",
+        "${a} plus ${b} equals ${c}",
+        "User ${name} is logged in",
+        "Zażółć ${word}",
+        "Go to ${page} page",
+    )
+    CALLS = (
+        "Login As bob",
+        "login as ANNE",
+        "Log In As admin",
+        "I have 3 apples",
+        "I have many apples",
+        "1 plus 2",
+        "1 plus 2 equals 3",
+        "User bob is logged in",
+        "zażółć gęślą",
+        "Go to main page",
+        "Go to page",
+        "Unknown",
+    )
+
+    @staticmethod
+    def keyword(name, lineno):
+        location = Location(source=Path("keywords.resource"), lineno=lineno, col=1, end_lineno=lineno, end_col=10)
+        return KeywordDefinition(
+            name=name,
+            normalized_name=normalize_robot_name(name),
+            location=location,
+            embedded=embedded_name_pattern(name),
+        )
+
+    def test_index_finds_the_same_keywords_as_matching_all(self):
+        keywords = [self.keyword(name, lineno) for lineno, name in enumerate(self.NAMES, start=1)]
+        index = KeywordIndex()
+        for keyword in keywords:
+            index.add(keyword)
+        for call in self.CALLS:
+            assert index.find(call) == [keyword for keyword in keywords if keyword.matches(call)]
+
+    def test_used_names_find_the_same_keywords_as_matching_all(self):
+        used = UsedKeywordNames()
+        for call in self.CALLS:
+            used.add(call, name_contains_variable=False)
+        for lineno, name in enumerate(self.NAMES, start=1):
+            keyword = self.keyword(name, lineno)
+            assert used.uses(keyword) == any(keyword.matches(call) for call in self.CALLS)
+
+    def test_names_added_after_lookup_are_used(self):
+        used = UsedKeywordNames()
+        keyword = self.keyword("Login As ${user}", 1)
+        assert not used.uses(keyword)
+        used.add("Login As bob", name_contains_variable=False)
+        assert used.uses(keyword)
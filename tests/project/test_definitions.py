@@ -1,4 +1,11 @@
-from robocop.project.definitions import ArgumentsSpec
+import pytest
+
+from robocop.project.definitions import (
+    ArgumentsSpec,
+    embedded_literal_affixes,
+    embedded_match_key,
+    embedded_name_pattern,
+)
 
 
 class TestArgumentsSpec:
@@ -32,3 +39,38 @@ class TestArgumentsSpec:
     def test_invalid_arguments_do_not_raise(self):
         spec = ArgumentsSpec.from_arguments(["${a}=1", "${b}"])
         assert isinstance(spec, ArgumentsSpec)
+
+
+class TestEmbeddedLiteralAffixes:
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            ("Login As ${user}", ("login as ", "")),
+            ("I have ${count:\\d+} apples", ("i have ", " apples")),
+            ("${a} plus ${b}", ("", "")),
+            ("Open_Browser ${url} now.", ("open_browser ", " now.")),
+            ("Select ${value:a|b} from list", ("select ", " from list")),
+            ("Name With (Parenthesis) ${arg}", ("name with (parenthesis) ", "")),
+        ],
+    )
+    def test_affixes(self, name, expected):
+        assert embedded_literal_affixes(embedded_name_pattern(name)) == expected
+
+    @pytest.mark.parametrize(
+        "name",
+        ["Login As ${user}", "I have ${count:\\d+} apples", "Select ${value:a|b} from list", "Say ${a}. Done"],
+    )
+    @pytest.mark.parametrize("call", ["LOGIN AS bob", "i  have 10 apples", "Select b from list", "say hi. done"])
+    def test_affixes_do_not_exclude_matching_names(self, name, call):
+        pattern = embedded_name_pattern(name)
+        prefix, suffix = embedded_literal_affixes(pattern)
+        key = embedded_match_key(call)
+        if pattern.fullmatch(call):
+            assert key.startswith(prefix)
+            assert key.endswith(suffix)
+
+    def test_match_key_of_non_ascii_name(self):
+        assert embedded_match_key("Zażółć gęślą") is None
+
+    def test_match_key_replaces_whitespace(self):
+        assert embedded_match_key("Log\tMessage") == "log message"
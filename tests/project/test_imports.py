@@ -74,6 +74,11 @@ class TestImportResolver:
         result = resolve(VariableScope(project / "test.robot"), "MyLib.py", project, ImportType.LIBRARY)
         assert result.status == ImportStatus.RESOLVED
 
+    def test_checked_paths_are_recorded(self, project):
+        resolver = ImportResolver(VariableScope(project / "test.robot"))
+        resolver.resolve(ImportType.RESOURCE, "resources/missing.resource", location(project / "test.robot"), project)
+        assert (project / "resources" / "missing.resource") in resolver.checked_paths
+
 
 class TestVariableScope:
     def test_command_line_overrides_own(self, tmp_path):
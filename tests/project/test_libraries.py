@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+import re
 import sys
 import time
 
@@ -117,6 +118,33 @@ class TestLibraryLoader:
         assert not spec.loaded
         assert "timed out" in spec.error
 
+    def test_import_budget_does_not_wait_for_slow_library(self, library_dir):
+        loader = build_library_loader(search_paths=[library_dir], workers=True, timeout=30, budget=3)
+        slow, fast = LibraryRequest(name="SlowLibrary"), LibraryRequest(name="MyLibrary")
+        loader.start_budget()
+        loader.preload([slow, fast])
+
+        assert keyword_names(loader.load(fast)) == ["Custom Keyword"]
+        assert not loader.budget_exceeded
+        spec = loader.load(slow)
+        late = loader.load(LibraryRequest(name="ArgLibrary"))  # not started before the budget was spent
+        loader.close()
+
+        assert "import budget" in spec.error
+        assert "import budget" in late.error
+        assert loader.budget_exceeded
+        assert slow.cache_key not in loader._cache  # noqa: SLF001
+
+    def test_import_budget_is_restarted(self, library_dir):
+        loader = build_library_loader(search_paths=[library_dir], budget=1)
+        loader.start_budget()
+        loader._deadline = time.monotonic() - 1  # noqa: SLF001
+        assert not loader.load(LibraryRequest(name="MyLibrary")).loaded
+
+        loader.start_budget()
+        assert not loader.budget_exceeded
+        assert loader.load(LibraryRequest(name="MyLibrary")).loaded
+
     def test_libraries_are_imported_in_process_by_default(self, library_dir, monkeypatch):
         loader = build_library_loader(search_paths=[library_dir])
         monkeypatch.setattr(
@@ -164,20 +192,32 @@ class TestLibraryLoader:
         assert sys.__stdout__ is original_stdout
         assert sys.__stderr__ is original_stderr
 
-    def test_scheduled_libraries_are_imported_in_parallel(self, library_dir):
+    def test_preloaded_libraries_are_imported_in_background(self, library_dir):
         loader = build_library_loader(search_paths=[library_dir], workers=True)
         requests = [LibraryRequest(name="MyLibrary"), LibraryRequest(name="ArgLibrary"), LibraryRequest(name="BuiltIn")]
-        loader.schedule_preload(requests)
+        loader.preload(requests)
+        deadline = time.monotonic() + 30
+        while not all(request.cache_key in loader._cache for request in requests):  # noqa: SLF001
+            assert time.monotonic() < deadline, "Libraries were not imported in the background"
+            time.sleep(0.05)
         assert keyword_names(loader.load(requests[0])) == ["Custom Keyword"]
-        assert all(request.cache_key in loader._cache for request in requests)  # noqa: SLF001
+        loader.close()
 
-    def test_scheduled_libraries_are_not_imported_without_workers(self, library_dir):
+    def test_preloaded_libraries_are_not_imported_without_workers(self, library_dir):
         loader = build_library_loader(search_paths=[library_dir])
         requests = [LibraryRequest(name="MyLibrary"), LibraryRequest(name="ArgLibrary")]
-        loader.schedule_preload(requests)
+        loader.preload(requests)
         assert keyword_names(loader.load(requests[0])) == ["Custom Keyword"]
         assert requests[1].cache_key not in loader._cache  # noqa: SLF001
 
+    def test_import_time_is_printed_in_verbose_mode(self, library_dir, capsys):
+        loader = build_library_loader(search_paths=[library_dir], ignored_libraries=["Arg*"], verbose=True)
+        loader.load(LibraryRequest(name="MyLibrary"))
+        loader.load(LibraryRequest(name="ArgLibrary"))
+        out = capsys.readouterr().out
+        assert re.search(r"^Loaded library MyLibrary in \d+\.\d\ds$", out, re.MULTILINE)
+        assert re.search(r"^Failed to load library ArgLibrary in \d+\.\d\ds$", out, re.MULTILINE)
+
     def test_ignored_library(self, library_dir):
         loader = build_library_loader(search_paths=[library_dir], ignored_libraries=["My*"])
         spec = loader.load(LibraryRequest(name="MyLibrary"))
@@ -262,6 +302,12 @@ class TestLibrariesInProjectContext:
         context = build_context(project)
         assert not context.library_loader.workers
 
+    def test_libraries_are_preloaded_while_building_context(self, project, monkeypatch):
+        preloaded = []
+        monkeypatch.setattr(LibraryLoader, "preload", lambda _, requests: preloaded.extend(requests))
+        build_context(project, library_workers=True)
+        assert sorted(request.name for request in preloaded) == ["BuiltIn", "Collections", "MyLibrary.py"]
+
     def test_library_keywords_are_visible_with_workers(self, project):
         context = build_context(project, library_workers=True)
         assert context.library_loader.workers
@@ -0,0 +1,210 @@
+"""Tests for the library keywords cache shared by all projects."""
+
+from __future__ import annotations
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from robocop.cache import RobocopCache
+from robocop.config.manager import ConfigManager
+from robocop.config.schema import RawConfig
+from robocop.project.context import build_project_context
+from robocop.project.libraries import LibraryLoader, LibraryRequest, build_library_loader
+from robocop.project.library_cache import SharedLibraryCache, default_library_cache_dir
+
+
+def response(name):
+    return {"status": "ok", "name": name, "source": None, "keywords": [{"name": f"{name} Keyword"}]}
+
+
+@pytest.fixture
+def library(tmp_path):
+    path = tmp_path / "installed" / "SharedLibrary.py"
+    path.parent.mkdir()
+    path.write_text("def shared_keyword():\n    pass\n")
+    return path
+
+
+@pytest.fixture
+def shared_cache(tmp_path):
+    return SharedLibraryCache(tmp_path / "shared")
+
+
+def fail_on_import(monkeypatch):
+    for method in ("_run_worker", "_import_in_process"):
+        monkeypatch.setattr(
+            LibraryLoader,
+            method,
+            lambda *args, **kwargs: pytest.fail("Library should be read from the shared cache"),  # noqa: ARG005
+        )
+
+
+class TestSharedLibraryCache:
+    def test_stored_response_is_returned(self, shared_cache, library):
+        shared_cache.set("SharedLibrary", library, library, response("Shared"))
+
+        assert shared_cache.get("SharedLibrary", library) == response("Shared")
+        assert shared_cache.get("SharedLibrary::argument", library) is None
+
+    def test_response_is_not_used_for_other_origin(self, shared_cache, library, tmp_path):
+        other_library = tmp_path / "other" / "SharedLibrary.py"
+        other_library.parent.mkdir()
+        other_library.write_text("def other_keyword():\n    pass\n")
+        shared_cache.set("SharedLibrary", library, library, response("Shared"))
+
+        assert shared_cache.get("SharedLibrary", other_library) is None
+
+    def test_copies_of_library_share_the_entry(self, shared_cache, library, tmp_path):
+        copy = tmp_path / "other_venv" / "SharedLibrary.py"
+        copy.parent.mkdir()
+        copy.write_text(library.read_text())
+        stored = response("Shared") | {"source": str(library)}
+        stored["keywords"] = [{"name": "Shared Keyword", "source": str(library)}]
+        shared_cache.set("SharedLibrary", library, library, stored)
+        library.unlink()
+
+        cached = shared_cache.get("SharedLibrary", copy)
+
+        assert len(list(shared_cache.directory.glob("*/*.json"))) == 1
+        assert cached is not None
+        assert cached["source"] == str(copy)
+        assert cached["keywords"] == [{"name": "Shared Keyword", "source": str(copy)}]
+
+    def test_response_is_not_used_when_library_changes(self, shared_cache, library):
+        shared_cache.set("SharedLibrary", library, library, response("Shared"))
+        library.write_text("def other_keyword():\n    pass\n")
+
+        assert shared_cache.get("SharedLibrary", library) is None
+
+    def test_responses_of_several_sources_are_kept(self, shared_cache, library, tmp_path):
+        other_library = tmp_path / "other" / "SharedLibrary.py"
+        other_library.parent.mkdir()
+        other_library.write_text("def other_keyword():\n    pass\n")
+
+        shared_cache.set("SharedLibrary", library, library, response("Shared"))
+        shared_cache.set("SharedLibrary", library, other_library, response("Other"))
+        assert shared_cache.get("SharedLibrary", library) == response("Other")
+
+        other_library.unlink()
+        assert shared_cache.get("SharedLibrary", library) == response("Shared")
+
+    def test_least_recently_used_entries_are_evicted(self, shared_cache, library):
+        for index in range(3):
+            shared_cache.set(f"Library{index}", library, library, response(f"Library{index}"))
+        entry_size = next(shared_cache.directory.glob("*/*.json")).stat().st_size
+        shared_cache.get("Library0", library)  # the oldest entry is used again
+        shared_cache.max_size = entry_size * 3
+
+        shared_cache.set("Library3", library, library, response("Library3"))
+
+        assert shared_cache.get("Library0", library) is not None
+        assert shared_cache.get("Library1", library) is None
+        assert shared_cache.get("Library3", library) is not None
+
+    def test_concurrent_writes(self, shared_cache, library):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(
+                executor.map(
+                    lambda index: shared_cache.set("SharedLibrary", library, library, response(str(index))), range(40)
+                )
+            )
+
+        entries = list(shared_cache.directory.glob("*/*"))
+        assert len(entries) == 1
+        assert len(json.loads(entries[0].read_text())["sources"]) == 1
+
+    def test_unreadable_entry_is_ignored(self, shared_cache, library):
+        shared_cache.set("SharedLibrary", library, library, response("Shared"))
+        next(shared_cache.directory.glob("*/*.json")).write_text("not json")
+
+        assert shared_cache.get("SharedLibrary", library) is None
+
+
+class TestLoaderWithSharedCache:
+    def test_library_imported_by_other_project_is_not_imported(self, library, shared_cache, tmp_path, monkeypatch):
+        first = RobocopCache(cache_dir=tmp_path / "first", enabled=True, verbose=False)
+        loader = build_library_loader(search_paths=[library.parent], cache=first, shared_cache=shared_cache)
+        assert loader.load(LibraryRequest(name="SharedLibrary")).loaded
+
+        fail_on_import(monkeypatch)
+        second = RobocopCache(cache_dir=tmp_path / "second", enabled=True, verbose=False)
+        next_loader = build_library_loader(search_paths=[library.parent], cache=second, shared_cache=shared_cache)
+        spec = next_loader.load(LibraryRequest(name="SharedLibrary"))
+
+        assert [keyword.name for keyword in spec.keywords] == ["Shared Keyword"]
+        assert second.data.libraries  # the project cache is filled from the shared cache
+
+    def test_library_installed_in_other_environment_is_not_imported(self, library, shared_cache, tmp_path, monkeypatch):
+        loader = build_library_loader(search_paths=[library.parent], shared_cache=shared_cache)
+        assert loader.load(LibraryRequest(name="SharedLibrary")).loaded
+        copy = tmp_path / "other_venv" / "SharedLibrary.py"
+        copy.parent.mkdir()
+        copy.write_text(library.read_text())
+
+        fail_on_import(monkeypatch)
+        next_loader = build_library_loader(search_paths=[copy.parent], shared_cache=shared_cache)
+        spec = next_loader.load(LibraryRequest(name="SharedLibrary"))
+
+        assert [keyword.name for keyword in spec.keywords] == ["Shared Keyword"]
+        assert spec.source == copy
+
+    def test_library_found_in_other_search_path_is_imported(self, shared_cache, tmp_path):
+        for variant in ("a", "b"):
+            library = tmp_path / variant / "FakeLib.py"
+            library.parent.mkdir()
+            library.write_text(f"def keyword_from_{variant}():\n    pass\n")
+        for variant in ("a", "b"):
+            loader = build_library_loader(search_paths=[tmp_path / variant], shared_cache=shared_cache)
+            spec = loader.load(LibraryRequest(name="FakeLib"))
+
+            assert [keyword.name for keyword in spec.keywords] == [f"Keyword From {variant.upper()}"]
+
+    def test_project_libraries_are_not_read_from_shared_cache(self, library, shared_cache, monkeypatch):
+        loader = build_library_loader(search_paths=[library.parent], shared_cache=shared_cache)
+        assert loader.load(LibraryRequest(name="SharedLibrary")).loaded
+
+        imported = []
+        import_in_process = LibraryLoader._import_in_process  # noqa: SLF001
+        monkeypatch.setattr(
+            LibraryLoader,
+            "_import_in_process",
+            lambda self, request: imported.append(request.name) or import_in_process(self, request),
+        )
+        loader = build_library_loader(
+            search_paths=[library.parent], project_root=library.parent, shared_cache=shared_cache
+        )
+
+        assert loader.load(LibraryRequest(name="SharedLibrary")).loaded
+        assert imported == ["SharedLibrary"]
+
+    def test_project_libraries_are_not_shared(self, library, shared_cache):
+        loader = build_library_loader(
+            search_paths=[library.parent], project_root=library.parent, shared_cache=shared_cache
+        )
+        assert loader.load(LibraryRequest(name="SharedLibrary")).loaded
+        assert not shared_cache.directory.exists()
+
+
+class TestSharedCacheInProjectContext:
+    @pytest.fixture
+    def project(self, tmp_path):
+        (tmp_path / "test.robot").write_text("*** Test Cases ***\nTest\n    Log    1\n")
+        return tmp_path
+
+    def build_context(self, project, **config):
+        config_manager = ConfigManager(
+            sources=[str(project)],
+            root=project,
+            ignore_file_config=True,
+            overwrite_config=RawConfig(**config),
+        )
+        return build_project_context(config_manager, silent=True)
+
+    def test_shared_cache_is_used_by_default(self, project, library_cache_dir):
+        context = self.build_context(project)
+        assert context.library_loader.shared_cache.directory == library_cache_dir == default_library_cache_dir()
+
+    def test_shared_cache_can_be_disabled(self, project):
+        assert self.build_context(project, shared_library_cache=False).library_loader.shared_cache is None
@@ -0,0 +1,175 @@
+"""Tests for reading library keywords from the Libdoc specification files."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+from robocop.config.manager import ConfigManager
+from robocop.config.schema import RawConfig
+from robocop.project.context import build_project_context
+from robocop.project.libraries import LibraryLoader, LibraryRequest, build_library_loader
+from robocop.project.library_specs import LibrarySpecIndex, read_spec, spec_library_name
+from robocop.run import build_library_specs
+
+LIBRARY = """
+def documented_keyword(first, second=None, *rest, named_only, **options):
+    pass
+"""
+
+RF3_XML_SPEC = """<?xml version="1.0" encoding="UTF-8"?>
+<keywordspec name="Old &amp; Library" type="LIBRARY" format="ROBOT" generated="20200101 00:00:00">
+<kw name="Old Keyword">
+<arguments>
+<arg>first</arg>
+<arg>second=default</arg>
+<arg>*rest</arg>
+</arguments>
+</kw>
+</keywordspec>
+"""
+
+
+def generate_spec(library_dir, output):
+    subprocess.run(  # noqa: S603
+        [sys.executable, "-m", "robot.libdoc", "--pythonpath", str(library_dir), "SpecLibrary", str(output)],
+        check=True,
+        capture_output=True,
+    )
+    return output
+
+
+def fail_on_import(monkeypatch):
+    for method in ("_run_worker", "_import_in_process"):
+        monkeypatch.setattr(
+            LibraryLoader,
+            method,
+            lambda *args, **kwargs: pytest.fail("Library should be read from the specification file"),  # noqa: ARG005
+        )
+
+
+@pytest.fixture
+def library_dir(tmp_path):
+    path = tmp_path / "installed"
+    path.mkdir()
+    (path / "SpecLibrary.py").write_text(LIBRARY)
+    return path
+
+
+@pytest.fixture
+def spec_dir(tmp_path):
+    path = tmp_path / "specs"
+    path.mkdir()
+    return path
+
+
+class TestReadSpec:
+    @pytest.mark.parametrize("suffix", [".json", ".xml"])
+    def test_generated_spec(self, library_dir, spec_dir, suffix):
+        spec_file = generate_spec(library_dir, spec_dir / f"SpecLibrary{suffix}")
+
+        response = read_spec(spec_file)
+
+        assert spec_library_name(spec_file) == "SpecLibrary"
+        assert response["status"] == "ok"
+        [keyword] = response["keywords"]
+        assert keyword["name"] == "Documented Keyword"
+        assert keyword["arguments"] == {
+            "positional": ["first", "second"],
+            "defaults": ["second"],
+            "var_positional": "rest",
+            "var_named": "options",
+            "named_only": ["named_only"],
+        }
+        assert keyword["lineno"] == 2
+
+    def test_robot_framework_3_spec(self, spec_dir):
+        spec_file = spec_dir / "OldLibrary.xml"
+        spec_file.write_text(RF3_XML_SPEC)
+
+        [keyword] = read_spec(spec_file)["keywords"]
+
+        assert spec_library_name(spec_file) == "Old & Library"
+        assert keyword["arguments"]["positional"] == ["first", "second"]
+        assert keyword["arguments"]["defaults"] == ["second"]
+        assert keyword["arguments"]["var_positional"] == "rest"
+
+    def test_other_files_are_ignored(self, spec_dir):
+        (spec_dir / "empty.json").write_text("")
+        (spec_dir / "package.json").write_text('{"name": "package"}')
+        (spec_dir / "notes.txt").write_text("SpecLibrary")
+
+        assert LibrarySpecIndex([spec_dir]).specs == {}
+
+    def test_invalid_spec(self, spec_dir):
+        spec_file = spec_dir / "Broken.json"
+        spec_file.write_text('{"specversion": 3, "name": "Broken", "keywords": [')
+
+        assert read_spec(spec_file)["status"] == "error"
+
+
+class TestLoaderWithSpecs:
+    def test_library_is_not_imported(self, library_dir, spec_dir, monkeypatch):
+        generate_spec(library_dir, spec_dir / "SpecLibrary.json")
+        fail_on_import(monkeypatch)
+        loader = build_library_loader(specs=LibrarySpecIndex([spec_dir]))
+
+        spec = loader.load(LibraryRequest(name="SpecLibrary"))
+
+        assert spec.loaded
+        assert [keyword.name for keyword in spec.keywords] == ["Documented Keyword"]
+
+    def test_library_without_spec_is_imported(self, library_dir, spec_dir):
+        loader = build_library_loader(search_paths=[library_dir], specs=LibrarySpecIndex([spec_dir]))
+
+        assert [keyword.name for keyword in loader.load(LibraryRequest(name="SpecLibrary")).keywords] == [
+            "Documented Keyword"
+        ]
+
+    def test_invalid_spec_falls_back_to_import(self, library_dir, spec_dir):
+        (spec_dir / "SpecLibrary.json").write_text('{"specversion": 3, "name": "SpecLibrary", "keywords": [')
+        loader = build_library_loader(search_paths=[library_dir], specs=LibrarySpecIndex([spec_dir]))
+
+        assert loader.load(LibraryRequest(name="SpecLibrary")).loaded
+
+
+class TestBuildSpecs:
+    @pytest.fixture
+    def project(self, tmp_path, library_dir):
+        project = tmp_path / "project"
+        project.mkdir()
+        (project / "LocalLibrary.py").write_text("def local_keyword():\n    pass\n")
+        (project / "test.robot").write_text(
+            "*** Settings ***\nLibrary    SpecLibrary\nLibrary    LocalLibrary.py\n\n*** Test Cases ***\nTest\n"
+            "    Documented Keyword    1    named_only=2\n"
+        )
+        (project / "pyproject.toml").write_text(
+            f'[tool.robocop]\npython-path = ["{library_dir.as_posix()}"]\nlibrary-specs = ["specs"]\n'
+        )
+        return project
+
+    def test_specs_of_project_libraries(self, project, monkeypatch):
+        monkeypatch.chdir(project)
+
+        results = build_library_specs(silent=True, return_result=True)
+
+        assert results == {
+            "BuiltIn": None,
+            "SpecLibrary": None,
+            "LocalLibrary": "Library is a part of the project",
+        }
+        assert sorted(path.name for path in (project / "specs").iterdir()) == ["BuiltIn.json", "SpecLibrary.json"]
+
+    def test_generated_specs_are_used(self, project, monkeypatch):
+        monkeypatch.chdir(project)
+        build_library_specs(silent=True, return_result=True)
+        fail_on_import(monkeypatch)
+
+        config_manager = ConfigManager(sources=[str(project)], root=project, overwrite_config=RawConfig())
+        context = build_project_context(config_manager, silent=True)
+        spec = context.library_loader.load(LibraryRequest(name="SpecLibrary"))
+
+        assert context.library_loader.specs.paths == [project / "specs"]
+        assert [keyword.name for keyword in spec.keywords] == ["Documented Keyword"]
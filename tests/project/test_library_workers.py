@@ -0,0 +1,117 @@
+"""Tests for the pool of processes importing libraries."""
+
+from __future__ import annotations
+
+import pytest
+
+from robocop.project.libraries import LibraryRequest, build_library_loader
+from robocop.project.library_workers import LibraryWorkerPool
+
+NOISY_LIBRARY = """
+import os
+import sys
+
+print("noise")
+os.write(1, b"noise written to the descriptor\\n")
+sys.stdin.read()
+
+
+def noisy_keyword():
+    pass
+"""
+
+
+def request(name, directory):
+    return {"name": name, "args": [], "search_paths": [str(directory)], "local_paths": [str(directory)]}
+
+
+def keyword_names(response):
+    return sorted(keyword["name"] for keyword in response["keywords"])
+
+
+@pytest.fixture
+def pool():
+    pool = LibraryWorkerPool(timeout=10)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def library_dir(tmp_path):
+    (tmp_path / "FirstLibrary.py").write_text("def first_keyword():\n    pass\n")
+    (tmp_path / "SecondLibrary.py").write_text("def second_keyword():\n    pass\n")
+    (tmp_path / "SlowLibrary.py").write_text("import time\n\ntime.sleep(30)\n")
+    (tmp_path / "NoisyLibrary.py").write_text(NOISY_LIBRARY)
+    return tmp_path
+
+
+class TestLibraryWorkerPool:
+    def test_worker_is_reused(self, pool, library_dir):
+        first = pool.run(request("FirstLibrary", library_dir))
+        worker = pool._idle[0]  # noqa: SLF001
+        second = pool.run(request("SecondLibrary", library_dir))
+
+        assert keyword_names(first) == ["First Keyword"]
+        assert keyword_names(second) == ["Second Keyword"]
+        assert pool._idle == [worker]  # noqa: SLF001
+        assert worker.imports == 2
+
+    def test_worker_is_replaced_after_max_imports(self, library_dir):
+        pool = LibraryWorkerPool(timeout=10, max_imports=1)
+        first = pool.run(request("FirstLibrary", library_dir))
+
+        assert first["status"] == "ok"
+        assert pool._idle == []  # noqa: SLF001
+        assert pool.run(request("SecondLibrary", library_dir))["status"] == "ok"
+
+    def test_only_hung_worker_is_replaced(self, library_dir):
+        pool = LibraryWorkerPool(timeout=2)
+        pool.run(request("FirstLibrary", library_dir))
+        idle_worker = pool._idle[0]  # noqa: SLF001
+
+        timed_out = pool.run(request("SlowLibrary", library_dir))
+        after_timeout = pool.run(request("SecondLibrary", library_dir))
+        pool.close()
+
+        assert "timed out" in timed_out["error"]
+        assert idle_worker.process.returncode is not None
+        assert keyword_names(after_timeout) == ["Second Keyword"]
+
+    def test_library_output_does_not_corrupt_response(self, pool, library_dir):
+        noisy = pool.run(request("NoisyLibrary", library_dir))
+        after_noisy = pool.run(request("FirstLibrary", library_dir))
+
+        assert keyword_names(noisy) == ["Noisy Keyword"]
+        assert keyword_names(after_noisy) == ["First Keyword"]
+
+    def test_local_modules_are_imported_again(self, pool, tmp_path):
+        for name in ("first", "second"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "SharedName.py").write_text(f"def {name}_keyword():\n    pass\n")
+
+        first = pool.run(request("SharedName", tmp_path / "first"))
+        second = pool.run(request("SharedName", tmp_path / "second"))
+
+        assert keyword_names(first) == ["First Keyword"]
+        assert keyword_names(second) == ["Second Keyword"]
+
+    def test_closed_pool_stops_workers(self, pool, library_dir):
+        pool.run(request("FirstLibrary", library_dir))
+        worker = pool._idle[0]  # noqa: SLF001
+
+        pool.close()
+
+        assert worker.process.returncode == 0
+
+
+class TestLoaderWithWorkers:
+    def test_loader_shares_pool_between_imports(self, library_dir):
+        loader = build_library_loader(search_paths=[library_dir], workers=True)
+        loader.load(LibraryRequest(name="FirstLibrary"))
+        pool = loader._pool  # noqa: SLF001
+        loader.load(LibraryRequest(name="SecondLibrary"))
+
+        assert loader._pool is pool  # noqa: SLF001
+        assert len(pool._idle) == 1  # noqa: SLF001
+        loader.close()
+        assert loader._pool is None  # noqa: SLF001
@@ -6,9 +6,17 @@ import pytest
 from robocop.config.manager import ConfigManager
 from robocop.config.parser import load_languages
 from robocop.config.schema import RawCacheConfig, RawConfig
+from robocop.linter.checkers.usage import KeywordNotFound
 from robocop.project.collector import ProjectFileCollector
 from robocop.project.context import build_project_context, collection_hash
-from robocop.project.serialization import collected_file_from_dict, collected_file_to_dict
+from robocop.project.imports import ImportResolver
+from robocop.project.serialization import (
+    collected_file_from_dict,
+    collected_file_to_dict,
+    resolved_imports_from_dict,
+    resolved_imports_to_dict,
+)
+from robocop.run import check_files
 from robocop.version_handling import ROBOT_VERSION, Version
 
 pytestmark_languages = pytest.mark.skipif(
@@ -156,6 +164,27 @@ class TestProjectCache:
         build_project_context(config_manager, silent=True)
         assert not config_manager.cache.data.project
 
+    def test_imports_are_not_resolved_again_in_next_run(self, project, tmp_path, monkeypatch):
+        expected = describe(build_context(project, tmp_path / "cache"))
+
+        monkeypatch.setattr(
+            ImportResolver,
+            "resolve",
+            lambda *args, **kwargs: pytest.fail("Imports should be read from the cache"),  # noqa: ARG005
+        )
+        assert describe(build_context(project, tmp_path / "cache")) == expected
+
+    def test_imports_are_resolved_again_when_checked_path_is_created(self, project, tmp_path):
+        test_file = project / "test.robot"
+        test_file.write_text(test_file.read_text().replace("Collections    AS    Col", "MyLibrary.py"))
+        build_context(project, tmp_path / "cache")
+
+        (project / "MyLibrary.py").write_text("def my_keyword():\n    pass\n")
+
+        context = build_context(project, tmp_path / "cache")
+        [library] = [imported for imported in context.get_file(test_file).imports if imported.name == "MyLibrary.py"]
+        assert library.resolved_path == (project / "MyLibrary.py").resolve()
+
     def test_embedded_keyword_still_matches_after_restoring(self, project, tmp_path):
         build_context(project, tmp_path / "cache")
         context = build_context(project, tmp_path / "cache")
@@ -180,3 +209,137 @@ class TestSerialization:
 
     def test_unknown_format_is_ignored(self, tmp_path):
         assert collected_file_from_dict({"version": -1}, tmp_path) is None
+
+    def test_round_trip_keeps_resolved_imports(self, project, tmp_path):
+        context = build_context(project, tmp_path / "cache", enabled=False)
+        for path, project_file in context.files.items():
+            restored = resolved_imports_from_dict(resolved_imports_to_dict(project_file.imports), path)
+            assert restored == project_file.imports
+
+    def test_unknown_format_of_resolved_imports_is_ignored(self, tmp_path):
+        assert resolved_imports_from_dict({"version": -1}, tmp_path) is None
+
+
+def check_project(project, cache_dir, select=("unused-keyword",), **kwargs):
+    return check_files(
+        sources=[project],
+        select=list(select),
+        root=project,
+        ignore_file_config=True,
+        return_result=True,
+        cache=True,
+        cache_dir=cache_dir,
+        silent=True,
+        **kwargs,
+    )
+
+
+def describe_diagnostics(diagnostics):
+    return sorted(
+        (diagnostic.rule.name, diagnostic.source.path.name, diagnostic.range.start.line, diagnostic.message)
+        for diagnostic in diagnostics
+    )
+
+
+class TestProjectChecksCache:
+    def test_project_is_not_analysed_again_when_nothing_changed(self, project, tmp_path, monkeypatch):
+        expected = describe_diagnostics(check_project(project, tmp_path / "cache"))
+        assert expected
+
+        monkeypatch.setattr(
+            "robocop.linter.runner.build_project_context",
+            lambda *args, **kwargs: pytest.fail("Project diagnostics should be read from the cache"),  # noqa: ARG005
+        )
+        assert describe_diagnostics(check_project(project, tmp_path / "cache")) == expected
+
+    def test_project_is_analysed_again_when_file_changes(self, project, tmp_path):
+        check_project(project, tmp_path / "cache")
+
+        test_file = project / "test.robot"
+        test_file.write_text(test_file.read_text() + "\n*** Keywords ***\nNew Keyword\n    Log    new\n")
+        os.utime(test_file, (time.time() + 10, time.time() + 10))
+
+        messages = [diagnostic.message for diagnostic in check_project(project, tmp_path / "cache")]
+        assert any("New Keyword" in message for message in messages)
+
+    def test_project_is_analysed_again_when_file_is_added(self, project, tmp_path):
+        before = describe_diagnostics(check_project(project, tmp_path / "cache"))
+
+        (project / "other.resource").write_text("*** Keywords ***\nOther Keyword\n    Log    a\n")
+
+        after = describe_diagnostics(check_project(project, tmp_path / "cache"))
+        assert len(after) == len(before) + 1
+
+    def test_results_of_each_configuration_are_cached(self, project, tmp_path, monkeypatch):
+        unused = describe_diagnostics(check_project(project, tmp_path / "cache"))
+        not_found = describe_diagnostics(check_project(project, tmp_path / "cache", select=["keyword-not-found"]))
+
+        monkeypatch.setattr(
+            "robocop.linter.runner.build_project_context",
+            lambda *args, **kwargs: pytest.fail("Project diagnostics should be read from the cache"),  # noqa: ARG005
+        )
+        assert describe_diagnostics(check_project(project, tmp_path / "cache")) == unused
+        assert (
+            describe_diagnostics(check_project(project, tmp_path / "cache", select=["keyword-not-found"])) == not_found
+        )
+
+
+@pytest.fixture
+def recorded_reported_paths(monkeypatch):
+    """Record files checked by the incremental ``keyword-not-found`` checker in every run."""
+    recorded = []
+    original = KeywordNotFound.scan_project
+
+    def recording_scan_project(self, project_source_file, config_manager, context):
+        reported_paths = context.reported_paths
+        recorded.append(None if reported_paths is None else sorted(path.name for path in reported_paths))
+        return original(self, project_source_file, config_manager, context)
+
+    monkeypatch.setattr(KeywordNotFound, "scan_project", recording_scan_project)
+    return recorded
+
+
+class TestIncrementalProjectChecks:
+    @pytest.fixture
+    def suites(self, project):
+        (project / "other.robot").write_text("*** Test Cases ***\nTest\n    Missing Keyword\n")
+        return project
+
+    def modify(self, path, content):
+        path.write_text(content)
+        os.utime(path, (time.time() + 10, time.time() + 10))
+
+    def test_only_changed_file_is_checked_again(self, suites, tmp_path, recorded_reported_paths):
+        check_project(suites, tmp_path / "cache", select=["keyword-not-found"])
+        self.modify(suites / "other.robot", "*** Test Cases ***\nTest\n    Other Missing Keyword\n")
+
+        diagnostics = describe_diagnostics(check_project(suites, tmp_path / "cache", select=["keyword-not-found"]))
+
+        assert recorded_reported_paths == [None, ["other.robot"]]
+        assert diagnostics == describe_diagnostics(
+            check_project(suites, tmp_path / "fresh", select=["keyword-not-found"])
+        )
+        assert [message for _, name, _, message in diagnostics if name == "other.robot"] == [
+            "Keyword 'Other Missing Keyword' not found"
+        ]
+
+    def test_files_importing_changed_file_are_checked_again(self, suites, tmp_path, recorded_reported_paths):
+        check_project(suites, tmp_path / "cache", select=["keyword-not-found"])
+        common = suites / "common.resource"
+        self.modify(common, common.read_text().replace("Common Keyword", "Renamed Keyword"))
+
+        diagnostics = describe_diagnostics(check_project(suites, tmp_path / "cache", select=["keyword-not-found"]))
+
+        assert recorded_reported_paths == [None, ["common.resource", "test.robot"]]
+        assert diagnostics == describe_diagnostics(
+            check_project(suites, tmp_path / "fresh", select=["keyword-not-found"])
+        )
+        assert ("keyword-not-found", "test.robot") in {(rule, name) for rule, name, *_ in diagnostics}
+
+    def test_whole_project_is_checked_when_checker_is_not_incremental(self, suites, tmp_path):
+        check_project(suites, tmp_path / "cache")
+        self.modify(suites / "other.robot", "*** Test Cases ***\nTest\n    Common Keyword    1\n")
+
+        diagnostics = describe_diagnostics(check_project(suites, tmp_path / "cache"))
+
+        assert diagnostics == describe_diagnostics(check_project(suites, tmp_path / "fresh"))
@@ -286,3 +286,20 @@ class TestConfigOption:
         assert default_result.exit_code == 2
         assert result.exit_code == 0
         assert "Rule: external-rule (EXT03)" in result.stdout
+
+
+class TestCacheCommands:
+    def test_cache_stats_and_prune(self, tmp_path):
+        test_file = tmp_path / "test.robot"
+        test_file.write_text("*** Test Cases ***\nTest\n    No Operation\n", encoding="utf-8")
+        removed_file = tmp_path / "removed.robot"
+        removed_file.write_text("*** Test Cases ***\nTest\n    No Operation\n", encoding="utf-8")
+        with working_directory(tmp_path):
+            CliRunner().invoke(app, ["check"])
+            removed_file.unlink()
+            stats_result = CliRunner().invoke(app, ["cache", "stats"])
+            prune_result = CliRunner().invoke(app, ["cache", "prune"])
+        assert stats_result.exit_code == 0
+        assert "linter" in stats_result.stdout
+        assert prune_result.exit_code == 0
+        assert "Removed 1 linter cache entry" in prune_result.stdout
@@ -0,0 +1,63 @@
+import pytest
+
+from robocop.config.manager import ConfigManager
+from robocop.runtime.shard import Shard, split_into_shards
+from tests import working_directory
+
+
+def write_files(directory, sizes):
+    paths = []
+    for index, size in enumerate(sizes):
+        path = directory / "tests" / f"suite_{index}.robot"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("*** Test Cases ***\n" + "#" * size)
+        paths.append(path.resolve())
+    return paths
+
+
+@pytest.mark.parametrize(("value", "expected"), [("1/1", Shard(1, 1)), ("3/8", Shard(3, 8))])
+def test_parse_shard(value, expected):
+    assert Shard.from_string(value) == expected
+    assert str(expected) == value
+
+
+@pytest.mark.parametrize("value", ["", "1", "0/2", "3/2", "1/0", "a/b", "1/2/3"])
+def test_parse_invalid_shard(value):
+    with pytest.raises(ValueError, match="Invalid shard"):
+        Shard.from_string(value)
+
+
+def test_shards_are_balanced_by_size(tmp_path):
+    paths = write_files(tmp_path, [60_000, 10_000, 20_000, 30_000])
+
+    shards = split_into_shards(paths, 2, tmp_path)
+
+    assert shards == [{paths[0]}, {paths[1], paths[2], paths[3]}]
+
+
+def test_shards_do_not_depend_on_project_location(tmp_path):
+    sizes = [100] * 10 + [5_000, 3_000]
+    first = write_files(tmp_path / "first", sizes)
+    second = write_files(tmp_path / "second_checkout", sizes)
+
+    first_shards = split_into_shards(reversed(first), 3, tmp_path / "first")
+    second_shards = split_into_shards(second, 3, tmp_path / "second_checkout")
+
+    assert [sorted(path.name for path in shard) for shard in first_shards] == [
+        sorted(path.name for path in shard) for shard in second_shards
+    ]
+    assert set().union(*first_shards) == set(first)
+
+
+def test_every_file_is_linted_by_one_shard(tmp_path):
+    write_files(tmp_path, range(0, 7000, 1000))
+    linted = []
+    with working_directory(tmp_path):
+        for index in (1, 2, 3):
+            linted.extend(
+                source_file.path.name for source_file in ConfigManager(root=tmp_path, shard=Shard(index, 3)).paths
+            )
+        all_files = [source_file.path.name for source_file in ConfigManager(root=tmp_path).paths]
+
+    assert sorted(linted) == sorted(all_files)
+    assert len(all_files) == 7
@@ -0,0 +1,189 @@
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from textwrap import dedent
+
+import pytest
+
+from robocop.formatter.runner import RobocopFormatter
+from robocop.linter.runner import RobocopLinter
+from robocop.run import check_files, format_files
+from robocop.runtime import session, watch
+from tests import working_directory
+
+SUITE = dedent("""
+    *** Test Cases ***
+    Test
+        Keyword
+
+
+    *** Keywords ***
+    Keyword
+        Log    {message}
+    """).lstrip()
+
+
+class FakeWatcher(watch.Watcher):
+    """Watcher applying the changes one by one, and interrupting the watch mode after the last one."""
+
+    def __init__(self, changes: list[Callable[[], set[Path]]]) -> None:
+        self.changes = changes
+        self.closed = False
+
+    def read_changes(self, timeout: float | None) -> set[Path]:
+        if timeout is not None:  # no more changes in the burst
+            return set()
+        if not self.changes:
+            raise KeyboardInterrupt
+        return self.changes.pop(0)()
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def linted(monkeypatch) -> list[list[str]]:
+    """Names of the files linted in every run of the watch mode."""
+    runs: list[list[str]] = []
+    run, run_check = RobocopLinter.run, RobocopLinter.run_check
+
+    def spy_run(self):
+        runs.append([])
+        return run(self)
+
+    def spy_run_check(self, source_file, fix_applier=None):
+        runs[-1].append(source_file.path.name)
+        return run_check(self, source_file, fix_applier)
+
+    monkeypatch.setattr(RobocopLinter, "run", spy_run)
+    monkeypatch.setattr(RobocopLinter, "run_check", spy_run_check)
+    return runs
+
+
+def use_watcher(monkeypatch, watcher: watch.Watcher) -> None:
+    monkeypatch.setattr(watch, "create_watcher", lambda _: watcher)
+
+
+def edit(path: Path, text: str) -> Callable[[], set[Path]]:
+    def write() -> set[Path]:
+        path.write_text(text, encoding="utf-8")
+        return {path}
+
+    return write
+
+
+class TestWatchMode:
+    def test_only_changed_files_are_linted_again(self, tmp_path, monkeypatch, linted, capsys):
+        first, second = tmp_path / "first.robot", tmp_path / "second.robot"
+        first.write_text(SUITE.format(message="first"), encoding="utf-8")
+        second.write_text(SUITE.format(message="second"), encoding="utf-8")
+        watcher = FakeWatcher([edit(second, SUITE.format(message="changed") + "Unused\n    No Operation\n")])
+        use_watcher(monkeypatch, watcher)
+
+        with working_directory(tmp_path):
+            check_files(watch=True, cache=False, select=["unused-keyword", "missing-doc-keyword"])
+
+        assert [sorted(run) for run in linted] == [["first.robot", "second.robot"], ["second.robot"]]
+        output = capsys.readouterr().out
+        assert "Found 2 issues." in output
+        assert "Found 4 issues." in output
+        assert "Detected changes in 1 file." in output
+        assert watcher.closed
+        assert session.active_session() is None
+
+    def test_files_saved_by_formatter_are_not_changes(self, tmp_path, monkeypatch):
+        suite = tmp_path / "suite.robot"
+        suite.write_text(SUITE.format(message="message").replace("    Log    ", "  Log  "), encoding="utf-8")
+        reported: list[set[Path]] = []
+
+        def saved_by_formatter() -> set[Path]:
+            reported.append({path for path in {suite} if not session.is_up_to_date(path)})
+            return {suite}
+
+        use_watcher(monkeypatch, FakeWatcher([saved_by_formatter]))
+        formatted = []
+        run = RobocopFormatter.run
+        monkeypatch.setattr(RobocopFormatter, "run", lambda self: formatted.append(run(self)))
+
+        with working_directory(tmp_path):
+            format_files(watch=True, cache=False, silent=True, return_result=True)
+
+        assert reported == [set()]
+        assert formatted == [0]
+        assert suite.read_text(encoding="utf-8") == SUITE.format(message="message")
+
+    def test_invalid_configuration_does_not_stop_watching(self, tmp_path, monkeypatch, linted):
+        (tmp_path / "suite.robot").write_text(SUITE.format(message="message"), encoding="utf-8")
+        config = tmp_path / "robocop.toml"
+        use_watcher(
+            monkeypatch,
+            FakeWatcher([edit(config, "[lint\n"), edit(config, "[lint]\nselect = ['unused-keyword']\n")]),
+        )
+
+        with working_directory(tmp_path):
+            check_files(watch=True, cache=False, silent=True)
+
+        assert len(linted) == 2
+
+
+def test_wait_for_changes_collects_burst():
+    bursts = [{Path("a.robot")}, {Path("b.robot")}, {Path("c.robot")}, set()]
+
+    class BurstWatcher(watch.Watcher):
+        def read_changes(self, timeout):  # noqa: ARG002
+            return bursts.pop(0)
+
+    assert watch.wait_for_changes(BurstWatcher(), debounce=0) == {Path("a.robot"), Path("b.robot"), Path("c.robot")}
+
+
+def test_watched_directories(tmp_path):
+    project, outside = tmp_path / "project", tmp_path / "outside"
+    (project / "tests").mkdir(parents=True)
+    outside.mkdir()
+    (outside / "suite.robot").write_text("", encoding="utf-8")
+
+    class Manager:
+        root = project
+        sources = ["tests", str(outside / "suite.robot")]
+
+    with working_directory(project):
+        assert watch.watched_directories(Manager()) == [project.resolve(), outside.resolve()]
+
+
+def wait_for(watcher: watch.Watcher, expected: set[Path]) -> set[Path]:
+    changes: set[Path] = set()
+    deadline = time.monotonic() + 5
+    while not expected <= changes and time.monotonic() < deadline:
+        changes |= watcher.read_changes(0.1)
+    return changes
+
+
+@pytest.mark.parametrize(
+    "create_watcher",
+    [
+        pytest.param(lambda directories: watch.PollingWatcher(directories, interval=0.01), id="polling"),
+        pytest.param(
+            watch.InotifyWatcher,
+            id="inotify",
+            marks=pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is only available on Linux"),
+        ),
+    ],
+)
+def test_watcher_detects_changes(tmp_path, create_watcher):
+    existing = tmp_path / "existing.robot"
+    existing.write_text("", encoding="utf-8")
+    watcher = create_watcher([tmp_path])
+    try:
+        (tmp_path / ".hidden.robot").write_text("ignored", encoding="utf-8")
+        existing.write_text("*** Test Cases ***\n", encoding="utf-8")
+        created = tmp_path / "new" / "created.robot"
+        created.parent.mkdir()
+        created.write_text("", encoding="utf-8")
+
+        changes = wait_for(watcher, {existing, created})
+
+        assert {existing, created} <= changes
+        assert tmp_path / ".hidden.robot" not in changes
+    finally:
+        watcher.close()